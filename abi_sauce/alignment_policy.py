@@ -1,19 +1,55 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Literal
+import hashlib
+import threading
+from typing import Any, Literal, TypeAlias
 
 from Bio import Align
+import numpy as np
 
+from abi_sauce.lru_cache import LruCache, LruCacheInfo
 from abi_sauce.orientation import reverse_complement_sequence
 
 AlignmentStrand = Literal["forward", "reverse_complement"]
 AlignmentStrandPolicy = Literal["auto", "forward", "reverse_complement"]
+AlignerScoringKey: TypeAlias = tuple[object, ...]
+SemiglobalScoringKey: TypeAlias = tuple[float, float, float, float]
+AlignmentCacheKey: TypeAlias = tuple[
+    str,
+    str,
+    tuple[AlignmentStrand, ...],
+    AlignerScoringKey,
+]
+
+_ALIGNMENT_CACHE_MAX_ENTRIES = 4096
+_ALIGNER_SCORING_ATTRIBUTES = (
+    "mode",
+    "wildcard",
+    "match_score",
+    "mismatch_score",
+    "open_internal_insertion_score",
+    "extend_internal_insertion_score",
+    "open_left_insertion_score",
+    "extend_left_insertion_score",
+    "open_right_insertion_score",
+    "extend_right_insertion_score",
+    "open_internal_deletion_score",
+    "extend_internal_deletion_score",
+    "open_left_deletion_score",
+    "extend_left_deletion_score",
+    "open_right_deletion_score",
+    "extend_right_deletion_score",
+)
 
 
 @dataclass(frozen=True, slots=True)
 class SelectedOrientedAlignment:
-    """One chosen alignment plus the oriented query sequence it used."""
+    """One chosen alignment plus the oriented query sequence it used.
+
+    ``score`` is the authoritative alignment score; alignments rebuilt from
+    cached coordinates carry no score of their own.
+    """
 
     strand: AlignmentStrand
     sequence: str
@@ -22,6 +58,34 @@ class SelectedOrientedAlignment:
     score: float
 
 
+@dataclass(frozen=True, slots=True)
+class CachedOrientedAlignment:
+    """Compact coordinates for one best oriented alignment, without sequences."""
+
+    strand: AlignmentStrand
+    coordinates: tuple[tuple[int, ...], tuple[int, ...]]
+    score: float
+
+
+@dataclass(frozen=True, slots=True)
+class AlignerPoolInfo:
+    """Usage counters for the process-wide pool of configured aligners."""
+
+    requests: int
+    constructions: int
+    size: int
+
+
+_aligner_pool: dict[SemiglobalScoringKey, Align.PairwiseAligner] = {}
+_aligner_pool_lock = threading.Lock()
+_aligner_pool_requests = 0
+_aligner_pool_constructions = 0
+
+_alignment_cache: LruCache[AlignmentCacheKey, CachedOrientedAlignment | None] = (
+    LruCache(_ALIGNMENT_CACHE_MAX_ENTRIES)
+)
+
+
 def build_semiglobal_aligner(
     *,
     match_score: float = 1.0,
@@ -51,6 +115,60 @@ def build_semiglobal_aligner(
     return aligner
 
 
+def shared_semiglobal_aligner(
+    *,
+    match_score: float = 1.0,
+    mismatch_score: float = -1.0,
+    open_internal_gap_score: float = -3.0,
+    extend_internal_gap_score: float = -1.0,
+) -> Align.PairwiseAligner:
+    """Return a pooled semi-global aligner for one scoring tuple.
+
+    Aligners are built once per ``(match, mismatch, gap open, gap extend)``
+    tuple and reused process-wide. Callers must treat the returned aligner as
+    read-only; use ``build_semiglobal_aligner`` for one that may be mutated.
+    """
+    global _aligner_pool_requests, _aligner_pool_constructions
+    scoring_key: SemiglobalScoringKey = (
+        float(match_score),
+        float(mismatch_score),
+        float(open_internal_gap_score),
+        float(extend_internal_gap_score),
+    )
+    with _aligner_pool_lock:
+        _aligner_pool_requests += 1
+        aligner = _aligner_pool.get(scoring_key)
+        if aligner is None:
+            aligner = build_semiglobal_aligner(
+                match_score=match_score,
+                mismatch_score=mismatch_score,
+                open_internal_gap_score=open_internal_gap_score,
+                extend_internal_gap_score=extend_internal_gap_score,
+            )
+            _aligner_pool[scoring_key] = aligner
+            _aligner_pool_constructions += 1
+        return aligner
+
+
+def aligner_pool_info() -> AlignerPoolInfo:
+    """Return request and construction counts for the shared aligner pool."""
+    with _aligner_pool_lock:
+        return AlignerPoolInfo(
+            requests=_aligner_pool_requests,
+            constructions=_aligner_pool_constructions,
+            size=len(_aligner_pool),
+        )
+
+
+def clear_aligner_pool() -> None:
+    """Drop every pooled aligner and reset the pool counters."""
+    global _aligner_pool_requests, _aligner_pool_constructions
+    with _aligner_pool_lock:
+        _aligner_pool.clear()
+        _aligner_pool_requests = 0
+        _aligner_pool_constructions = 0
+
+
 def oriented_qualities(
     display_qualities: list[int] | None,
     *,
@@ -77,6 +195,43 @@ def alignment_strands_for_policy(
     raise ValueError(f"Unsupported strand policy: {strand_policy}")
 
 
+def aligner_scoring_key(aligner: Align.PairwiseAligner) -> AlignerScoringKey:
+    """Return the hashable scoring parameters that determine one aligner's DP."""
+    return (
+        *(
+            getattr(aligner, attribute_name)
+            for attribute_name in _ALIGNER_SCORING_ATTRIBUTES
+        ),
+        _substitution_matrix_key(aligner.substitution_matrix),
+    )
+
+
+def build_alignment_cache_key(
+    *,
+    target_sequence: str,
+    display_query_sequence: str,
+    candidate_strands: tuple[AlignmentStrand, ...],
+    aligner: Align.PairwiseAligner,
+) -> AlignmentCacheKey:
+    """Return the content-based cache key for one oriented alignment search."""
+    return (
+        _sequence_digest(target_sequence),
+        _sequence_digest(display_query_sequence),
+        candidate_strands,
+        aligner_scoring_key(aligner),
+    )
+
+
+def alignment_cache_info() -> LruCacheInfo:
+    """Return the current hit/miss counters for the oriented-alignment cache."""
+    return _alignment_cache.info()
+
+
+def clear_alignment_cache() -> None:
+    """Drop every cached oriented alignment and reset the counters."""
+    _alignment_cache.clear()
+
+
 def select_best_oriented_alignment(
     *,
     target_sequence: str,
@@ -84,21 +239,78 @@ def select_best_oriented_alignment(
     display_query_qualities: list[int] | None,
     aligner: Align.PairwiseAligner,
     allowed_strands: tuple[AlignmentStrand, ...] | None = None,
+    use_cache: bool = True,
 ) -> SelectedOrientedAlignment | None:
-    """Align forward and/or reverse-complement query candidates and keep the best."""
-    candidate_strands = (
+    """Align forward and/or reverse-complement query candidates and keep the best.
+
+    The DP result only depends on the two sequences, the candidate strands and
+    the aligner scoring, so it is cached process-wide on exactly that content.
+    Record names, annotations and qualities never invalidate a cached alignment.
+    """
+    candidate_strands: tuple[AlignmentStrand, ...] = (
         allowed_strands
         if allowed_strands is not None
         else ("forward", "reverse_complement")
     )
+    if not use_cache:
+        return _select_best_oriented_alignment_uncached(
+            target_sequence=target_sequence,
+            display_query_sequence=display_query_sequence,
+            display_query_qualities=display_query_qualities,
+            aligner=aligner,
+            candidate_strands=candidate_strands,
+        )
 
+    cache_key = build_alignment_cache_key(
+        target_sequence=target_sequence,
+        display_query_sequence=display_query_sequence,
+        candidate_strands=candidate_strands,
+        aligner=aligner,
+    )
+    found, cached_alignment = _alignment_cache.lookup(cache_key)
+    if found:
+        if cached_alignment is None:
+            return None
+        return _selected_alignment_from_cache(
+            cached_alignment,
+            target_sequence=target_sequence,
+            display_query_sequence=display_query_sequence,
+            display_query_qualities=display_query_qualities,
+        )
+
+    best_alignment = _select_best_oriented_alignment_uncached(
+        target_sequence=target_sequence,
+        display_query_sequence=display_query_sequence,
+        display_query_qualities=display_query_qualities,
+        aligner=aligner,
+        candidate_strands=candidate_strands,
+    )
+    _alignment_cache.store(
+        cache_key,
+        (
+            None
+            if best_alignment is None
+            else CachedOrientedAlignment(
+                strand=best_alignment.strand,
+                coordinates=_compact_coordinates(best_alignment.alignment),
+                score=best_alignment.score,
+            )
+        ),
+    )
+    return best_alignment
+
+
+def _select_best_oriented_alignment_uncached(
+    *,
+    target_sequence: str,
+    display_query_sequence: str,
+    display_query_qualities: list[int] | None,
+    aligner: Align.PairwiseAligner,
+    candidate_strands: tuple[AlignmentStrand, ...],
+) -> SelectedOrientedAlignment | None:
     best_alignment: SelectedOrientedAlignment | None = None
     for strand in candidate_strands:
-        oriented_sequence = (
-            display_query_sequence
-            if strand == "forward"
-            else reverse_complement_sequence(display_query_sequence)
-        )
+        oriented_sequence = _oriented_query_sequence(display_query_sequence, strand)
         alignments = aligner.align(target_sequence, oriented_sequence)
         if len(alignments) == 0:
             continue
@@ -116,6 +328,61 @@ def select_best_oriented_alignment(
     return best_alignment
 
 
+def _selected_alignment_from_cache(
+    cached_alignment: CachedOrientedAlignment,
+    *,
+    target_sequence: str,
+    display_query_sequence: str,
+    display_query_qualities: list[int] | None,
+) -> SelectedOrientedAlignment:
+    oriented_sequence = _oriented_query_sequence(
+        display_query_sequence,
+        cached_alignment.strand,
+    )
+    alignment = Align.Alignment(
+        [target_sequence, oriented_sequence],
+        np.array(cached_alignment.coordinates, dtype=np.intp),
+    )
+    return SelectedOrientedAlignment(
+        strand=cached_alignment.strand,
+        sequence=oriented_sequence,
+        qualities=oriented_qualities(
+            display_query_qualities,
+            strand=cached_alignment.strand,
+        ),
+        alignment=alignment,
+        score=cached_alignment.score,
+    )
+
+
+def _compact_coordinates(alignment: Any) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    target_coordinates, query_coordinates = alignment.coordinates.tolist()
+    return (tuple(target_coordinates), tuple(query_coordinates))
+
+
+def _oriented_query_sequence(
+    display_query_sequence: str,
+    strand: AlignmentStrand,
+) -> str:
+    if strand == "forward":
+        return display_query_sequence
+    return reverse_complement_sequence(display_query_sequence)
+
+
+def _substitution_matrix_key(substitution_matrix: Any) -> tuple[str, str] | None:
+    if substitution_matrix is None:
+        return None
+    matrix_values = np.ascontiguousarray(substitution_matrix, dtype=np.float64)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{matrix_values.shape}".encode("utf-8"))
+    digest.update(matrix_values.tobytes())
+    return (str(getattr(substitution_matrix, "alphabet", "")), digest.hexdigest())
+
+
+def _sequence_digest(sequence: str) -> str:
+    return hashlib.blake2b(sequence.encode("utf-8"), digest_size=16).hexdigest()
+
+
 def alignment_overlap_metrics(
     alignment: Any,
     *,
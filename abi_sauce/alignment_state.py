@@ -34,6 +34,7 @@ class AlignmentDefinition:
     reference_name: str | None = None
     reference_text: str | None = None
     strand_policy: StrandPolicy = "auto"
+    coverage_padding: int | None = None
 
 
 @dataclass(frozen=True, slots=True)
@@ -122,6 +123,7 @@ def create_alignment_definition(
     reference_name: str | None = None,
     reference_text: str | None = None,
     strand_policy: StrandPolicy = "auto",
+    coverage_padding: int | None = None,
 ) -> AlignmentDefinition:
     """Create and persist one new saved alignment definition."""
     current_state = read_alignment_session_state(session_state)
@@ -144,6 +146,7 @@ def create_alignment_definition(
         reference_name=_normalized_optional_text(reference_name),
         reference_text=_normalized_optional_text(reference_text),
         strand_policy=strand_policy,
+        coverage_padding=coverage_padding,
     )
     alignments_by_id = dict(current_state.alignments_by_id)
     alignments_by_id[definition.alignment_id] = definition
@@ -169,6 +172,7 @@ def update_alignment_definition(
     reference_name: str | None = None,
     reference_text: str | None = None,
     strand_policy: StrandPolicy = "auto",
+    coverage_padding: int | None = None,
 ) -> AlignmentDefinition:
     """Update and persist one existing saved alignment definition."""
     current_state = read_alignment_session_state(session_state)
@@ -196,6 +200,7 @@ def update_alignment_definition(
         reference_name=_normalized_optional_text(reference_name),
         reference_text=_normalized_optional_text(reference_text),
         strand_policy=strand_policy,
+        coverage_padding=coverage_padding,
     )
 
     alignments_by_id = dict(current_state.alignments_by_id)
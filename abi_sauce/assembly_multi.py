@@ -1,28 +1,32 @@
 from __future__ import annotations
 
-from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import partial
 
 from Bio import Align
+import numpy as np
 
 from abi_sauce.alignment_policy import (
     alignment_overlap_metrics,
     oriented_qualities,
     select_best_oriented_alignment,
+    shared_semiglobal_aligner,
 )
-from abi_sauce.assembly_pairwise import build_assembly_aligner
 from abi_sauce.assembly_types import (
+    GRID_GAP_CODE,
+    GRID_MISSING,
     AssemblyConfig,
     AssemblyStrand,
-    ConflictResolution,
-    MultiAssemblyColumn,
+    MultiAssemblyGrid,
     MultiAssemblyMember,
-    MultiAssemblyMemberCell,
     MultiAssemblyResult,
 )
+from abi_sauce.column_consensus import call_column_consensus
+from abi_sauce.insertion_merge import InsertionBucketMerger
 from abi_sauce.models import SequenceRecord
 from abi_sauce.oriented_reads import PreparedTrimmedRead, prepare_trimmed_reads
-from abi_sauce.trace_coordinates import trace_position_for_oriented_query_index
+from abi_sauce.parallel import ordered_process_map
+from abi_sauce.trace_coordinates import trace_positions_for_oriented_query_indices
 from abi_sauce.trimming import TrimResult
 
 
@@ -41,20 +45,22 @@ class _ResolvedMultiMemberInput:
 
 
 @dataclass(frozen=True, slots=True)
-class _ProjectedMultiCell:
-    base: str
-    query_index: int | None
-    query_pos: int | None
-    quality: int | None
-    trace_x: int | None
-    is_gap: bool
+class _OrientedMultiMemberTables:
+    base_codes: np.ndarray
+    qualities: np.ndarray
+    trace_x: np.ndarray
 
 
 @dataclass(frozen=True, slots=True)
 class _PlacedMultiMember:
     member: MultiAssemblyMember
-    seed_column_cells: tuple[_ProjectedMultiCell, ...]
-    insertion_cells_by_bucket: dict[int, tuple[_ProjectedMultiCell, ...]]
+    tables: _OrientedMultiMemberTables | None = None
+    seed_query_indices: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int32)
+    )
+    insertion_query_indices_by_bucket: dict[int, tuple[int, ...]] = field(
+        default_factory=dict
+    )
 
 
 def assemble_trimmed_multi(
@@ -64,11 +70,17 @@ def assemble_trimmed_multi(
     trim_results_by_source_filename: dict[str, TrimResult],
     config: AssemblyConfig | None = None,
     aligner: Align.PairwiseAligner | None = None,
+    max_workers: int | None = 1,
 ) -> MultiAssemblyResult:
-    """Assemble multiple currently trimmed reads onto one seed-aligned grid."""
+    """Assemble multiple currently trimmed reads onto one seed-aligned grid.
+
+    Non-seed members are placed independently; ``max_workers`` other than 1
+    spreads those placements over a process pool (``None`` uses every core)
+    while keeping member order deterministic.
+    """
     resolved_config = AssemblyConfig() if config is None else config
     resolved_aligner = (
-        build_assembly_aligner(
+        shared_semiglobal_aligner(
             match_score=resolved_config.match_score,
             mismatch_score=resolved_config.mismatch_score,
             open_internal_gap_score=resolved_config.open_internal_gap_score,
@@ -116,27 +128,30 @@ def assemble_trimmed_multi(
             aligned_member_sequences=(),
             gapped_consensus="",
             consensus_sequence="",
-            columns=(),
             included_member_count=0,
             excluded_member_count=len(member_inputs),
             ambiguous_column_count=0,
         )
 
     seed_member_input = _select_multi_seed_member(non_empty_member_inputs)
-    seed_sequence = seed_member_input.display_sequence
 
     placements: list[_PlacedMultiMember] = [_build_seed_multi_member(seed_member_input)]
-    for member_input in member_inputs:
-        if member_input.member_index == seed_member_input.member_index:
-            continue
-        placements.append(
-            _place_member_against_multi_seed(
+    placements.extend(
+        ordered_process_map(
+            partial(
+                _place_multi_member_task,
                 seed_member_input=seed_member_input,
-                member_input=member_input,
                 config=resolved_config,
                 aligner=resolved_aligner,
-            )
+            ),
+            tuple(
+                member_input
+                for member_input in member_inputs
+                if member_input.member_index != seed_member_input.member_index
+            ),
+            max_workers=max_workers,
         )
+    )
 
     placements_by_index = {
         placement.member.member_index: placement for placement in placements
@@ -149,94 +164,162 @@ def assemble_trimmed_multi(
     included_placements = tuple(
         placement for placement in ordered_placements if placement.member.included
     )
-    included_member_indices = tuple(
-        placement.member.member_index for placement in included_placements
-    )
-
+    tables_by_member_index = {
+        placement.member.member_index: placement.tables
+        for placement in included_placements
+        if placement.tables is not None
+    }
+    merger = InsertionBucketMerger(resolved_aligner)
     bucket_columns_by_index = {
         bucket_index: _resolve_multi_insertion_bucket(
-            bucket_cells_by_member={
-                placement.member.member_index: placement.insertion_cells_by_bucket.get(
-                    bucket_index, ()
-                )
-                for placement in included_placements
-            },
-            included_member_indices=included_member_indices,
-            aligner=resolved_aligner,
+            bucket_query_indices_by_member=bucket_query_indices_by_member,
+            tables_by_member_index=tables_by_member_index,
+            merger=merger,
+        )
+        for bucket_index, bucket_query_indices_by_member in (
+            _sparse_multi_insertion_buckets(included_placements).items()
         )
-        for bucket_index in range(len(seed_sequence) + 1)
     }
 
-    aligned_sequences_by_member_index: dict[int, list[str]] = {
-        member_index: [] for member_index in included_member_indices
-    }
-    columns: list[MultiAssemblyColumn] = []
-    column_index = 1
-
-    for bucket_index in range(len(seed_sequence) + 1):
-        for bucket_column in bucket_columns_by_index[bucket_index]:
-            column = _build_multi_assembly_column(
-                column_index=column_index,
-                column_cells_by_member=bucket_column,
-                included_member_indices=included_member_indices,
-                quality_margin=resolved_config.quality_margin,
-            )
-            if column is None:
-                continue
-            columns.append(column)
-            for member_cell in column.member_cells:
-                aligned_sequences_by_member_index[member_cell.member_index].append(
-                    member_cell.base
-                )
-            column_index += 1
-        if bucket_index >= len(seed_sequence):
-            continue
-        column = _build_multi_assembly_column(
-            column_index=column_index,
-            column_cells_by_member={
-                placement.member.member_index: placement.seed_column_cells[bucket_index]
-                for placement in included_placements
-            },
-            included_member_indices=included_member_indices,
+    grid = _build_multi_assembly_grid(
+        included_placements=included_placements,
+        bucket_columns_by_index=bucket_columns_by_index,
+        quality_margin=resolved_config.quality_margin,
+    )
+
+    return _multi_assembly_result(
+        members=tuple(placement.member for placement in ordered_placements),
+        seed_member_index=seed_member_input.member_index,
+        grid=grid,
+    )
+
+
+def add_member_to_multi_assembly(
+    result: MultiAssemblyResult,
+    *,
+    source_filename: str,
+    raw_records_by_source_filename: dict[str, SequenceRecord],
+    trim_results_by_source_filename: dict[str, TrimResult],
+    config: AssemblyConfig | None = None,
+    aligner: Align.PairwiseAligner | None = None,
+) -> MultiAssemblyResult:
+    """Add one trimmed read to an existing multi-read assembly.
+
+    The new read is placed against the current seed and spliced into the
+    grid; existing members are not re-placed. Its insertions are folded into
+    the existing insertion columns of each bucket with
+    ``InsertionBucketMerger``, as if it were merged last there. Only when
+    the new read would become the seed (or there is no seed yet) is the
+    assembly rebuilt with ``assemble_trimmed_multi``, so the record mappings
+    must cover every current member as well as ``source_filename``.
+    """
+    resolved_config = AssemblyConfig() if config is None else config
+    resolved_aligner = (
+        shared_semiglobal_aligner(
+            match_score=resolved_config.match_score,
+            mismatch_score=resolved_config.mismatch_score,
+            open_internal_gap_score=resolved_config.open_internal_gap_score,
+            extend_internal_gap_score=resolved_config.extend_internal_gap_score,
+        )
+        if aligner is None
+        else aligner
+    )
+    rebuild = partial(
+        assemble_trimmed_multi,
+        source_filenames=(
+            *(member.source_filename for member in result.members),
+            source_filename,
+        ),
+        raw_records_by_source_filename=raw_records_by_source_filename,
+        trim_results_by_source_filename=trim_results_by_source_filename,
+        config=resolved_config,
+        aligner=resolved_aligner,
+    )
+    seed_member = next(
+        (member for member in result.members if member.is_seed and member.included),
+        None,
+    )
+    if seed_member is None or not result.grid.column_count:
+        return rebuild()
+
+    seed_prepared_read, new_prepared_read = prepare_trimmed_reads(
+        source_filenames=(seed_member.source_filename, source_filename),
+        raw_records_by_source_filename=raw_records_by_source_filename,
+        trim_results_by_source_filename=trim_results_by_source_filename,
+    )
+    seed_member_input = _resolved_multi_member_input(
+        member_index=seed_member.member_index,
+        prepared_read=seed_prepared_read,
+    )
+    new_member_input = _resolved_multi_member_input(
+        member_index=len(result.members),
+        prepared_read=new_prepared_read,
+    )
+    if _select_multi_seed_member((seed_member_input, new_member_input)) is (
+        new_member_input
+    ):
+        return rebuild()
+
+    placement = _place_member_against_multi_seed(
+        seed_member_input=seed_member_input,
+        member_input=new_member_input,
+        config=resolved_config,
+        aligner=resolved_aligner,
+    )
+    grid = result.grid
+    if placement.member.included and placement.tables is not None:
+        grid = _splice_multi_member_into_grid(
+            grid,
+            placement=placement,
+            tables=placement.tables,
+            seed_column_positions=np.flatnonzero(
+                grid.query_indices[grid.row_position(seed_member.member_index)]
+                != GRID_MISSING
+            ),
+            merger=InsertionBucketMerger(resolved_aligner),
             quality_margin=resolved_config.quality_margin,
         )
-        if column is None:
-            continue
-        columns.append(column)
-        for member_cell in column.member_cells:
-            aligned_sequences_by_member_index[member_cell.member_index].append(
-                member_cell.base
-            )
-        column_index += 1
+    return _multi_assembly_result(
+        members=(*result.members, placement.member),
+        seed_member_index=result.seed_member_index,
+        grid=grid,
+    )
 
-    gapped_consensus = "".join(column.consensus_base for column in columns)
-    consensus_sequence = "".join(base for base in gapped_consensus if base != "-")
-    ambiguous_column_count = sum(column.ambiguous for column in columns)
-    included_member_count = len(included_member_indices)
+
+def _multi_assembly_result(
+    *,
+    members: tuple[MultiAssemblyMember, ...],
+    seed_member_index: int,
+    grid: MultiAssemblyGrid,
+) -> MultiAssemblyResult:
+    gapped_consensus = grid.consensus_codes.tobytes().decode("ascii")
+    consensus_sequence = gapped_consensus.replace("-", "")
+    ambiguous_column_count = int(np.count_nonzero(grid.consensus_codes == ord("N")))
+    included_member_count = len(grid.member_indices)
     rejected_reason = None
     accepted = True
     if included_member_count < 2:
         accepted = False
         rejected_reason = "fewer than 2 members passed placement thresholds"
-    elif not columns or not consensus_sequence:
+    elif not grid.column_count or not consensus_sequence:
         accepted = False
         rejected_reason = "no consensus columns could be derived"
 
     return MultiAssemblyResult(
-        members=tuple(placement.member for placement in ordered_placements),
-        seed_member_index=seed_member_input.member_index,
+        members=members,
+        seed_member_index=seed_member_index,
         accepted=accepted,
         rejection_reason=rejected_reason,
-        included_member_indices=included_member_indices,
+        included_member_indices=grid.member_indices,
         aligned_member_sequences=tuple(
-            "".join(aligned_sequences_by_member_index[member_index])
-            for member_index in included_member_indices
+            grid.aligned_sequence(row_position)
+            for row_position in range(included_member_count)
         ),
         gapped_consensus=gapped_consensus,
         consensus_sequence=consensus_sequence,
-        columns=tuple(columns),
+        grid=grid,
         included_member_count=included_member_count,
-        excluded_member_count=len(member_inputs) - included_member_count,
+        excluded_member_count=len(members) - included_member_count,
         ambiguous_column_count=ambiguous_column_count,
     )
 
@@ -276,21 +359,6 @@ def _select_multi_seed_member(
 def _build_seed_multi_member(
     seed_member_input: _ResolvedMultiMemberInput,
 ) -> _PlacedMultiMember:
-    seed_oriented_qualities = oriented_qualities(
-        seed_member_input.display_qualities,
-        strand="forward",
-    )
-    seed_column_cells = tuple(
-        _projected_multi_cell(
-            raw_record=seed_member_input.raw_record,
-            trim_result=seed_member_input.trim_result,
-            strand="forward",
-            base=base,
-            query_index=query_index,
-            oriented_qualities=seed_oriented_qualities,
-        )
-        for query_index, base in enumerate(seed_member_input.display_sequence)
-    )
     return _PlacedMultiMember(
         member=MultiAssemblyMember(
             member_index=seed_member_input.member_index,
@@ -307,8 +375,19 @@ def _build_seed_multi_member(
             overlap_length=len(seed_member_input.display_sequence),
             percent_identity=100.0,
         ),
-        seed_column_cells=seed_column_cells,
-        insertion_cells_by_bucket={},
+        tables=_oriented_multi_member_tables(
+            member_input=seed_member_input,
+            oriented_sequence=seed_member_input.display_sequence,
+            oriented_qualities=oriented_qualities(
+                seed_member_input.display_qualities,
+                strand="forward",
+            ),
+            strand="forward",
+        ),
+        seed_query_indices=np.arange(
+            len(seed_member_input.display_sequence),
+            dtype=np.int32,
+        ),
     )
 
 
@@ -327,8 +406,21 @@ def _excluded_multi_member_for_empty_sequence(
             has_trace_data=member_input.has_trace_data,
             has_qualities=member_input.has_qualities,
         ),
-        seed_column_cells=(),
-        insertion_cells_by_bucket={},
+    )
+
+
+def _place_multi_member_task(
+    member_input: _ResolvedMultiMemberInput,
+    *,
+    seed_member_input: _ResolvedMultiMemberInput,
+    config: AssemblyConfig,
+    aligner: Align.PairwiseAligner,
+) -> _PlacedMultiMember:
+    return _place_member_against_multi_seed(
+        seed_member_input=seed_member_input,
+        member_input=member_input,
+        config=config,
+        aligner=aligner,
     )
 
 
@@ -362,8 +454,6 @@ def _place_member_against_multi_seed(
                 has_trace_data=member_input.has_trace_data,
                 has_qualities=member_input.has_qualities,
             ),
-            seed_column_cells=(),
-            insertion_cells_by_bucket={},
         )
 
     overlap_length, percent_identity = alignment_overlap_metrics(
@@ -392,17 +482,13 @@ def _place_member_against_multi_seed(
                 overlap_length=overlap_length,
                 percent_identity=percent_identity,
             ),
-            seed_column_cells=(),
-            insertion_cells_by_bucket={},
         )
 
-    seed_column_cells, insertion_cells_by_bucket = _project_member_against_seed(
-        alignment=best_member_alignment.alignment,
-        member_input=member_input,
-        oriented_sequence=best_member_alignment.sequence,
-        oriented_qualities=best_member_alignment.qualities,
-        strand=best_member_alignment.strand,
-        seed_length=len(seed_member_input.display_sequence),
+    seed_query_indices, insertion_query_indices_by_bucket = (
+        _project_member_against_seed(
+            alignment=best_member_alignment.alignment,
+            seed_length=len(seed_member_input.display_sequence),
+        )
     )
     return _PlacedMultiMember(
         member=MultiAssemblyMember(
@@ -419,8 +505,14 @@ def _place_member_against_multi_seed(
             overlap_length=overlap_length,
             percent_identity=percent_identity,
         ),
-        seed_column_cells=seed_column_cells,
-        insertion_cells_by_bucket=insertion_cells_by_bucket,
+        tables=_oriented_multi_member_tables(
+            member_input=member_input,
+            oriented_sequence=best_member_alignment.sequence,
+            oriented_qualities=best_member_alignment.qualities,
+            strand=best_member_alignment.strand,
+        ),
+        seed_query_indices=seed_query_indices,
+        insertion_query_indices_by_bucket=insertion_query_indices_by_bucket,
     )
 
 
@@ -448,282 +540,334 @@ def _multi_member_rejection_reason(
 def _project_member_against_seed(
     *,
     alignment,
-    member_input: _ResolvedMultiMemberInput,
-    oriented_sequence: str,
-    oriented_qualities: list[int] | None,
-    strand: AssemblyStrand,
     seed_length: int,
-) -> tuple[tuple[_ProjectedMultiCell, ...], dict[int, tuple[_ProjectedMultiCell, ...]]]:
-    seed_column_cells: list[_ProjectedMultiCell] = [
-        _gap_multi_projected_cell() for _ in range(seed_length)
-    ]
-    insertion_cells_by_bucket: dict[int, list[_ProjectedMultiCell]] = {}
-    last_seed_index = -1
-
-    for target_index, query_index in zip(
-        alignment.indices[0],
-        alignment.indices[1],
+) -> tuple[np.ndarray, dict[int, tuple[int, ...]]]:
+    target_indices = np.asarray(alignment.indices[0], dtype=np.int64)
+    query_indices = np.asarray(alignment.indices[1], dtype=np.int64)
+
+    seed_query_indices = np.full(seed_length, GRID_MISSING, dtype=np.int32)
+    aligned_mask = (target_indices >= 0) & (query_indices >= 0)
+    seed_query_indices[target_indices[aligned_mask]] = query_indices[aligned_mask]
+
+    insertion_mask = (target_indices < 0) & (query_indices >= 0)
+    insertion_buckets = np.maximum.accumulate(target_indices)[insertion_mask] + 1
+    insertion_query_indices_by_bucket: dict[int, list[int]] = {}
+    for bucket_index, query_index in zip(
+        insertion_buckets.tolist(),
+        query_indices[insertion_mask].tolist(),
         strict=True,
     ):
-        resolved_target_index = int(target_index)
-        resolved_query_index = int(query_index)
-
-        if resolved_target_index >= 0:
-            last_seed_index = resolved_target_index
-            if resolved_query_index < 0:
-                continue
-            seed_column_cells[resolved_target_index] = _projected_multi_cell(
-                raw_record=member_input.raw_record,
-                trim_result=member_input.trim_result,
-                strand=strand,
-                base=oriented_sequence[resolved_query_index],
-                query_index=resolved_query_index,
-                oriented_qualities=oriented_qualities,
-            )
-            continue
-
-        if resolved_query_index < 0:
-            continue
-        bucket_index = last_seed_index + 1
-        insertion_cells_by_bucket.setdefault(bucket_index, []).append(
-            _projected_multi_cell(
-                raw_record=member_input.raw_record,
-                trim_result=member_input.trim_result,
-                strand=strand,
-                base=oriented_sequence[resolved_query_index],
-                query_index=resolved_query_index,
-                oriented_qualities=oriented_qualities,
-            )
+        insertion_query_indices_by_bucket.setdefault(bucket_index, []).append(
+            query_index
         )
 
     return (
-        tuple(seed_column_cells),
+        seed_query_indices,
         {
-            bucket_index: tuple(cells)
-            for bucket_index, cells in insertion_cells_by_bucket.items()
+            bucket_index: tuple(bucket_query_indices)
+            for bucket_index, bucket_query_indices in (
+                insertion_query_indices_by_bucket.items()
+            )
         },
     )
 
 
-def _projected_multi_cell(
+def _oriented_multi_member_tables(
     *,
-    raw_record: SequenceRecord,
-    trim_result: TrimResult,
-    strand: AssemblyStrand,
-    base: str,
-    query_index: int,
+    member_input: _ResolvedMultiMemberInput,
+    oriented_sequence: str,
     oriented_qualities: list[int] | None,
-) -> _ProjectedMultiCell:
-    return _ProjectedMultiCell(
-        base=base,
-        query_index=query_index,
-        query_pos=query_index + 1,
-        quality=(
-            None if oriented_qualities is None else int(oriented_qualities[query_index])
+    strand: AssemblyStrand,
+) -> _OrientedMultiMemberTables:
+    trace_positions = trace_positions_for_oriented_query_indices(
+        raw_record=member_input.raw_record,
+        trim_result=member_input.trim_result,
+        strand=strand,
+    )
+    return _OrientedMultiMemberTables(
+        base_codes=np.frombuffer(oriented_sequence.encode("ascii"), dtype=np.uint8),
+        qualities=(
+            np.full(len(oriented_sequence), GRID_MISSING, dtype=np.int32)
+            if oriented_qualities is None
+            else np.asarray(oriented_qualities, dtype=np.int32)
         ),
-        trace_x=trace_position_for_oriented_query_index(
-            raw_record=raw_record,
-            trim_result=trim_result,
-            oriented_query_index=query_index,
-            strand=strand,
+        trace_x=np.asarray(
+            [
+                GRID_MISSING if trace_position is None else trace_position
+                for trace_position in trace_positions
+            ],
+            dtype=np.int32,
         ),
-        is_gap=False,
     )
 
 
-def _gap_multi_projected_cell() -> _ProjectedMultiCell:
-    return _ProjectedMultiCell(
-        base="-",
-        query_index=None,
-        query_pos=None,
-        quality=None,
-        trace_x=None,
-        is_gap=True,
-    )
+def _sparse_multi_insertion_buckets(
+    placements: tuple[_PlacedMultiMember, ...],
+) -> dict[int, dict[int, tuple[int, ...]]]:
+    bucket_query_indices_by_index: dict[int, dict[int, tuple[int, ...]]] = {}
+    for placement in placements:
+        for bucket_index, query_indices in (
+            placement.insertion_query_indices_by_bucket.items()
+        ):
+            bucket_query_indices_by_index.setdefault(bucket_index, {})[
+                placement.member.member_index
+            ] = query_indices
+    return dict(sorted(bucket_query_indices_by_index.items()))
 
 
 def _resolve_multi_insertion_bucket(
     *,
-    bucket_cells_by_member: dict[int, tuple[_ProjectedMultiCell, ...]],
-    included_member_indices: tuple[int, ...],
-    aligner: Align.PairwiseAligner,
-) -> tuple[dict[int, _ProjectedMultiCell], ...]:
-    non_empty_bucket_cells = [
-        (member_index, cells)
-        for member_index, cells in bucket_cells_by_member.items()
-        if cells
-    ]
-    if not non_empty_bucket_cells:
-        return ()
-
-    non_empty_bucket_cells.sort(key=lambda item: (-len(item[1]), item[0]))
-    anchor_member_index, anchor_cells = non_empty_bucket_cells[0]
-    resolved_columns = [{anchor_member_index: cell} for cell in anchor_cells]
-    for member_index, member_cells in non_empty_bucket_cells[1:]:
-        resolved_columns = _merge_multi_bucket_member_cells(
-            resolved_columns,
-            member_index=member_index,
-            member_cells=member_cells,
-            aligner=aligner,
-        )
-
-    for resolved_column in resolved_columns:
-        for member_index in included_member_indices:
-            resolved_column.setdefault(member_index, _gap_multi_projected_cell())
-
-    return tuple(resolved_columns)
-
-
-def _merge_multi_bucket_member_cells(
-    resolved_columns: list[dict[int, _ProjectedMultiCell]],
-    *,
-    member_index: int,
-    member_cells: tuple[_ProjectedMultiCell, ...],
-    aligner: Align.PairwiseAligner,
-) -> list[dict[int, _ProjectedMultiCell]]:
-    representative_sequence = "".join(
-        _multi_bucket_column_representative(resolved_column)
-        for resolved_column in resolved_columns
-    )
-    member_sequence = "".join(cell.base for cell in member_cells)
-    if not representative_sequence:
-        return [{member_index: cell} for cell in member_cells]
-
-    alignment = aligner.align(representative_sequence, member_sequence)[0]
-    merged_columns: list[dict[int, _ProjectedMultiCell]] = []
-    for target_index, query_index in zip(
-        alignment.indices[0],
-        alignment.indices[1],
-        strict=True,
-    ):
-        resolved_target_index = int(target_index)
-        resolved_query_index = int(query_index)
-        if resolved_target_index >= 0:
-            merged_column = dict(resolved_columns[resolved_target_index])
-            merged_column[member_index] = (
-                _gap_multi_projected_cell()
-                if resolved_query_index < 0
-                else member_cells[resolved_query_index]
+    bucket_query_indices_by_member: dict[int, tuple[int, ...]],
+    tables_by_member_index: dict[int, _OrientedMultiMemberTables],
+    merger: InsertionBucketMerger,
+) -> tuple[dict[int, int], ...]:
+    non_empty_bucket_query_indices = sorted(
+        (
+            (member_index, query_indices)
+            for member_index, query_indices in bucket_query_indices_by_member.items()
+            if query_indices
+        ),
+        key=lambda item: (-len(item[1]), item[0]),
+    )
+    merged_columns = merger.merge(
+        [
+            tables_by_member_index[member_index]
+            .base_codes[list(query_indices)]
+            .tobytes()
+            .decode("ascii")
+            for member_index, query_indices in non_empty_bucket_query_indices
+        ]
+    )
+    return tuple(
+        {
+            non_empty_bucket_query_indices[sequence_position][0]: (
+                non_empty_bucket_query_indices[sequence_position][1][base_offset]
             )
-            merged_columns.append(merged_column)
-            continue
-        if resolved_query_index < 0:
-            continue
-        merged_columns.append({member_index: member_cells[resolved_query_index]})
-    return merged_columns
-
-
-def _multi_bucket_column_representative(
-    resolved_column: dict[int, _ProjectedMultiCell],
-) -> str:
-    bases = [
-        cell.base
-        for cell in resolved_column.values()
-        if not cell.is_gap and cell.base != "-"
-    ]
-    if not bases:
-        return "N"
-    base_counts = Counter(bases)
-    return sorted(
-        base_counts.items(),
-        key=lambda item: (-item[1], item[0]),
-    )[
-        0
-    ][0]
+            for sequence_position, base_offset in merged_column.items()
+        }
+        for merged_column in merged_columns
+    )
 
 
-def _build_multi_assembly_column(
+def _multi_insertion_bucket_bounds(
+    bucket_index: int,
     *,
-    column_index: int,
-    column_cells_by_member: dict[int, _ProjectedMultiCell],
-    included_member_indices: tuple[int, ...],
-    quality_margin: int,
-) -> MultiAssemblyColumn | None:
-    ordered_projected_cells = tuple(
-        column_cells_by_member.get(member_index, _gap_multi_projected_cell())
-        for member_index in included_member_indices
+    seed_column_positions: np.ndarray,
+    column_count: int,
+) -> tuple[int, int]:
+    bucket_start = (
+        0 if bucket_index == 0 else int(seed_column_positions[bucket_index - 1]) + 1
     )
-    non_gap_projected_cells = tuple(
-        cell for cell in ordered_projected_cells if not cell.is_gap and cell.base != "-"
+    bucket_end = (
+        column_count
+        if bucket_index >= len(seed_column_positions)
+        else int(seed_column_positions[bucket_index])
     )
-    if not non_gap_projected_cells:
-        return None
+    return bucket_start, bucket_end
+
 
-    support_counts: Counter[str] = Counter(
-        cell.base for cell in non_gap_projected_cells
+def _splice_multi_member_into_grid(
+    grid: MultiAssemblyGrid,
+    *,
+    placement: _PlacedMultiMember,
+    tables: _OrientedMultiMemberTables,
+    seed_column_positions: np.ndarray,
+    merger: InsertionBucketMerger,
+    quality_margin: int,
+) -> MultiAssemblyGrid:
+    column_count = grid.column_count
+    new_row_query_indices = np.full(column_count, GRID_MISSING, dtype=np.int32)
+    new_row_query_indices[seed_column_positions] = placement.seed_query_indices
+
+    # Each output column is either an existing grid column (with the new
+    # member's query index or a gap) or a new insertion column only the new
+    # member fills; ``-1`` sources mark the new columns.
+    source_columns: list[np.ndarray] = []
+    spliced_query_indices: list[np.ndarray] = []
+    next_column = 0
+    for bucket_index, member_query_indices in sorted(
+        placement.insertion_query_indices_by_bucket.items()
+    ):
+        bucket_start, bucket_end = _multi_insertion_bucket_bounds(
+            bucket_index,
+            seed_column_positions=seed_column_positions,
+            column_count=column_count,
+        )
+        source_columns.append(np.arange(next_column, bucket_start))
+        spliced_query_indices.append(new_row_query_indices[next_column:bucket_start])
+        index_pairs = merger.place(
+            [
+                _grid_column_bases(grid, column_position)
+                for column_position in range(bucket_start, bucket_end)
+            ],
+            tables.base_codes[list(member_query_indices)].tobytes().decode("ascii"),
+        )
+        source_columns.append(
+            np.asarray(
+                [
+                    -1 if column_offset < 0 else bucket_start + column_offset
+                    for column_offset, _ in index_pairs
+                ],
+                dtype=np.int64,
+            )
+        )
+        spliced_query_indices.append(
+            np.asarray(
+                [
+                    (
+                        GRID_MISSING
+                        if base_offset < 0
+                        else member_query_indices[base_offset]
+                    )
+                    for _, base_offset in index_pairs
+                ],
+                dtype=np.int32,
+            )
+        )
+        next_column = bucket_end
+    source_columns.append(np.arange(next_column, column_count))
+    spliced_query_indices.append(new_row_query_indices[next_column:])
+
+    column_sources = np.concatenate(source_columns).astype(np.int64)
+    new_query_indices = np.concatenate(spliced_query_indices).astype(np.int32)
+    query_indices = np.vstack(
+        [
+            _gather_grid_columns(grid.query_indices, column_sources, GRID_MISSING),
+            new_query_indices,
+        ]
     )
-    quality_sums: dict[str, int] = {}
-    for cell in non_gap_projected_cells:
-        quality_sums[cell.base] = quality_sums.get(cell.base, 0) + int(
-            0 if cell.quality is None else cell.quality
+    base_codes, qualities, trace_x = (
+        np.vstack(
+            [
+                _gather_grid_columns(grid_matrix, column_sources, fill_value),
+                _member_grid_row(member_values, new_query_indices, fill_value),
+            ]
         )
-
-    consensus_base, resolution = _resolve_multi_consensus_column(
-        support_counts=support_counts,
-        quality_sums=quality_sums,
+        for grid_matrix, member_values, fill_value in (
+            (grid.base_codes, tables.base_codes, GRID_GAP_CODE),
+            (grid.qualities, tables.qualities, GRID_MISSING),
+            (grid.trace_x, tables.trace_x, GRID_MISSING),
+        )
+    )
+    consensus = call_column_consensus(
+        base_codes=base_codes,
+        qualities=qualities,
+        gap_mask=query_indices == GRID_MISSING,
         quality_margin=quality_margin,
     )
-    return MultiAssemblyColumn(
-        column_index=column_index,
-        consensus_base=consensus_base,
-        resolution=resolution,
-        member_cells=tuple(
-            MultiAssemblyMemberCell(
-                member_index=member_index,
-                base=projected_cell.base,
-                query_index=projected_cell.query_index,
-                query_pos=projected_cell.query_pos,
-                quality=projected_cell.quality,
-                trace_x=projected_cell.trace_x,
-                is_gap=projected_cell.is_gap,
-            )
-            for member_index, projected_cell in zip(
-                included_member_indices,
-                ordered_projected_cells,
-                strict=True,
-            )
-        ),
-        support_counts=tuple(
-            sorted(
-                support_counts.items(),
-                key=lambda item: (-item[1], item[0]),
-            )
-        ),
-        quality_sums=tuple(sorted(quality_sums.items())),
-        non_gap_member_count=len(non_gap_projected_cells),
-        gap_member_count=len(ordered_projected_cells) - len(non_gap_projected_cells),
-        ambiguous=consensus_base == "N",
+    return MultiAssemblyGrid(
+        member_indices=(*grid.member_indices, placement.member.member_index),
+        base_codes=base_codes,
+        query_indices=query_indices,
+        qualities=qualities,
+        trace_x=trace_x,
+        consensus_codes=consensus.consensus_codes,
+        resolution_codes=consensus.resolution_codes,
     )
 
 
-def _resolve_multi_consensus_column(
+def _grid_column_bases(grid: MultiAssemblyGrid, column_position: int) -> str:
+    present = grid.query_indices[:, column_position] != GRID_MISSING
+    return grid.base_codes[present, column_position].tobytes().decode("ascii")
+
+
+def _member_grid_row(
+    member_values: np.ndarray,
+    query_indices: np.ndarray,
+    fill_value: int,
+) -> np.ndarray:
+    present = query_indices != GRID_MISSING
+    row = np.full(query_indices.shape, fill_value, dtype=member_values.dtype)
+    row[present] = member_values[query_indices[present]]
+    return row
+
+
+def _gather_grid_columns(
+    matrix: np.ndarray,
+    column_sources: np.ndarray,
+    fill_value: int,
+) -> np.ndarray:
+    new_column_mask = column_sources < 0
+    gathered = matrix[:, np.where(new_column_mask, 0, column_sources)]
+    gathered[:, new_column_mask] = fill_value
+    return gathered
+
+
+def _build_multi_assembly_grid(
     *,
-    support_counts: Counter[str],
-    quality_sums: dict[str, int],
+    included_placements: tuple[_PlacedMultiMember, ...],
+    bucket_columns_by_index: dict[int, tuple[dict[int, int], ...]],
     quality_margin: int,
-) -> tuple[str, ConflictResolution]:
-    ranked_bases = sorted(
-        support_counts,
-        key=lambda base: (-support_counts[base], -quality_sums.get(base, 0), base),
+) -> MultiAssemblyGrid:
+    member_indices = tuple(
+        placement.member.member_index for placement in included_placements
     )
-    if len(ranked_bases) == 1:
-        base = ranked_bases[0]
-        return (
-            (base, "single_read") if support_counts[base] == 1 else (base, "concordant")
+    row_position_by_member_index = {
+        member_index: row_position
+        for row_position, member_index in enumerate(member_indices)
+    }
+    seed_query_indices = np.stack(
+        [placement.seed_query_indices for placement in included_placements]
+    )
+
+    query_index_blocks: list[np.ndarray] = []
+    previous_bucket_index = 0
+    for bucket_index in sorted(bucket_columns_by_index):
+        bucket_columns = bucket_columns_by_index[bucket_index]
+        if not bucket_columns:
+            continue
+        query_index_blocks.append(
+            seed_query_indices[:, previous_bucket_index:bucket_index]
+        )
+        insertion_block = np.full(
+            (len(member_indices), len(bucket_columns)),
+            GRID_MISSING,
+            dtype=np.int32,
         )
+        for column_offset, bucket_column in enumerate(bucket_columns):
+            for member_index, query_index in bucket_column.items():
+                insertion_block[
+                    row_position_by_member_index[member_index],
+                    column_offset,
+                ] = query_index
+        query_index_blocks.append(insertion_block)
+        previous_bucket_index = bucket_index
+    query_index_blocks.append(seed_query_indices[:, previous_bucket_index:])
+
+    query_indices = np.concatenate(query_index_blocks, axis=1)
+    query_indices = query_indices[:, (query_indices != GRID_MISSING).any(axis=0)]
+    gap_mask = query_indices == GRID_MISSING
+    lookup_indices = np.where(gap_mask, 0, query_indices)
+
+    base_codes = np.full(query_indices.shape, GRID_GAP_CODE, dtype=np.uint8)
+    qualities = np.full(query_indices.shape, GRID_MISSING, dtype=np.int32)
+    trace_x = np.full(query_indices.shape, GRID_MISSING, dtype=np.int32)
+    for row_position, placement in enumerate(included_placements):
+        tables = placement.tables
+        if tables is None:
+            continue
+        row_present = ~gap_mask[row_position]
+        row_lookup = lookup_indices[row_position][row_present]
+        base_codes[row_position, row_present] = tables.base_codes[row_lookup]
+        qualities[row_position, row_present] = tables.qualities[row_lookup]
+        trace_x[row_position, row_present] = tables.trace_x[row_lookup]
+
+    consensus = call_column_consensus(
+        base_codes=base_codes,
+        qualities=qualities,
+        gap_mask=gap_mask,
+        quality_margin=quality_margin,
+    )
 
-    top_base = ranked_bases[0]
-    next_base = ranked_bases[1]
-    top_support = support_counts[top_base]
-    next_support = support_counts[next_base]
-    top_quality = quality_sums.get(top_base, 0)
-    next_quality = quality_sums.get(next_base, 0)
-
-    if top_support > next_support:
-        return top_base, "majority_resolved"
-    if (top_quality - next_quality) >= quality_margin:
-        return top_base, "quality_resolved"
-    return "N", "ambiguous"
+    return MultiAssemblyGrid(
+        member_indices=member_indices,
+        base_codes=base_codes,
+        query_indices=query_indices,
+        qualities=qualities,
+        trace_x=trace_x,
+        consensus_codes=consensus.consensus_codes,
+        resolution_codes=consensus.resolution_codes,
+    )
 
 
 def _mean_quality(qualities: list[int] | None) -> float:
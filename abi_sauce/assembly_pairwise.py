@@ -1,25 +1,30 @@
 from __future__ import annotations
 
 from Bio import Align
+import numpy as np
 
 from abi_sauce.alignment_policy import (
     build_semiglobal_aligner,
     oriented_qualities,
     select_best_oriented_alignment,
+    shared_semiglobal_aligner,
 )
 from abi_sauce.assembly_types import (
+    CONFLICT_RESOLUTIONS,
     AssemblyColumn,
     AssemblyConfig,
     AssemblyConflict,
     AssemblyResult,
     AssemblyStrand,
-    ConflictResolution,
 )
 from abi_sauce.models import SequenceRecord
 from abi_sauce.oriented_reads import prepare_trimmed_read
-from abi_sauce.trace_coordinates import trace_position_for_oriented_query_index
+from abi_sauce.trace_coordinates import trace_positions_for_oriented_query_indices
 from abi_sauce.trimming import TrimResult
 
+_GAP_CODE = ord("-")
+_N_CODE = ord("N")
+
 
 def build_assembly_aligner(
     *,
@@ -51,7 +56,7 @@ def assemble_trimmed_pair(
     """Assemble two currently trimmed reads into one consensus result."""
     resolved_config = AssemblyConfig() if config is None else config
     resolved_aligner = (
-        build_assembly_aligner(
+        shared_semiglobal_aligner(
             match_score=resolved_config.match_score,
             mismatch_score=resolved_config.mismatch_score,
             open_internal_gap_score=resolved_config.open_internal_gap_score,
@@ -180,118 +185,135 @@ def _extract_assembly_result(
     quality_margin: int,
     score: float,
 ) -> AssemblyResult:
-    target_indices = alignment.indices[0]
-    query_indices = alignment.indices[1]
+    target_indices = np.asarray(alignment.indices[0], dtype=np.int64)
+    query_indices = np.asarray(alignment.indices[1], dtype=np.int64)
+    left_present = target_indices >= 0
+    right_present = query_indices >= 0
+    overlap_mask = left_present & right_present
+
+    left_codes = _gapped_base_codes(left_oriented_sequence, target_indices)
+    right_codes = _gapped_base_codes(right_oriented_sequence, query_indices)
+    left_qualities, left_has_quality = _gapped_qualities(
+        left_oriented_qualities,
+        target_indices,
+    )
+    right_qualities, right_has_quality = _gapped_qualities(
+        right_oriented_qualities,
+        query_indices,
+    )
+    match_mask = overlap_mask & (left_codes == right_codes)
+    mismatch_mask = overlap_mask & ~match_mask
+
+    quality_resolvable = (
+        mismatch_mask
+        & left_has_quality
+        & right_has_quality
+        & (np.abs(left_qualities - right_qualities) >= quality_margin)
+    )
+    consensus_codes = np.full(len(target_indices), _N_CODE, dtype=np.uint8)
+    resolution_codes = np.full(
+        len(target_indices),
+        CONFLICT_RESOLUTIONS.index("ambiguous"),
+        dtype=np.int8,
+    )
+    consensus_codes[match_mask] = left_codes[match_mask]
+    resolution_codes[match_mask] = CONFLICT_RESOLUTIONS.index("concordant")
+    consensus_codes[quality_resolvable] = np.where(
+        left_qualities > right_qualities,
+        left_codes,
+        right_codes,
+    )[quality_resolvable]
+    resolution_codes[quality_resolvable] = CONFLICT_RESOLUTIONS.index(
+        "quality_resolved"
+    )
+    for single_mask, codes in (
+        (left_present & ~right_present, left_codes),
+        (right_present & ~left_present, right_codes),
+    ):
+        consensus_codes[single_mask] = codes[single_mask]
+        resolution_codes[single_mask] = CONFLICT_RESOLUTIONS.index("single_read")
+
+    gapped_consensus_codes = np.where(
+        left_present | right_present,
+        consensus_codes,
+        _GAP_CODE,
+    ).astype(np.uint8)
+    match_line_codes = np.full(len(target_indices), ord(" "), dtype=np.uint8)
+    match_line_codes[match_mask] = ord("|")
+    match_line_codes[mismatch_mask] = ord(".")
+
+    left_trace_table = trace_positions_for_oriented_query_indices(
+        raw_record=left_raw_record,
+        trim_result=left_trim_result,
+        strand="forward",
+    )
+    right_trace_table = trace_positions_for_oriented_query_indices(
+        raw_record=right_raw_record,
+        trim_result=right_trim_result,
+        strand=chosen_right_orientation,
+    )
+
+    aligned_left = left_codes.tobytes().decode("ascii")
+    aligned_right = right_codes.tobytes().decode("ascii")
+    consensus_bases = consensus_codes.tobytes().decode("ascii")
+    gapped_consensus = gapped_consensus_codes.tobytes().decode("ascii")
 
-    aligned_left_chars: list[str] = []
-    aligned_right_chars: list[str] = []
-    match_line_chars: list[str] = []
-    gapped_consensus_chars: list[str] = []
     columns: list[AssemblyColumn] = []
     conflicts: list[AssemblyConflict] = []
-
-    overlap_length = 0
-    match_count = 0
-    mismatch_count = 0
-
-    for column_index, (target_index, query_index) in enumerate(
-        zip(target_indices, query_indices, strict=True),
-        start=1,
+    for (
+        column_index,
+        target_index,
+        query_index,
+        left_quality,
+        left_has_quality_value,
+        right_quality,
+        right_has_quality_value,
+        resolution_code,
+        is_overlap,
+        is_match,
+    ) in zip(
+        range(1, len(target_indices) + 1),
+        target_indices.tolist(),
+        query_indices.tolist(),
+        left_qualities.tolist(),
+        left_has_quality.tolist(),
+        right_qualities.tolist(),
+        right_has_quality.tolist(),
+        resolution_codes.tolist(),
+        overlap_mask.tolist(),
+        match_mask.tolist(),
+        strict=True,
     ):
-        resolved_target_index = int(target_index)
-        resolved_query_index = int(query_index)
-
-        left_base = (
-            "-"
-            if resolved_target_index < 0
-            else left_oriented_sequence[resolved_target_index]
-        )
-        right_base = (
-            "-"
-            if resolved_query_index < 0
-            else right_oriented_sequence[resolved_query_index]
-        )
-        aligned_left_chars.append(left_base)
-        aligned_right_chars.append(right_base)
-
-        left_quality = (
-            None
-            if resolved_target_index < 0 or left_oriented_qualities is None
-            else int(left_oriented_qualities[resolved_target_index])
-        )
-        right_quality = (
-            None
-            if resolved_query_index < 0 or right_oriented_qualities is None
-            else int(right_oriented_qualities[resolved_query_index])
-        )
-        left_query_pos = (
-            None if resolved_target_index < 0 else resolved_target_index + 1
-        )
-        right_query_pos = None if resolved_query_index < 0 else resolved_query_index + 1
-
-        consensus_base, resolution = _resolve_consensus_column(
-            left_base=left_base,
-            right_base=right_base,
-            left_quality=left_quality,
-            right_quality=right_quality,
-            quality_margin=quality_margin,
-        )
-        gapped_consensus_chars.append(
-            "-" if left_base == "-" and right_base == "-" else consensus_base
-        )
-
-        if left_base != "-" and right_base != "-":
-            overlap_length += 1
-            if left_base == right_base:
-                match_count += 1
-                match_line_chars.append("|")
-            else:
-                mismatch_count += 1
-                match_line_chars.append(".")
-        else:
-            match_line_chars.append(" ")
-
-        left_trace_x = trace_position_for_oriented_query_index(
-            raw_record=left_raw_record,
-            trim_result=left_trim_result,
-            oriented_query_index=(
-                None if resolved_target_index < 0 else resolved_target_index
-            ),
-            strand="forward",
-        )
-        right_trace_x = trace_position_for_oriented_query_index(
-            raw_record=right_raw_record,
-            trim_result=right_trim_result,
-            oriented_query_index=(
-                None if resolved_query_index < 0 else resolved_query_index
-            ),
-            strand=chosen_right_orientation,
-        )
+        left_query_index = None if target_index < 0 else target_index
+        right_query_index = None if query_index < 0 else query_index
         column = AssemblyColumn(
             column_index=column_index,
-            left_base=left_base,
-            right_base=right_base,
-            consensus_base=consensus_base,
-            resolution=resolution,
-            left_query_index=(
-                None if resolved_target_index < 0 else resolved_target_index
+            left_base=aligned_left[column_index - 1],
+            right_base=aligned_right[column_index - 1],
+            consensus_base=consensus_bases[column_index - 1],
+            resolution=CONFLICT_RESOLUTIONS[resolution_code],
+            left_query_index=left_query_index,
+            right_query_index=right_query_index,
+            left_query_pos=None if left_query_index is None else target_index + 1,
+            right_query_pos=None if right_query_index is None else query_index + 1,
+            left_quality=left_quality if left_has_quality_value else None,
+            right_quality=right_quality if right_has_quality_value else None,
+            left_trace_x=(
+                None if left_query_index is None else left_trace_table[target_index]
             ),
-            right_query_index=(
-                None if resolved_query_index < 0 else resolved_query_index
+            right_trace_x=(
+                None if right_query_index is None else right_trace_table[query_index]
             ),
-            left_query_pos=left_query_pos,
-            right_query_pos=right_query_pos,
-            left_quality=left_quality,
-            right_quality=right_quality,
-            left_trace_x=left_trace_x,
-            right_trace_x=right_trace_x,
-            is_overlap=left_base != "-" and right_base != "-",
-            is_match=left_base != "-" and right_base != "-" and left_base == right_base,
+            is_overlap=is_overlap,
+            is_match=is_match,
         )
         columns.append(column)
-        if resolution != "concordant":
+        if column.resolution != "concordant":
             conflicts.append(_conflict_from_column(column))
 
+    overlap_length = int(np.count_nonzero(overlap_mask))
+    match_count = int(np.count_nonzero(match_mask))
+    mismatch_count = overlap_length - match_count
     percent_identity = (match_count / overlap_length) * 100.0 if overlap_length else 0.0
 
     return AssemblyResult(
@@ -306,18 +328,36 @@ def _extract_assembly_result(
         overlap_length=overlap_length,
         percent_identity=percent_identity,
         mismatch_count=mismatch_count,
-        aligned_left="".join(aligned_left_chars),
-        match_line="".join(match_line_chars),
-        aligned_right="".join(aligned_right_chars),
-        gapped_consensus="".join(gapped_consensus_chars),
-        consensus_sequence="".join(
-            base for base in gapped_consensus_chars if base != "-"
-        ),
+        aligned_left=aligned_left,
+        match_line=match_line_codes.tobytes().decode("ascii"),
+        aligned_right=aligned_right,
+        gapped_consensus=gapped_consensus,
+        consensus_sequence=gapped_consensus.replace("-", ""),
         columns=tuple(columns),
         conflicts=tuple(conflicts),
     )
 
 
+def _gapped_base_codes(sequence: str, indices: np.ndarray) -> np.ndarray:
+    sequence_codes = np.frombuffer(sequence.encode("ascii"), dtype=np.uint8)
+    codes = np.full(len(indices), _GAP_CODE, dtype=np.uint8)
+    present = indices >= 0
+    codes[present] = sequence_codes[indices[present]]
+    return codes
+
+
+def _gapped_qualities(
+    qualities: list[int] | None,
+    indices: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    values = np.zeros(len(indices), dtype=np.int64)
+    if qualities is None:
+        return values, np.zeros(len(indices), dtype=bool)
+    present = indices >= 0
+    values[present] = np.asarray(qualities, dtype=np.int64)[indices[present]]
+    return values, present
+
+
 def _conflict_from_column(column: AssemblyColumn) -> AssemblyConflict:
     return AssemblyConflict(
         column_index=column.column_index,
@@ -334,36 +374,6 @@ def _conflict_from_column(column: AssemblyColumn) -> AssemblyConflict:
     )
 
 
-def _resolve_consensus_column(
-    *,
-    left_base: str,
-    right_base: str,
-    left_quality: int | None,
-    right_quality: int | None,
-    quality_margin: int,
-) -> tuple[str, ConflictResolution]:
-    if left_base != "-" and right_base != "-":
-        if left_base == right_base:
-            return left_base, "concordant"
-        if (
-            left_quality is not None
-            and right_quality is not None
-            and abs(left_quality - right_quality) >= quality_margin
-        ):
-            return (
-                (left_base, "quality_resolved")
-                if left_quality > right_quality
-                else (right_base, "quality_resolved")
-            )
-        return "N", "ambiguous"
-
-    if left_base != "-":
-        return left_base, "single_read"
-    if right_base != "-":
-        return right_base, "single_read"
-    return "N", "ambiguous"
-
-
 def _replace_result_acceptance(
     result: AssemblyResult,
     *,
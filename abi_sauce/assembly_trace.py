@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+import hashlib
 import math
+from typing import TypeAlias
+
+import numpy as np
 
 from abi_sauce.assembly_types import (
+    CONFLICT_RESOLUTIONS,
+    GRID_MISSING,
     AssemblyColumn,
     AssemblyResult,
     AssemblyStrand,
     ConflictResolution,
-    MultiAssemblyColumn,
+    MultiAssemblyGrid,
     MultiAssemblyResult,
 )
 from abi_sauce.chromatogram import (
@@ -16,18 +23,33 @@ from abi_sauce.chromatogram import (
     ChromatogramBaseSpan,
     ChromatogramChannel,
     ChromatogramView,
-    build_chromatogram_view,
-    reverse_complement_chromatogram_view,
+    ChromatogramViewCacheKey,
+    build_chromatogram_view_cache_key,
+    build_oriented_chromatogram_view,
+    build_view_fingerprint,
+    chromatogram_signal_envelope,
 )
-from abi_sauce.models import SequenceRecord
-from abi_sauce.signal_sampling import resample_signal_window
+from abi_sauce.lru_cache import LruCache, LruCacheInfo
+from abi_sauce.models import SequenceOrientation, SequenceRecord
+from abi_sauce.signal_envelope import SignalEnvelope
+from abi_sauce.signal_sampling import linspace, resample_signal_windows
 from abi_sauce.trace_coordinates import oriented_trim_interval
 from abi_sauce.trimming import TrimResult
 
+TraceChannelValues: TypeAlias = tuple[str, str, tuple[float, ...], tuple[float, ...]]
+AssemblyTraceRowSourceCacheKey: TypeAlias = tuple[
+    ChromatogramViewCacheKey,
+    SequenceOrientation,
+    AssemblyStrand,
+]
+
 _DEFAULT_SAMPLES_PER_CELL = 16
 _REDUCED_SAMPLES_PER_CELL = 8
 _ADAPTIVE_REDUCED_ALIGNMENT_LENGTH = 400
 _ADAPTIVE_REDUCED_TOTAL_CELLS = 1200
+_DEFAULT_VISIBLE_TRACE_COLUMNS = 60
+_DEFAULT_TRACE_PREFETCH_COLUMNS = 90
+_ROW_SOURCE_CACHE_MAX_ENTRIES = 256
 
 
 @dataclass(frozen=True, slots=True)
@@ -61,12 +83,115 @@ class AssemblyTraceCell:
     raw_left: float | None = None
     raw_right: float | None = None
     raw_center: float | None = None
-    channels: tuple[AssemblyTraceChannelSegment, ...] = ()
+    has_trace_signal: bool = False
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PackedTraceSignal:
+    """Normalized channel signal of one trace row packed into read-only arrays.
+
+    ``traced_cells`` flags the row cells that carry signal and ``signal`` is a
+    float32 ``channel x traced cell x sample`` array over those cells.
+    """
+
+    channel_bases: tuple[str, ...] = ()
+    channel_colors: tuple[str, ...] = ()
+    samples_per_cell: int = 0
+    traced_cells: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.bool_)
+    )
+    signal: np.ndarray = field(
+        default_factory=lambda: np.zeros((0, 0, 0), dtype=np.float32)
+    )
+    _traced_offsets: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.traced_cells.flags.writeable = False
+        self.signal.flags.writeable = False
+        traced_offsets = np.zeros(self.traced_cells.size + 1, dtype=np.intp)
+        np.cumsum(self.traced_cells, out=traced_offsets[1:])
+        object.__setattr__(self, "_traced_offsets", traced_offsets)
+
+    @property
+    def traced_cell_count(self) -> int:
+        """Return how many row cells carry resampled signal."""
+        return int(self._traced_offsets[-1])
 
     @property
-    def has_trace_signal(self) -> bool:
-        """Return whether the cell carries any resampled trace segments."""
-        return bool(self.channels)
+    def traced_positions(self) -> np.ndarray:
+        """Return the row positions of the traced cells, in order."""
+        return np.flatnonzero(self.traced_cells)
+
+    def content_digest(self) -> str:
+        """Return a stable digest over the channel metadata and every array."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(
+            repr(
+                (self.channel_bases, self.channel_colors, self.samples_per_cell)
+            ).encode("utf-8")
+        )
+        for array in (self.traced_cells, self.signal):
+            digest.update(f"{array.dtype.str}{array.shape}".encode("utf-8"))
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedTraceSignal):
+            return NotImplemented
+        return self.content_digest() == other.content_digest()
+
+    def __hash__(self) -> int:
+        return hash(self.content_digest())
+
+    def __repr__(self) -> str:
+        return (
+            f"PackedTraceSignal(channels={len(self.channel_bases)}, "
+            f"traced_cells={self.traced_cell_count}, "
+            f"digest={self.content_digest()})"
+        )
+
+    def has_cell_signal(self, cell_position: int) -> bool:
+        """Return whether one row cell carries resampled signal."""
+        return bool(self.channel_bases) and bool(self.traced_cells[cell_position])
+
+    def traced_x_values(
+        self,
+        *,
+        cell_lefts: Sequence[float],
+        cell_rights: Sequence[float],
+    ) -> np.ndarray:
+        """Return ``traced cell x sample`` x values from per-row-cell bounds."""
+        traced_positions = self.traced_positions
+        if traced_positions.size == 0:
+            return np.empty((0, self.samples_per_cell), dtype=np.float64)
+        traced_lefts = np.asarray(cell_lefts, dtype=np.float64)[traced_positions]
+        traced_rights = np.asarray(cell_rights, dtype=np.float64)[traced_positions]
+        steps = (traced_rights - traced_lefts) / float(self.samples_per_cell - 1)
+        return traced_lefts[:, None] + (
+            steps[:, None] * np.arange(self.samples_per_cell, dtype=np.float64)
+        )
+
+    def cell_channel_values(
+        self,
+        cell_position: int,
+        *,
+        cell_left: float,
+        cell_right: float,
+    ) -> tuple[TraceChannelValues, ...]:
+        """Return ``(base, color, x_values, normalized_signal)`` per channel."""
+        if not self.has_cell_signal(cell_position):
+            return ()
+        traced_position = int(self._traced_offsets[cell_position])
+        x_values = linspace(cell_left, cell_right, self.samples_per_cell)
+        return tuple(
+            (base, color, x_values, tuple(normalized_signal))
+            for base, color, normalized_signal in zip(
+                self.channel_bases,
+                self.channel_colors,
+                self.signal[:, traced_position, :].tolist(),
+                strict=True,
+            )
+        )
 
 
 @dataclass(frozen=True, slots=True)
@@ -92,28 +217,86 @@ class AssemblyTraceRow:
     signal_scale: float
     has_trace_signal: bool
     cells: tuple[AssemblyTraceCell, ...] = ()
+    packed_signal: PackedTraceSignal = field(default_factory=PackedTraceSignal)
 
     @property
     def aligned_sequence(self) -> str:
         """Return the row's gapped aligned sequence."""
         return "".join(cell.base for cell in self.cells)
 
+    def cell_channels(
+        self,
+        cell_position: int,
+    ) -> tuple[AssemblyTraceChannelSegment, ...]:
+        """Return the resampled channel segments of one row cell."""
+        cell = self.cells[cell_position]
+        return tuple(
+            AssemblyTraceChannelSegment(
+                base=base,
+                color=color,
+                x_values=x_values,
+                normalized_signal=normalized_signal,
+            )
+            for base, color, x_values, normalized_signal in (
+                self.packed_signal.cell_channel_values(
+                    cell_position,
+                    cell_left=cell.cell_left,
+                    cell_right=cell.cell_right,
+                )
+            )
+        )
+
+    def traced_channel_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(x_values, signal)`` arrays for every traced cell of the row.
+
+        ``x_values`` is ``traced cell x sample`` and ``signal`` is
+        ``channel x traced cell x sample``, in ``packed_signal`` channel order.
+        """
+        return (
+            self.packed_signal.traced_x_values(
+                cell_lefts=[cell.cell_left for cell in self.cells],
+                cell_rights=[cell.cell_right for cell in self.cells],
+            ),
+            self.packed_signal.signal,
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class AssemblyTraceView:
-    """Pure aligned-trace view state for pairwise or multi-read assembly."""
+    """Pure aligned-trace view state for pairwise or multi-read assembly.
+
+    ``columns`` always spans the whole alignment. When ``column_window`` is a
+    zero-based half-open ``(start, end)`` column range, row cells are built
+    only for the columns inside it. ``fingerprint`` digests the result, row
+    sources and layout the view was built from.
+    """
 
     columns: tuple[AssemblyTraceColumn, ...] = ()
     rows: tuple[AssemblyTraceRow, ...] = ()
     cell_width: float = 1.0
     samples_per_cell: int = 16
     trace_row_height: float = 3.0
+    column_window: tuple[int, int] | None = None
+    fingerprint: str | None = field(default=None, compare=False, repr=False)
 
     @property
     def alignment_length(self) -> int:
         """Return the number of alignment columns represented in the view."""
         return len(self.columns)
 
+    @property
+    def is_windowed(self) -> bool:
+        """Return whether row cells cover only ``column_window``."""
+        return self.column_window is not None
+
+    @property
+    def window_columns(self) -> tuple[AssemblyTraceColumn, ...]:
+        """Return the columns whose row cells were built."""
+        if self.column_window is None:
+            return self.columns
+        window_start, window_end = self.column_window
+        return self.columns[window_start:window_end]
+
     @property
     def total_height(self) -> float:
         """Return the full y-extent occupied by all trace rows."""
@@ -134,6 +317,22 @@ class AssemblyTraceRowSource:
     base_calls_by_full_index: dict[int, ChromatogramBaseCall] | None = None
     base_spans_by_full_index: dict[int, ChromatogramBaseSpan] | None = None
     signal_scale: float = 1.0
+    signal_envelope: SignalEnvelope | None = field(
+        default=None,
+        compare=False,
+        repr=False,
+    )
+    cache_key: AssemblyTraceRowSourceCacheKey | None = field(
+        default=None,
+        compare=False,
+        repr=False,
+    )
+
+
+_row_source_cache: LruCache[
+    AssemblyTraceRowSourceCacheKey,
+    AssemblyTraceRowSource,
+] = LruCache(_ROW_SOURCE_CACHE_MAX_ENTRIES)
 
 
 @dataclass(frozen=True, slots=True)
@@ -161,6 +360,7 @@ def build_pairwise_assembly_trace_view(
     trace_row_height: float = 3.0,
     left_row_source: AssemblyTraceRowSource | None = None,
     right_row_source: AssemblyTraceRowSource | None = None,
+    column_window: tuple[int, int] | None = None,
 ) -> AssemblyTraceView:
     """Build a stacked alignment-column trace view for one pairwise assembly."""
     columns = _pairwise_trace_columns(result.columns)
@@ -174,6 +374,11 @@ def build_pairwise_assembly_trace_view(
         samples_per_cell=resolved_samples_per_cell,
         trace_row_height=trace_row_height,
     )
+    window_start, window_end = trace_column_window_bounds(
+        column_window,
+        alignment_length=len(columns),
+    )
+    window_columns = result.columns[window_start:window_end]
 
     resolved_left_row_source = (
         build_assembly_trace_row_source(
@@ -211,7 +416,7 @@ def build_pairwise_assembly_trace_view(
             result.left_display_name,
             "forward",
             resolved_left_row_source,
-            tuple(_left_column_projection(column) for column in result.columns),
+            tuple(_left_column_projection(column) for column in window_columns),
         ),
         (
             result.right_display_name,
@@ -219,16 +424,18 @@ def build_pairwise_assembly_trace_view(
             result.right_display_name,
             result.chosen_right_orientation,
             resolved_right_row_source,
-            tuple(_right_column_projection(column) for column in result.columns),
+            tuple(_right_column_projection(column) for column in window_columns),
         ),
     )
 
     return _build_trace_view(
+        result=result,
         columns=columns,
         row_specs=row_specs,
         cell_width=cell_width,
         samples_per_cell=resolved_samples_per_cell,
         trace_row_height=trace_row_height,
+        column_window=column_window,
     )
 
 
@@ -241,9 +448,11 @@ def build_multi_assembly_trace_view(
     samples_per_cell: int | None = None,
     trace_row_height: float = 3.0,
     row_sources_by_member_index: dict[int, AssemblyTraceRowSource] | None = None,
+    column_window: tuple[int, int] | None = None,
 ) -> AssemblyTraceView:
     """Build a stacked alignment-column trace view for one multi-read assembly."""
-    columns = _multi_trace_columns(result.columns)
+    grid = result.grid
+    columns = _multi_trace_columns(grid)
     resolved_samples_per_cell = resolve_assembly_trace_samples_per_cell(
         alignment_length=len(columns),
         row_count=len(result.included_member_indices),
@@ -254,6 +463,10 @@ def build_multi_assembly_trace_view(
         samples_per_cell=resolved_samples_per_cell,
         trace_row_height=trace_row_height,
     )
+    window_start, window_end = trace_column_window_bounds(
+        column_window,
+        alignment_length=len(columns),
+    )
 
     members_by_index = {member.member_index: member for member in result.members}
     row_specs: list[
@@ -266,12 +479,7 @@ def build_multi_assembly_trace_view(
             tuple[_AssemblyColumnProjection, ...],
         ]
     ] = []
-    member_cell_position_by_index = {
-        member_index: position
-        for position, member_index in enumerate(result.included_member_indices)
-    }
-
-    for member_index in result.included_member_indices:
+    for row_position, member_index in enumerate(result.included_member_indices):
         member = members_by_index[member_index]
         row_source = (
             row_sources_by_member_index[member_index]
@@ -290,24 +498,101 @@ def build_multi_assembly_trace_view(
                 member.display_name,
                 member.chosen_orientation,
                 row_source,
-                tuple(
-                    _multi_member_projection(
-                        column,
-                        member_cell_position=member_cell_position_by_index[
-                            member_index
-                        ],
-                    )
-                    for column in result.columns
+                _multi_member_projections(
+                    grid,
+                    row_position=row_position,
+                    window_start=window_start,
+                    window_end=window_end,
                 ),
             )
         )
 
     return _build_trace_view(
+        result=result,
         columns=columns,
         row_specs=tuple(row_specs),
         cell_width=cell_width,
         samples_per_cell=resolved_samples_per_cell,
         trace_row_height=trace_row_height,
+        column_window=column_window,
+    )
+
+
+def resolve_trace_column_window(
+    *,
+    alignment_length: int,
+    first_visible_column_index: int = 1,
+    visible_columns: int = _DEFAULT_VISIBLE_TRACE_COLUMNS,
+    prefetch_columns: int = _DEFAULT_TRACE_PREFETCH_COLUMNS,
+) -> tuple[int, int] | None:
+    """Return the column window to build for one viewport, or ``None`` for all.
+
+    The first visible column is snapped down to a multiple of
+    ``prefetch_columns`` and the window spans ``visible_columns`` from there
+    plus ``prefetch_columns`` on either side, so every viewport starting before
+    the next snap point resolves to the same window and short pans reuse
+    already-built cells. Alignments that fit inside one window are not windowed.
+    """
+    if visible_columns < 1:
+        raise ValueError("visible_columns must be >= 1")
+    if prefetch_columns < 0:
+        raise ValueError("prefetch_columns must be >= 0")
+    first_visible_position = min(
+        max(first_visible_column_index - 1, 0),
+        max(alignment_length - visible_columns, 0),
+    )
+    if prefetch_columns:
+        first_visible_position -= first_visible_position % prefetch_columns
+    window_start = max(first_visible_position - prefetch_columns, 0)
+    window_end = min(
+        first_visible_position + visible_columns + prefetch_columns,
+        alignment_length,
+    )
+    if window_start == 0 and window_end == alignment_length:
+        return None
+    return (window_start, window_end)
+
+
+def trace_column_window_bounds(
+    column_window: tuple[int, int] | None,
+    *,
+    alignment_length: int,
+) -> tuple[int, int]:
+    """Return concrete ``(start, end)`` bounds for an optional column window."""
+    if column_window is None:
+        return (0, alignment_length)
+    window_start, window_end = column_window
+    if not 0 <= window_start <= window_end <= alignment_length:
+        raise ValueError("column_window must lie within the alignment")
+    return (window_start, window_end)
+
+
+def trace_view_fingerprint(
+    view_kind: str,
+    result: object,
+    *,
+    row_sources: tuple[AssemblyTraceRowSource, ...],
+    cell_width: float,
+    samples_per_cell: int,
+    trace_row_height: float,
+    column_window: tuple[int, int] | None,
+) -> str | None:
+    """Return a trace view's upstream fingerprint, or ``None`` if unknown.
+
+    Row sources built outside ``build_assembly_trace_row_source`` carry no
+    cache key, so views drawn from them get no fingerprint.
+    """
+    row_source_keys = tuple(row_source.cache_key for row_source in row_sources)
+    if None in row_source_keys:
+        return None
+    return build_view_fingerprint(
+        view_kind,
+        repr(result),
+        row_source_keys,
+        cell_width,
+        samples_per_cell,
+        trace_row_height,
+        column_window,
     )
 
 
@@ -327,6 +612,7 @@ def _validate_trace_view_parameters(
 
 def _build_trace_view(
     *,
+    result: AssemblyResult | MultiAssemblyResult,
     columns: tuple[AssemblyTraceColumn, ...],
     row_specs: tuple[
         tuple[
@@ -342,11 +628,17 @@ def _build_trace_view(
     cell_width: float,
     samples_per_cell: int,
     trace_row_height: float,
+    column_window: tuple[int, int] | None,
 ) -> AssemblyTraceView:
+    window_start, window_end = trace_column_window_bounds(
+        column_window,
+        alignment_length=len(columns),
+    )
+    window_columns = columns[window_start:window_end]
     total_rows = len(row_specs)
     rows = tuple(
         _build_trace_row(
-            columns=columns,
+            columns=window_columns,
             label=label,
             source_filename=source_filename,
             display_name=display_name,
@@ -375,6 +667,16 @@ def _build_trace_view(
         cell_width=cell_width,
         samples_per_cell=samples_per_cell,
         trace_row_height=trace_row_height,
+        column_window=column_window,
+        fingerprint=trace_view_fingerprint(
+            "assembly_trace_view",
+            result,
+            row_sources=tuple(row_spec[4] for row_spec in row_specs),
+            cell_width=cell_width,
+            samples_per_cell=samples_per_cell,
+            trace_row_height=trace_row_height,
+            column_window=column_window,
+        ),
     )
 
 
@@ -395,15 +697,36 @@ def _build_trace_row(
 ) -> AssemblyTraceRow:
     y_bottom = float(total_rows - row_order_index - 1) * trace_row_height
     y_top = y_bottom + trace_row_height
+    raw_windows = tuple(
+        (
+            trace_raw_window(row_source, query_index=projection.query_index)
+            if projection.query_index is not None and projection.base != "-"
+            else (None, None, None)
+        )
+        for projection in projections
+    )
+    packed_signal = resample_trace_row_windows(
+        row_source,
+        cell_windows=tuple(
+            (float(column.column_index - 1) * cell_width, raw_left, raw_right)
+            for column, (raw_left, raw_right, _raw_center) in zip(
+                columns, raw_windows, strict=True
+            )
+        ),
+        cell_width=cell_width,
+        samples_per_cell=samples_per_cell,
+    )
     cells = tuple(
         _build_trace_cell(
             column=column,
-            row_source=row_source,
             projection=projection,
+            raw_window=raw_window,
+            has_trace_signal=packed_signal.has_cell_signal(cell_position),
             cell_width=cell_width,
-            samples_per_cell=samples_per_cell,
         )
-        for column, projection in zip(columns, projections, strict=True)
+        for cell_position, (column, projection, raw_window) in enumerate(
+            zip(columns, projections, raw_windows, strict=True)
+        )
     )
     return AssemblyTraceRow(
         label=label,
@@ -415,49 +738,22 @@ def _build_trace_row(
         signal_scale=row_source.signal_scale,
         has_trace_signal=any(cell.has_trace_signal for cell in cells),
         cells=cells,
+        packed_signal=packed_signal,
     )
 
 
 def _build_trace_cell(
     *,
     column: AssemblyTraceColumn,
-    row_source: AssemblyTraceRowSource,
     projection: _AssemblyColumnProjection,
+    raw_window: tuple[float | None, float | None, float | None],
+    has_trace_signal: bool,
     cell_width: float,
-    samples_per_cell: int,
 ) -> AssemblyTraceCell:
     cell_left = float(column.column_index - 1) * cell_width
     cell_right = cell_left + cell_width
     cell_center = (cell_left + cell_right) / 2.0
-
-    raw_left: float | None = None
-    raw_right: float | None = None
-    raw_center: float | None = None
-    channels: tuple[AssemblyTraceChannelSegment, ...] = ()
-
-    if projection.query_index is not None and projection.base != "-":
-        full_base_index = row_source.trimmed_start + projection.query_index
-        base_call = _mapping_lookup(
-            row_source.base_calls_by_full_index, full_base_index
-        )
-        base_span = _mapping_lookup(
-            row_source.base_spans_by_full_index, full_base_index
-        )
-        if base_call is not None:
-            raw_center = float(base_call.position)
-        if base_span is not None:
-            raw_left = base_span.left
-            raw_right = base_span.right
-            raw_center = base_span.center if raw_center is None else raw_center
-            channels = _build_cell_channels(
-                channels=row_source.channels,
-                raw_left=raw_left,
-                raw_right=raw_right,
-                cell_left=cell_left,
-                cell_right=cell_right,
-                samples_per_cell=samples_per_cell,
-                signal_scale=row_source.signal_scale,
-            )
+    raw_left, raw_right, raw_center = raw_window
 
     return AssemblyTraceCell(
         column_index=column.column_index,
@@ -477,7 +773,79 @@ def _build_trace_cell(
         raw_left=raw_left,
         raw_right=raw_right,
         raw_center=raw_center,
-        channels=channels,
+        has_trace_signal=has_trace_signal,
+    )
+
+
+def trace_raw_window(
+    row_source: AssemblyTraceRowSource,
+    *,
+    query_index: int,
+) -> tuple[float | None, float | None, float | None]:
+    """Return ``(raw_left, raw_right, raw_center)`` for one trimmed query base."""
+    full_base_index = row_source.trimmed_start + query_index
+    base_call = _mapping_lookup(row_source.base_calls_by_full_index, full_base_index)
+    base_span = _mapping_lookup(row_source.base_spans_by_full_index, full_base_index)
+    raw_center = None if base_call is None else float(base_call.position)
+    if base_span is None:
+        return (None, None, raw_center)
+    return (
+        base_span.left,
+        base_span.right,
+        base_span.center if raw_center is None else raw_center,
+    )
+
+
+def resample_trace_row_windows(
+    row_source: AssemblyTraceRowSource,
+    *,
+    cell_windows: tuple[tuple[float, float | None, float | None], ...],
+    cell_width: float,
+    samples_per_cell: int,
+) -> PackedTraceSignal:
+    """Resample every traced cell of one row for all channels in one batch.
+
+    ``cell_windows`` holds ``(cell_left, raw_left, raw_right)`` per cell; cells
+    without a usable raw window are left untraced in the packed result.
+    """
+    traced_flags = np.fromiter(
+        (
+            raw_left is not None and raw_right is not None and raw_right > raw_left
+            for _cell_left, raw_left, raw_right in cell_windows
+        ),
+        dtype=np.bool_,
+        count=len(cell_windows),
+    )
+    traced_positions = np.flatnonzero(traced_flags).tolist()
+    if not row_source.channels or not traced_positions:
+        return PackedTraceSignal(
+            channel_bases=tuple(channel.base for channel in row_source.channels),
+            channel_colors=tuple(channel.color for channel in row_source.channels),
+            samples_per_cell=samples_per_cell,
+            traced_cells=np.zeros(len(cell_windows), dtype=np.bool_),
+        )
+
+    # Traced windows have both raw bounds, so they pack into one float array.
+    traced_windows = np.asarray(
+        [cell_windows[position] for position in traced_positions],
+        dtype=np.float64,
+    )
+    _x_values, sampled_signal = resample_signal_windows(
+        [channel.signal for channel in row_source.channels],
+        raw_left=traced_windows[:, 1],
+        raw_right=traced_windows[:, 2],
+        cell_left=traced_windows[:, 0],
+        cell_right=traced_windows[:, 0] + cell_width,
+        sample_count=samples_per_cell,
+        signal_scale=row_source.signal_scale,
+        clamp_to_unit=True,
+    )
+    return PackedTraceSignal(
+        channel_bases=tuple(channel.base for channel in row_source.channels),
+        channel_colors=tuple(channel.color for channel in row_source.channels),
+        samples_per_cell=samples_per_cell,
+        traced_cells=traced_flags,
+        signal=sampled_signal.astype(np.float32),
     )
 
 
@@ -505,10 +873,73 @@ def build_assembly_trace_row_source(
     raw_record: SequenceRecord,
     trim_result: TrimResult,
     strand: AssemblyStrand,
+    use_cache: bool = True,
+) -> AssemblyTraceRowSource:
+    """Return the oriented chromatogram geometry one aligned trace row draws from.
+
+    Row sources are cached process-wide per read content, trim and strand, so
+    assembly and reference-alignment trace views of the same read share one.
+    """
+    cache_key = build_assembly_trace_row_source_cache_key(
+        raw_record=raw_record,
+        trim_result=trim_result,
+        strand=strand,
+    )
+    if not use_cache:
+        return _build_assembly_trace_row_source_uncached(
+            raw_record=raw_record,
+            trim_result=trim_result,
+            strand=strand,
+            cache_key=cache_key,
+        )
+
+    row_source = _row_source_cache.get(cache_key)
+    if row_source is None:
+        row_source = _build_assembly_trace_row_source_uncached(
+            raw_record=raw_record,
+            trim_result=trim_result,
+            strand=strand,
+            cache_key=cache_key,
+        )
+        _row_source_cache.store(cache_key, row_source)
+    return row_source
+
+
+def build_assembly_trace_row_source_cache_key(
+    *,
+    raw_record: SequenceRecord,
+    trim_result: TrimResult,
+    strand: AssemblyStrand,
+) -> AssemblyTraceRowSourceCacheKey:
+    """Return the content-based cache key for one aligned trace row source."""
+    return (
+        build_chromatogram_view_cache_key(raw_record, trim_result),
+        raw_record.orientation,
+        strand,
+    )
+
+
+def assembly_trace_row_source_cache_info() -> LruCacheInfo:
+    """Return the current hit/miss counters for the trace row-source cache."""
+    return _row_source_cache.info()
+
+
+def clear_assembly_trace_row_source_cache() -> None:
+    """Drop every cached trace row source and reset the counters."""
+    _row_source_cache.clear()
+
+
+def _build_assembly_trace_row_source_uncached(
+    *,
+    raw_record: SequenceRecord,
+    trim_result: TrimResult,
+    strand: AssemblyStrand,
+    cache_key: AssemblyTraceRowSourceCacheKey,
 ) -> AssemblyTraceRowSource:
-    view = build_chromatogram_view(raw_record, trim_result)
-    oriented_view = (
-        view if strand == "forward" else reverse_complement_chromatogram_view(view)
+    oriented_view = build_oriented_chromatogram_view(
+        raw_record,
+        trim_result,
+        orientation=_trace_orientation(raw_record=raw_record, strand=strand),
     )
     trimmed_start, _trimmed_end = oriented_trim_interval(
         raw_record=raw_record,
@@ -521,8 +952,10 @@ def build_assembly_trace_row_source(
     base_spans_by_full_index = {
         base_span.base_index: base_span for base_span in oriented_view.base_spans
     }
+    signal_envelope = chromatogram_signal_envelope(oriented_view)
     signal_scale = _row_signal_scale(
         view=oriented_view,
+        signal_envelope=signal_envelope,
         base_spans_by_full_index=base_spans_by_full_index,
         trimmed_start=trimmed_start,
         trimmed_length=trim_result.trimmed_length,
@@ -535,12 +968,25 @@ def build_assembly_trace_row_source(
         base_calls_by_full_index=base_calls_by_full_index,
         base_spans_by_full_index=base_spans_by_full_index,
         signal_scale=signal_scale,
+        signal_envelope=signal_envelope,
+        cache_key=cache_key,
     )
 
 
+def _trace_orientation(
+    *,
+    raw_record: SequenceRecord,
+    strand: AssemblyStrand,
+) -> SequenceOrientation:
+    if (strand == "forward") == (raw_record.orientation == "forward"):
+        return "forward"
+    return "reverse_complement"
+
+
 def _row_signal_scale(
     *,
     view: ChromatogramView,
+    signal_envelope: SignalEnvelope,
     base_spans_by_full_index: dict[int, ChromatogramBaseSpan],
     trimmed_start: int,
     trimmed_length: int,
@@ -561,53 +1007,12 @@ def _row_signal_scale(
         max(view.trace_length - 1, 0),
         int(math.ceil(max(span.right for span in trimmed_spans))),
     )
-    if right < left:
+    max_signal = signal_envelope.range_max(left, right)
+    if max_signal is None:
         return 1.0
-
-    max_signal = max(
-        channel.signal[sample_index]
-        for channel in view.channels
-        for sample_index in range(left, right + 1)
-    )
     return float(max(max_signal, 1))
 
 
-def _build_cell_channels(
-    *,
-    channels: tuple[ChromatogramChannel, ...],
-    raw_left: float,
-    raw_right: float,
-    cell_left: float,
-    cell_right: float,
-    samples_per_cell: int,
-    signal_scale: float,
-) -> tuple[AssemblyTraceChannelSegment, ...]:
-    if not channels or raw_right <= raw_left:
-        return ()
-
-    channel_segments: list[AssemblyTraceChannelSegment] = []
-    for channel in channels:
-        x_values, sampled_signal = resample_signal_window(
-            channel.signal,
-            raw_left=raw_left,
-            raw_right=raw_right,
-            cell_left=cell_left,
-            cell_right=cell_right,
-            sample_count=samples_per_cell,
-            signal_scale=signal_scale,
-            clamp_to_unit=True,
-        )
-        channel_segments.append(
-            AssemblyTraceChannelSegment(
-                base=channel.base,
-                color=channel.color,
-                x_values=x_values,
-                normalized_signal=sampled_signal,
-            )
-        )
-    return tuple(channel_segments)
-
-
 def _pairwise_trace_columns(
     columns: tuple[AssemblyColumn, ...],
 ) -> tuple[AssemblyTraceColumn, ...]:
@@ -629,50 +1034,93 @@ def _pairwise_trace_columns(
 
 
 def _multi_trace_columns(
-    columns: tuple[MultiAssemblyColumn, ...],
+    grid: MultiAssemblyGrid,
 ) -> tuple[AssemblyTraceColumn, ...]:
-    return tuple(
-        AssemblyTraceColumn(
-            column_index=column.column_index,
-            consensus_base=column.consensus_base,
-            resolution=column.resolution,
-            hover_text=(
-                f"column={column.column_index}"
-                f"<br>consensus={column.consensus_base}"
-                f"<br>resolution={column.resolution}"
-                f"<br>support={_multi_support_summary(column)}"
-                f"<br>non_gap_members={column.non_gap_member_count}"
-                f"<br>gap_members={column.gap_member_count}"
-            ),
+    non_gap_counts = grid.non_gap_counts.tolist()
+    member_count = len(grid.member_indices)
+    trace_columns: list[AssemblyTraceColumn] = []
+    for column_position, (consensus_code, resolution_code) in enumerate(
+        zip(
+            grid.consensus_codes.tolist(),
+            grid.resolution_codes.tolist(),
+            strict=True,
         )
-        for column in columns
-    )
+    ):
+        column_index = column_position + 1
+        consensus_base = chr(consensus_code)
+        resolution = CONFLICT_RESOLUTIONS[resolution_code]
+        non_gap_member_count = non_gap_counts[column_position]
+        trace_columns.append(
+            AssemblyTraceColumn(
+                column_index=column_index,
+                consensus_base=consensus_base,
+                resolution=resolution,
+                hover_text=(
+                    f"column={column_index}"
+                    f"<br>consensus={consensus_base}"
+                    f"<br>resolution={resolution}"
+                    "<br>support="
+                    f"{_multi_support_summary(grid.support_counts(column_position))}"
+                    f"<br>non_gap_members={non_gap_member_count}"
+                    f"<br>gap_members={member_count - non_gap_member_count}"
+                ),
+            )
+        )
+    return tuple(trace_columns)
 
 
-def _multi_support_summary(column: MultiAssemblyColumn) -> str:
-    if not column.support_counts:
+def _multi_support_summary(support_counts: tuple[tuple[str, int], ...]) -> str:
+    if not support_counts:
         return "NA"
-    return ", ".join(f"{base}:{count}" for base, count in column.support_counts)
+    return ", ".join(f"{base}:{count}" for base, count in support_counts)
 
 
-def _multi_member_projection(
-    column: MultiAssemblyColumn,
+def _multi_member_projections(
+    grid: MultiAssemblyGrid,
     *,
-    member_cell_position: int,
-) -> _AssemblyColumnProjection:
-    member_cell = column.member_cells[member_cell_position]
-    return _AssemblyColumnProjection(
-        base=member_cell.base,
-        query_index=member_cell.query_index,
-        query_pos=member_cell.query_pos,
-        quality=member_cell.quality,
-        trace_x=member_cell.trace_x,
-        is_overlap=column.non_gap_member_count > 1,
-        is_match=(
-            not member_cell.is_gap
-            and member_cell.base == column.consensus_base
-            and column.consensus_base != "N"
-        ),
+    row_position: int,
+    window_start: int,
+    window_end: int,
+) -> tuple[_AssemblyColumnProjection, ...]:
+    window = slice(window_start, window_end)
+    row_query_indices = grid.query_indices[row_position, window]
+    row_is_gap = row_query_indices == GRID_MISSING
+    row_base_codes = grid.base_codes[row_position, window]
+    consensus_codes = grid.consensus_codes[window]
+    is_overlap = (grid.non_gap_counts[window] > 1).tolist()
+    is_match = (
+        ~row_is_gap
+        & (row_base_codes == consensus_codes)
+        & (consensus_codes != ord("N"))
+    ).tolist()
+    return tuple(
+        _AssemblyColumnProjection(
+            base=chr(base_code),
+            query_index=None if gap else query_index,
+            query_pos=None if gap else query_index + 1,
+            quality=None if quality == GRID_MISSING else quality,
+            trace_x=None if trace_x == GRID_MISSING else trace_x,
+            is_overlap=column_is_overlap,
+            is_match=column_is_match,
+        )
+        for (
+            base_code,
+            query_index,
+            quality,
+            trace_x,
+            gap,
+            column_is_overlap,
+            column_is_match,
+        ) in zip(
+            row_base_codes.tolist(),
+            row_query_indices.tolist(),
+            grid.qualities[row_position, window].tolist(),
+            grid.trace_x[row_position, window].tolist(),
+            row_is_gap.tolist(),
+            is_overlap,
+            is_match,
+            strict=True,
+        )
     )
 
 
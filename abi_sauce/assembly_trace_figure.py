@@ -1,14 +1,15 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Final
+from typing import Any, Final
 
+import numpy as np
 import plotly.graph_objects as go
 
 from abi_sauce.assembly_types import ConflictResolution
 from abi_sauce.assembly_trace import (
     AssemblyTraceCell,
-    AssemblyTraceChannelSegment,
     AssemblyTraceRow,
     AssemblyTraceView,
 )
@@ -93,6 +94,20 @@ _DARK_THEME: Final[AssemblyTraceFigureTheme] = AssemblyTraceFigureTheme(
 _CONSENSUS_BAND_HEIGHT: Final[float] = 0.9
 _CONSENSUS_BAND_GAP: Final[float] = 0.3
 _DEFAULT_INITIAL_VISIBLE_COLUMNS: Final[int] = 50
+_ROW_HOVER_TEMPLATE: Final[str] = (
+    "row=%{customdata[9]}"
+    "<br>strand=%{customdata[10]}"
+    "<br>column=%{customdata[0]}"
+    "<br>base=%{customdata[1]}"
+    "<br>consensus=%{customdata[2]}"
+    "<br>resolution=%{customdata[3]}"
+    "<br>query_pos=%{customdata[4]}"
+    "<br>quality=%{customdata[5]}"
+    "<br>trace_x=%{customdata[6]}"
+    "<br>raw_left=%{customdata[7]}"
+    "<br>raw_right=%{customdata[8]}"
+    "<extra></extra>"
+)
 
 
 def build_assembly_trace_figure(
@@ -100,36 +115,27 @@ def build_assembly_trace_figure(
     *,
     theme_type: str = "light",
     selected_column_index: int | None = None,
+    batch_rows: bool = False,
 ) -> go.Figure:
-    """Build a stacked alignment-column electropherogram figure."""
+    """Build a stacked alignment-column electropherogram figure.
+
+    With ``batch_rows`` every row shares one background trace, one channel
+    trace per base, one base-label trace and one hover trace.
+    """
     theme = _resolve_figure_theme(theme_type)
     figure = go.Figure()
 
     consensus_bottom = view.total_height + _CONSENSUS_BAND_GAP
     consensus_top = consensus_bottom + _CONSENSUS_BAND_HEIGHT
     consensus_mid = (consensus_bottom + consensus_top) / 2.0
-    total_height = consensus_top + 0.2
+    total_height = _figure_total_height(view)
 
-    if (
-        selected_column_index is not None
-        and 1 <= selected_column_index <= view.alignment_length
+    for shape in build_assembly_trace_selection_shapes(
+        view,
+        theme_type=theme_type,
+        selected_column_index=selected_column_index,
     ):
-        selected_left, selected_right = _column_bounds(
-            selected_column_index,
-            cell_width=view.cell_width,
-        )
-        figure.add_shape(
-            type="rect",
-            xref="x",
-            yref="y",
-            x0=selected_left,
-            x1=selected_right,
-            y0=0.0,
-            y1=total_height,
-            line={"width": 0},
-            fillcolor=theme.selected_column_color,
-            layer="below",
-        )
+        figure.add_shape(**shape)
 
     _add_consensus_band(
         figure,
@@ -140,20 +146,23 @@ def build_assembly_trace_figure(
         y_text=consensus_mid,
     )
 
-    for row in view.rows:
-        _add_row_background(
-            figure,
-            row=row,
-            view=view,
-            theme=theme,
-        )
-        _add_row_channel_segments(
-            figure,
-            row=row,
-            theme=theme,
-        )
-        _add_row_base_labels(figure, row=row, theme=theme)
-        _add_row_hover_markers(figure, row=row)
+    if batch_rows:
+        _add_batched_rows(figure, view=view, theme=theme)
+    else:
+        for row in view.rows:
+            _add_row_background(
+                figure,
+                row=row,
+                view=view,
+                theme=theme,
+            )
+            _add_row_channel_segments(
+                figure,
+                row=row,
+                theme=theme,
+            )
+            _add_row_base_labels(figure, row=row, theme=theme)
+            _add_row_hover_markers(figure, row=row)
 
     figure.update_xaxes(
         title_text="Alignment column",
@@ -194,6 +203,47 @@ def build_assembly_trace_figure(
     return figure
 
 
+def build_assembly_trace_selection_shapes(
+    view: AssemblyTraceView,
+    *,
+    theme_type: str = "light",
+    selected_column_index: int | None = None,
+) -> tuple[dict[str, Any], ...]:
+    """Return the selected-column highlight shapes of ``build_assembly_trace_figure``.
+
+    The highlight is the only selection-dependent part of the figure, so it
+    can be overlaid on a cached figure spec built without a selection.
+    """
+    if (
+        selected_column_index is None
+        or not 1 <= selected_column_index <= view.alignment_length
+    ):
+        return ()
+
+    selected_left, selected_right = _column_bounds(
+        selected_column_index,
+        cell_width=view.cell_width,
+    )
+    return (
+        {
+            "type": "rect",
+            "xref": "x",
+            "yref": "y",
+            "x0": selected_left,
+            "x1": selected_right,
+            "y0": 0.0,
+            "y1": _figure_total_height(view),
+            "line": {"width": 0},
+            "fillcolor": _resolve_figure_theme(theme_type).selected_column_color,
+            "layer": "below",
+        },
+    )
+
+
+def _figure_total_height(view: AssemblyTraceView) -> float:
+    return view.total_height + _CONSENSUS_BAND_GAP + _CONSENSUS_BAND_HEIGHT + 0.2
+
+
 def _add_consensus_band(
     figure: go.Figure,
     *,
@@ -203,18 +253,17 @@ def _add_consensus_band(
     y_top: float,
     y_text: float,
 ) -> None:
+    columns = view.window_columns
     _add_background_bars(
         figure,
         x_values=[
             _column_center(column.column_index, cell_width=view.cell_width)
-            for column in view.columns
+            for column in columns
         ],
         y_base=y_bottom,
         height=y_top - y_bottom,
         width=view.cell_width,
-        colors=[
-            theme.resolution_fill_colors[column.resolution] for column in view.columns
-        ],
+        colors=[theme.resolution_fill_colors[column.resolution] for column in columns],
         name="Consensus background",
     )
 
@@ -222,10 +271,10 @@ def _add_consensus_band(
         go.Scattergl(
             x=[
                 _column_center(column.column_index, cell_width=view.cell_width)
-                for column in view.columns
+                for column in columns
             ],
-            y=[y_text] * len(view.columns),
-            text=[column.consensus_base for column in view.columns],
+            y=[y_text] * len(columns),
+            text=[column.consensus_base for column in columns],
             mode="text",
             name="Consensus",
             textfont={"color": theme.consensus_text_color},
@@ -237,13 +286,13 @@ def _add_consensus_band(
         go.Scattergl(
             x=[
                 _column_center(column.column_index, cell_width=view.cell_width)
-                for column in view.columns
+                for column in columns
             ],
-            y=[y_text] * len(view.columns),
+            y=[y_text] * len(columns),
             mode="markers",
             name="Consensus hover",
             showlegend=False,
-            customdata=[column.hover_text for column in view.columns],
+            customdata=[column.hover_text for column in columns],
             marker={"size": 14, "opacity": 0},
             hovertemplate="%{customdata}<extra></extra>",
         )
@@ -256,6 +305,25 @@ def _add_row_background(
     row: AssemblyTraceRow,
     view: AssemblyTraceView,
     theme: AssemblyTraceFigureTheme,
+) -> None:
+    _add_row_border(figure, row=row, view=view, theme=theme)
+    _add_background_bars(
+        figure,
+        x_values=[cell.cell_center for cell in row.cells],
+        y_base=row.y_bottom,
+        height=row.y_top - row.y_bottom,
+        width=view.cell_width,
+        colors=[_cell_fill_color(cell, theme) for cell in row.cells],
+        name=f"{row.display_name} background",
+    )
+
+
+def _add_row_border(
+    figure: go.Figure,
+    *,
+    row: AssemblyTraceRow,
+    view: AssemblyTraceView,
+    theme: AssemblyTraceFigureTheme,
 ) -> None:
     full_left, full_right = view.x_range
     figure.add_shape(
@@ -271,40 +339,31 @@ def _add_row_background(
         layer="below",
     )
 
-    _add_background_bars(
-        figure,
-        x_values=[cell.cell_center for cell in row.cells],
-        y_base=row.y_bottom,
-        height=row.y_top - row.y_bottom,
-        width=view.cell_width,
-        colors=[_cell_fill_color(cell, theme) for cell in row.cells],
-        name=f"{row.display_name} background",
-    )
-
 
 def _add_background_bars(
     figure: go.Figure,
     *,
-    x_values: list[float],
-    y_base: float,
-    height: float,
+    x_values: Sequence[float] | np.ndarray,
+    y_base: float | np.ndarray,
+    height: float | np.ndarray,
     width: float,
-    colors: list[str],
+    colors: Sequence[str] | np.ndarray,
     name: str,
 ) -> None:
-    if not x_values:
+    if not len(x_values):
         return
 
+    bar_count = len(x_values)
     figure.add_trace(
         go.Bar(
-            x=x_values,
-            y=[height] * len(x_values),
-            base=[y_base] * len(x_values),
-            width=[width] * len(x_values),
+            x=np.asarray(x_values, dtype=np.float64),
+            y=np.broadcast_to(np.asarray(height, dtype=np.float64), (bar_count,)),
+            base=np.broadcast_to(np.asarray(y_base, dtype=np.float64), (bar_count,)),
+            width=np.full(bar_count, width, dtype=np.float64),
             name=name,
             showlegend=False,
             marker={
-                "color": colors,
+                "color": np.asarray(colors, dtype=object),
                 "line": {"width": 0},
             },
             hoverinfo="skip",
@@ -322,49 +381,59 @@ def _add_row_channel_segments(
     if not row.has_trace_signal:
         return
 
-    baseline = row.y_bottom + 0.15
-    trace_height = max((row.y_top - row.y_bottom) - 1.0, 0.5)
-
-    channel_order = _row_channel_order(row)
-    for channel_index, base in enumerate(channel_order):
-        x_values: list[float | None] = []
-        y_values: list[float | None] = []
-        for cell in row.cells:
-            segment = _cell_channel_segment(cell, base=base)
-            if segment is None or not segment.x_values or not segment.normalized_signal:
-                x_values.append(None)
-                y_values.append(None)
-                continue
-
-            x_values.extend(segment.x_values)
-            y_values.extend(
-                baseline + (trace_height * signal)
-                for signal in segment.normalized_signal
-            )
-            x_values.append(None)
-            y_values.append(None)
-
-        if not x_values:
+    for base, x_values, y_values in _row_channel_points(row):
+        if not x_values.size:
             continue
 
-        color = _trace_color_for_segment_base(
-            base=base,
-            fallback_color="magenta",
-            theme=theme,
-        )
         figure.add_trace(
             go.Scattergl(
                 x=x_values,
                 y=y_values,
                 mode="lines",
                 name=f"{row.display_name}:{base}",
-                line={"color": color, "width": 1.2},
+                line={
+                    "color": _trace_color_for_segment_base(
+                        base=base,
+                        fallback_color="magenta",
+                        theme=theme,
+                    ),
+                    "width": 1.2,
+                },
                 hoverinfo="skip",
                 hovertemplate=None,
             )
         )
 
 
+def _row_channel_points(
+    row: AssemblyTraceRow,
+) -> tuple[tuple[str, np.ndarray, np.ndarray], ...]:
+    """Return ``(base, x, y)`` row polylines with a NaN break after every cell.
+
+    The packed row arrays are built once and shared by every channel.
+    """
+    x_values, signal = row.traced_channel_arrays()
+    separated_x_values = _nan_separated_cells(x_values)
+    baseline = row.y_bottom + 0.15
+    trace_height = max((row.y_top - row.y_bottom) - 1.0, 0.5)
+    return tuple(
+        (
+            base,
+            separated_x_values,
+            _nan_separated_cells(
+                baseline + (trace_height * signal[channel_index].astype(np.float64))
+            ),
+        )
+        for channel_index, base in enumerate(row.packed_signal.channel_bases)
+    )
+
+
+def _nan_separated_cells(values: np.ndarray) -> np.ndarray:
+    separated = np.full((values.shape[0], values.shape[1] + 1), np.nan)
+    separated[:, :-1] = values
+    return separated.ravel()
+
+
 def _add_row_base_labels(
     figure: go.Figure,
     *,
@@ -379,26 +448,31 @@ def _add_row_base_labels(
             text=[cell.base for cell in row.cells],
             mode="text",
             name=f"{row.display_name} bases",
-            textfont={
-                "color": [
-                    (
-                        _trace_color_for_segment_base(
-                            base=cell.base,
-                            fallback_color=theme.font_color,
-                            theme=theme,
-                        )
-                        if cell.base != "-"
-                        else theme.font_color
-                    )
-                    for cell in row.cells
-                ]
-            },
+            textfont={"color": _row_base_label_colors(row, theme)},
             hoverinfo="skip",
             hovertemplate=None,
         )
     )
 
 
+def _row_base_label_colors(
+    row: AssemblyTraceRow,
+    theme: AssemblyTraceFigureTheme,
+) -> list[str]:
+    return [
+        (
+            _trace_color_for_segment_base(
+                base=cell.base,
+                fallback_color=theme.font_color,
+                theme=theme,
+            )
+            if cell.base != "-"
+            else theme.font_color
+        )
+        for cell in row.cells
+    ]
+
+
 def _add_row_hover_markers(
     figure: go.Figure,
     *,
@@ -411,57 +485,128 @@ def _add_row_hover_markers(
             mode="markers",
             name=f"{row.display_name} hover",
             showlegend=False,
-            customdata=[
-                [
-                    cell.column_index,
-                    cell.base,
-                    cell.consensus_base,
-                    cell.resolution,
-                    cell.query_pos,
-                    cell.quality,
-                    cell.trace_x,
-                    cell.raw_left,
-                    cell.raw_right,
-                    row.display_name,
-                    row.strand,
-                ]
-                for cell in row.cells
-            ],
+            customdata=_row_hover_customdata(row),
             marker={"size": 16, "opacity": 0},
-            hovertemplate=(
-                "row=%{customdata[9]}"
-                "<br>strand=%{customdata[10]}"
-                "<br>column=%{customdata[0]}"
-                "<br>base=%{customdata[1]}"
-                "<br>consensus=%{customdata[2]}"
-                "<br>resolution=%{customdata[3]}"
-                "<br>query_pos=%{customdata[4]}"
-                "<br>quality=%{customdata[5]}"
-                "<br>trace_x=%{customdata[6]}"
-                "<br>raw_left=%{customdata[7]}"
-                "<br>raw_right=%{customdata[8]}"
-                "<extra></extra>"
-            ),
+            hovertemplate=_ROW_HOVER_TEMPLATE,
         )
     )
 
 
-def _row_channel_order(row: AssemblyTraceRow) -> tuple[str, ...]:
-    for cell in row.cells:
-        if cell.channels:
-            return tuple(segment.base for segment in cell.channels)
-    return ("G", "A", "T", "C")
+def _row_hover_customdata(row: AssemblyTraceRow) -> list[list[object]]:
+    return [
+        [
+            cell.column_index,
+            cell.base,
+            cell.consensus_base,
+            cell.resolution,
+            cell.query_pos,
+            cell.quality,
+            cell.trace_x,
+            cell.raw_left,
+            cell.raw_right,
+            row.display_name,
+            row.strand,
+        ]
+        for cell in row.cells
+    ]
+
+
+def _add_batched_rows(
+    figure: go.Figure,
+    *,
+    view: AssemblyTraceView,
+    theme: AssemblyTraceFigureTheme,
+) -> None:
+    rows = view.rows
+    for row in rows:
+        _add_row_border(figure, row=row, view=view, theme=theme)
+    cell_centers = np.fromiter(
+        (cell.cell_center for row in rows for cell in row.cells),
+        dtype=np.float64,
+    )
+    row_cell_counts = [len(row.cells) for row in rows]
+    _add_background_bars(
+        figure,
+        x_values=cell_centers,
+        y_base=np.repeat([row.y_bottom for row in rows], row_cell_counts),
+        height=np.repeat([row.y_top - row.y_bottom for row in rows], row_cell_counts),
+        width=view.cell_width,
+        colors=[_cell_fill_color(cell, theme) for row in rows for cell in row.cells],
+        name="Row backgrounds",
+    )
 
+    points_by_base: dict[str, tuple[list[np.ndarray], list[np.ndarray]]] = {}
+    for row in rows:
+        if not row.has_trace_signal:
+            continue
+        for base, row_x_values, row_y_values in _row_channel_points(row):
+            x_parts, y_parts = points_by_base.setdefault(base, ([], []))
+            x_parts.append(row_x_values)
+            y_parts.append(row_y_values)
+    for base, (x_parts, y_parts) in points_by_base.items():
+        x_values = np.concatenate(x_parts)
+        if not x_values.size:
+            continue
+        figure.add_trace(
+            go.Scattergl(
+                x=x_values,
+                y=np.concatenate(y_parts),
+                mode="lines",
+                name=f"Rows:{base}",
+                line={
+                    "color": _trace_color_for_segment_base(
+                        base=base,
+                        fallback_color="magenta",
+                        theme=theme,
+                    ),
+                    "width": 1.2,
+                },
+                hoverinfo="skip",
+                hovertemplate=None,
+            )
+        )
 
-def _cell_channel_segment(
-    cell: AssemblyTraceCell,
-    *,
-    base: str,
-) -> AssemblyTraceChannelSegment | None:
-    for segment in cell.channels:
-        if segment.base == base:
-            return segment
-    return None
+    if not cell_centers.size:
+        return
+    figure.add_trace(
+        go.Scattergl(
+            x=cell_centers,
+            y=np.repeat([row.y_top - 0.35 for row in rows], row_cell_counts),
+            text=np.array(
+                [cell.base for row in rows for cell in row.cells],
+                dtype=object,
+            ),
+            mode="text",
+            name="Row bases",
+            textfont={
+                "color": np.array(
+                    [
+                        color
+                        for row in rows
+                        for color in _row_base_label_colors(row, theme)
+                    ],
+                    dtype=object,
+                )
+            },
+            hoverinfo="skip",
+            hovertemplate=None,
+        )
+    )
+    figure.add_trace(
+        go.Scattergl(
+            x=cell_centers,
+            y=np.repeat([_row_midpoint(row) for row in rows], row_cell_counts),
+            mode="markers",
+            name="Row hover",
+            showlegend=False,
+            customdata=np.array(
+                [values for row in rows for values in _row_hover_customdata(row)],
+                dtype=object,
+            ),
+            marker={"size": 16, "opacity": 0},
+            hovertemplate=_ROW_HOVER_TEMPLATE,
+        )
+    )
 
 
 def _trace_color_for_segment_base(
@@ -498,6 +643,8 @@ def _resolve_figure_theme(theme_type: str) -> AssemblyTraceFigureTheme:
 
 def _initial_x_range(view: AssemblyTraceView) -> tuple[float, float]:
     full_left, full_right = view.x_range
+    if view.column_window is not None:
+        full_left = float(view.column_window[0]) * view.cell_width
     visible_width = min(
         float(_DEFAULT_INITIAL_VISIBLE_COLUMNS) * view.cell_width,
         full_right - full_left,
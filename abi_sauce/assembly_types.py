@@ -1,7 +1,11 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Literal, TypeAlias
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+import hashlib
+from typing import Literal, TypeAlias, overload
+
+import numpy as np
 
 from abi_sauce.alignment_policy import AlignmentStrand
 
@@ -14,6 +18,16 @@ ConflictResolution: TypeAlias = Literal[
     "ambiguous",
 ]
 
+CONFLICT_RESOLUTIONS: tuple[ConflictResolution, ...] = (
+    "concordant",
+    "single_read",
+    "quality_resolved",
+    "majority_resolved",
+    "ambiguous",
+)
+GRID_MISSING = -(2**31)
+GRID_GAP_CODE = ord("-")
+
 
 @dataclass(frozen=True, slots=True)
 class AssemblyConfig:
@@ -141,6 +155,204 @@ class MultiAssemblyColumn:
     ambiguous: bool = False
 
 
+def _empty_grid_matrix(dtype: type) -> np.ndarray:
+    return np.zeros((0, 0), dtype=dtype)
+
+
+def _empty_grid_vector(dtype: type) -> np.ndarray:
+    return np.zeros(0, dtype=dtype)
+
+
+@dataclass(frozen=True, slots=True)
+class MultiAssemblyGrid:
+    """Member x column arrays backing one multi-read alignment grid.
+
+    Row ``i`` of every matrix belongs to ``member_indices[i]``. Integer cells
+    without a value (gaps, reads without qualities or trace positions) hold
+    ``GRID_MISSING``; gap cells carry ``-`` in ``base_codes``.
+    """
+
+    member_indices: tuple[int, ...] = ()
+    base_codes: np.ndarray = field(
+        default_factory=lambda: _empty_grid_matrix(np.uint8)
+    )
+    query_indices: np.ndarray = field(
+        default_factory=lambda: _empty_grid_matrix(np.int32)
+    )
+    qualities: np.ndarray = field(default_factory=lambda: _empty_grid_matrix(np.int32))
+    trace_x: np.ndarray = field(default_factory=lambda: _empty_grid_matrix(np.int32))
+    consensus_codes: np.ndarray = field(
+        default_factory=lambda: _empty_grid_vector(np.uint8)
+    )
+    resolution_codes: np.ndarray = field(
+        default_factory=lambda: _empty_grid_vector(np.int8)
+    )
+
+    @property
+    def column_count(self) -> int:
+        return int(self.consensus_codes.shape[0])
+
+    @property
+    def gap_mask(self) -> np.ndarray:
+        """Return a member x column mask of gap cells."""
+        return self.query_indices == GRID_MISSING
+
+    @property
+    def non_gap_counts(self) -> np.ndarray:
+        """Return the number of non-gap members in every column."""
+        return np.count_nonzero(~self.gap_mask, axis=0)
+
+    def row_position(self, member_index: int) -> int:
+        """Return the matrix row that holds one included member."""
+        return self.member_indices.index(member_index)
+
+    def aligned_sequence(self, row_position: int) -> str:
+        """Return one member row as a gapped sequence string."""
+        return self.base_codes[row_position].tobytes().decode("ascii")
+
+    def support_counts(self, column_position: int) -> tuple[tuple[str, int], ...]:
+        """Return non-gap base counts for one column, most supported first."""
+        column_gap_mask = self.query_indices[:, column_position] == GRID_MISSING
+        base_codes, counts = np.unique(
+            self.base_codes[~column_gap_mask, column_position],
+            return_counts=True,
+        )
+        return tuple(
+            sorted(
+                (
+                    (chr(base_code), count)
+                    for base_code, count in zip(
+                        base_codes.tolist(),
+                        counts.tolist(),
+                        strict=True,
+                    )
+                ),
+                key=lambda item: (-item[1], item[0]),
+            )
+        )
+
+    def column(self, column_position: int) -> MultiAssemblyColumn:
+        """Materialize one zero-based column as a ``MultiAssemblyColumn``."""
+        column_base_codes = self.base_codes[:, column_position].tolist()
+        column_query_indices = self.query_indices[:, column_position].tolist()
+        column_qualities = self.qualities[:, column_position].tolist()
+        column_trace_x = self.trace_x[:, column_position].tolist()
+
+        member_cells: list[MultiAssemblyMemberCell] = []
+        support_counts: dict[str, int] = {}
+        quality_sums: dict[str, int] = {}
+        for member_index, base_code, query_index, quality, trace_x in zip(
+            self.member_indices,
+            column_base_codes,
+            column_query_indices,
+            column_qualities,
+            column_trace_x,
+            strict=True,
+        ):
+            is_gap = query_index == GRID_MISSING
+            base = chr(base_code)
+            member_cells.append(
+                MultiAssemblyMemberCell(
+                    member_index=member_index,
+                    base=base,
+                    query_index=None if is_gap else query_index,
+                    query_pos=None if is_gap else query_index + 1,
+                    quality=None if quality == GRID_MISSING else quality,
+                    trace_x=None if trace_x == GRID_MISSING else trace_x,
+                    is_gap=is_gap,
+                )
+            )
+            if is_gap:
+                continue
+            support_counts[base] = support_counts.get(base, 0) + 1
+            quality_sums[base] = quality_sums.get(base, 0) + (
+                0 if quality == GRID_MISSING else quality
+            )
+
+        consensus_base = chr(int(self.consensus_codes[column_position]))
+        resolution_code = int(self.resolution_codes[column_position])
+        non_gap_member_count = sum(support_counts.values())
+        return MultiAssemblyColumn(
+            column_index=column_position + 1,
+            consensus_base=consensus_base,
+            resolution=CONFLICT_RESOLUTIONS[resolution_code],
+            member_cells=tuple(member_cells),
+            support_counts=tuple(
+                sorted(support_counts.items(), key=lambda item: (-item[1], item[0]))
+            ),
+            quality_sums=tuple(sorted(quality_sums.items())),
+            non_gap_member_count=non_gap_member_count,
+            gap_member_count=len(member_cells) - non_gap_member_count,
+            ambiguous=consensus_base == "N",
+        )
+
+    def content_digest(self) -> str:
+        """Return a stable digest over every array in the grid."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(self.member_indices).encode("utf-8"))
+        for array in (
+            self.base_codes,
+            self.query_indices,
+            self.qualities,
+            self.trace_x,
+            self.consensus_codes,
+            self.resolution_codes,
+        ):
+            digest.update(repr(array.shape).encode("utf-8"))
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MultiAssemblyGrid):
+            return NotImplemented
+        return self.content_digest() == other.content_digest()
+
+    def __hash__(self) -> int:
+        return hash(self.content_digest())
+
+    def __repr__(self) -> str:
+        return (
+            f"MultiAssemblyGrid(members={len(self.member_indices)}, "
+            f"columns={self.column_count}, digest={self.content_digest()})"
+        )
+
+
+class MultiAssemblyColumnsView(Sequence[MultiAssemblyColumn]):
+    """Lazy tuple-like view that materializes grid columns on access."""
+
+    __slots__ = ("_grid",)
+
+    def __init__(self, grid: MultiAssemblyGrid) -> None:
+        self._grid = grid
+
+    def __len__(self) -> int:
+        return self._grid.column_count
+
+    @overload
+    def __getitem__(self, index: int) -> MultiAssemblyColumn: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> tuple[MultiAssemblyColumn, ...]: ...
+
+    def __getitem__(
+        self,
+        index: int | slice,
+    ) -> MultiAssemblyColumn | tuple[MultiAssemblyColumn, ...]:
+        if isinstance(index, slice):
+            return tuple(
+                self._grid.column(position)
+                for position in range(*index.indices(len(self)))
+            )
+        position = index + len(self) if index < 0 else index
+        if position < 0 or position >= len(self):
+            raise IndexError("multi-assembly column index out of range")
+        return self._grid.column(position)
+
+    def __iter__(self) -> Iterator[MultiAssemblyColumn]:
+        for position in range(len(self)):
+            yield self._grid.column(position)
+
+
 @dataclass(frozen=True, slots=True)
 class MultiAssemblyResult:
     """Derived anchored multi-read assembly result."""
@@ -153,11 +365,16 @@ class MultiAssemblyResult:
     aligned_member_sequences: tuple[str, ...]
     gapped_consensus: str
     consensus_sequence: str
-    columns: tuple[MultiAssemblyColumn, ...] = ()
+    grid: MultiAssemblyGrid = field(default_factory=MultiAssemblyGrid)
     included_member_count: int = 0
     excluded_member_count: int = 0
     ambiguous_column_count: int = 0
 
+    @property
+    def columns(self) -> MultiAssemblyColumnsView:
+        """Return lazily materialized per-column records for the grid."""
+        return MultiAssemblyColumnsView(self.grid)
+
     @property
     def conflict_count(self) -> int:
         return self.ambiguous_column_count
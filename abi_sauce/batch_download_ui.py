@@ -7,6 +7,7 @@ import streamlit as st
 from abi_sauce.batch import ExportFormat
 from abi_sauce.exceptions import ExportError
 from abi_sauce.services.batch_export import prepare_batch_download
+from abi_sauce.services.batch_report import build_batch_chromatogram_report
 from abi_sauce.services.batch_trim import PreparedBatch
 
 
@@ -95,3 +96,54 @@ def render_batch_download_controls(
         )
 
     _download_fragment()
+
+
+def render_batch_report_controls(
+    *,
+    prepared_batch: PreparedBatch,
+    key_prefix: str,
+    default_filename_stem: str = "abi-sauce-report",
+) -> None:
+    """Render on-demand chromatogram report controls for the active batch."""
+    filename_stem = st.text_input(
+        "Report filename stem",
+        value=default_filename_stem,
+        key=f"{key_prefix}.filename_stem",
+    )
+    report_state_key = f"{key_prefix}.report"
+    report_inputs = (
+        prepared_batch.signature,
+        filename_stem,
+        tuple(
+            (
+                source_filename,
+                trim_result.bases_removed_left,
+                trim_result.bases_removed_right,
+            )
+            for source_filename, trim_result in prepared_batch.trim_results.items()
+        ),
+    )
+    if st.button("Build chromatogram report", key=f"{key_prefix}.build_button"):
+        with st.spinner("Rendering chromatograms..."):
+            st.session_state[report_state_key] = (
+                report_inputs,
+                build_batch_chromatogram_report(
+                    prepared_batch,
+                    filename_stem=filename_stem,
+                ),
+            )
+
+    report_state = st.session_state.get(report_state_key)
+    if report_state is None or report_state[0] != report_inputs:
+        st.caption("Renders a printable HTML report with one thumbnail per read.")
+        return
+
+    report = report_state[1]
+    st.caption(f"{len(report.entries)} read(s) rendered")
+    st.download_button(
+        label="Download chromatogram report",
+        data=report.data,
+        file_name=report.filename,
+        mime=report.mime,
+        key=f"{key_prefix}.download_button",
+    )
@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Final
+import hashlib
+from typing import Final, TypeAlias
 
+import numpy as np
+
+from abi_sauce.lru_cache import LruCache, LruCacheInfo
 from abi_sauce.models import SequenceOrientation, SequenceRecord, TraceData
-from abi_sauce.signal_sampling import resample_signal_window
+from abi_sauce.signal_decimation import SignalPyramid
+from abi_sauce.signal_envelope import SignalEnvelope
+from abi_sauce.signal_sampling import resample_signal_windows
 from abi_sauce.trace_coordinates import display_trim_start
 from abi_sauce.orientation import complement_base
 from abi_sauce.trimming import TrimResult
@@ -17,6 +23,9 @@ _CHANNEL_COLORS: Final[dict[str, str]] = {
     "G": "black",
     "T": "red",
 }
+_CHROMATOGRAM_VIEW_CACHE_MAX_ENTRIES: Final[int] = 128
+
+ChromatogramViewCacheKey: TypeAlias = tuple[str, tuple[int, int, int] | None]
 
 
 @dataclass(frozen=True, slots=True)
@@ -72,7 +81,12 @@ class ChromatogramTrimBoundaries:
 
 @dataclass(frozen=True, slots=True)
 class ChromatogramView:
-    """Pure plotting/view-model state for one chromatogram."""
+    """Pure plotting/view-model state for one chromatogram.
+
+    ``fingerprint`` digests the record content, trim counts and orientation
+    the view was built from, so caches can key on it without hashing the
+    full signal.
+    """
 
     is_renderable: bool
     render_failure_reason: str | None = None
@@ -86,6 +100,17 @@ class ChromatogramView:
     )
     retained_sample_range: tuple[float, float] | None = None
     has_any_retained_samples: bool = True
+    signal_envelope: SignalEnvelope | None = field(
+        default=None,
+        compare=False,
+        repr=False,
+    )
+    signal_pyramid: SignalPyramid | None = field(
+        default=None,
+        compare=False,
+        repr=False,
+    )
+    fingerprint: str | None = field(default=None, compare=False, repr=False)
 
     @property
     def trace_length(self) -> int:
@@ -127,17 +152,71 @@ class ChromatogramColumn:
     raw_left: float | None = None
     raw_right: float | None = None
     raw_center: float | None = None
-    channels: tuple[ChromatogramColumnChannel, ...] = ()
+    has_trace_signal: bool = False
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PackedColumnSignal:
+    """Resampled column channel signal packed into read-only arrays.
+
+    ``x_values`` is a ``traced column x sample`` array and ``signal`` a
+    ``channel x traced column x sample`` array, where ``traced_columns``
+    holds the ascending positions of the columns that carry signal.
+    """
+
+    channel_bases: tuple[str, ...] = ()
+    traced_columns: np.ndarray = field(
+        default_factory=lambda: np.zeros(0, dtype=np.int64)
+    )
+    x_values: np.ndarray = field(default_factory=lambda: np.zeros((0, 0)))
+    signal: np.ndarray = field(default_factory=lambda: np.zeros((0, 0, 0)))
+
+    def __post_init__(self) -> None:
+        for array in (self.traced_columns, self.x_values, self.signal):
+            array.flags.writeable = False
 
     @property
-    def has_trace_signal(self) -> bool:
-        """Return whether the column carries any resampled trace segments."""
-        return bool(self.channels)
+    def traced_column_count(self) -> int:
+        """Return how many base columns carry resampled signal."""
+        return int(self.traced_columns.size)
+
+    def traced_position(self, column_position: int) -> int | None:
+        """Return the traced-array index of one column, or ``None`` if untraced."""
+        traced_position = int(np.searchsorted(self.traced_columns, column_position))
+        if (
+            traced_position < self.traced_column_count
+            and int(self.traced_columns[traced_position]) == column_position
+        ):
+            return traced_position
+        return None
+
+    def content_digest(self) -> str:
+        """Return a stable digest over the channel bases and every array."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr(self.channel_bases).encode("utf-8"))
+        for array in (self.traced_columns, self.x_values, self.signal):
+            digest.update(f"{array.dtype.str}{array.shape}".encode("utf-8"))
+            digest.update(np.ascontiguousarray(array).tobytes())
+        return digest.hexdigest()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedColumnSignal):
+            return NotImplemented
+        return self.content_digest() == other.content_digest()
+
+    def __hash__(self) -> int:
+        return hash(self.content_digest())
 
 
 @dataclass(frozen=True, slots=True)
 class ChromatogramColumnView:
-    """Pure fixed-width base-column view for one chromatogram."""
+    """Pure fixed-width base-column view for one chromatogram.
+
+    Resampled channel signal lives only in ``packed_signal``; use
+    ``column_channels`` for one column's segments. ``fingerprint`` digests
+    the inputs the view was built from, so caches can key on it without
+    hashing every column.
+    """
 
     is_renderable: bool
     render_failure_reason: str | None = None
@@ -147,6 +226,11 @@ class ChromatogramColumnView:
     )
     cell_width: float = 1.0
     samples_per_base: int = 16
+    packed_signal: PackedColumnSignal = field(
+        default_factory=PackedColumnSignal,
+        repr=False,
+    )
+    fingerprint: str | None = field(default=None, compare=False, repr=False)
 
     @property
     def base_count(self) -> int:
@@ -168,6 +252,35 @@ class ChromatogramColumnView:
         """Return the x-extent in base-column coordinates."""
         return (0.0, float(self.base_count) * self.cell_width)
 
+    def column_channels(
+        self,
+        column_position: int,
+    ) -> tuple[ChromatogramColumnChannel, ...]:
+        """Return the resampled channel segments of one base column."""
+        traced_position = self.packed_signal.traced_position(column_position)
+        if traced_position is None:
+            return ()
+        x_values = tuple(self.packed_signal.x_values[traced_position].tolist())
+        return tuple(
+            ChromatogramColumnChannel(
+                base=base,
+                color=_display_color_for_base(base),
+                x_values=x_values,
+                signal=tuple(channel_signal),
+            )
+            for base, channel_signal in zip(
+                self.packed_signal.channel_bases,
+                self.packed_signal.signal[:, traced_position, :].tolist(),
+                strict=True,
+            )
+        )
+
+
+_chromatogram_view_cache: LruCache[
+    ChromatogramViewCacheKey,
+    dict[SequenceOrientation, ChromatogramView],
+] = LruCache(_CHROMATOGRAM_VIEW_CACHE_MAX_ENTRIES)
+
 
 def build_chromatogram_column_view(
     record: SequenceRecord,
@@ -176,84 +289,181 @@ def build_chromatogram_column_view(
     cell_width: float = 1.0,
     samples_per_base: int = 16,
 ) -> ChromatogramColumnView:
-    """Project one chromatogram onto a fixed-width base-column grid."""
+    """Project one chromatogram onto a fixed-width base-column grid.
+
+    Column bounds, qualities, peak heights and resampled channel segments are
+    derived from the raw trace arrays in display orientation, without building
+    the full-trace view first.
+    """
     if cell_width <= 0:
         raise ValueError("cell_width must be > 0")
     if samples_per_base < 2:
         raise ValueError("samples_per_base must be >= 2")
 
-    raw_view = build_chromatogram_view(record, trim_result)
-    if not raw_view.is_renderable:
+    fingerprint = build_view_fingerprint(
+        "chromatogram_column_view",
+        build_chromatogram_view_cache_key(record, trim_result),
+        record.orientation,
+        cell_width,
+        samples_per_base,
+    )
+    trace_data = record.trace_data
+    if trace_data is None:
         return ChromatogramColumnView(
             is_renderable=False,
-            render_failure_reason=raw_view.render_failure_reason,
+            render_failure_reason="missing_trace_data",
             cell_width=cell_width,
             samples_per_base=samples_per_base,
+            fingerprint=fingerprint,
         )
 
-    base_spans_by_index = {
-        base_span.base_index: base_span for base_span in raw_view.base_spans
-    }
-    quality_segments_by_index = {
-        quality_segment.base_index: quality_segment
-        for quality_segment in raw_view.quality_segments
-    }
-
-    columns: list[ChromatogramColumn] = []
-    for column_index, base_call in enumerate(raw_view.base_calls, start=1):
-        cell_left = float(column_index - 1) * cell_width
-        cell_right = cell_left + cell_width
-        cell_center = _midpoint(cell_left, cell_right)
-
-        base_span = base_spans_by_index.get(base_call.base_index)
-        quality_segment = quality_segments_by_index.get(base_call.base_index)
-        raw_left = None if base_span is None else base_span.left
-        raw_right = None if base_span is None else base_span.right
-        raw_center = (
-            float(base_call.position) if base_span is None else float(base_span.center)
+    channel_bases, signal_matrix = _column_signal_matrix(trace_data)
+    if not channel_bases:
+        return ChromatogramColumnView(
+            is_renderable=False,
+            render_failure_reason="missing_trace_channels",
+            cell_width=cell_width,
+            samples_per_base=samples_per_base,
+            fingerprint=fingerprint,
         )
 
-        columns.append(
-            ChromatogramColumn(
-                column_index=column_index,
-                base_index=base_call.base_index,
-                query_pos=base_call.base_index + 1,
-                base=base_call.base,
-                color=base_call.color,
-                quality=(
-                    None if quality_segment is None else int(quality_segment.quality)
-                ),
-                trace_x=base_call.position,
-                peak_height=_peak_height_for_base_call(raw_view, base_call),
-                is_retained=_is_base_index_retained(
-                    base_index=base_call.base_index,
-                    trim_result=trim_result,
-                    display_orientation=record.orientation,
-                ),
-                cell_left=cell_left,
-                cell_right=cell_right,
-                cell_center=cell_center,
-                raw_left=raw_left,
-                raw_right=raw_right,
-                raw_center=raw_center,
-                channels=(
-                    ()
-                    if base_span is None
-                    else _build_column_channels(
-                        channels=raw_view.channels,
-                        raw_left=base_span.left,
-                        raw_right=base_span.right,
-                        cell_left=cell_left,
-                        cell_right=cell_right,
-                        samples_per_base=samples_per_base,
-                    )
-                ),
+    trace_length = signal_matrix.shape[1]
+    usable_base_count = min(len(record.sequence), len(trace_data.base_positions))
+    base_positions = np.asarray(
+        trace_data.base_positions[:usable_base_count],
+        dtype=np.int64,
+    )
+    base_indices = np.flatnonzero(
+        (base_positions >= 0) & (base_positions < trace_length)
+    )
+    positions = base_positions[base_indices]
+    bases = [record.sequence[base_index].upper() for base_index in base_indices]
+    span_lefts, span_rights = _column_span_edges(positions, trace_length=trace_length)
+    has_span = span_rights - span_lefts > 0
+    has_quality = has_span.copy()
+    if record.qualities is None:
+        has_quality[:] = False
+        qualities = np.zeros(len(base_indices), dtype=np.int64)
+    else:
+        has_quality &= base_indices < len(record.qualities)
+        qualities = np.asarray(
+            [
+                int(record.qualities[base_index]) if is_known else 0
+                for base_index, is_known in zip(base_indices, has_quality)
+            ],
+            dtype=np.int64,
+        )
+    peak_heights = _column_peak_heights(
+        channel_bases,
+        signal_matrix,
+        bases=bases,
+        positions=positions,
+    )
+    span_centers = positions.astype(np.float64)
+
+    if record.orientation != "forward":
+        mirror = float(trace_length - 1)
+        channel_bases = tuple(_complement_display_base(base) for base in channel_bases)
+        signal_matrix = signal_matrix[:, ::-1]
+        bases = [_complement_display_base(base) for base in reversed(bases)]
+        base_indices = np.arange(len(bases), dtype=np.int64)
+        positions = (mirror - positions[::-1]).astype(np.int64)
+        peak_heights = peak_heights[::-1]
+        (
+            has_span,
+            span_lefts,
+            span_rights,
+            span_centers,
+        ) = _reverse_complement_column_spans(
+            has_span,
+            span_lefts=span_lefts,
+            span_rights=span_rights,
+            span_centers=span_centers,
+            mirror=mirror,
+        )
+        has_quality, qualities = _reverse_complement_column_qualities(
+            has_quality,
+            qualities,
+        )
+
+    base_count = len(bases)
+    cell_lefts = np.arange(base_count, dtype=np.float64) * cell_width
+    cell_rights = cell_lefts + cell_width
+    is_retained = _column_retained_mask(
+        base_indices,
+        trim_result=trim_result,
+        display_orientation=record.orientation,
+    )
+    packed_signal = _resample_column_channels(
+        channel_bases,
+        signal_matrix,
+        has_span=has_span,
+        span_lefts=span_lefts,
+        span_rights=span_rights,
+        cell_lefts=cell_lefts,
+        cell_rights=cell_rights,
+        samples_per_base=samples_per_base,
+    )
+
+    columns = tuple(
+        ChromatogramColumn(
+            column_index=column_position + 1,
+            base_index=base_index,
+            query_pos=base_index + 1,
+            base=base,
+            color=_display_color_for_base(base),
+            quality=quality if is_quality_known else None,
+            trace_x=position,
+            peak_height=peak_height,
+            is_retained=is_column_retained,
+            cell_left=cell_left,
+            cell_right=cell_right,
+            cell_center=_midpoint(cell_left, cell_right),
+            raw_left=span_left if is_span_known else None,
+            raw_right=span_right if is_span_known else None,
+            raw_center=span_center if is_span_known else float(position),
+            has_trace_signal=is_span_known,
+        )
+        for (
+            column_position,
+            (
+                base_index,
+                base,
+                position,
+                quality,
+                is_quality_known,
+                peak_height,
+                is_column_retained,
+                cell_left,
+                cell_right,
+                span_left,
+                span_right,
+                span_center,
+                is_span_known,
+            ),
+        ) in enumerate(
+            zip(
+                base_indices.tolist(),
+                bases,
+                positions.tolist(),
+                qualities.tolist(),
+                has_quality.tolist(),
+                peak_heights.tolist(),
+                is_retained.tolist(),
+                cell_lefts.tolist(),
+                cell_rights.tolist(),
+                span_lefts.tolist(),
+                span_rights.tolist(),
+                span_centers.tolist(),
+                has_span.tolist(),
+                strict=True,
             )
         )
+    )
 
     return ChromatogramColumnView(
         is_renderable=True,
-        columns=tuple(columns),
+        columns=columns,
         trim_boundaries=_resolve_column_trim_boundaries(
             trim_result=trim_result,
             base_count=len(columns),
@@ -262,19 +472,153 @@ def build_chromatogram_column_view(
         ),
         cell_width=cell_width,
         samples_per_base=samples_per_base,
+        packed_signal=packed_signal,
+        fingerprint=fingerprint,
     )
 
 
 def build_chromatogram_view(
     record: SequenceRecord,
     trim_result: TrimResult | None = None,
+    *,
+    use_cache: bool = True,
 ) -> ChromatogramView:
     """Build a normalized chromatogram view model from one sequence record."""
+    return build_oriented_chromatogram_view(
+        record,
+        trim_result,
+        orientation=record.orientation,
+        use_cache=use_cache,
+    )
+
+
+def build_oriented_chromatogram_view(
+    record: SequenceRecord,
+    trim_result: TrimResult | None = None,
+    *,
+    orientation: SequenceOrientation,
+    use_cache: bool = True,
+) -> ChromatogramView:
+    """Build one record's chromatogram view in an explicit raw-trace orientation.
+
+    The forward geometry only depends on the record's sequence, qualities and
+    trace data plus the trim counts, so it is cached process-wide on exactly
+    that content. The reverse-complement view is only derived from the cached
+    forward view when first requested, and mirrors its signal arrays.
+    """
+    cache_key = build_chromatogram_view_cache_key(record, trim_result)
+    if not use_cache:
+        return orient_chromatogram_view(
+            _build_forward_chromatogram_view(record, trim_result, cache_key=cache_key),
+            orientation,
+        )
+
+    cached_views = _chromatogram_view_cache.get(cache_key)
+    if cached_views is None:
+        cached_views = {
+            "forward": _build_forward_chromatogram_view(
+                record,
+                trim_result,
+                cache_key=cache_key,
+            )
+        }
+        _chromatogram_view_cache.store(cache_key, cached_views)
+    oriented_view = cached_views.get(orientation)
+    if oriented_view is None:
+        oriented_view = _store_cached_oriented_view(
+            cached_views,
+            orientation,
+            orient_chromatogram_view(cached_views["forward"], orientation),
+        )
+    return oriented_view
+
+
+def build_chromatogram_view_cache_key(
+    record: SequenceRecord,
+    trim_result: TrimResult | None = None,
+) -> ChromatogramViewCacheKey:
+    """Return the content-based cache key for one forward chromatogram view."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(record.sequence).encode("utf-8"))
+    digest.update(_array_digest_bytes(record.qualities))
+    trace_data = record.trace_data
+    if trace_data is not None:
+        digest.update(repr(trace_data.channel_order).encode("utf-8"))
+        digest.update(_array_digest_bytes(trace_data.base_positions))
+        for data_key, signal in sorted(trace_data.channels.items()):
+            digest.update(repr(data_key).encode("utf-8"))
+            digest.update(_array_digest_bytes(signal))
+    return (
+        digest.hexdigest(),
+        (
+            None
+            if trim_result is None
+            else (
+                trim_result.bases_removed_left,
+                trim_result.bases_removed_right,
+                trim_result.trimmed_length,
+            )
+        ),
+    )
+
+
+def build_view_fingerprint(*parts: object) -> str:
+    """Return a short digest of the upstream inputs one view was built from."""
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def chromatogram_view_cache_info() -> LruCacheInfo:
+    """Return the current hit/miss counters for the chromatogram view cache."""
+    return _chromatogram_view_cache.info()
+
+
+def clear_chromatogram_view_cache() -> None:
+    """Drop every cached chromatogram view and reset the counters."""
+    _chromatogram_view_cache.clear()
+
+
+def orient_chromatogram_view(
+    view: ChromatogramView,
+    orientation: SequenceOrientation,
+) -> ChromatogramView:
+    """Return a chromatogram view in the requested orientation."""
+    return _apply_orientation_to_view(view, orientation)
+
+
+def reverse_complement_chromatogram_view(
+    view: ChromatogramView,
+) -> ChromatogramView:
+    """Return a reverse-complemented chromatogram view."""
+    return orient_chromatogram_view(view, "reverse_complement")
+
+
+def chromatogram_signal_envelope(view: ChromatogramView) -> SignalEnvelope:
+    """Return the view's channel envelope, building one if it carries none."""
+    if view.signal_envelope is not None:
+        return view.signal_envelope
+    return SignalEnvelope(tuple(channel.signal for channel in view.channels))
+
+
+def chromatogram_signal_pyramid(view: ChromatogramView) -> SignalPyramid:
+    """Return the view's decimation pyramid, building one if it carries none."""
+    if view.signal_pyramid is not None:
+        return view.signal_pyramid
+    return SignalPyramid(tuple(channel.signal for channel in view.channels))
+
+
+def _build_forward_chromatogram_view(
+    record: SequenceRecord,
+    trim_result: TrimResult | None,
+    *,
+    cache_key: ChromatogramViewCacheKey,
+) -> ChromatogramView:
+    fingerprint = build_view_fingerprint("chromatogram_view", cache_key, "forward")
     trace_data = record.trace_data
     if trace_data is None:
         return ChromatogramView(
             is_renderable=False,
             render_failure_reason="missing_trace_data",
+            fingerprint=fingerprint,
         )
 
     channels = _build_channels(trace_data)
@@ -282,6 +626,7 @@ def build_chromatogram_view(
         return ChromatogramView(
             is_renderable=False,
             render_failure_reason="missing_trace_channels",
+            fingerprint=fingerprint,
         )
 
     trace_length = min(len(channel.signal) for channel in channels)
@@ -289,6 +634,7 @@ def build_chromatogram_view(
         return ChromatogramView(
             is_renderable=False,
             render_failure_reason="empty_trace_channels",
+            fingerprint=fingerprint,
         )
 
     x_values = tuple(range(trace_length))
@@ -325,7 +671,7 @@ def build_chromatogram_view(
         trace_length=trace_length,
     )
 
-    raw_view = ChromatogramView(
+    return ChromatogramView(
         is_renderable=True,
         x_values=x_values,
         channels=sanitized_channels,
@@ -335,23 +681,30 @@ def build_chromatogram_view(
         trim_boundaries=trim_boundaries,
         retained_sample_range=retained_sample_range,
         has_any_retained_samples=has_any_retained_samples,
+        signal_envelope=SignalEnvelope(
+            tuple(channel.signal for channel in sanitized_channels)
+        ),
+        signal_pyramid=SignalPyramid(
+            tuple(channel.signal for channel in sanitized_channels)
+        ),
+        fingerprint=fingerprint,
     )
-    return orient_chromatogram_view(raw_view, record.orientation)
 
 
-def orient_chromatogram_view(
-    view: ChromatogramView,
+def _store_cached_oriented_view(
+    cached_views: dict[SequenceOrientation, ChromatogramView],
     orientation: SequenceOrientation,
+    view: ChromatogramView,
 ) -> ChromatogramView:
-    """Return a chromatogram view in the requested orientation."""
-    return _apply_orientation_to_view(view, orientation)
+    with _chromatogram_view_cache.lock:
+        return cached_views.setdefault(orientation, view)
 
 
-def reverse_complement_chromatogram_view(
-    view: ChromatogramView,
-) -> ChromatogramView:
-    """Return a reverse-complemented chromatogram view."""
-    return orient_chromatogram_view(view, "reverse_complement")
+def _array_digest_bytes(values: list[int] | None) -> bytes:
+    if values is None:
+        return b"None"
+    array = np.asarray(values)
+    return f"{array.dtype.str}{array.shape}".encode("utf-8") + array.tobytes()
 
 
 def _build_channels(trace_data: TraceData) -> tuple[ChromatogramChannel, ...]:
@@ -518,74 +871,150 @@ def _quality_right_edge(
     )
 
 
-def _peak_height_for_base_call(
-    view: ChromatogramView,
-    base_call: ChromatogramBaseCall,
-) -> int | None:
-    for channel in view.channels:
-        if channel.base == base_call.base and base_call.position < len(channel.signal):
-            return channel.signal[base_call.position]
-
-    fallback_heights = [
-        channel.signal[base_call.position]
-        for channel in view.channels
-        if base_call.position < len(channel.signal)
-    ]
-    if not fallback_heights:
-        return None
-    return max(fallback_heights)
+def _column_signal_matrix(
+    trace_data: TraceData,
+) -> tuple[tuple[str, ...], np.ndarray]:
+    channel_order = _normalize_channel_order(trace_data.channel_order)
+    base_by_data_key = dict(zip(_TRACE_CHANNEL_KEYS, channel_order, strict=True))
+    channel_bases: list[str] = []
+    signals: list[np.ndarray] = []
+    for data_key in _TRACE_CHANNEL_KEYS:
+        signal = trace_data.channels.get(data_key)
+        if signal is None or not len(signal):
+            continue
+        channel_bases.append(base_by_data_key[data_key])
+        signals.append(np.asarray(signal, dtype=np.int64))
+    if not signals:
+        return (), np.zeros((0, 0), dtype=np.int64)
+
+    trace_length = min(signal.size for signal in signals)
+    return tuple(channel_bases), np.stack(
+        [signal[:trace_length] for signal in signals]
+    )
 
 
-def _build_column_channels(
+def _column_span_edges(
+    positions: np.ndarray,
     *,
-    channels: tuple[ChromatogramChannel, ...],
-    raw_left: float,
-    raw_right: float,
-    cell_left: float,
-    cell_right: float,
-    samples_per_base: int,
-) -> tuple[ChromatogramColumnChannel, ...]:
-    if not channels or raw_right <= raw_left:
-        return ()
-
-    column_channels: list[ChromatogramColumnChannel] = []
-    for channel in channels:
-        x_values, sampled_signal = resample_signal_window(
-            channel.signal,
-            raw_left=raw_left,
-            raw_right=raw_right,
-            cell_left=cell_left,
-            cell_right=cell_right,
-            sample_count=samples_per_base,
-        )
-        column_channels.append(
-            ChromatogramColumnChannel(
-                base=channel.base,
-                color=channel.color,
-                x_values=x_values,
-                signal=sampled_signal,
-            )
-        )
-    return tuple(column_channels)
+    trace_length: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    if not positions.size:
+        return np.zeros(0, dtype=np.float64), np.zeros(0, dtype=np.float64)
+
+    midpoints = (positions[:-1] + positions[1:]) / 2.0
+    edge_positions = tuple(int(position) for position in positions[:2])
+    tail_positions = tuple(int(position) for position in positions[-2:])
+    lefts = np.concatenate([[_extrapolated_left_edge(edge_positions)], midpoints])
+    rights = np.concatenate([midpoints, [_extrapolated_right_edge(tail_positions)]])
+    last_sample = float(trace_length - 1)
+    return np.clip(lefts, 0.0, last_sample), np.clip(rights, 0.0, last_sample)
+
+
+def _column_peak_heights(
+    channel_bases: tuple[str, ...],
+    signal_matrix: np.ndarray,
+    *,
+    bases: list[str],
+    positions: np.ndarray,
+) -> np.ndarray:
+    if not positions.size:
+        return np.zeros(0, dtype=np.int64)
+
+    values_at_calls = signal_matrix[:, positions]
+    matches_call_base = np.asarray(
+        [[channel_base == base for base in bases] for channel_base in channel_bases]
+    )
+    first_match = matches_call_base.argmax(axis=0)
+    return np.where(
+        matches_call_base.any(axis=0),
+        values_at_calls[first_match, np.arange(positions.size)],
+        values_at_calls.max(axis=0),
+    )
 
 
-def _is_base_index_retained(
+def _reverse_complement_column_spans(
+    has_span: np.ndarray,
+    *,
+    span_lefts: np.ndarray,
+    span_rights: np.ndarray,
+    span_centers: np.ndarray,
+    mirror: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    # Oriented spans are renumbered by display position among spans, not calls.
+    source = np.flatnonzero(has_span)[::-1]
+    oriented_has_span = np.arange(has_span.size) < source.size
+    oriented_lefts = np.zeros(has_span.size, dtype=np.float64)
+    oriented_rights = np.zeros(has_span.size, dtype=np.float64)
+    oriented_centers = np.zeros(has_span.size, dtype=np.float64)
+    oriented_lefts[: source.size] = mirror - span_rights[source]
+    oriented_rights[: source.size] = mirror - span_lefts[source]
+    oriented_centers[: source.size] = mirror - span_centers[source]
+    return oriented_has_span, oriented_lefts, oriented_rights, oriented_centers
+
+
+def _reverse_complement_column_qualities(
+    has_quality: np.ndarray,
+    qualities: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    source = np.flatnonzero(has_quality)[::-1]
+    oriented_qualities = np.zeros(has_quality.size, dtype=np.int64)
+    oriented_qualities[: source.size] = qualities[source]
+    return np.arange(has_quality.size) < source.size, oriented_qualities
+
+
+def _column_retained_mask(
+    base_indices: np.ndarray,
     *,
-    base_index: int,
     trim_result: TrimResult | None,
     display_orientation: SequenceOrientation,
-) -> bool:
+) -> np.ndarray:
     if trim_result is None:
-        return True
+        return np.ones(base_indices.size, dtype=bool)
     if trim_result.trimmed_length <= 0:
-        return False
+        return np.zeros(base_indices.size, dtype=bool)
 
     trimmed_display_start = display_trim_start(
         trim_result,
         display_orientation=display_orientation,
     )
     display_trim_end = trimmed_display_start + trim_result.trimmed_length
-    return trimmed_display_start <= base_index < display_trim_end
+    return (base_indices >= trimmed_display_start) & (base_indices < display_trim_end)
+
+
+def _resample_column_channels(
+    channel_bases: tuple[str, ...],
+    signal_matrix: np.ndarray,
+    *,
+    has_span: np.ndarray,
+    span_lefts: np.ndarray,
+    span_rights: np.ndarray,
+    cell_lefts: np.ndarray,
+    cell_rights: np.ndarray,
+    samples_per_base: int,
+) -> PackedColumnSignal:
+    column_positions = np.flatnonzero(has_span)
+    if not column_positions.size:
+        return PackedColumnSignal(
+            channel_bases=channel_bases,
+            traced_columns=column_positions,
+            x_values=np.zeros((0, samples_per_base)),
+            signal=np.zeros((len(channel_bases), 0, samples_per_base)),
+        )
+
+    x_values, sampled_signal = resample_signal_windows(
+        signal_matrix,
+        raw_left=span_lefts[column_positions],
+        raw_right=span_rights[column_positions],
+        cell_left=cell_lefts[column_positions],
+        cell_right=cell_rights[column_positions],
+        sample_count=samples_per_base,
+    )
+    return PackedColumnSignal(
+        channel_bases=channel_bases,
+        traced_columns=column_positions,
+        x_values=x_values,
+        signal=sampled_signal,
+    )
 
 
 def _resolve_column_trim_boundaries(
@@ -701,10 +1130,11 @@ def _apply_orientation_to_view(
         return view
 
     trace_length = view.trace_length
+    channels = _reverse_complement_channels(view.channels)
     return ChromatogramView(
         is_renderable=True,
         x_values=view.x_values,
-        channels=_reverse_complement_channels(view.channels),
+        channels=channels,
         base_calls=_reverse_complement_base_calls(
             view.base_calls,
             trace_length=trace_length,
@@ -726,6 +1156,19 @@ def _apply_orientation_to_view(
             trace_length=trace_length,
         ),
         has_any_retained_samples=view.has_any_retained_samples,
+        signal_envelope=(
+            None
+            if view.signal_envelope is None
+            else view.signal_envelope.reversed()
+        ),
+        signal_pyramid=(
+            None if view.signal_pyramid is None else view.signal_pyramid.reversed()
+        ),
+        fingerprint=(
+            None
+            if view.fingerprint is None
+            else build_view_fingerprint(view.fingerprint, orientation)
+        ),
     )
 
 
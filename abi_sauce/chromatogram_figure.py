@@ -1,22 +1,30 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from typing import Final
 
+import numpy as np
 import plotly.graph_objects as go
 
 from abi_sauce.chromatogram import (
     ChromatogramBaseCall,
     ChromatogramChannel,
     ChromatogramColumn,
-    ChromatogramColumnChannel,
     ChromatogramColumnView,
     ChromatogramQualitySegment,
     ChromatogramView,
+    PackedColumnSignal,
+    chromatogram_signal_envelope,
+    chromatogram_signal_pyramid,
 )
+from abi_sauce.signal_decimation import SignalPyramid
+from abi_sauce.signal_envelope import SignalEnvelope
 
 _DEFAULT_INITIAL_VISIBLE_BASES: Final[int] = 50
 _DEFAULT_INITIAL_BASE_PADDING_MULTIPLIER: Final[float] = 1.0
+_DEFAULT_PLOT_WIDTH_PX: Final[int] = 1200
+_TRACE_POINTS_PER_PIXEL: Final[int] = 2
 
 
 @dataclass(frozen=True, slots=True)
@@ -94,26 +102,53 @@ def build_chromatogram_figure(
     view: ChromatogramView,
     *,
     theme_type: str = "light",
+    x_range: tuple[float, float] | list[float] | None = None,
+    plot_width_px: int = _DEFAULT_PLOT_WIDTH_PX,
 ) -> go.Figure:
-    """Build a deterministic Plotly figure from a normalized chromatogram view."""
+    """Build a deterministic Plotly figure from a normalized chromatogram view.
+
+    Channel traces keep full resolution around ``x_range`` (the initial
+    window when omitted) and fall back to min/max decimated samples, sized
+    to ``plot_width_px``, across the rest of the trace.
+    """
     if not view.is_renderable:
         raise ValueError("Chromatogram view is not renderable")
 
-    max_signal = _max_signal(view)
+    signal_envelope = chromatogram_signal_envelope(view)
+    signal_pyramid = chromatogram_signal_pyramid(view)
+    max_signal = _max_signal(signal_envelope)
     base_label_y = _base_label_y(max_signal)
     theme = _resolve_figure_theme(theme_type)
+    visible_x_range = _initial_x_range(view) if x_range is None else tuple(x_range)
 
     figure = go.Figure()
 
-    for channel in view.channels:
-        _add_channel_traces(figure, view=view, channel=channel, theme=theme)
+    for channel_index, channel in enumerate(view.channels):
+        _add_channel_traces(
+            figure,
+            view=view,
+            channel=channel,
+            sample_positions=_channel_sample_positions(
+                signal_pyramid,
+                channel_index,
+                visible_x_range=visible_x_range,
+                plot_width_px=plot_width_px,
+            ),
+            signal=signal_pyramid.channel_values(channel_index),
+            theme=theme,
+        )
 
     called_peak_positions: list[int] = []
-    called_peak_heights: list[int] = []
+    called_peak_heights: list[int | float] = []
     called_peak_bases: list[str] = []
     called_peak_colors: list[str] = []
+    signals_by_base = _channel_signals_by_base(view)
     for base_call in view.base_calls:
-        peak_height = _resolve_called_peak_height(view, base_call)
+        peak_height = _resolve_called_peak_height(
+            base_call,
+            signals_by_base=signals_by_base,
+            signal_envelope=signal_envelope,
+        )
         if peak_height is None:
             continue
         called_peak_positions.append(base_call.position)
@@ -211,7 +246,7 @@ def build_chromatogram_figure(
         title_text="Sample index",
         title_font={"color": theme.font_color},
         tickfont={"color": theme.font_color},
-        range=list(_initial_x_range(view)),
+        range=list(visible_x_range),
         showgrid=False,
         linecolor=theme.axis_color,
         rangeslider={
@@ -271,15 +306,31 @@ def build_chromatogram_column_figure(
         raise ValueError("Chromatogram column view is not renderable")
 
     theme = _resolve_figure_theme(theme_type)
-    max_signal = _max_column_signal(view)
+    packed_signal = view.packed_signal
+    max_signal = _max_column_signal(packed_signal)
     base_label_y = _base_label_y(max_signal)
     figure = go.Figure()
 
-    for base in _column_trace_bases(view):
+    retained_windows = np.fromiter(
+        (column.is_retained for column in view.columns),
+        dtype=bool,
+        count=view.base_count,
+    )[packed_signal.traced_columns]
+    any_retained = view.has_any_retained_bases
+    any_trimmed = any(not column.is_retained for column in view.columns)
+    for base, channel_signal in zip(
+        packed_signal.channel_bases,
+        packed_signal.signal,
+        strict=True,
+    ):
         _add_column_channel_traces(
             figure,
-            view=view,
             base=base,
+            x_values=packed_signal.x_values,
+            channel_signal=channel_signal,
+            retained_windows=retained_windows,
+            any_retained=any_retained,
+            any_trimmed=any_trimmed,
             theme=theme,
         )
 
@@ -450,10 +501,11 @@ def build_chromatogram_column_figure(
     return figure
 
 
-def _max_signal(view: ChromatogramView) -> float:
-    if not view.channels:
+def _max_signal(signal_envelope: SignalEnvelope) -> float:
+    maximum = signal_envelope.maximum
+    if maximum is None:
         return 1.0
-    return float(max(max(channel.signal) for channel in view.channels))
+    return float(maximum)
 
 
 def _base_label_y(max_signal: float) -> float:
@@ -584,22 +636,67 @@ def _clamp_x(value: float, *, view: ChromatogramView) -> float:
     return max(0.0, min(value, float(view.trace_length - 1)))
 
 
-def _resolve_called_peak_height(
+def _channel_signals_by_base(
     view: ChromatogramView,
-    base_call: ChromatogramBaseCall,
-) -> int | None:
+) -> dict[str, tuple[tuple[int, ...], ...]]:
+    signals_by_base: dict[str, tuple[tuple[int, ...], ...]] = {}
     for channel in view.channels:
-        if channel.base == base_call.base and base_call.position < len(channel.signal):
-            return channel.signal[base_call.position]
+        signals_by_base[channel.base] = (
+            *signals_by_base.get(channel.base, ()),
+            channel.signal,
+        )
+    return signals_by_base
 
-    fallback_heights = [
-        channel.signal[base_call.position]
-        for channel in view.channels
-        if base_call.position < len(channel.signal)
-    ]
-    if not fallback_heights:
-        return None
-    return max(fallback_heights)
+
+def _resolve_called_peak_height(
+    base_call: ChromatogramBaseCall,
+    *,
+    signals_by_base: dict[str, tuple[tuple[int, ...], ...]],
+    signal_envelope: SignalEnvelope,
+) -> int | float | None:
+    for signal in signals_by_base.get(base_call.base, ()):
+        if base_call.position < len(signal):
+            return signal[base_call.position]
+
+    return signal_envelope.value_at(base_call.position)
+
+
+def _channel_sample_positions(
+    signal_pyramid: SignalPyramid,
+    channel_index: int,
+    *,
+    visible_x_range: tuple[float, ...],
+    plot_width_px: int,
+) -> np.ndarray:
+    last_position = signal_pyramid.sample_count - 1
+    overview_points = max(plot_width_px, 1) * _TRACE_POINTS_PER_PIXEL
+    visible_left = max(math.floor(visible_x_range[0]), 0)
+    visible_right = min(math.ceil(visible_x_range[-1]), last_position)
+    visible_span = max(visible_right - visible_left, 1)
+    detail_left = max(visible_left - visible_span, 0)
+    detail_right = min(visible_right + visible_span, last_position)
+    return np.concatenate(
+        [
+            signal_pyramid.sample_positions(
+                channel_index,
+                left=0,
+                right=detail_left - 1,
+                max_points=overview_points,
+            ),
+            signal_pyramid.sample_positions(
+                channel_index,
+                left=detail_left,
+                right=detail_right,
+                max_points=3 * overview_points,
+            ),
+            signal_pyramid.sample_positions(
+                channel_index,
+                left=detail_right + 1,
+                right=last_position,
+                max_points=overview_points,
+            ),
+        ]
+    )
 
 
 def _add_channel_traces(
@@ -607,14 +704,16 @@ def _add_channel_traces(
     *,
     view: ChromatogramView,
     channel: ChromatogramChannel,
+    sample_positions: np.ndarray,
+    signal: np.ndarray,
     theme: ChromatogramFigureTheme,
 ) -> None:
     retained_range = view.retained_sample_range
     if retained_range is None and view.has_any_retained_samples:
         figure.add_trace(
             go.Scattergl(
-                x=view.x_values,
-                y=channel.signal,
+                x=sample_positions,
+                y=signal[sample_positions],
                 mode="lines",
                 name=f"{channel.base} trace",
                 line={"color": _trace_color(channel.color, theme)},
@@ -626,8 +725,8 @@ def _add_channel_traces(
 
     figure.add_trace(
         go.Scattergl(
-            x=view.x_values,
-            y=channel.signal,
+            x=sample_positions,
+            y=signal[sample_positions],
             mode="lines",
             name=f"{channel.base} trace",
             line={"color": _trace_color(channel.color, theme, muted=True)},
@@ -639,18 +738,17 @@ def _add_channel_traces(
     if retained_range is None:
         return
 
-    retained_x = list(view.x_values)
-    retained_y = [
-        signal if retained_range[0] <= sample <= retained_range[1] else None
-        for sample, signal in zip(view.x_values, channel.signal, strict=True)
+    retained_positions = sample_positions[
+        (sample_positions >= retained_range[0])
+        & (sample_positions <= retained_range[1])
     ]
-    if not any(value is not None for value in retained_y):
+    if not retained_positions.size:
         return
 
     figure.add_trace(
         go.Scattergl(
-            x=retained_x,
-            y=retained_y,
+            x=retained_positions,
+            y=signal[retained_positions],
             mode="lines",
             name=f"{channel.base} trace (retained)",
             showlegend=False,
@@ -661,112 +759,57 @@ def _add_channel_traces(
     )
 
 
-def _max_column_signal(view: ChromatogramColumnView) -> float:
-    signal_values = [
-        max(channel.signal)
-        for column in view.columns
-        for channel in column.channels
-        if channel.signal
-    ]
-    if not signal_values:
+def _max_column_signal(packed_signal: PackedColumnSignal) -> float:
+    if not np.isfinite(packed_signal.signal).any():
         return 1.0
-    return float(max(signal_values))
-
+    return float(np.nanmax(packed_signal.signal))
 
-def _column_trace_bases(view: ChromatogramColumnView) -> tuple[str, ...]:
-    for column in view.columns:
-        if column.channels:
-            return tuple(channel.base for channel in column.channels)
-    return ("G", "A", "T", "C")
 
-
-def _column_channel_segment(
-    column: ChromatogramColumn,
-    *,
-    base: str,
-) -> ChromatogramColumnChannel | None:
-    for channel in column.channels:
-        if channel.base == base:
-            return channel
-    return None
-
-
-def _column_channel_points(
-    view: ChromatogramColumnView,
-    *,
-    base: str,
-    retained_only: bool | None,
-) -> tuple[list[float | None], list[float | None]]:
-    x_values: list[float | None] = []
-    y_values: list[float | None] = []
-    for column in view.columns:
-        include_column = retained_only is None or column.is_retained is retained_only
-        channel = _column_channel_segment(column, base=base)
-        if (
-            not include_column
-            or channel is None
-            or not channel.x_values
-            or not channel.signal
-        ):
-            x_values.append(None)
-            y_values.append(None)
-            continue
-        x_values.extend(channel.x_values)
-        y_values.extend(channel.signal)
-        x_values.append(None)
-        y_values.append(None)
-    return x_values, y_values
+def _nan_separated_rows(values: np.ndarray) -> np.ndarray:
+    separated = np.full((values.shape[0], values.shape[1] + 1), np.nan)
+    separated[:, :-1] = values
+    return separated.ravel()
 
 
 def _add_column_channel_traces(
     figure: go.Figure,
     *,
-    view: ChromatogramColumnView,
     base: str,
+    x_values: np.ndarray,
+    channel_signal: np.ndarray,
+    retained_windows: np.ndarray,
+    any_retained: bool,
+    any_trimmed: bool,
     theme: ChromatogramFigureTheme,
 ) -> None:
-    any_retained = view.has_any_retained_bases
-    any_trimmed = any(not column.is_retained for column in view.columns)
-
-    x_values, y_values = _column_channel_points(
-        view,
-        base=base,
-        retained_only=None,
-    )
-    if any(value is not None for value in y_values):
-        figure.add_trace(
-            go.Scattergl(
-                x=x_values,
-                y=y_values,
-                mode="lines",
-                name=f"{base} trace",
-                line={
-                    "color": _trace_color(
-                        _channel_color_for_base(base),
-                        theme,
-                        muted=any_trimmed or not any_retained,
-                    )
-                },
-                hoverinfo="skip",
-                hovertemplate=None,
-            )
-        )
-
-    if not any_retained or not any_trimmed:
+    if not channel_signal.size:
         return
 
-    retained_x_values, retained_y_values = _column_channel_points(
-        view,
-        base=base,
-        retained_only=True,
+    figure.add_trace(
+        go.Scattergl(
+            x=_nan_separated_rows(x_values),
+            y=_nan_separated_rows(channel_signal),
+            mode="lines",
+            name=f"{base} trace",
+            line={
+                "color": _trace_color(
+                    _channel_color_for_base(base),
+                    theme,
+                    muted=any_trimmed or not any_retained,
+                )
+            },
+            hoverinfo="skip",
+            hovertemplate=None,
+        )
     )
-    if not any(value is not None for value in retained_y_values):
+
+    if not any_retained or not any_trimmed or not retained_windows.any():
         return
 
     figure.add_trace(
         go.Scattergl(
-            x=retained_x_values,
-            y=retained_y_values,
+            x=_nan_separated_rows(x_values[retained_windows]),
+            y=_nan_separated_rows(channel_signal[retained_windows]),
             mode="lines",
             name=f"{base} trace (retained)",
             showlegend=False,
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+from html import escape
+from typing import Final
+
+import numpy as np
+
+from abi_sauce.assembly_trace import AssemblyTraceRow, AssemblyTraceView
+from abi_sauce.chromatogram import (
+    ChromatogramView,
+    chromatogram_signal_envelope,
+    chromatogram_signal_pyramid,
+)
+
+_DEFAULT_WIDTH_PX: Final[int] = 960
+_DEFAULT_HEIGHT_PX: Final[int] = 160
+_DEFAULT_ROW_HEIGHT_PX: Final[int] = 72
+_MARGIN_PX: Final[float] = 4.0
+_TRACE_POINTS_PER_PIXEL: Final[int] = 2
+_BACKGROUND_COLOR: Final[str] = "#FFFFFF"
+_TRIMMED_FILL: Final[str] = "#BEBEBE"
+_TRIMMED_FILL_OPACITY: Final[float] = 0.45
+_TRIM_MARKER_COLOR: Final[str] = "#666666"
+_ROW_BORDER_COLOR: Final[str] = "rgba(0, 0, 0, 0.10)"
+_ROW_LABEL_COLOR: Final[str] = "#111111"
+_ROW_TRACE_BASELINE: Final[float] = 0.15
+
+
+def render_chromatogram_svg(
+    view: ChromatogramView,
+    *,
+    width_px: int = _DEFAULT_WIDTH_PX,
+    height_px: int = _DEFAULT_HEIGHT_PX,
+) -> str:
+    """Render a whole-trace chromatogram thumbnail as a standalone SVG document.
+
+    Channels are drawn from the view's min/max decimation pyramid at two
+    points per pixel, so the SVG size depends on ``width_px`` rather than on
+    the trace length; trimmed regions are shaded.
+    """
+    if not view.is_renderable:
+        raise ValueError("Chromatogram view is not renderable")
+
+    signal_pyramid = chromatogram_signal_pyramid(view)
+    max_signal = float(chromatogram_signal_envelope(view).maximum or 0) or 1.0
+    last_position = max(signal_pyramid.sample_count - 1, 1)
+    x_scale = (width_px - (2.0 * _MARGIN_PX)) / float(last_position)
+    y_scale = (height_px - (2.0 * _MARGIN_PX)) / max_signal
+
+    elements = [_background_rect(width_px, height_px)]
+    elements.extend(
+        _trimmed_region_rects(
+            view,
+            x_scale=x_scale,
+            width_px=width_px,
+            height_px=height_px,
+        )
+    )
+    for channel_index, channel in enumerate(view.channels):
+        positions = signal_pyramid.sample_positions(
+            channel_index,
+            left=0,
+            right=signal_pyramid.sample_count - 1,
+            max_points=width_px * _TRACE_POINTS_PER_PIXEL,
+        )
+        if positions.size == 0:
+            continue
+        signal = signal_pyramid.channel_values(channel_index)[positions]
+        elements.append(
+            _polyline(
+                _MARGIN_PX + (positions * x_scale),
+                (height_px - _MARGIN_PX) - (signal * y_scale),
+                color=channel.color,
+            )
+        )
+    return _svg_document(elements, width_px=width_px, height_px=height_px)
+
+
+def render_assembly_trace_svg(
+    view: AssemblyTraceView,
+    *,
+    width_px: int = _DEFAULT_WIDTH_PX,
+    row_height_px: int = _DEFAULT_ROW_HEIGHT_PX,
+) -> str:
+    """Render stacked aligned-trace rows as a standalone SVG document.
+
+    Each row's packed float32 signal is drawn as one path per channel; the
+    x-extent covers ``column_window`` when the view is windowed.
+    """
+    window_start, window_end = view.column_window or (0, view.alignment_length)
+    x_left = float(window_start) * view.cell_width
+    x_span = max(float(window_end - window_start) * view.cell_width, view.cell_width)
+    height_px = max(row_height_px * len(view.rows), 1)
+    x_scale = (width_px - (2.0 * _MARGIN_PX)) / x_span
+    y_scale = height_px / max(view.total_height, view.trace_row_height)
+
+    elements = [_background_rect(width_px, height_px)]
+    for row in view.rows:
+        row_top_px = (view.total_height - row.y_top) * y_scale
+        elements.append(
+            f'<line x1="0" y1="{row_top_px:.1f}" x2="{width_px}" '
+            f'y2="{row_top_px:.1f}" stroke="{_ROW_BORDER_COLOR}"/>'
+        )
+        elements.extend(
+            _row_channel_paths(
+                row,
+                x_left=x_left,
+                x_scale=x_scale,
+                y_scale=y_scale,
+                total_height=view.total_height,
+            )
+        )
+        elements.append(
+            f'<text x="{_MARGIN_PX:.1f}" y="{row_top_px + 12.0:.1f}" '
+            f'font-family="sans-serif" font-size="11" fill="{_ROW_LABEL_COLOR}">'
+            f"{escape(row.display_name)}</text>"
+        )
+    return _svg_document(elements, width_px=width_px, height_px=height_px)
+
+
+def _row_channel_paths(
+    row: AssemblyTraceRow,
+    *,
+    x_left: float,
+    x_scale: float,
+    y_scale: float,
+    total_height: float,
+) -> list[str]:
+    packed_signal = row.packed_signal
+    if not packed_signal.channel_bases or packed_signal.traced_cell_count == 0:
+        return []
+
+    x_values, signal = row.traced_channel_arrays()
+    x_px = _MARGIN_PX + ((x_values - x_left) * x_scale)
+    baseline = row.y_bottom + _ROW_TRACE_BASELINE
+    trace_height = max((row.y_top - row.y_bottom) - 1.0, 0.5)
+
+    paths = []
+    for color, channel_signal in zip(
+        packed_signal.channel_colors,
+        signal,
+        strict=True,
+    ):
+        y_px = (total_height - (baseline + (trace_height * channel_signal))) * y_scale
+        segments = (
+            f"M{_point_list(cell_x[:1], cell_y[:1])} "
+            f"L{_point_list(cell_x[1:], cell_y[1:])}"
+            for cell_x, cell_y in zip(x_px, y_px, strict=True)
+        )
+        paths.append(
+            f'<path d="{" ".join(segments)}" fill="none" stroke="{color}" '
+            'stroke-width="1" stroke-linejoin="round"/>'
+        )
+    return paths
+
+
+def _trimmed_region_rects(
+    view: ChromatogramView,
+    *,
+    x_scale: float,
+    width_px: int,
+    height_px: int,
+) -> list[str]:
+    if not view.has_any_retained_samples:
+        return [_trimmed_rect(0.0, float(width_px), height_px=height_px)]
+
+    rects = []
+    left_boundary = view.trim_boundaries.left
+    right_boundary = view.trim_boundaries.right
+    if left_boundary is not None:
+        left_px = _MARGIN_PX + (left_boundary * x_scale)
+        rects.append(_trimmed_rect(0.0, left_px, height_px=height_px))
+        rects.append(_trim_marker(left_px, height_px=height_px))
+    if right_boundary is not None:
+        right_px = _MARGIN_PX + (right_boundary * x_scale)
+        rects.append(_trimmed_rect(right_px, float(width_px), height_px=height_px))
+        rects.append(_trim_marker(right_px, height_px=height_px))
+    return rects
+
+
+def _trimmed_rect(left_px: float, right_px: float, *, height_px: int) -> str:
+    return (
+        f'<rect x="{left_px:.1f}" y="0" width="{max(right_px - left_px, 0.0):.1f}" '
+        f'height="{height_px}" fill="{_TRIMMED_FILL}" '
+        f'fill-opacity="{_TRIMMED_FILL_OPACITY}"/>'
+    )
+
+
+def _trim_marker(x_px: float, *, height_px: int) -> str:
+    return (
+        f'<line x1="{x_px:.1f}" y1="0" x2="{x_px:.1f}" y2="{height_px}" '
+        f'stroke="{_TRIM_MARKER_COLOR}" stroke-dasharray="4 3"/>'
+    )
+
+
+def _background_rect(width_px: int, height_px: int) -> str:
+    return (
+        f'<rect x="0" y="0" width="{width_px}" height="{height_px}" '
+        f'fill="{_BACKGROUND_COLOR}"/>'
+    )
+
+
+def _polyline(x_px: np.ndarray, y_px: np.ndarray, *, color: str) -> str:
+    return (
+        f'<polyline points="{_point_list(x_px, y_px)}" fill="none" '
+        f'stroke="{color}" stroke-width="1" stroke-linejoin="round"/>'
+    )
+
+
+def _point_list(x_px: np.ndarray, y_px: np.ndarray) -> str:
+    return " ".join(map("{:.1f},{:.1f}".format, x_px.tolist(), y_px.tolist()))
+
+
+def _svg_document(elements: list[str], *, width_px: int, height_px: int) -> str:
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" '
+        f'width="{width_px}" height="{height_px}" '
+        f'viewBox="0 0 {width_px} {height_px}">' + "".join(elements) + "</svg>"
+    )
+
+
+__all__ = ["render_assembly_trace_svg", "render_chromatogram_svg"]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from abi_sauce.assembly_types import CONFLICT_RESOLUTIONS, GRID_MISSING
+
+CONSENSUS_RESOLUTIONS: tuple[str, ...] = (*CONFLICT_RESOLUTIONS, "deleted")
+
+_AMBIGUOUS_CODE = ord("N")
+_DELETED_CODE = ord("-")
+_RESOLUTION_CODES = {
+    resolution: resolution_code
+    for resolution_code, resolution in enumerate(CONSENSUS_RESOLUTIONS)
+}
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnConsensus:
+    """Batched consensus calls for every column of one member x column grid.
+
+    ``support_counts`` and ``quality_sums`` are ``alphabet x column`` matrices;
+    ``resolution_codes`` index into ``CONSENSUS_RESOLUTIONS``.
+    """
+
+    alphabet: np.ndarray
+    support_counts: np.ndarray
+    quality_sums: np.ndarray
+    consensus_codes: np.ndarray
+    resolution_codes: np.ndarray
+
+    def support_count_items(self, column_position: int) -> tuple[tuple[str, int], ...]:
+        """Return ``(base, count)`` pairs for one column, most supported first."""
+        return tuple(
+            sorted(
+                self._column_items(self.support_counts, column_position),
+                key=lambda item: (-item[1], item[0]),
+            )
+        )
+
+    def quality_sum_items(self, column_position: int) -> tuple[tuple[str, int], ...]:
+        """Return ``(base, quality sum)`` pairs for one column, sorted by base."""
+        return tuple(sorted(self._column_items(self.quality_sums, column_position)))
+
+    def _column_items(
+        self,
+        matrix: np.ndarray,
+        column_position: int,
+    ) -> list[tuple[str, int]]:
+        present = self.support_counts[:, column_position] > 0
+        return [
+            (chr(base_code), value)
+            for base_code, value in zip(
+                self.alphabet[present].tolist(),
+                matrix[present, column_position].tolist(),
+                strict=True,
+            )
+        ]
+
+
+def call_column_consensus(
+    *,
+    base_codes: np.ndarray,
+    qualities: np.ndarray,
+    gap_mask: np.ndarray,
+    quality_margin: int,
+    allow_deleted: np.ndarray | None = None,
+) -> ColumnConsensus:
+    """Call consensus bases and resolutions for all columns of one grid at once.
+
+    Bases are ranked per column by support, then summed quality, then base
+    letter. Missing qualities (``GRID_MISSING``) count as zero. Columns without
+    any non-gap cell resolve to ``-``/``deleted`` where ``allow_deleted`` is set
+    and to ``N``/``ambiguous`` otherwise.
+    """
+    column_count = base_codes.shape[1]
+    present = ~gap_mask
+    alphabet = np.unique(base_codes[present]).astype(np.uint8)
+
+    base_masks = (base_codes[None, :, :] == alphabet[:, None, None]) & present
+    support_counts = base_masks.sum(axis=1, dtype=np.int64)
+    member_qualities = np.where(qualities == GRID_MISSING, 0, qualities).astype(
+        np.int64
+    )
+    quality_sums = (base_masks * member_qualities[None, :, :]).sum(axis=1)
+
+    # Two zero-support sentinel rows keep ``top``/``next`` defined for every
+    # column; they always rank below any base that is actually present.
+    sentinel_rows = np.zeros((2, column_count), dtype=np.int64)
+    ranked_counts = np.vstack([support_counts, sentinel_rows])
+    ranked_qualities = np.vstack([quality_sums, sentinel_rows])
+    base_rank = np.broadcast_to(
+        np.arange(ranked_counts.shape[0])[:, None],
+        ranked_counts.shape,
+    )
+    ranking = np.lexsort((base_rank, -ranked_qualities, -ranked_counts), axis=0)
+    columns = np.arange(column_count)
+    top, next_ = ranking[0], ranking[1]
+    top_support = ranked_counts[top, columns]
+    next_support = ranked_counts[next_, columns]
+    top_quality = ranked_qualities[top, columns]
+    next_quality = ranked_qualities[next_, columns]
+    distinct_base_counts = np.count_nonzero(support_counts, axis=0)
+
+    consensus_codes = np.full(column_count, _AMBIGUOUS_CODE, dtype=np.uint8)
+    resolution_codes = np.full(
+        column_count,
+        _RESOLUTION_CODES["ambiguous"],
+        dtype=np.int8,
+    )
+
+    single_base = distinct_base_counts == 1
+    majority = (distinct_base_counts > 1) & (top_support > next_support)
+    quality_resolved = (
+        (distinct_base_counts > 1)
+        & ~majority
+        & ((top_quality - next_quality) >= quality_margin)
+    )
+    called = single_base | majority | quality_resolved
+    consensus_codes[called] = alphabet[top[called]]
+    resolution_codes[single_base] = np.where(
+        top_support[single_base] == 1,
+        _RESOLUTION_CODES["single_read"],
+        _RESOLUTION_CODES["concordant"],
+    )
+    resolution_codes[majority] = _RESOLUTION_CODES["majority_resolved"]
+    resolution_codes[quality_resolved] = _RESOLUTION_CODES["quality_resolved"]
+
+    if allow_deleted is not None:
+        deleted = (distinct_base_counts == 0) & allow_deleted
+        consensus_codes[deleted] = _DELETED_CODE
+        resolution_codes[deleted] = _RESOLUTION_CODES["deleted"]
+
+    return ColumnConsensus(
+        alphabet=alphabet,
+        support_counts=support_counts,
+        quality_sums=quality_sums,
+        consensus_codes=consensus_codes,
+        resolution_codes=resolution_codes,
+    )
+
+
+__all__ = [
+    "CONSENSUS_RESOLUTIONS",
+    "ColumnConsensus",
+    "call_column_consensus",
+]
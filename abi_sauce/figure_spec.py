@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from numbers import Real
+from typing import Any, Final, TypeAlias
+
+import numpy as np
+import plotly.graph_objects as go
+
+FigureSpec: TypeAlias = dict[str, Any]
+
+_NUMERIC_TRACE_KEYS: Final[tuple[str, ...]] = ("x", "y", "width", "base")
+_MIN_PACKED_ARRAY_LENGTH: Final[int] = 8
+
+
+def figure_spec(figure: go.Figure) -> FigureSpec:
+    """Return a plain Plotly figure dict with numeric trace arrays packed.
+
+    Numeric ``x``/``y``/``width``/``base`` arrays become numpy arrays, which
+    Plotly serializes as base64 typed arrays; ``None`` gaps become ``NaN``.
+    """
+    spec = figure.to_plotly_json()
+    return {
+        "data": [_packed_trace(trace) for trace in spec["data"]],
+        "layout": spec["layout"],
+    }
+
+
+def update_figure_spec_layout(spec: FigureSpec, **layout: Any) -> FigureSpec:
+    """Return a figure spec with layout keys merged in, like ``update_layout``."""
+    return {
+        **spec,
+        "layout": _merged_layout(spec.get("layout", {}), layout),
+    }
+
+
+def overlay_figure_spec_shapes(
+    spec: FigureSpec,
+    shapes: Sequence[Mapping[str, Any]],
+) -> FigureSpec:
+    """Return a figure spec with ``shapes`` drawn beneath its existing shapes.
+
+    Overlay shapes are prepended, matching builders that add them before any
+    other shape; the spec's trace data is shared, not copied.
+    """
+    if not shapes:
+        return spec
+    return {
+        **spec,
+        "layout": {
+            **spec.get("layout", {}),
+            "shapes": [
+                *(dict(shape) for shape in shapes),
+                *spec.get("layout", {}).get("shapes", ()),
+            ],
+        },
+    }
+
+
+def _packed_trace(trace: dict[str, Any]) -> dict[str, Any]:
+    return {
+        key: (_packed_values(value) if key in _NUMERIC_TRACE_KEYS else value)
+        for key, value in trace.items()
+    }
+
+
+def _packed_values(values: object) -> object:
+    if isinstance(values, np.ndarray) or not isinstance(values, Sequence):
+        return values
+    if isinstance(values, str) or len(values) < _MIN_PACKED_ARRAY_LENGTH:
+        return values
+    if not all(
+        value is None or (isinstance(value, Real) and not isinstance(value, bool))
+        for value in values
+    ):
+        return values
+    if any(value is None for value in values):
+        return np.array(
+            [np.nan if value is None else value for value in values],
+            dtype=np.float64,
+        )
+    return np.asarray(values)
+
+
+def _merged_layout(
+    layout: Mapping[str, Any],
+    updates: Mapping[str, Any],
+) -> dict[str, Any]:
+    merged = dict(layout)
+    for key, value in updates.items():
+        current = merged.get(key)
+        if isinstance(current, Mapping) and isinstance(value, Mapping):
+            merged[key] = _merged_layout(current, value)
+        else:
+            merged[key] = value
+    return merged
+
+
+__all__ = [
+    "FigureSpec",
+    "figure_spec",
+    "overlay_figure_spec_shapes",
+    "update_figure_spec_layout",
+]
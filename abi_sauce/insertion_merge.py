@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Sequence
+from numbers import Real
+
+from Bio import Align
+
+_GAP_SCORE_ATTRIBUTES = (
+    "open_internal_insertion_score",
+    "extend_internal_insertion_score",
+    "open_left_insertion_score",
+    "extend_left_insertion_score",
+    "open_right_insertion_score",
+    "extend_right_insertion_score",
+    "open_internal_deletion_score",
+    "extend_internal_deletion_score",
+    "open_left_deletion_score",
+    "extend_left_deletion_score",
+    "open_right_deletion_score",
+    "extend_right_deletion_score",
+)
+
+
+class InsertionBucketMerger:
+    """Fold the insertion sequences of one bucket into shared gapped columns.
+
+    Sequences are merged in the order given against a running base profile of
+    the columns built so far; each profile column is represented by its most
+    supported base (ties broken by base letter). A sequence that reads exactly
+    like the profile representative is placed on the diagonal without a DP,
+    and every other ``(representative, sequence)`` pair is aligned at most once
+    per merger, so one merger should be reused for every bucket of a grid.
+    """
+
+    __slots__ = ("_aligner", "_identity_is_optimal", "_index_pairs", "_call_count")
+
+    def __init__(self, aligner: Align.PairwiseAligner) -> None:
+        self._aligner = aligner
+        self._identity_is_optimal = _identity_alignment_is_optimal(aligner)
+        self._index_pairs: dict[tuple[str, str], tuple[tuple[int, int], ...]] = {}
+        self._call_count = 0
+
+    @property
+    def aligner_call_count(self) -> int:
+        """Return how many pairwise DPs this merger has actually run."""
+        return self._call_count
+
+    def merge(self, sequences: Sequence[str]) -> tuple[dict[int, int], ...]:
+        """Return one ``{sequence position: base offset}`` mapping per column.
+
+        Sequence positions index into ``sequences``; a sequence missing from a
+        column is gapped there.
+        """
+        columns: list[dict[int, int]] = []
+        profiles: list[dict[str, int]] = []
+        representative: list[str] = []
+        for sequence_position, sequence in enumerate(sequences):
+            if not sequence:
+                continue
+            merged_columns: list[dict[int, int]] = []
+            merged_profiles: list[dict[str, int]] = []
+            merged_representative: list[str] = []
+            for target_index, query_index in self.aligned_index_pairs(
+                "".join(representative),
+                sequence,
+            ):
+                if target_index < 0:
+                    base = sequence[query_index]
+                    merged_columns.append({sequence_position: query_index})
+                    merged_profiles.append({base: 1})
+                    merged_representative.append(base)
+                    continue
+                column = columns[target_index]
+                profile = profiles[target_index]
+                column_representative = representative[target_index]
+                if query_index >= 0:
+                    base = sequence[query_index]
+                    column = {**column, sequence_position: query_index}
+                    profile = {**profile, base: profile.get(base, 0) + 1}
+                    column_representative = _profile_representative(profile)
+                merged_columns.append(column)
+                merged_profiles.append(profile)
+                merged_representative.append(column_representative)
+            columns = merged_columns
+            profiles = merged_profiles
+            representative = merged_representative
+        return tuple(columns)
+
+    def place(
+        self,
+        column_bases: Sequence[str],
+        sequence: str,
+    ) -> tuple[tuple[int, int], ...]:
+        """Return ``(column, base offset)`` pairs folding one more sequence in.
+
+        ``column_bases`` holds the bases already merged into each existing
+        column, which is represented by its most supported base as in
+        ``merge``; ``-1`` marks a new column or a gapped base offset.
+        """
+        return self.aligned_index_pairs(
+            "".join(
+                _profile_representative(Counter(bases)) for bases in column_bases
+            ),
+            sequence,
+        )
+
+    def aligned_index_pairs(
+        self,
+        representative_sequence: str,
+        member_sequence: str,
+    ) -> tuple[tuple[int, int], ...]:
+        """Return ``(target, query)`` index pairs, ``-1`` marking a gap."""
+        if not representative_sequence:
+            return tuple(
+                (-1, query_index) for query_index in range(len(member_sequence))
+            )
+        if self._identity_is_optimal and representative_sequence == member_sequence:
+            return tuple((index, index) for index in range(len(member_sequence)))
+
+        cache_key = (representative_sequence, member_sequence)
+        index_pairs = self._index_pairs.get(cache_key)
+        if index_pairs is None:
+            alignment = self._aligner.align(representative_sequence, member_sequence)[0]
+            self._call_count += 1
+            index_pairs = tuple(
+                (target_index, query_index)
+                for target_index, query_index in zip(
+                    alignment.indices[0].tolist(),
+                    alignment.indices[1].tolist(),
+                    strict=True,
+                )
+                if target_index >= 0 or query_index >= 0
+            )
+            self._index_pairs[cache_key] = index_pairs
+        return index_pairs
+
+
+def _profile_representative(profile: dict[str, int]) -> str:
+    return min(profile.items(), key=lambda item: (-item[1], item[0]))[0]
+
+
+def _identity_alignment_is_optimal(aligner: Align.PairwiseAligner) -> bool:
+    # With positive match scores, no wildcard and no rewarded gaps, the
+    # diagonal strictly outscores every other alignment of a sequence with
+    # itself, so the DP can be skipped for identical pairs.
+    if (
+        aligner.mode != "global"
+        or aligner.substitution_matrix is not None
+        or aligner.wildcard is not None
+    ):
+        return False
+    scores = [
+        aligner.match_score,
+        aligner.mismatch_score,
+        *(getattr(aligner, name) for name in _GAP_SCORE_ATTRIBUTES),
+    ]
+    if not all(isinstance(score, Real) for score in scores):
+        return False
+    match_score, mismatch_score, *gap_scores = scores
+    return (
+        match_score > 0 and mismatch_score <= match_score and max(gap_scores) <= 0
+    )
+
+
+__all__ = ["InsertionBucketMerger"]
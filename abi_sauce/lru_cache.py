@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from dataclasses import dataclass
+import threading
+from typing import Generic, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+
+@dataclass(frozen=True, slots=True)
+class LruCacheInfo:
+    """Hit/miss counters for one process-wide LRU cache."""
+
+    hits: int
+    misses: int
+    size: int
+    max_entries: int
+
+
+class LruCache(Generic[KeyT, ValueT]):
+    """Thread-safe bounded mapping that evicts the least recently used entry.
+
+    ``lock`` guards the entries and counters; callers may hold it to mutate a
+    cached value in place.
+    """
+
+    __slots__ = ("_entries", "_hits", "_misses", "lock", "max_entries")
+
+    def __init__(self, max_entries: int) -> None:
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+        self._entries: OrderedDict[KeyT, ValueT] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self.lock = threading.Lock()
+        self.max_entries = max_entries
+
+    def lookup(self, key: KeyT) -> tuple[bool, ValueT | None]:
+        """Return ``(found, value)`` and count the hit or miss."""
+        with self.lock:
+            if key not in self._entries:
+                self._misses += 1
+                return False, None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return True, self._entries[key]
+
+    def get(self, key: KeyT) -> ValueT | None:
+        """Return one cached value, or ``None`` on a miss."""
+        return self.lookup(key)[1]
+
+    def store(self, key: KeyT, value: ValueT) -> None:
+        """Insert or refresh one entry, evicting the oldest past ``max_entries``."""
+        with self.lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def info(self) -> LruCacheInfo:
+        """Return the current hit/miss counters."""
+        with self.lock:
+            return LruCacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                size=len(self._entries),
+                max_entries=self.max_entries,
+            )
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self.lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+__all__ = ["LruCache", "LruCacheInfo"]
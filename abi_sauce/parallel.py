@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+import os
+from typing import TypeVar
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+DEFAULT_PARALLEL_MIN_ITEMS = 8
+
+
+def resolve_max_workers(max_workers: int | None, item_count: int) -> int:
+    """Return the effective worker count for one batch of independent items."""
+    if item_count <= 0:
+        return 1
+    requested_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+    if requested_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {requested_workers}")
+    return min(requested_workers, item_count)
+
+
+def ordered_process_map(
+    func: Callable[[ItemT], ResultT],
+    items: Sequence[ItemT],
+    *,
+    max_workers: int | None = 1,
+    min_items: int = DEFAULT_PARALLEL_MIN_ITEMS,
+) -> list[ResultT]:
+    """Map ``func`` over ``items`` in a process pool, preserving input order.
+
+    ``max_workers=None`` uses every available core. Small batches (fewer than
+    ``min_items``) and single-worker requests run serially in-process, so the
+    result never depends on the execution path.
+    """
+    resolved_workers = resolve_max_workers(max_workers, len(items))
+    if resolved_workers <= 1 or len(items) < min_items:
+        return [func(item) for item in items]
+
+    with ProcessPoolExecutor(max_workers=resolved_workers) as executor:
+        return list(executor.map(func, items))
+
+
+__all__ = [
+    "DEFAULT_PARALLEL_MIN_ITEMS",
+    "ordered_process_map",
+    "resolve_max_workers",
+]
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+import plotly.graph_objects as go
+
+from abi_sauce.trace_signatures import BatchTraceSignatures
+
+_SMALL_PLATE_COLUMNS: Final[int] = 12
+_LARGE_PLATE_COLUMNS: Final[int] = 24
+_SMALL_PLATE_READ_COUNT: Final[int] = 96
+_WELL_PADDING: Final[float] = 0.08
+_ENVELOPE_TOP: Final[float] = 0.12
+_ENVELOPE_BOTTOM: Final[float] = 0.82
+_RETAINED_RANGE_Y: Final[float] = 0.92
+_ROW_HEIGHT_PX: Final[int] = 56
+_HEADER_HEIGHT_PX: Final[int] = 48
+_SNR_COLORSCALE: Final[str] = "RdYlGn"
+
+
+@dataclass(frozen=True, slots=True)
+class PlateOverviewFigureTheme:
+    envelope_color: str
+    retained_range_color: str
+    empty_well_color: str
+    paper_bgcolor: str
+    font_color: str
+    axis_color: str
+
+
+_LIGHT_THEME: Final[PlateOverviewFigureTheme] = PlateOverviewFigureTheme(
+    envelope_color="rgba(17, 17, 17, 0.85)",
+    retained_range_color="#1D4ED8",
+    empty_well_color="#F4F6F8",
+    paper_bgcolor="rgba(0, 0, 0, 0)",
+    font_color="#111111",
+    axis_color="#444444",
+)
+
+_DARK_THEME: Final[PlateOverviewFigureTheme] = PlateOverviewFigureTheme(
+    envelope_color="rgba(229, 231, 235, 0.85)",
+    retained_range_color="#60A5FA",
+    empty_well_color="#1F2937",
+    paper_bgcolor="rgba(0, 0, 0, 0)",
+    font_color="#FAFAFA",
+    axis_color="#CBD5E1",
+)
+
+
+def default_plate_columns(read_count: int) -> int:
+    """Return the well columns of the smallest standard plate holding the reads."""
+    return (
+        _SMALL_PLATE_COLUMNS
+        if read_count <= _SMALL_PLATE_READ_COUNT
+        else _LARGE_PLATE_COLUMNS
+    )
+
+
+def plate_well_labels(read_count: int, *, plate_columns: int) -> tuple[str, ...]:
+    """Return row-major well labels (``A1``, ``A2``, ...) for a batch of reads."""
+    return tuple(
+        f"{_plate_row_label(read_index // plate_columns)}"
+        f"{(read_index % plate_columns) + 1}"
+        for read_index in range(read_count)
+    )
+
+
+def build_plate_overview_figure(
+    signatures: BatchTraceSignatures,
+    *,
+    plate_columns: int | None = None,
+    theme_type: str = "light",
+) -> go.Figure:
+    """Build a plate-grid figure of every read's trace signature.
+
+    Reads fill wells in row-major upload order. Each well is shaded by its
+    median window SNR and overlaid with the decimated signal envelope and
+    the retained (trimmed) range; all wells share three traces, so the
+    figure size does not grow with trace length.
+    """
+    theme = _resolve_figure_theme(theme_type)
+    read_count = signatures.read_count
+    if plate_columns is None:
+        plate_columns = default_plate_columns(read_count)
+    if plate_columns <= 0:
+        raise ValueError("plate_columns must be > 0")
+
+    plate_rows = max(math.ceil(read_count / plate_columns), 1)
+    read_indexes = np.arange(read_count)
+    well_rows = read_indexes // plate_columns
+    well_columns = read_indexes % plate_columns
+    median_snr = signatures.median_snr
+    well_labels = plate_well_labels(read_count, plate_columns=plate_columns)
+
+    snr_grid = np.full((plate_rows, plate_columns), np.nan, dtype=np.float32)
+    snr_grid[well_rows, well_columns] = median_snr
+    finite_snr = median_snr[np.isfinite(median_snr)]
+    snr_max = float(np.percentile(finite_snr, 95)) if finite_snr.size else 1.0
+
+    figure = go.Figure()
+    figure.add_trace(
+        go.Heatmap(
+            x=np.arange(plate_columns) + 0.5,
+            y=np.arange(plate_rows) + 0.5,
+            z=snr_grid,
+            zmin=0.0,
+            zmax=max(snr_max, 1.0),
+            colorscale=_SNR_COLORSCALE,
+            opacity=0.55,
+            xgap=2,
+            ygap=2,
+            hoverinfo="skip",
+            colorbar={"title": {"text": "Median SNR"}, "thickness": 12},
+        )
+    )
+    figure.add_trace(
+        go.Scattergl(
+            x=_well_polyline_values(
+                well_columns[:, None]
+                + _WELL_PADDING
+                + (
+                    (1.0 - (2.0 * _WELL_PADDING))
+                    * np.linspace(0.0, 1.0, signatures.envelope.shape[1])[None, :]
+                ),
+            ),
+            y=_well_polyline_values(
+                well_rows[:, None]
+                + _ENVELOPE_BOTTOM
+                - ((_ENVELOPE_BOTTOM - _ENVELOPE_TOP) * signatures.envelope),
+            ),
+            mode="lines",
+            line={"color": theme.envelope_color, "width": 1},
+            hoverinfo="skip",
+            showlegend=False,
+        )
+    )
+    figure.add_trace(
+        go.Scattergl(
+            x=_well_polyline_values(
+                well_columns[:, None]
+                + _WELL_PADDING
+                + ((1.0 - (2.0 * _WELL_PADDING)) * signatures.retained_range),
+            ),
+            y=_well_polyline_values(
+                np.repeat(well_rows[:, None] + _RETAINED_RANGE_Y, 2, axis=1),
+            ),
+            mode="lines",
+            line={"color": theme.retained_range_color, "width": 3},
+            hoverinfo="skip",
+            showlegend=False,
+        )
+    )
+    figure.add_trace(
+        go.Scatter(
+            x=well_columns + 0.5,
+            y=well_rows + 0.5,
+            mode="markers",
+            marker={"size": 24, "opacity": 0.0, "symbol": "square"},
+            customdata=np.column_stack(
+                [
+                    np.asarray(signatures.source_filenames, dtype=object),
+                    np.asarray(signatures.display_names, dtype=object),
+                    np.asarray(well_labels, dtype=object),
+                    np.round(median_snr, 1).astype(object),
+                ]
+            )
+            if read_count
+            else None,
+            hovertemplate=(
+                "%{customdata[2]} · %{customdata[1]}<br>"
+                "%{customdata[0]}<br>"
+                "Median SNR: %{customdata[3]}<extra></extra>"
+            ),
+            showlegend=False,
+        )
+    )
+    figure.update_xaxes(
+        range=[0.0, float(plate_columns)],
+        tickvals=np.arange(plate_columns) + 0.5,
+        ticktext=[str(column + 1) for column in range(plate_columns)],
+        side="top",
+        showgrid=False,
+        zeroline=False,
+        fixedrange=True,
+        tickfont={"color": theme.font_color},
+        linecolor=theme.axis_color,
+    )
+    figure.update_yaxes(
+        range=[float(plate_rows), 0.0],
+        tickvals=np.arange(plate_rows) + 0.5,
+        ticktext=[_plate_row_label(row) for row in range(plate_rows)],
+        showgrid=False,
+        zeroline=False,
+        fixedrange=True,
+        tickfont={"color": theme.font_color},
+        linecolor=theme.axis_color,
+    )
+    figure.update_layout(
+        height=_HEADER_HEIGHT_PX + (plate_rows * _ROW_HEIGHT_PX),
+        margin={"l": 24, "r": 24, "t": 32, "b": 16},
+        plot_bgcolor=theme.empty_well_color,
+        paper_bgcolor=theme.paper_bgcolor,
+        font={"color": theme.font_color},
+        hovermode="closest",
+        showlegend=False,
+    )
+    return figure
+
+
+def _well_polyline_values(values: np.ndarray) -> np.ndarray:
+    separated = np.full((values.shape[0], values.shape[1] + 1), np.nan)
+    separated[:, :-1] = values
+    return separated.ravel()
+
+
+def _plate_row_label(row_index: int) -> str:
+    label = ""
+    row_number = row_index + 1
+    while row_number > 0:
+        row_number, remainder = divmod(row_number - 1, 26)
+        label = chr(ord("A") + remainder) + label
+    return label
+
+
+def _resolve_figure_theme(theme_type: str) -> PlateOverviewFigureTheme:
+    return _DARK_THEME if theme_type == "dark" else _LIGHT_THEME
+
+
+__all__ = [
+    "PlateOverviewFigureTheme",
+    "build_plate_overview_figure",
+    "default_plate_columns",
+    "plate_well_labels",
+]
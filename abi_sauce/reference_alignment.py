@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from Bio import Align
+import numpy as np
 
 from abi_sauce.alignment_policy import (
     alignment_strands_for_policy,
     build_semiglobal_aligner,
     select_best_oriented_alignment,
+    shared_semiglobal_aligner,
 )
 from abi_sauce.models import SequenceRecord
 from abi_sauce.oriented_reads import prepare_trimmed_read
@@ -88,7 +90,7 @@ def align_trimmed_read_to_reference(
     if not prepared_query_read.display_sequence:
         raise ValueError("Trimmed query sequence is empty.")
 
-    resolved_aligner = build_aligner() if aligner is None else aligner
+    resolved_aligner = shared_semiglobal_aligner() if aligner is None else aligner
     allowed_strands = alignment_strands_for_policy(strand_policy)
     best_query_alignment = select_best_oriented_alignment(
         target_sequence=reference_sequence,
@@ -192,6 +194,13 @@ def _extract_alignment_details(
     reference_positions: list[int] = []
     query_positions: list[int] = []
 
+    previous_target_indices, next_target_indices = _neighbor_non_gap_indices(
+        target_indices
+    )
+    previous_query_indices, next_query_indices = _neighbor_non_gap_indices(
+        query_indices
+    )
+
     for column_index, (target_index, query_index) in enumerate(
         zip(target_indices, query_indices, strict=True),
         start=1,
@@ -245,8 +254,9 @@ def _extract_alignment_details(
         )
         flank_q_left, flank_q_right = _flanking_qualities_for_column(
             oriented_query_qualities,
-            query_indices,
-            column_index=column_index - 1,
+            current_index=resolved_query_index,
+            previous_index=previous_query_indices[column_index - 1],
+            next_index=next_query_indices[column_index - 1],
         )
         trace_x = trace_position_for_oriented_query_index(
             raw_record=raw_record,
@@ -258,12 +268,20 @@ def _extract_alignment_details(
         )
         context_ref = _context_window(
             reference_sequence,
-            _context_index_for_column(target_indices, column_index - 1),
+            _context_index_for_column(
+                current_index=resolved_target_index,
+                previous_index=previous_target_indices[column_index - 1],
+                next_index=next_target_indices[column_index - 1],
+            ),
             window=context_window,
         )
         context_query = _context_window(
             oriented_query_sequence,
-            _context_index_for_column(query_indices, column_index - 1),
+            _context_index_for_column(
+                current_index=resolved_query_index,
+                previous_index=previous_query_indices[column_index - 1],
+                next_index=next_query_indices[column_index - 1],
+            ),
             window=context_window,
         )
 
@@ -333,16 +351,46 @@ def _extract_alignment_details(
     )
 
 
+def _neighbor_non_gap_indices(indices) -> tuple[list[int], list[int]]:
+    """Return the nearest non-gap index strictly before/after every column.
+
+    Both lists hold ``-1`` where no such neighbor exists. They are derived with
+    running max/min accumulations, so lookups stay O(1) per column no matter
+    how long the surrounding gap runs are.
+    """
+    resolved_indices = np.asarray(indices, dtype=np.int64)
+    column_count = len(resolved_indices)
+    if column_count == 0:
+        return [], []
+
+    column_positions = np.arange(column_count, dtype=np.int64)
+    is_non_gap = resolved_indices >= 0
+
+    last_non_gap_column = np.maximum.accumulate(
+        np.where(is_non_gap, column_positions, -1)
+    )
+    previous_columns = np.concatenate(([-1], last_non_gap_column[:-1]))
+    next_non_gap_column = np.minimum.accumulate(
+        np.where(is_non_gap, column_positions, column_count)[::-1]
+    )[::-1]
+    next_columns = np.concatenate((next_non_gap_column[1:], [column_count]))
+
+    padded_indices = np.concatenate((resolved_indices, [-1]))
+    previous_indices = padded_indices[previous_columns]
+    next_indices = padded_indices[next_columns]
+    return previous_indices.tolist(), next_indices.tolist()
+
+
 def _flanking_qualities_for_column(
     qualities: list[int] | None,
-    indices,
     *,
-    column_index: int,
+    current_index: int,
+    previous_index: int,
+    next_index: int,
 ) -> tuple[int | None, int | None]:
     if qualities is None:
         return (None, None)
 
-    current_index = int(indices[column_index])
     if current_index >= 0:
         left = qualities[current_index - 1] if current_index - 1 >= 0 else None
         right = (
@@ -353,40 +401,23 @@ def _flanking_qualities_for_column(
             None if right is None else int(right),
         )
 
-    previous_index = None
-    for scan_index in range(column_index - 1, -1, -1):
-        value = int(indices[scan_index])
-        if value >= 0:
-            previous_index = value
-            break
-
-    next_index = None
-    for scan_index in range(column_index + 1, len(indices)):
-        value = int(indices[scan_index])
-        if value >= 0:
-            next_index = value
-            break
-
-    left = None if previous_index is None else int(qualities[previous_index])
-    right = None if next_index is None else int(qualities[next_index])
+    left = None if previous_index < 0 else int(qualities[previous_index])
+    right = None if next_index < 0 else int(qualities[next_index])
     return (left, right)
 
 
-def _context_index_for_column(indices, column_index: int) -> int | None:
-    current_index = int(indices[column_index])
+def _context_index_for_column(
+    *,
+    current_index: int,
+    previous_index: int,
+    next_index: int,
+) -> int | None:
     if current_index >= 0:
         return current_index
-
-    for scan_index in range(column_index + 1, len(indices)):
-        value = int(indices[scan_index])
-        if value >= 0:
-            return value
-
-    for scan_index in range(column_index - 1, -1, -1):
-        value = int(indices[scan_index])
-        if value >= 0:
-            return value
-
+    if next_index >= 0:
+        return next_index
+    if previous_index >= 0:
+        return previous_index
     return None
 
 
@@ -1,22 +1,26 @@
 from __future__ import annotations
 
-from collections import Counter
 from dataclasses import dataclass
+from functools import partial
 
 from Bio import Align
+import numpy as np
 
 from abi_sauce.alignment_policy import (
     alignment_overlap_metrics,
     alignment_strands_for_policy,
     select_best_oriented_alignment,
+    shared_semiglobal_aligner,
 )
-from abi_sauce.assembly_types import AssemblyConfig
+from abi_sauce.assembly_types import GRID_MISSING, AssemblyConfig
+from abi_sauce.column_consensus import CONSENSUS_RESOLUTIONS, call_column_consensus
+from abi_sauce.insertion_merge import InsertionBucketMerger
 from abi_sauce.models import SequenceRecord
 from abi_sauce.oriented_reads import PreparedTrimmedRead, prepare_trimmed_reads
-from abi_sauce.reference_alignment import build_aligner, normalize_reference
+from abi_sauce.parallel import ordered_process_map
+from abi_sauce.reference_alignment import normalize_reference
 from abi_sauce.reference_alignment_types import (
     ChosenStrand,
-    ReferenceConsensusResolution,
     ReferenceMultiAnchorKind,
     ReferenceMultiAlignmentColumn,
     ReferenceMultiAlignmentMember,
@@ -52,10 +56,29 @@ class _ProjectedReferenceMultiCell:
     is_gap: bool
 
 
+_GAP_REFERENCE_MULTI_CELL = _ProjectedReferenceMultiCell(
+    base="-",
+    query_index=None,
+    query_pos=None,
+    qscore=None,
+    trace_x=None,
+    is_gap=True,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _ReferenceMultiColumnSpec:
+    anchor_kind: ReferenceMultiAnchorKind
+    anchor_index: int
+    ref_index: int | None
+    ref_base: str
+    member_cells: tuple[_ProjectedReferenceMultiCell, ...]
+
+
 @dataclass(frozen=True, slots=True)
 class _PlacedReferenceMultiMember:
     member: ReferenceMultiAlignmentMember
-    reference_cells: tuple[_ProjectedReferenceMultiCell, ...]
+    reference_cells_by_index: dict[int, _ProjectedReferenceMultiCell]
     insertion_cells_by_bucket: dict[int, tuple[_ProjectedReferenceMultiCell, ...]]
 
 
@@ -69,15 +92,27 @@ def align_trimmed_reads_to_reference(
     strand_policy: StrandPolicy = "auto",
     config: AssemblyConfig | None = None,
     aligner: Align.PairwiseAligner | None = None,
+    max_workers: int | None = 1,
+    coverage_padding: int | None = None,
 ) -> ReferenceMultiAlignmentResult:
-    """Align multiple trimmed reads independently to one shared reference grid."""
+    """Align multiple trimmed reads independently to one shared reference grid.
+
+    ``max_workers`` other than 1 places members over a process pool (``None``
+    uses every core); member order in the result is unaffected.
+
+    ``coverage_padding`` switches to a windowed grid: only the union of
+    reference intervals covered by included reads, each widened by that many
+    bases, gets columns. Columns keep their reference coordinates.
+    """
+    if coverage_padding is not None and coverage_padding < 0:
+        raise ValueError(f"coverage_padding must be >= 0, got {coverage_padding}")
     normalized_reference_name, reference_sequence = normalize_reference(reference_text)
     resolved_reference_name = (
         normalized_reference_name if reference_name is None else reference_name
     )
     resolved_config = AssemblyConfig() if config is None else config
     resolved_aligner = (
-        build_aligner(
+        shared_semiglobal_aligner(
             match_score=resolved_config.match_score,
             mismatch_score=resolved_config.mismatch_score,
             open_internal_gap_score=resolved_config.open_internal_gap_score,
@@ -102,14 +137,17 @@ def align_trimmed_reads_to_reference(
 
     allowed_strands = alignment_strands_for_policy(strand_policy)
     placements = tuple(
-        _place_member_against_reference(
-            reference_sequence=reference_sequence,
-            member_input=member_input,
-            config=resolved_config,
-            aligner=resolved_aligner,
-            allowed_strands=allowed_strands,
+        ordered_process_map(
+            partial(
+                _place_reference_multi_member_task,
+                reference_sequence=reference_sequence,
+                config=resolved_config,
+                aligner=resolved_aligner,
+                allowed_strands=allowed_strands,
+            ),
+            member_inputs,
+            max_workers=max_workers,
         )
-        for member_input in member_inputs
     )
     included_placements = tuple(
         placement for placement in placements if placement.member.included
@@ -118,72 +156,77 @@ def align_trimmed_reads_to_reference(
         placement.member.member_index for placement in included_placements
     )
 
+    merger = InsertionBucketMerger(resolved_aligner)
     bucket_columns_by_index = {
         bucket_index: _resolve_reference_multi_insertion_bucket(
-            bucket_cells_by_member={
-                placement.member.member_index: placement.insertion_cells_by_bucket.get(
-                    bucket_index,
-                    (),
-                )
-                for placement in included_placements
-            },
-            included_member_indices=included_member_indices,
-            aligner=resolved_aligner,
+            bucket_cells_by_member=bucket_cells_by_member,
+            merger=merger,
+        )
+        for bucket_index, bucket_cells_by_member in (
+            _sparse_reference_multi_insertion_buckets(included_placements).items()
         )
-        for bucket_index in range(len(reference_sequence) + 1)
     }
 
-    aligned_sequences_by_member_index: dict[int, list[str]] = {
-        member_index: [] for member_index in included_member_indices
-    }
-    columns: list[ReferenceMultiAlignmentColumn] = []
-    column_index = 1
-
-    for bucket_index in range(len(reference_sequence) + 1):
-        for bucket_column in bucket_columns_by_index[bucket_index]:
-            column = _build_reference_multi_column(
-                column_index=column_index,
-                anchor_kind="insertion",
-                anchor_index=bucket_index,
-                ref_index=None,
-                ref_base="-",
-                column_cells_by_member=bucket_column,
-                included_member_indices=included_member_indices,
-                quality_margin=resolved_config.quality_margin,
-            )
-            if column is None:
-                continue
-            columns.append(column)
-            for member_cell in column.member_cells:
-                aligned_sequences_by_member_index[member_cell.member_index].append(
-                    member_cell.base
+    reference_windows = (
+        ((0, len(reference_sequence)),)
+        if coverage_padding is None
+        else _reference_coverage_windows(
+            included_placements,
+            reference_length=len(reference_sequence),
+            padding=coverage_padding,
+        )
+    )
+    column_specs: list[_ReferenceMultiColumnSpec] = []
+    for window_start, window_end in reference_windows:
+        for bucket_index in range(window_start, window_end + 1):
+            for bucket_column in bucket_columns_by_index.get(bucket_index, ()):
+                ordered_projected_cells = _ordered_reference_multi_cells(
+                    bucket_column,
+                    included_member_indices=included_member_indices,
+                )
+                if all(
+                    cell.is_gap or cell.base == "-"
+                    for cell in ordered_projected_cells
+                ):
+                    continue
+                column_specs.append(
+                    _ReferenceMultiColumnSpec(
+                        anchor_kind="insertion",
+                        anchor_index=bucket_index,
+                        ref_index=None,
+                        ref_base="-",
+                        member_cells=ordered_projected_cells,
+                    )
                 )
-            column_index += 1
 
-        if bucket_index >= len(reference_sequence):
-            continue
+            if bucket_index >= window_end:
+                continue
 
-        column = _build_reference_multi_column(
-            column_index=column_index,
-            anchor_kind="reference",
-            anchor_index=bucket_index,
-            ref_index=bucket_index,
-            ref_base=reference_sequence[bucket_index],
-            column_cells_by_member={
-                placement.member.member_index: placement.reference_cells[bucket_index]
-                for placement in included_placements
-            },
-            included_member_indices=included_member_indices,
-            quality_margin=resolved_config.quality_margin,
-        )
-        if column is None:
-            continue
-        columns.append(column)
-        for member_cell in column.member_cells:
-            aligned_sequences_by_member_index[member_cell.member_index].append(
-                member_cell.base
+            column_specs.append(
+                _ReferenceMultiColumnSpec(
+                    anchor_kind="reference",
+                    anchor_index=bucket_index,
+                    ref_index=bucket_index,
+                    ref_base=reference_sequence[bucket_index],
+                    member_cells=tuple(
+                        placement.reference_cells_by_index.get(
+                            bucket_index,
+                            _GAP_REFERENCE_MULTI_CELL,
+                        )
+                        for placement in included_placements
+                    ),
+                )
             )
-        column_index += 1
+
+    columns = _build_reference_multi_columns(
+        column_specs,
+        included_member_indices=included_member_indices,
+        quality_margin=resolved_config.quality_margin,
+    )
+    aligned_member_sequences = tuple(
+        "".join(column.member_cells[row_position].base for column in columns)
+        for row_position in range(len(included_member_indices))
+    )
 
     gapped_reference = "".join(column.ref_base for column in columns)
     gapped_consensus = "".join(column.consensus_base for column in columns)
@@ -209,10 +252,7 @@ def align_trimmed_reads_to_reference(
         rejection_reason=rejection_reason,
         members=tuple(placement.member for placement in placements),
         included_member_indices=included_member_indices,
-        aligned_member_sequences=tuple(
-            "".join(aligned_sequences_by_member_index[member_index])
-            for member_index in included_member_indices
-        ),
+        aligned_member_sequences=aligned_member_sequences,
         gapped_reference=gapped_reference,
         gapped_consensus=gapped_consensus,
         consensus_sequence=consensus_sequence,
@@ -220,6 +260,7 @@ def align_trimmed_reads_to_reference(
         included_member_count=included_member_count,
         excluded_member_count=len(member_inputs) - included_member_count,
         ambiguous_column_count=ambiguous_column_count,
+        reference_windows=reference_windows,
     )
 
 
@@ -242,6 +283,23 @@ def _resolved_reference_multi_member_input(
     )
 
 
+def _place_reference_multi_member_task(
+    member_input: _ResolvedReferenceMultiMemberInput,
+    *,
+    reference_sequence: str,
+    config: AssemblyConfig,
+    aligner: Align.PairwiseAligner,
+    allowed_strands: tuple[ChosenStrand, ...],
+) -> _PlacedReferenceMultiMember:
+    return _place_member_against_reference(
+        reference_sequence=reference_sequence,
+        member_input=member_input,
+        config=config,
+        aligner=aligner,
+        allowed_strands=allowed_strands,
+    )
+
+
 def _place_member_against_reference(
     *,
     reference_sequence: str,
@@ -297,13 +355,14 @@ def _place_member_against_reference(
             deletion_count=deletion_count,
         )
 
-    reference_cells, insertion_cells_by_bucket = _project_member_against_reference(
-        alignment=best_alignment.alignment,
-        member_input=member_input,
-        oriented_sequence=best_alignment.sequence,
-        oriented_qualities=best_alignment.qualities,
-        strand=best_alignment.strand,
-        reference_length=len(reference_sequence),
+    reference_cells_by_index, insertion_cells_by_bucket = (
+        _project_member_against_reference(
+            alignment=best_alignment.alignment,
+            member_input=member_input,
+            oriented_sequence=best_alignment.sequence,
+            oriented_qualities=best_alignment.qualities,
+            strand=best_alignment.strand,
+        )
     )
     return _PlacedReferenceMultiMember(
         member=ReferenceMultiAlignmentMember(
@@ -323,7 +382,7 @@ def _place_member_against_reference(
             insertion_count=insertion_count,
             deletion_count=deletion_count,
         ),
-        reference_cells=reference_cells,
+        reference_cells_by_index=reference_cells_by_index,
         insertion_cells_by_bucket=insertion_cells_by_bucket,
     )
 
@@ -358,7 +417,7 @@ def _excluded_reference_multi_member(
             insertion_count=insertion_count,
             deletion_count=deletion_count,
         ),
-        reference_cells=(),
+        reference_cells_by_index={},
         insertion_cells_by_bucket={},
     )
 
@@ -420,14 +479,11 @@ def _project_member_against_reference(
     oriented_sequence: str,
     oriented_qualities: list[int] | None,
     strand: ChosenStrand,
-    reference_length: int,
 ) -> tuple[
-    tuple[_ProjectedReferenceMultiCell, ...],
+    dict[int, _ProjectedReferenceMultiCell],
     dict[int, tuple[_ProjectedReferenceMultiCell, ...]],
 ]:
-    reference_cells: list[_ProjectedReferenceMultiCell] = [
-        _gap_reference_multi_projected_cell() for _ in range(reference_length)
-    ]
+    reference_cells_by_index: dict[int, _ProjectedReferenceMultiCell] = {}
     insertion_cells_by_bucket: dict[int, list[_ProjectedReferenceMultiCell]] = {}
     last_reference_index = -1
 
@@ -443,13 +499,15 @@ def _project_member_against_reference(
             last_reference_index = resolved_target_index
             if resolved_query_index < 0:
                 continue
-            reference_cells[resolved_target_index] = _projected_reference_multi_cell(
-                raw_record=member_input.raw_record,
-                trim_result=member_input.trim_result,
-                strand=strand,
-                base=oriented_sequence[resolved_query_index],
-                query_index=resolved_query_index,
-                oriented_qualities=oriented_qualities,
+            reference_cells_by_index[resolved_target_index] = (
+                _projected_reference_multi_cell(
+                    raw_record=member_input.raw_record,
+                    trim_result=member_input.trim_result,
+                    strand=strand,
+                    base=oriented_sequence[resolved_query_index],
+                    query_index=resolved_query_index,
+                    oriented_qualities=oriented_qualities,
+                )
             )
             continue
 
@@ -468,7 +526,7 @@ def _project_member_against_reference(
         )
 
     return (
-        tuple(reference_cells),
+        reference_cells_by_index,
         {
             bucket_index: tuple(cells)
             for bucket_index, cells in insertion_cells_by_bucket.items()
@@ -502,225 +560,181 @@ def _projected_reference_multi_cell(
     )
 
 
-def _gap_reference_multi_projected_cell() -> _ProjectedReferenceMultiCell:
-    return _ProjectedReferenceMultiCell(
-        base="-",
-        query_index=None,
-        query_pos=None,
-        qscore=None,
-        trace_x=None,
-        is_gap=True,
-    )
-
-
-def _resolve_reference_multi_insertion_bucket(
+def _reference_coverage_windows(
+    placements: tuple[_PlacedReferenceMultiMember, ...],
     *,
-    bucket_cells_by_member: dict[int, tuple[_ProjectedReferenceMultiCell, ...]],
-    included_member_indices: tuple[int, ...],
-    aligner: Align.PairwiseAligner,
-) -> tuple[dict[int, _ProjectedReferenceMultiCell], ...]:
-    non_empty_bucket_cells = [
-        (member_index, cells)
-        for member_index, cells in bucket_cells_by_member.items()
-        if cells
-    ]
-    if not non_empty_bucket_cells:
-        return ()
-
-    non_empty_bucket_cells.sort(key=lambda item: (-len(item[1]), item[0]))
-    anchor_member_index, anchor_cells = non_empty_bucket_cells[0]
-    resolved_columns = [{anchor_member_index: cell} for cell in anchor_cells]
-    for member_index, member_cells in non_empty_bucket_cells[1:]:
-        resolved_columns = _merge_reference_multi_bucket_member_cells(
-            resolved_columns,
-            member_index=member_index,
-            member_cells=member_cells,
-            aligner=aligner,
+    reference_length: int,
+    padding: int,
+) -> tuple[tuple[int, int], ...]:
+    covered_intervals: list[tuple[int, int]] = []
+    for placement in placements:
+        # Insertion bucket ``b`` sits before reference base ``b``, so it is
+        # covered by any window that spans ``start <= b <= end``.
+        window_starts = [
+            *placement.reference_cells_by_index,
+            *placement.insertion_cells_by_bucket,
+        ]
+        window_ends = [
+            *(ref_index + 1 for ref_index in placement.reference_cells_by_index),
+            *placement.insertion_cells_by_bucket,
+        ]
+        if not window_starts:
+            continue
+        covered_intervals.append(
+            (
+                max(min(window_starts) - padding, 0),
+                min(max(window_ends) + padding, reference_length),
+            )
         )
 
-    for resolved_column in resolved_columns:
-        for member_index in included_member_indices:
-            resolved_column.setdefault(
-                member_index, _gap_reference_multi_projected_cell()
+    merged_windows: list[tuple[int, int]] = []
+    for window_start, window_end in sorted(covered_intervals):
+        if merged_windows and window_start <= merged_windows[-1][1]:
+            merged_windows[-1] = (
+                merged_windows[-1][0],
+                max(merged_windows[-1][1], window_end),
             )
+            continue
+        merged_windows.append((window_start, window_end))
+    return tuple(merged_windows)
+
 
-    return tuple(resolved_columns)
+def _sparse_reference_multi_insertion_buckets(
+    placements: tuple[_PlacedReferenceMultiMember, ...],
+) -> dict[int, dict[int, tuple[_ProjectedReferenceMultiCell, ...]]]:
+    bucket_cells_by_index: dict[
+        int, dict[int, tuple[_ProjectedReferenceMultiCell, ...]]
+    ] = {}
+    for placement in placements:
+        for bucket_index, cells in placement.insertion_cells_by_bucket.items():
+            bucket_cells_by_index.setdefault(bucket_index, {})[
+                placement.member.member_index
+            ] = cells
+    return dict(sorted(bucket_cells_by_index.items()))
 
 
-def _merge_reference_multi_bucket_member_cells(
-    resolved_columns: list[dict[int, _ProjectedReferenceMultiCell]],
+def _resolve_reference_multi_insertion_bucket(
     *,
-    member_index: int,
-    member_cells: tuple[_ProjectedReferenceMultiCell, ...],
-    aligner: Align.PairwiseAligner,
-) -> list[dict[int, _ProjectedReferenceMultiCell]]:
-    representative_sequence = "".join(
-        _reference_multi_bucket_column_representative(resolved_column)
-        for resolved_column in resolved_columns
+    bucket_cells_by_member: dict[int, tuple[_ProjectedReferenceMultiCell, ...]],
+    merger: InsertionBucketMerger,
+) -> tuple[dict[int, _ProjectedReferenceMultiCell], ...]:
+    non_empty_bucket_cells = sorted(
+        (
+            (member_index, cells)
+            for member_index, cells in bucket_cells_by_member.items()
+            if cells
+        ),
+        key=lambda item: (-len(item[1]), item[0]),
     )
-    member_sequence = "".join(cell.base for cell in member_cells)
-    if not representative_sequence:
-        return [{member_index: cell} for cell in member_cells]
-
-    alignment = aligner.align(representative_sequence, member_sequence)[0]
-    merged_columns: list[dict[int, _ProjectedReferenceMultiCell]] = []
-    for target_index, query_index in zip(
-        alignment.indices[0],
-        alignment.indices[1],
-        strict=True,
-    ):
-        resolved_target_index = int(target_index)
-        resolved_query_index = int(query_index)
-        if resolved_target_index >= 0:
-            merged_column = dict(resolved_columns[resolved_target_index])
-            merged_column[member_index] = (
-                _gap_reference_multi_projected_cell()
-                if resolved_query_index < 0
-                else member_cells[resolved_query_index]
+    merged_columns = merger.merge(
+        ["".join(cell.base for cell in cells) for _, cells in non_empty_bucket_cells]
+    )
+    return tuple(
+        {
+            non_empty_bucket_cells[sequence_position][0]: (
+                non_empty_bucket_cells[sequence_position][1][base_offset]
             )
-            merged_columns.append(merged_column)
-            continue
-        if resolved_query_index < 0:
-            continue
-        merged_columns.append({member_index: member_cells[resolved_query_index]})
-    return merged_columns
-
-
-def _reference_multi_bucket_column_representative(
-    resolved_column: dict[int, _ProjectedReferenceMultiCell],
-) -> str:
-    bases = [
-        cell.base
-        for cell in resolved_column.values()
-        if not cell.is_gap and cell.base != "-"
-    ]
-    if not bases:
-        return "N"
-    base_counts = Counter(bases)
-    return sorted(
-        base_counts.items(),
-        key=lambda item: (-item[1], item[0]),
-    )[
-        0
-    ][0]
-
-
-def _build_reference_multi_column(
-    *,
-    column_index: int,
-    anchor_kind: ReferenceMultiAnchorKind,
-    anchor_index: int,
-    ref_index: int | None,
-    ref_base: str,
+            for sequence_position, base_offset in merged_column.items()
+        }
+        for merged_column in merged_columns
+    )
+
+
+def _ordered_reference_multi_cells(
     column_cells_by_member: dict[int, _ProjectedReferenceMultiCell],
+    *,
     included_member_indices: tuple[int, ...],
-    quality_margin: int,
-) -> ReferenceMultiAlignmentColumn | None:
-    ordered_projected_cells = tuple(
-        column_cells_by_member.get(member_index, _gap_reference_multi_projected_cell())
+) -> tuple[_ProjectedReferenceMultiCell, ...]:
+    return tuple(
+        column_cells_by_member.get(member_index, _GAP_REFERENCE_MULTI_CELL)
         for member_index in included_member_indices
     )
-    non_gap_projected_cells = tuple(
-        cell for cell in ordered_projected_cells if not cell.is_gap and cell.base != "-"
-    )
-    if anchor_kind == "insertion" and not non_gap_projected_cells:
-        return None
 
-    support_counts: Counter[str] = Counter(
-        cell.base for cell in non_gap_projected_cells
-    )
-    quality_sums: dict[str, int] = {}
-    for cell in non_gap_projected_cells:
-        quality_sums[cell.base] = quality_sums.get(cell.base, 0) + int(
-            0 if cell.qscore is None else cell.qscore
-        )
 
-    consensus_base, resolution = _resolve_reference_multi_consensus_column(
-        support_counts=support_counts,
-        quality_sums=quality_sums,
+def _build_reference_multi_columns(
+    column_specs: list[_ReferenceMultiColumnSpec],
+    *,
+    included_member_indices: tuple[int, ...],
+    quality_margin: int,
+) -> tuple[ReferenceMultiAlignmentColumn, ...]:
+    member_count = len(included_member_indices)
+    column_count = len(column_specs)
+    base_codes = np.full((member_count, column_count), ord("-"), dtype=np.uint8)
+    qualities = np.full((member_count, column_count), GRID_MISSING, dtype=np.int32)
+    gap_mask = np.ones((member_count, column_count), dtype=bool)
+    for column_position, column_spec in enumerate(column_specs):
+        for row_position, cell in enumerate(column_spec.member_cells):
+            if cell.is_gap or cell.base == "-":
+                continue
+            base_codes[row_position, column_position] = ord(cell.base)
+            gap_mask[row_position, column_position] = False
+            if cell.qscore is not None:
+                qualities[row_position, column_position] = cell.qscore
+
+    consensus = call_column_consensus(
+        base_codes=base_codes,
+        qualities=qualities,
+        gap_mask=gap_mask,
         quality_margin=quality_margin,
-        ref_base=ref_base,
-        allow_deleted=anchor_kind == "reference",
-    )
-    matches_reference = (
-        None if anchor_kind == "insertion" else consensus_base == ref_base
-    )
-    return ReferenceMultiAlignmentColumn(
-        column_index=column_index,
-        anchor_kind=anchor_kind,
-        anchor_index=anchor_index,
-        ref_index=ref_index,
-        ref_pos=None if ref_index is None else ref_index + 1,
-        ref_base=ref_base,
-        consensus_base=consensus_base,
-        resolution=resolution,
-        member_cells=tuple(
-            ReferenceMultiAlignmentMemberCell(
-                member_index=member_index,
-                base=projected_cell.base,
-                query_index=projected_cell.query_index,
-                query_pos=projected_cell.query_pos,
-                qscore=projected_cell.qscore,
-                trace_x=projected_cell.trace_x,
-                is_gap=projected_cell.is_gap,
-            )
-            for member_index, projected_cell in zip(
-                included_member_indices,
-                ordered_projected_cells,
-                strict=True,
-            )
-        ),
-        support_counts=tuple(
-            sorted(
-                support_counts.items(),
-                key=lambda item: (-item[1], item[0]),
-            )
+        allow_deleted=np.asarray(
+            [column_spec.anchor_kind == "reference" for column_spec in column_specs],
+            dtype=bool,
         ),
-        quality_sums=tuple(sorted(quality_sums.items())),
-        non_gap_member_count=len(non_gap_projected_cells),
-        gap_member_count=len(ordered_projected_cells) - len(non_gap_projected_cells),
-        ambiguous=consensus_base == "N",
-        matches_reference=matches_reference,
     )
+    non_gap_counts = np.count_nonzero(~gap_mask, axis=0).tolist()
 
-
-def _resolve_reference_multi_consensus_column(
-    *,
-    support_counts: Counter[str],
-    quality_sums: dict[str, int],
-    quality_margin: int,
-    ref_base: str,
-    allow_deleted: bool,
-) -> tuple[str, ReferenceConsensusResolution]:
-    if not support_counts:
-        if allow_deleted:
-            return "-", "deleted"
-        return "N", "ambiguous"
-
-    ranked_bases = sorted(
-        support_counts,
-        key=lambda base: (-support_counts[base], -quality_sums.get(base, 0), base),
-    )
-    if len(ranked_bases) == 1:
-        base = ranked_bases[0]
-        return (
-            (base, "single_read") if support_counts[base] == 1 else (base, "concordant")
+    columns: list[ReferenceMultiAlignmentColumn] = []
+    for column_position, (column_spec, consensus_code, resolution_code) in enumerate(
+        zip(
+            column_specs,
+            consensus.consensus_codes.tolist(),
+            consensus.resolution_codes.tolist(),
+            strict=True,
         )
-
-    top_base = ranked_bases[0]
-    next_base = ranked_bases[1]
-    top_support = support_counts[top_base]
-    next_support = support_counts[next_base]
-    top_quality = quality_sums.get(top_base, 0)
-    next_quality = quality_sums.get(next_base, 0)
-
-    if top_support > next_support:
-        return top_base, "majority_resolved"
-    if (top_quality - next_quality) >= quality_margin:
-        return top_base, "quality_resolved"
-    if ref_base != "-" and ref_base in support_counts:
-        return "N", "ambiguous"
-    return "N", "ambiguous"
+    ):
+        consensus_base = chr(consensus_code)
+        non_gap_member_count = non_gap_counts[column_position]
+        columns.append(
+            ReferenceMultiAlignmentColumn(
+                column_index=column_position + 1,
+                anchor_kind=column_spec.anchor_kind,
+                anchor_index=column_spec.anchor_index,
+                ref_index=column_spec.ref_index,
+                ref_pos=(
+                    None if column_spec.ref_index is None else column_spec.ref_index + 1
+                ),
+                ref_base=column_spec.ref_base,
+                consensus_base=consensus_base,
+                resolution=CONSENSUS_RESOLUTIONS[resolution_code],
+                member_cells=tuple(
+                    ReferenceMultiAlignmentMemberCell(
+                        member_index=member_index,
+                        base=projected_cell.base,
+                        query_index=projected_cell.query_index,
+                        query_pos=projected_cell.query_pos,
+                        qscore=projected_cell.qscore,
+                        trace_x=projected_cell.trace_x,
+                        is_gap=projected_cell.is_gap,
+                    )
+                    for member_index, projected_cell in zip(
+                        included_member_indices,
+                        column_spec.member_cells,
+                        strict=True,
+                    )
+                ),
+                support_counts=consensus.support_count_items(column_position),
+                quality_sums=consensus.quality_sum_items(column_position),
+                non_gap_member_count=non_gap_member_count,
+                gap_member_count=member_count - non_gap_member_count,
+                ambiguous=consensus_base == "N",
+                matches_reference=(
+                    None
+                    if column_spec.anchor_kind == "insertion"
+                    else consensus_base == column_spec.ref_base
+                ),
+            )
+        )
+    return tuple(columns)
 
 
 __all__ = ["align_trimmed_reads_to_reference"]
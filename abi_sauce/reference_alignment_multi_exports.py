@@ -10,7 +10,10 @@ def format_reference_multi_alignment_fasta(
     consensus_name: str | None = None,
 ) -> str:
     """Render a shared-reference multi-read alignment as gapped FASTA."""
-    lines = [f">{result.reference_name}", result.gapped_reference]
+    reference_header = f">{result.reference_name}"
+    if result.is_windowed:
+        reference_header += f" windows={_format_reference_windows(result)}"
+    lines = [reference_header, result.gapped_reference]
 
     members_by_index = {
         member.member_index: member for member in result.members if member.included
@@ -65,10 +68,25 @@ def consensus_record_from_reference_multi_result(
             "ambiguous_column_count": result.ambiguous_column_count,
             "alignment_accepted": result.accepted,
             "alignment_rejection_reason": result.rejection_reason,
+            "reference_windows": (
+                _format_reference_windows(result) if result.is_windowed else None
+            ),
         },
     )
 
 
+def _format_reference_windows(result: ReferenceMultiAlignmentResult) -> str:
+    reference_windows = (
+        ((0, len(result.reference_sequence)),)
+        if result.reference_windows is None
+        else result.reference_windows
+    )
+    return ",".join(
+        f"{window_start + 1}-{window_end}"
+        for window_start, window_end in reference_windows
+    )
+
+
 __all__ = [
     "format_reference_multi_alignment_fasta",
     "consensus_record_from_reference_multi_result",
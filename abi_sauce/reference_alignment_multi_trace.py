@@ -1,18 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from abi_sauce.assembly_trace import (
     AssemblyTraceRowSource,
+    PackedTraceSignal,
     build_assembly_trace_row_source,
+    resample_trace_row_windows,
     resolve_assembly_trace_samples_per_cell,
+    trace_column_window_bounds,
+    trace_raw_window,
+    trace_view_fingerprint,
 )
 from abi_sauce.models import SequenceRecord
 from abi_sauce.reference_alignment_types import (
     ReferenceMultiAlignmentColumn,
     ReferenceMultiAlignmentResult,
 )
-from abi_sauce.signal_sampling import resample_signal_window
 from abi_sauce.trimming import TrimResult
 
 
@@ -49,11 +55,7 @@ class ReferenceMultiAlignmentTraceCell:
     raw_left: float | None = None
     raw_right: float | None = None
     raw_center: float | None = None
-    channels: tuple[ReferenceMultiAlignmentTraceChannelSegment, ...] = ()
-
-    @property
-    def has_trace_signal(self) -> bool:
-        return bool(self.channels)
+    has_trace_signal: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,11 +71,43 @@ class ReferenceMultiAlignmentTraceRow:
     signal_scale: float
     has_trace_signal: bool
     cells: tuple[ReferenceMultiAlignmentTraceCell, ...] = ()
+    packed_signal: PackedTraceSignal = field(default_factory=PackedTraceSignal)
 
     @property
     def aligned_sequence(self) -> str:
         return "".join(cell.query_base for cell in self.cells)
 
+    def cell_channels(
+        self,
+        cell_position: int,
+    ) -> tuple[ReferenceMultiAlignmentTraceChannelSegment, ...]:
+        cell = self.cells[cell_position]
+        return tuple(
+            ReferenceMultiAlignmentTraceChannelSegment(
+                base=base,
+                color=color,
+                x_values=x_values,
+                normalized_signal=normalized_signal,
+            )
+            for base, color, x_values, normalized_signal in (
+                self.packed_signal.cell_channel_values(
+                    cell_position,
+                    cell_left=cell.cell_left,
+                    cell_right=cell.cell_right,
+                )
+            )
+        )
+
+    def traced_channel_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(x_values, signal)`` arrays for every traced cell of the row."""
+        return (
+            self.packed_signal.traced_x_values(
+                cell_lefts=[cell.cell_left for cell in self.cells],
+                cell_rights=[cell.cell_right for cell in self.cells],
+            ),
+            self.packed_signal.signal,
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class ReferenceMultiAlignmentTraceView:
@@ -85,11 +119,24 @@ class ReferenceMultiAlignmentTraceView:
     cell_width: float = 1.0
     samples_per_cell: int = 16
     trace_row_height: float = 3.0
+    column_window: tuple[int, int] | None = None
+    fingerprint: str | None = field(default=None, compare=False, repr=False)
 
     @property
     def alignment_length(self) -> int:
         return len(self.columns)
 
+    @property
+    def is_windowed(self) -> bool:
+        return self.column_window is not None
+
+    @property
+    def window_columns(self) -> tuple[ReferenceMultiAlignmentColumn, ...]:
+        if self.column_window is None:
+            return self.columns
+        window_start, window_end = self.column_window
+        return self.columns[window_start:window_end]
+
     @property
     def total_height(self) -> float:
         return float(len(self.rows)) * self.trace_row_height
@@ -108,8 +155,13 @@ def build_reference_multi_alignment_trace_view(
     samples_per_cell: int | None = None,
     trace_row_height: float = 3.0,
     row_sources_by_member_index: dict[int, AssemblyTraceRowSource] | None = None,
+    column_window: tuple[int, int] | None = None,
 ) -> ReferenceMultiAlignmentTraceView:
-    """Build one stacked shared-reference electropherogram view."""
+    """Build one stacked shared-reference electropherogram view.
+
+    With a zero-based half-open ``column_window``, only cells inside it are
+    built while ``columns`` still spans the whole alignment.
+    """
     resolved_samples_per_cell = resolve_assembly_trace_samples_per_cell(
         alignment_length=len(result.columns),
         row_count=len(result.included_member_indices),
@@ -120,6 +172,11 @@ def build_reference_multi_alignment_trace_view(
         samples_per_cell=resolved_samples_per_cell,
         trace_row_height=trace_row_height,
     )
+    window_start, window_end = trace_column_window_bounds(
+        column_window,
+        alignment_length=len(result.columns),
+    )
+    window_columns = result.columns[window_start:window_end]
 
     members_by_index = {member.member_index: member for member in result.members}
     member_cell_position_by_index = {
@@ -128,6 +185,7 @@ def build_reference_multi_alignment_trace_view(
     }
 
     rows: list[ReferenceMultiAlignmentTraceRow] = []
+    row_sources: list[AssemblyTraceRowSource] = []
     total_rows = len(result.included_member_indices)
     for row_order_index, member_index in enumerate(result.included_member_indices):
         member = members_by_index[member_index]
@@ -141,9 +199,10 @@ def build_reference_multi_alignment_trace_view(
                 strand=member.chosen_strand,
             )
         )
+        row_sources.append(row_source)
         rows.append(
             _build_trace_row(
-                columns=result.columns,
+                columns=window_columns,
                 member_cell_position=member_cell_position_by_index[member_index],
                 label=member.display_name,
                 source_filename=member.source_filename,
@@ -165,6 +224,16 @@ def build_reference_multi_alignment_trace_view(
         cell_width=cell_width,
         samples_per_cell=resolved_samples_per_cell,
         trace_row_height=trace_row_height,
+        column_window=column_window,
+        fingerprint=trace_view_fingerprint(
+            "reference_multi_alignment_trace_view",
+            result,
+            row_sources=tuple(row_sources),
+            cell_width=cell_width,
+            samples_per_cell=resolved_samples_per_cell,
+            trace_row_height=trace_row_height,
+            column_window=column_window,
+        ),
     )
 
 
@@ -199,15 +268,38 @@ def _build_trace_row(
 ) -> ReferenceMultiAlignmentTraceRow:
     y_bottom = float(total_rows - row_order_index - 1) * trace_row_height
     y_top = y_bottom + trace_row_height
+    raw_windows = tuple(
+        (
+            trace_raw_window(row_source, query_index=member_cell.query_index)
+            if member_cell.query_index is not None and member_cell.base != "-"
+            else (None, None, None)
+        )
+        for member_cell in (
+            column.member_cells[member_cell_position] for column in columns
+        )
+    )
+    packed_signal = resample_trace_row_windows(
+        row_source,
+        cell_windows=tuple(
+            (float(column.column_index - 1) * cell_width, raw_left, raw_right)
+            for column, (raw_left, raw_right, _raw_center) in zip(
+                columns, raw_windows, strict=True
+            )
+        ),
+        cell_width=cell_width,
+        samples_per_cell=samples_per_cell,
+    )
     cells = tuple(
         _build_trace_cell(
             column=column,
             member_cell_position=member_cell_position,
-            row_source=row_source,
+            raw_window=raw_window,
+            has_trace_signal=packed_signal.has_cell_signal(cell_position),
             cell_width=cell_width,
-            samples_per_cell=samples_per_cell,
         )
-        for column in columns
+        for cell_position, (column, raw_window) in enumerate(
+            zip(columns, raw_windows, strict=True)
+        )
     )
     return ReferenceMultiAlignmentTraceRow(
         label=label,
@@ -219,6 +311,7 @@ def _build_trace_row(
         signal_scale=row_source.signal_scale,
         has_trace_signal=any(cell.has_trace_signal for cell in cells),
         cells=cells,
+        packed_signal=packed_signal,
     )
 
 
@@ -226,42 +319,15 @@ def _build_trace_cell(
     *,
     column: ReferenceMultiAlignmentColumn,
     member_cell_position: int,
-    row_source: AssemblyTraceRowSource,
+    raw_window: tuple[float | None, float | None, float | None],
+    has_trace_signal: bool,
     cell_width: float,
-    samples_per_cell: int,
 ) -> ReferenceMultiAlignmentTraceCell:
     member_cell = column.member_cells[member_cell_position]
     cell_left = float(column.column_index - 1) * cell_width
     cell_right = cell_left + cell_width
     cell_center = (cell_left + cell_right) / 2.0
-
-    raw_left: float | None = None
-    raw_right: float | None = None
-    raw_center: float | None = None
-    channels: tuple[ReferenceMultiAlignmentTraceChannelSegment, ...] = ()
-
-    if member_cell.query_index is not None and member_cell.base != "-":
-        full_base_index = row_source.trimmed_start + member_cell.query_index
-        base_call = _mapping_lookup(
-            row_source.base_calls_by_full_index, full_base_index
-        )
-        base_span = _mapping_lookup(
-            row_source.base_spans_by_full_index, full_base_index
-        )
-        if base_call is not None:
-            raw_center = float(base_call.position)
-        if base_span is not None:
-            raw_left = base_span.left
-            raw_right = base_span.right
-            raw_center = base_span.center if raw_center is None else raw_center
-            channels = _build_cell_channels(
-                row_source=row_source,
-                raw_left=raw_left,
-                raw_right=raw_right,
-                cell_left=cell_left,
-                cell_right=cell_right,
-                samples_per_cell=samples_per_cell,
-            )
+    raw_left, raw_right, raw_center = raw_window
 
     return ReferenceMultiAlignmentTraceCell(
         column_index=column.column_index,
@@ -287,51 +353,10 @@ def _build_trace_cell(
         raw_left=raw_left,
         raw_right=raw_right,
         raw_center=raw_center,
-        channels=channels,
+        has_trace_signal=has_trace_signal,
     )
 
 
-def _build_cell_channels(
-    *,
-    row_source: AssemblyTraceRowSource,
-    raw_left: float,
-    raw_right: float,
-    cell_left: float,
-    cell_right: float,
-    samples_per_cell: int,
-) -> tuple[ReferenceMultiAlignmentTraceChannelSegment, ...]:
-    if not row_source.channels or raw_right <= raw_left:
-        return ()
-
-    channel_segments: list[ReferenceMultiAlignmentTraceChannelSegment] = []
-    for channel in row_source.channels:
-        x_values, sampled_signal = resample_signal_window(
-            channel.signal,
-            raw_left=raw_left,
-            raw_right=raw_right,
-            cell_left=cell_left,
-            cell_right=cell_right,
-            sample_count=samples_per_cell,
-            signal_scale=row_source.signal_scale,
-            clamp_to_unit=True,
-        )
-        channel_segments.append(
-            ReferenceMultiAlignmentTraceChannelSegment(
-                base=channel.base,
-                color=channel.color,
-                x_values=x_values,
-                normalized_signal=sampled_signal,
-            )
-        )
-    return tuple(channel_segments)
-
-
-def _mapping_lookup(mapping, key: int):
-    if mapping is None:
-        return None
-    return mapping.get(key)
-
-
 __all__ = [
     "ReferenceMultiAlignmentTraceChannelSegment",
     "ReferenceMultiAlignmentTraceCell",
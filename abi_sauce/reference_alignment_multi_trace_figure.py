@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Final
+from typing import Any, Final
 
+import numpy as np
 import plotly.graph_objects as go
 
 from abi_sauce.reference_alignment_multi_trace import (
     ReferenceMultiAlignmentTraceCell,
-    ReferenceMultiAlignmentTraceChannelSegment,
     ReferenceMultiAlignmentTraceRow,
     ReferenceMultiAlignmentTraceView,
 )
@@ -106,6 +107,23 @@ _CONSENSUS_BAND_HEIGHT: Final[float] = 0.9
 _BAND_GAP: Final[float] = 0.3
 _DEFAULT_INITIAL_VISIBLE_COLUMNS: Final[int] = 50
 _DEFAULT_INITIAL_COLUMN_PADDING_MULTIPLIER: Final[float] = 1.0
+_ROW_HOVER_TEMPLATE: Final[str] = (
+    "row=%{customdata[12]}"
+    "<br>strand=%{customdata[13]}"
+    "<br>column=%{customdata[0]}"
+    "<br>anchor=%{customdata[1]}"
+    "<br>reference_base=%{customdata[2]}"
+    "<br>query_base=%{customdata[3]}"
+    "<br>consensus=%{customdata[4]}"
+    "<br>resolution=%{customdata[5]}"
+    "<br>ref_pos=%{customdata[6]}"
+    "<br>query_pos=%{customdata[7]}"
+    "<br>quality=%{customdata[8]}"
+    "<br>trace_x=%{customdata[9]}"
+    "<br>raw_left=%{customdata[10]}"
+    "<br>raw_right=%{customdata[11]}"
+    "<extra></extra>"
+)
 
 
 def build_reference_multi_alignment_trace_figure(
@@ -113,8 +131,13 @@ def build_reference_multi_alignment_trace_figure(
     *,
     theme_type: str = "light",
     selected_column_index: int | None = None,
+    batch_rows: bool = False,
 ) -> go.Figure:
-    """Build a stacked shared-reference electropherogram figure."""
+    """Build a stacked shared-reference electropherogram figure.
+
+    With ``batch_rows`` every row shares one background trace, one channel
+    trace per base, one base-label trace and one hover trace.
+    """
     theme = _resolve_figure_theme(theme_type)
     figure = go.Figure()
 
@@ -125,28 +148,14 @@ def build_reference_multi_alignment_trace_figure(
     reference_bottom = rows_y_offset + view.total_height + _BAND_GAP
     reference_top = reference_bottom + _REFERENCE_BAND_HEIGHT
     reference_mid = (reference_bottom + reference_top) / 2.0
-    total_height = reference_top + 0.2
+    total_height = _figure_total_height(view)
 
-    if (
-        selected_column_index is not None
-        and 1 <= selected_column_index <= view.alignment_length
+    for shape in build_reference_multi_alignment_trace_selection_shapes(
+        view,
+        theme_type=theme_type,
+        selected_column_index=selected_column_index,
     ):
-        selected_left, selected_right = _column_bounds(
-            selected_column_index,
-            cell_width=view.cell_width,
-        )
-        figure.add_shape(
-            type="rect",
-            xref="x",
-            yref="y",
-            x0=selected_left,
-            x1=selected_right,
-            y0=0.0,
-            y1=total_height,
-            line={"width": 0},
-            fillcolor=theme.selected_column_color,
-            layer="below",
-        )
+        figure.add_shape(**shape)
 
     _add_consensus_band(
         figure,
@@ -165,31 +174,39 @@ def build_reference_multi_alignment_trace_figure(
         y_text=reference_mid,
     )
 
-    for row in view.rows:
-        _add_row_background(
+    if batch_rows:
+        _add_batched_rows(
             figure,
-            row=row,
             view=view,
             theme=theme,
             y_offset=rows_y_offset,
         )
-        _add_row_channel_segments(
-            figure,
-            row=row,
-            theme=theme,
-            y_offset=rows_y_offset,
-        )
-        _add_row_base_labels(
-            figure,
-            row=row,
-            theme=theme,
-            y_offset=rows_y_offset,
-        )
-        _add_row_hover_markers(
-            figure,
-            row=row,
-            y_offset=rows_y_offset,
-        )
+    else:
+        for row in view.rows:
+            _add_row_background(
+                figure,
+                row=row,
+                view=view,
+                theme=theme,
+                y_offset=rows_y_offset,
+            )
+            _add_row_channel_segments(
+                figure,
+                row=row,
+                theme=theme,
+                y_offset=rows_y_offset,
+            )
+            _add_row_base_labels(
+                figure,
+                row=row,
+                theme=theme,
+                y_offset=rows_y_offset,
+            )
+            _add_row_hover_markers(
+                figure,
+                row=row,
+                y_offset=rows_y_offset,
+            )
 
     figure.update_xaxes(
         title_text="Alignment column",
@@ -230,6 +247,50 @@ def build_reference_multi_alignment_trace_figure(
     return figure
 
 
+def build_reference_multi_alignment_trace_selection_shapes(
+    view: ReferenceMultiAlignmentTraceView,
+    *,
+    theme_type: str = "light",
+    selected_column_index: int | None = None,
+) -> tuple[dict[str, Any], ...]:
+    """Return the selected-column highlight as standalone layout shapes."""
+    if (
+        selected_column_index is None
+        or not 1 <= selected_column_index <= view.alignment_length
+    ):
+        return ()
+
+    selected_left, selected_right = _column_bounds(
+        selected_column_index,
+        cell_width=view.cell_width,
+    )
+    return (
+        {
+            "type": "rect",
+            "xref": "x",
+            "yref": "y",
+            "x0": selected_left,
+            "x1": selected_right,
+            "y0": 0.0,
+            "y1": _figure_total_height(view),
+            "line": {"width": 0},
+            "fillcolor": _resolve_figure_theme(theme_type).selected_column_color,
+            "layer": "below",
+        },
+    )
+
+
+def _figure_total_height(view: ReferenceMultiAlignmentTraceView) -> float:
+    return (
+        _CONSENSUS_BAND_HEIGHT
+        + _BAND_GAP
+        + view.total_height
+        + _BAND_GAP
+        + _REFERENCE_BAND_HEIGHT
+        + 0.2
+    )
+
+
 def _add_reference_band(
     figure: go.Figure,
     *,
@@ -239,26 +300,27 @@ def _add_reference_band(
     y_top: float,
     y_text: float,
 ) -> None:
+    columns = view.window_columns
     _add_background_bars(
         figure,
         x_values=[
             _column_center(column.column_index, cell_width=view.cell_width)
-            for column in view.columns
+            for column in columns
         ],
         y_base=y_bottom,
         height=y_top - y_bottom,
         width=view.cell_width,
-        colors=[_column_fill_color(column, theme) for column in view.columns],
+        colors=[_column_fill_color(column, theme) for column in columns],
         name="Reference background",
     )
     figure.add_trace(
         go.Scattergl(
             x=[
                 _column_center(column.column_index, cell_width=view.cell_width)
-                for column in view.columns
+                for column in columns
             ],
-            y=[y_text] * len(view.columns),
-            text=[column.ref_base for column in view.columns],
+            y=[y_text] * len(columns),
+            text=[column.ref_base for column in columns],
             mode="text",
             name="Reference",
             textfont={"color": theme.reference_text_color},
@@ -270,9 +332,9 @@ def _add_reference_band(
         go.Scattergl(
             x=[
                 _column_center(column.column_index, cell_width=view.cell_width)
-                for column in view.columns
+                for column in columns
             ],
-            y=[y_text] * len(view.columns),
+            y=[y_text] * len(columns),
             mode="markers",
             name="Reference hover",
             showlegend=False,
@@ -287,7 +349,7 @@ def _add_reference_band(
                     f"<br>resolution={column.resolution}"
                     f"<br>support={_support_summary(column.support_counts)}"
                 )
-                for column in view.columns
+                for column in columns
             ],
             marker={"size": 14, "opacity": 0},
             hovertemplate="%{customdata}<extra></extra>",
@@ -304,26 +366,27 @@ def _add_consensus_band(
     y_top: float,
     y_text: float,
 ) -> None:
+    columns = view.window_columns
     _add_background_bars(
         figure,
         x_values=[
             _column_center(column.column_index, cell_width=view.cell_width)
-            for column in view.columns
+            for column in columns
         ],
         y_base=y_bottom,
         height=y_top - y_bottom,
         width=view.cell_width,
-        colors=[_column_fill_color(column, theme) for column in view.columns],
+        colors=[_column_fill_color(column, theme) for column in columns],
         name="Consensus background",
     )
     figure.add_trace(
         go.Scattergl(
             x=[
                 _column_center(column.column_index, cell_width=view.cell_width)
-                for column in view.columns
+                for column in columns
             ],
-            y=[y_text] * len(view.columns),
-            text=[column.consensus_base for column in view.columns],
+            y=[y_text] * len(columns),
+            text=[column.consensus_base for column in columns],
             mode="text",
             name="Consensus",
             textfont={"color": theme.consensus_text_color},
@@ -335,9 +398,9 @@ def _add_consensus_band(
         go.Scattergl(
             x=[
                 _column_center(column.column_index, cell_width=view.cell_width)
-                for column in view.columns
+                for column in columns
             ],
-            y=[y_text] * len(view.columns),
+            y=[y_text] * len(columns),
             mode="markers",
             name="Consensus hover",
             showlegend=False,
@@ -350,7 +413,7 @@ def _add_consensus_band(
                     f"<br>support={_support_summary(column.support_counts)}"
                     f"<br>gap_members={column.gap_member_count}"
                 )
-                for column in view.columns
+                for column in columns
             ],
             marker={"size": 14, "opacity": 0},
             hovertemplate="%{customdata}<extra></extra>",
@@ -365,6 +428,26 @@ def _add_row_background(
     view: ReferenceMultiAlignmentTraceView,
     theme: ReferenceMultiAlignmentTraceFigureTheme,
     y_offset: float,
+) -> None:
+    _add_row_border(figure, row=row, view=view, theme=theme, y_offset=y_offset)
+    _add_background_bars(
+        figure,
+        x_values=[cell.cell_center for cell in row.cells],
+        y_base=row.y_bottom + y_offset,
+        height=row.y_top - row.y_bottom,
+        width=view.cell_width,
+        colors=[_cell_fill_color(cell, theme) for cell in row.cells],
+        name=f"{row.display_name} background",
+    )
+
+
+def _add_row_border(
+    figure: go.Figure,
+    *,
+    row: ReferenceMultiAlignmentTraceRow,
+    view: ReferenceMultiAlignmentTraceView,
+    theme: ReferenceMultiAlignmentTraceFigureTheme,
+    y_offset: float,
 ) -> None:
     full_left, full_right = view.x_range
     figure.add_shape(
@@ -379,38 +462,33 @@ def _add_row_background(
         fillcolor=theme.row_background_color,
         layer="below",
     )
-    _add_background_bars(
-        figure,
-        x_values=[cell.cell_center for cell in row.cells],
-        y_base=row.y_bottom + y_offset,
-        height=row.y_top - row.y_bottom,
-        width=view.cell_width,
-        colors=[_cell_fill_color(cell, theme) for cell in row.cells],
-        name=f"{row.display_name} background",
-    )
 
 
 def _add_background_bars(
     figure: go.Figure,
     *,
-    x_values: list[float],
-    y_base: float,
-    height: float,
+    x_values: Sequence[float] | np.ndarray,
+    y_base: float | np.ndarray,
+    height: float | np.ndarray,
     width: float,
-    colors: list[str],
+    colors: Sequence[str] | np.ndarray,
     name: str,
 ) -> None:
-    if not x_values:
+    if not len(x_values):
         return
+    bar_count = len(x_values)
     figure.add_trace(
         go.Bar(
-            x=x_values,
-            y=[height] * len(x_values),
-            base=[y_base] * len(x_values),
-            width=[width] * len(x_values),
+            x=np.asarray(x_values, dtype=np.float64),
+            y=np.broadcast_to(np.asarray(height, dtype=np.float64), (bar_count,)),
+            base=np.broadcast_to(np.asarray(y_base, dtype=np.float64), (bar_count,)),
+            width=np.full(bar_count, width, dtype=np.float64),
             name=name,
             showlegend=False,
-            marker={"color": colors, "line": {"width": 0}},
+            marker={
+                "color": np.asarray(colors, dtype=object),
+                "line": {"width": 0},
+            },
             hoverinfo="skip",
             hovertemplate=None,
         )
@@ -427,25 +505,8 @@ def _add_row_channel_segments(
     if not row.has_trace_signal:
         return
 
-    baseline = row.y_bottom + y_offset + 0.15
-    trace_height = max((row.y_top - row.y_bottom) - 1.0, 0.5)
-    for base in _row_channel_order(row):
-        x_values: list[float | None] = []
-        y_values: list[float | None] = []
-        for cell in row.cells:
-            segment = _cell_channel_segment(cell, base=base)
-            if segment is None or not segment.x_values or not segment.normalized_signal:
-                x_values.append(None)
-                y_values.append(None)
-                continue
-            x_values.extend(segment.x_values)
-            y_values.extend(
-                baseline + (trace_height * signal)
-                for signal in segment.normalized_signal
-            )
-            x_values.append(None)
-            y_values.append(None)
-        if not x_values:
+    for base, x_values, y_values in _row_channel_points(row, y_offset=y_offset):
+        if not x_values.size:
             continue
         figure.add_trace(
             go.Scattergl(
@@ -467,6 +528,33 @@ def _add_row_channel_segments(
         )
 
 
+def _row_channel_points(
+    row: ReferenceMultiAlignmentTraceRow,
+    *,
+    y_offset: float,
+) -> tuple[tuple[str, np.ndarray, np.ndarray], ...]:
+    x_values, signal = row.traced_channel_arrays()
+    separated_x_values = _nan_separated_cells(x_values)
+    baseline = row.y_bottom + y_offset + 0.15
+    trace_height = max((row.y_top - row.y_bottom) - 1.0, 0.5)
+    return tuple(
+        (
+            base,
+            separated_x_values,
+            _nan_separated_cells(
+                baseline + (trace_height * signal[channel_index].astype(np.float64))
+            ),
+        )
+        for channel_index, base in enumerate(row.packed_signal.channel_bases)
+    )
+
+
+def _nan_separated_cells(values: np.ndarray) -> np.ndarray:
+    separated = np.full((values.shape[0], values.shape[1] + 1), np.nan)
+    separated[:, :-1] = values
+    return separated.ravel()
+
+
 def _add_row_base_labels(
     figure: go.Figure,
     *,
@@ -482,26 +570,31 @@ def _add_row_base_labels(
             text=[cell.query_base for cell in row.cells],
             mode="text",
             name=f"{row.display_name} bases",
-            textfont={
-                "color": [
-                    (
-                        _trace_color_for_segment_base(
-                            base=cell.query_base,
-                            fallback_color=theme.font_color,
-                            theme=theme,
-                        )
-                        if cell.query_base != "-"
-                        else theme.font_color
-                    )
-                    for cell in row.cells
-                ]
-            },
+            textfont={"color": _row_base_label_colors(row, theme)},
             hoverinfo="skip",
             hovertemplate=None,
         )
     )
 
 
+def _row_base_label_colors(
+    row: ReferenceMultiAlignmentTraceRow,
+    theme: ReferenceMultiAlignmentTraceFigureTheme,
+) -> list[str]:
+    return [
+        (
+            _trace_color_for_segment_base(
+                base=cell.query_base,
+                fallback_color=theme.font_color,
+                theme=theme,
+            )
+            if cell.query_base != "-"
+            else theme.font_color
+        )
+        for cell in row.cells
+    ]
+
+
 def _add_row_hover_markers(
     figure: go.Figure,
     *,
@@ -515,43 +608,141 @@ def _add_row_hover_markers(
             mode="markers",
             name=f"{row.display_name} hover",
             showlegend=False,
-            customdata=[
-                [
-                    cell.column_index,
-                    cell.anchor_kind,
-                    cell.ref_base,
-                    cell.query_base,
-                    cell.consensus_base,
-                    cell.resolution,
-                    cell.ref_pos,
-                    cell.query_pos,
-                    cell.quality,
-                    cell.trace_x,
-                    cell.raw_left,
-                    cell.raw_right,
-                    row.display_name,
-                    row.strand,
-                ]
-                for cell in row.cells
-            ],
+            customdata=_row_hover_customdata(row),
             marker={"size": 16, "opacity": 0},
-            hovertemplate=(
-                "row=%{customdata[12]}"
-                "<br>strand=%{customdata[13]}"
-                "<br>column=%{customdata[0]}"
-                "<br>anchor=%{customdata[1]}"
-                "<br>reference_base=%{customdata[2]}"
-                "<br>query_base=%{customdata[3]}"
-                "<br>consensus=%{customdata[4]}"
-                "<br>resolution=%{customdata[5]}"
-                "<br>ref_pos=%{customdata[6]}"
-                "<br>query_pos=%{customdata[7]}"
-                "<br>quality=%{customdata[8]}"
-                "<br>trace_x=%{customdata[9]}"
-                "<br>raw_left=%{customdata[10]}"
-                "<br>raw_right=%{customdata[11]}"
-                "<extra></extra>"
+            hovertemplate=_ROW_HOVER_TEMPLATE,
+        )
+    )
+
+
+def _row_hover_customdata(
+    row: ReferenceMultiAlignmentTraceRow,
+) -> list[list[object]]:
+    return [
+        [
+            cell.column_index,
+            cell.anchor_kind,
+            cell.ref_base,
+            cell.query_base,
+            cell.consensus_base,
+            cell.resolution,
+            cell.ref_pos,
+            cell.query_pos,
+            cell.quality,
+            cell.trace_x,
+            cell.raw_left,
+            cell.raw_right,
+            row.display_name,
+            row.strand,
+        ]
+        for cell in row.cells
+    ]
+
+
+def _add_batched_rows(
+    figure: go.Figure,
+    *,
+    view: ReferenceMultiAlignmentTraceView,
+    theme: ReferenceMultiAlignmentTraceFigureTheme,
+    y_offset: float,
+) -> None:
+    rows = view.rows
+    for row in rows:
+        _add_row_border(figure, row=row, view=view, theme=theme, y_offset=y_offset)
+    cell_centers = np.fromiter(
+        (cell.cell_center for row in rows for cell in row.cells),
+        dtype=np.float64,
+    )
+    row_cell_counts = [len(row.cells) for row in rows]
+    _add_background_bars(
+        figure,
+        x_values=cell_centers,
+        y_base=np.repeat([row.y_bottom + y_offset for row in rows], row_cell_counts),
+        height=np.repeat([row.y_top - row.y_bottom for row in rows], row_cell_counts),
+        width=view.cell_width,
+        colors=[_cell_fill_color(cell, theme) for row in rows for cell in row.cells],
+        name="Row backgrounds",
+    )
+
+    points_by_base: dict[str, tuple[list[np.ndarray], list[np.ndarray]]] = {}
+    for row in rows:
+        if not row.has_trace_signal:
+            continue
+        for base, row_x_values, row_y_values in _row_channel_points(
+            row,
+            y_offset=y_offset,
+        ):
+            x_parts, y_parts = points_by_base.setdefault(base, ([], []))
+            x_parts.append(row_x_values)
+            y_parts.append(row_y_values)
+    for base, (x_parts, y_parts) in points_by_base.items():
+        x_values = np.concatenate(x_parts)
+        if not x_values.size:
+            continue
+        figure.add_trace(
+            go.Scattergl(
+                x=x_values,
+                y=np.concatenate(y_parts),
+                mode="lines",
+                name=f"Rows:{base}",
+                line={
+                    "color": _trace_color_for_segment_base(
+                        base=base,
+                        fallback_color="magenta",
+                        theme=theme,
+                    ),
+                    "width": 1.2,
+                },
+                hoverinfo="skip",
+                hovertemplate=None,
+            )
+        )
+
+    if not cell_centers.size:
+        return
+    figure.add_trace(
+        go.Scattergl(
+            x=cell_centers,
+            y=np.repeat(
+                [row.y_top + y_offset - 0.35 for row in rows],
+                row_cell_counts,
+            ),
+            text=np.array(
+                [cell.query_base for row in rows for cell in row.cells],
+                dtype=object,
+            ),
+            mode="text",
+            name="Row bases",
+            textfont={
+                "color": np.array(
+                    [
+                        color
+                        for row in rows
+                        for color in _row_base_label_colors(row, theme)
+                    ],
+                    dtype=object,
+                )
+            },
+            hoverinfo="skip",
+            hovertemplate=None,
+        )
+    )
+    figure.add_trace(
+        go.Scattergl(
+            x=cell_centers,
+            y=np.repeat(
+                [_row_midpoint(row, y_offset=y_offset) for row in rows],
+                row_cell_counts,
+            ),
+            mode="markers",
+            name="Row hover",
+            showlegend=False,
+            customdata=np.array(
+                [values for row in rows for values in _row_hover_customdata(row)],
+                dtype=object,
             ),
+            marker={"size": 16, "opacity": 0},
+            hovertemplate=_ROW_HOVER_TEMPLATE,
         )
     )
 
@@ -577,24 +768,6 @@ def _support_summary(support_counts: tuple[tuple[str, int], ...]) -> str:
     return ", ".join(f"{base}:{count}" for base, count in support_counts)
 
 
-def _row_channel_order(row: ReferenceMultiAlignmentTraceRow) -> tuple[str, ...]:
-    for cell in row.cells:
-        if cell.channels:
-            return tuple(segment.base for segment in cell.channels)
-    return ("G", "A", "T", "C")
-
-
-def _cell_channel_segment(
-    cell: ReferenceMultiAlignmentTraceCell,
-    *,
-    base: str,
-) -> ReferenceMultiAlignmentTraceChannelSegment | None:
-    for segment in cell.channels:
-        if segment.base == base:
-            return segment
-    return None
-
-
 def _trace_color_for_segment_base(
     *,
     base: str,
@@ -645,13 +818,14 @@ def _initial_x_range(view: ReferenceMultiAlignmentTraceView) -> tuple[float, flo
 def _first_visible_column_index(
     view: ReferenceMultiAlignmentTraceView,
 ) -> int | None:
+    window_start = 0 if view.column_window is None else view.column_window[0]
     for column_offset in range(view.alignment_length):
         if any(
             row.cells[column_offset].has_trace_signal
             for row in view.rows
             if column_offset < len(row.cells)
         ):
-            return column_offset + 1
+            return window_start + column_offset + 1
 
     for column_offset in range(view.alignment_length):
         if any(
@@ -659,7 +833,7 @@ def _first_visible_column_index(
             for row in view.rows
             if column_offset < len(row.cells)
         ):
-            return column_offset + 1
+            return window_start + column_offset + 1
 
     return None
 
@@ -686,4 +860,7 @@ def _column_center(
     return (left + right) / 2.0
 
 
-__all__ = ["build_reference_multi_alignment_trace_figure"]
+__all__ = [
+    "build_reference_multi_alignment_trace_figure",
+    "build_reference_multi_alignment_trace_selection_shapes",
+]
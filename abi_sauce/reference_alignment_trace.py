@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
 
 from abi_sauce.assembly_trace import (
     AssemblyTraceRowSource,
+    PackedTraceSignal,
     build_assembly_trace_row_source,
+    resample_trace_row_windows,
     resolve_assembly_trace_samples_per_cell,
+    trace_column_window_bounds,
+    trace_raw_window,
+    trace_view_fingerprint,
 )
 from abi_sauce.models import SequenceRecord
 from abi_sauce.reference_alignment_types import (
@@ -13,7 +20,6 @@ from abi_sauce.reference_alignment_types import (
     ChosenStrand,
     ReferenceAlignmentColumn,
 )
-from abi_sauce.signal_sampling import resample_signal_window
 from abi_sauce.trimming import TrimResult
 
 
@@ -48,12 +54,7 @@ class ReferenceAlignmentTraceCell:
     raw_left: float | None = None
     raw_right: float | None = None
     raw_center: float | None = None
-    channels: tuple[ReferenceAlignmentTraceChannelSegment, ...] = ()
-
-    @property
-    def has_trace_signal(self) -> bool:
-        """Return whether the cell carries any resampled trace segments."""
-        return bool(self.channels)
+    has_trace_signal: bool = False
 
 
 @dataclass(frozen=True, slots=True)
@@ -69,12 +70,45 @@ class ReferenceAlignmentTraceRow:
     signal_scale: float
     has_trace_signal: bool
     cells: tuple[ReferenceAlignmentTraceCell, ...] = ()
+    packed_signal: PackedTraceSignal = field(default_factory=PackedTraceSignal)
 
     @property
     def aligned_sequence(self) -> str:
         """Return the row's gapped aligned query sequence."""
         return "".join(cell.query_base for cell in self.cells)
 
+    def cell_channels(
+        self,
+        cell_position: int,
+    ) -> tuple[ReferenceAlignmentTraceChannelSegment, ...]:
+        """Return the resampled channel segments of one row cell."""
+        cell = self.cells[cell_position]
+        return tuple(
+            ReferenceAlignmentTraceChannelSegment(
+                base=base,
+                color=color,
+                x_values=x_values,
+                normalized_signal=normalized_signal,
+            )
+            for base, color, x_values, normalized_signal in (
+                self.packed_signal.cell_channel_values(
+                    cell_position,
+                    cell_left=cell.cell_left,
+                    cell_right=cell.cell_right,
+                )
+            )
+        )
+
+    def traced_channel_arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return ``(x_values, signal)`` arrays for every traced cell of the row."""
+        return (
+            self.packed_signal.traced_x_values(
+                cell_lefts=[cell.cell_left for cell in self.cells],
+                cell_rights=[cell.cell_right for cell in self.cells],
+            ),
+            self.packed_signal.signal,
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class ReferenceAlignmentTraceView:
@@ -89,12 +123,27 @@ class ReferenceAlignmentTraceView:
     cell_width: float = 1.0
     samples_per_cell: int = 16
     trace_row_height: float = 3.0
+    column_window: tuple[int, int] | None = None
+    fingerprint: str | None = field(default=None, compare=False, repr=False)
 
     @property
     def alignment_length(self) -> int:
         """Return the number of alignment columns represented in the view."""
         return len(self.columns)
 
+    @property
+    def is_windowed(self) -> bool:
+        """Return whether row cells cover only ``column_window``."""
+        return self.column_window is not None
+
+    @property
+    def window_columns(self) -> tuple[ReferenceAlignmentColumn, ...]:
+        """Return the columns whose row cells were built."""
+        if self.column_window is None:
+            return self.columns
+        window_start, window_end = self.column_window
+        return self.columns[window_start:window_end]
+
     @property
     def total_height(self) -> float:
         """Return the total y-extent occupied by all query rows."""
@@ -116,8 +165,13 @@ def build_reference_alignment_trace_view(
     samples_per_cell: int | None = None,
     trace_row_height: float = 3.0,
     row_source: AssemblyTraceRowSource | None = None,
+    column_window: tuple[int, int] | None = None,
 ) -> ReferenceAlignmentTraceView:
-    """Build one reference-vs-query aligned electropherogram view."""
+    """Build one reference-vs-query aligned electropherogram view.
+
+    With a zero-based half-open ``column_window``, only cells inside it are
+    built while ``columns`` still spans the whole alignment.
+    """
     resolved_samples_per_cell = resolve_assembly_trace_samples_per_cell(
         alignment_length=len(result.columns),
         row_count=1,
@@ -128,6 +182,10 @@ def build_reference_alignment_trace_view(
         samples_per_cell=resolved_samples_per_cell,
         trace_row_height=trace_row_height,
     )
+    window_start, window_end = trace_column_window_bounds(
+        column_window,
+        alignment_length=len(result.columns),
+    )
 
     resolved_row_source = (
         build_assembly_trace_row_source(
@@ -140,6 +198,7 @@ def build_reference_alignment_trace_view(
     )
     query_row = _build_trace_row(
         result=result,
+        columns=result.columns[window_start:window_end],
         source_filename=source_filename,
         row_source=resolved_row_source,
         cell_width=cell_width,
@@ -156,6 +215,16 @@ def build_reference_alignment_trace_view(
         cell_width=cell_width,
         samples_per_cell=resolved_samples_per_cell,
         trace_row_height=trace_row_height,
+        column_window=column_window,
+        fingerprint=trace_view_fingerprint(
+            "reference_alignment_trace_view",
+            (source_filename, result),
+            row_sources=(resolved_row_source,),
+            cell_width=cell_width,
+            samples_per_cell=resolved_samples_per_cell,
+            trace_row_height=trace_row_height,
+            column_window=column_window,
+        ),
     )
 
 
@@ -176,6 +245,7 @@ def _validate_trace_view_parameters(
 def _build_trace_row(
     *,
     result: AlignmentResult,
+    columns: tuple[ReferenceAlignmentColumn, ...],
     source_filename: str,
     row_source: AssemblyTraceRowSource,
     cell_width: float,
@@ -184,14 +254,35 @@ def _build_trace_row(
 ) -> ReferenceAlignmentTraceRow:
     y_bottom = 0.0
     y_top = trace_row_height
+    raw_windows = tuple(
+        (
+            trace_raw_window(row_source, query_index=column.query_index)
+            if column.query_index is not None and column.query_base != "-"
+            else (None, None, None)
+        )
+        for column in columns
+    )
+    packed_signal = resample_trace_row_windows(
+        row_source,
+        cell_windows=tuple(
+            (float(column.column_index - 1) * cell_width, raw_left, raw_right)
+            for column, (raw_left, raw_right, _raw_center) in zip(
+                columns, raw_windows, strict=True
+            )
+        ),
+        cell_width=cell_width,
+        samples_per_cell=samples_per_cell,
+    )
     cells = tuple(
         _build_trace_cell(
             column=column,
-            row_source=row_source,
+            raw_window=raw_window,
+            has_trace_signal=packed_signal.has_cell_signal(cell_position),
             cell_width=cell_width,
-            samples_per_cell=samples_per_cell,
         )
-        for column in result.columns
+        for cell_position, (column, raw_window) in enumerate(
+            zip(columns, raw_windows, strict=True)
+        )
     )
     return ReferenceAlignmentTraceRow(
         label=result.sample_name,
@@ -203,47 +294,21 @@ def _build_trace_row(
         signal_scale=row_source.signal_scale,
         has_trace_signal=any(cell.has_trace_signal for cell in cells),
         cells=cells,
+        packed_signal=packed_signal,
     )
 
 
 def _build_trace_cell(
     *,
     column: ReferenceAlignmentColumn,
-    row_source: AssemblyTraceRowSource,
+    raw_window: tuple[float | None, float | None, float | None],
+    has_trace_signal: bool,
     cell_width: float,
-    samples_per_cell: int,
 ) -> ReferenceAlignmentTraceCell:
     cell_left = float(column.column_index - 1) * cell_width
     cell_right = cell_left + cell_width
     cell_center = (cell_left + cell_right) / 2.0
-
-    raw_left: float | None = None
-    raw_right: float | None = None
-    raw_center: float | None = None
-    channels: tuple[ReferenceAlignmentTraceChannelSegment, ...] = ()
-
-    if column.query_index is not None and column.query_base != "-":
-        full_base_index = row_source.trimmed_start + column.query_index
-        base_call = _mapping_lookup(
-            row_source.base_calls_by_full_index, full_base_index
-        )
-        base_span = _mapping_lookup(
-            row_source.base_spans_by_full_index, full_base_index
-        )
-        if base_call is not None:
-            raw_center = float(base_call.position)
-        if base_span is not None:
-            raw_left = base_span.left
-            raw_right = base_span.right
-            raw_center = base_span.center if raw_center is None else raw_center
-            channels = _build_cell_channels(
-                row_source=row_source,
-                raw_left=raw_left,
-                raw_right=raw_right,
-                cell_left=cell_left,
-                cell_right=cell_right,
-                samples_per_cell=samples_per_cell,
-            )
+    raw_left, raw_right, raw_center = raw_window
 
     return ReferenceAlignmentTraceCell(
         column_index=column.column_index,
@@ -263,51 +328,10 @@ def _build_trace_cell(
         raw_left=raw_left,
         raw_right=raw_right,
         raw_center=raw_center,
-        channels=channels,
+        has_trace_signal=has_trace_signal,
     )
 
 
-def _build_cell_channels(
-    *,
-    row_source: AssemblyTraceRowSource,
-    raw_left: float,
-    raw_right: float,
-    cell_left: float,
-    cell_right: float,
-    samples_per_cell: int,
-) -> tuple[ReferenceAlignmentTraceChannelSegment, ...]:
-    if not row_source.channels or raw_right <= raw_left:
-        return ()
-
-    channel_segments: list[ReferenceAlignmentTraceChannelSegment] = []
-    for channel in row_source.channels:
-        x_values, sampled_signal = resample_signal_window(
-            channel.signal,
-            raw_left=raw_left,
-            raw_right=raw_right,
-            cell_left=cell_left,
-            cell_right=cell_right,
-            sample_count=samples_per_cell,
-            signal_scale=row_source.signal_scale,
-            clamp_to_unit=True,
-        )
-        channel_segments.append(
-            ReferenceAlignmentTraceChannelSegment(
-                base=channel.base,
-                color=channel.color,
-                x_values=x_values,
-                normalized_signal=sampled_signal,
-            )
-        )
-    return tuple(channel_segments)
-
-
-def _mapping_lookup(mapping, key: int):
-    if mapping is None:
-        return None
-    return mapping.get(key)
-
-
 __all__ = [
     "ReferenceAlignmentTraceChannelSegment",
     "ReferenceAlignmentTraceCell",
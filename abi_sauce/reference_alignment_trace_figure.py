@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Final
+from typing import Any, Final
 
 import plotly.graph_objects as go
 
@@ -113,28 +113,14 @@ def build_reference_alignment_trace_figure(
     reference_bottom = view.total_height + _REFERENCE_BAND_GAP
     reference_top = reference_bottom + _REFERENCE_BAND_HEIGHT
     reference_mid = (reference_bottom + reference_top) / 2.0
-    total_height = reference_top + 0.2
+    total_height = _figure_total_height(view)
 
-    if (
-        selected_column_index is not None
-        and 1 <= selected_column_index <= view.alignment_length
+    for shape in build_reference_alignment_trace_selection_shapes(
+        view,
+        theme_type=theme_type,
+        selected_column_index=selected_column_index,
     ):
-        selected_left, selected_right = _column_bounds(
-            selected_column_index,
-            cell_width=view.cell_width,
-        )
-        figure.add_shape(
-            type="rect",
-            xref="x",
-            yref="y",
-            x0=selected_left,
-            x1=selected_right,
-            y0=0.0,
-            y1=total_height,
-            line={"width": 0},
-            fillcolor=theme.selected_column_color,
-            layer="below",
-        )
+        figure.add_shape(**shape)
 
     _add_reference_band(
         figure,
@@ -190,6 +176,43 @@ def build_reference_alignment_trace_figure(
     return figure
 
 
+def build_reference_alignment_trace_selection_shapes(
+    view: ReferenceAlignmentTraceView,
+    *,
+    theme_type: str = "light",
+    selected_column_index: int | None = None,
+) -> tuple[dict[str, Any], ...]:
+    """Return the selected-column highlight as standalone layout shapes."""
+    if (
+        selected_column_index is None
+        or not 1 <= selected_column_index <= view.alignment_length
+    ):
+        return ()
+
+    selected_left, selected_right = _column_bounds(
+        selected_column_index,
+        cell_width=view.cell_width,
+    )
+    return (
+        {
+            "type": "rect",
+            "xref": "x",
+            "yref": "y",
+            "x0": selected_left,
+            "x1": selected_right,
+            "y0": 0.0,
+            "y1": _figure_total_height(view),
+            "line": {"width": 0},
+            "fillcolor": _resolve_figure_theme(theme_type).selected_column_color,
+            "layer": "below",
+        },
+    )
+
+
+def _figure_total_height(view: ReferenceAlignmentTraceView) -> float:
+    return view.total_height + _REFERENCE_BAND_GAP + _REFERENCE_BAND_HEIGHT + 0.2
+
+
 def _add_reference_band(
     figure: go.Figure,
     *,
@@ -199,26 +222,27 @@ def _add_reference_band(
     y_top: float,
     y_text: float,
 ) -> None:
+    columns = view.window_columns
     _add_background_bars(
         figure,
         x_values=[
             _column_center(column.column_index, cell_width=view.cell_width)
-            for column in view.columns
+            for column in columns
         ],
         y_base=y_bottom,
         height=y_top - y_bottom,
         width=view.cell_width,
-        colors=[_event_fill_color(column.event_type, theme) for column in view.columns],
+        colors=[_event_fill_color(column.event_type, theme) for column in columns],
         name="Reference background",
     )
     figure.add_trace(
         go.Scattergl(
             x=[
                 _column_center(column.column_index, cell_width=view.cell_width)
-                for column in view.columns
+                for column in columns
             ],
-            y=[y_text] * len(view.columns),
-            text=[column.ref_base for column in view.columns],
+            y=[y_text] * len(columns),
+            text=[column.ref_base for column in columns],
             mode="text",
             name="Reference",
             textfont={"color": theme.reference_text_color},
@@ -230,9 +254,9 @@ def _add_reference_band(
         go.Scattergl(
             x=[
                 _column_center(column.column_index, cell_width=view.cell_width)
-                for column in view.columns
+                for column in columns
             ],
-            y=[y_text] * len(view.columns),
+            y=[y_text] * len(columns),
             mode="markers",
             name="Reference hover",
             showlegend=False,
@@ -246,7 +270,7 @@ def _add_reference_band(
                     f"<br>ref_pos={column.ref_pos}"
                     f"<br>query_pos={column.query_pos}"
                 )
-                for column in view.columns
+                for column in columns
             ],
             marker={"size": 14, "opacity": 0},
             hovertemplate="%{customdata}<extra></extra>",
@@ -324,12 +348,15 @@ def _add_row_channel_segments(
 
     baseline = row.y_bottom + 0.15
     trace_height = max((row.y_top - row.y_bottom) - 1.0, 0.5)
+    cell_channels = tuple(
+        row.cell_channels(cell_position) for cell_position in range(len(row.cells))
+    )
 
     for base in _row_channel_order(row):
         x_values: list[float | None] = []
         y_values: list[float | None] = []
-        for cell in row.cells:
-            segment = _cell_channel_segment(cell, base=base)
+        for segments in cell_channels:
+            segment = _cell_channel_segment(segments, base=base)
             if segment is None or not segment.x_values or not segment.normalized_signal:
                 x_values.append(None)
                 y_values.append(None)
@@ -450,18 +477,17 @@ def _add_row_hover_markers(
 
 
 def _row_channel_order(row: ReferenceAlignmentTraceRow) -> tuple[str, ...]:
-    for cell in row.cells:
-        if cell.channels:
-            return tuple(segment.base for segment in cell.channels)
+    if row.has_trace_signal:
+        return row.packed_signal.channel_bases
     return ("G", "A", "T", "C")
 
 
 def _cell_channel_segment(
-    cell: ReferenceAlignmentTraceCell,
+    segments: tuple[ReferenceAlignmentTraceChannelSegment, ...],
     *,
     base: str,
 ) -> ReferenceAlignmentTraceChannelSegment | None:
-    for segment in cell.channels:
+    for segment in segments:
         if segment.base == base:
             return segment
     return None
@@ -533,13 +559,14 @@ def _initial_x_range(view: ReferenceAlignmentTraceView) -> tuple[float, float]:
 def _first_visible_column_index(
     view: ReferenceAlignmentTraceView,
 ) -> int | None:
+    window_start = 0 if view.column_window is None else view.column_window[0]
     for column_offset in range(view.alignment_length):
         if any(
             row.cells[column_offset].has_trace_signal
             for row in view.rows
             if column_offset < len(row.cells)
         ):
-            return column_offset + 1
+            return window_start + column_offset + 1
 
     for column_offset in range(view.alignment_length):
         if any(
@@ -547,7 +574,7 @@ def _first_visible_column_index(
             for row in view.rows
             if column_offset < len(row.cells)
         ):
-            return column_offset + 1
+            return window_start + column_offset + 1
 
     return None
 
@@ -574,4 +601,7 @@ def _column_center(
     return (left + right) / 2.0
 
 
-__all__ = ["build_reference_alignment_trace_figure"]
+__all__ = [
+    "build_reference_alignment_trace_figure",
+    "build_reference_alignment_trace_selection_shapes",
+]
@@ -135,6 +135,17 @@ class ReferenceMultiAlignmentResult:
     included_member_count: int = 0
     excluded_member_count: int = 0
     ambiguous_column_count: int = 0
+    reference_windows: tuple[tuple[int, int], ...] | None = None
+
+    @property
+    def is_windowed(self) -> bool:
+        """Return whether the grid covers only part of the reference.
+
+        ``reference_windows=None`` means the grid spans the full reference.
+        """
+        return self.reference_windows is not None and self.reference_windows != (
+            (0, len(self.reference_sequence)),
+        )
 
 
 __all__ = [
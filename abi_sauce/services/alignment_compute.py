@@ -155,6 +155,7 @@ def _compute_saved_reference_multi_alignment(
             reference_name=definition.reference_name,
             strand_policy=definition.strand_policy,
             config=definition.assembly_config,
+            coverage_padding=definition.coverage_padding,
         )
     except ValueError as exc:
         return ComputedAlignment(
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 from typing import Literal
 
@@ -8,10 +8,13 @@ from abi_sauce.assembly_exports import (
     consensus_record_from_multi_result,
     consensus_record_from_result,
 )
-from abi_sauce.assembly_multi import assemble_trimmed_multi
+from abi_sauce.assembly_multi import (
+    add_member_to_multi_assembly,
+    assemble_trimmed_multi,
+)
 from abi_sauce.assembly_pairwise import assemble_trimmed_pair
 from abi_sauce.assembly_state import AssemblyDefinition
-from abi_sauce.assembly_types import AssemblyComputationResult
+from abi_sauce.assembly_types import AssemblyComputationResult, MultiAssemblyResult
 from abi_sauce.models import SequenceRecord
 from abi_sauce.services.batch_trim import PreparedBatch
 
@@ -46,8 +49,14 @@ class ComputedAssembly:
 def compute_saved_assembly(
     prepared_batch: PreparedBatch,
     definition: AssemblyDefinition,
+    *,
+    previous_result: AssemblyComputationResult | None = None,
 ) -> ComputedAssembly:
-    """Resolve one saved assembly definition against the current prepared batch."""
+    """Resolve one saved assembly definition against the current prepared batch.
+
+    ``previous_result`` may hold this definition's earlier multi-read result,
+    computed from the same batch and config; see ``compute_saved_multi_assembly``.
+    """
     definition_reasons = _definition_ineligible_reasons(prepared_batch, definition)
     if definition_reasons:
         return ComputedAssembly(
@@ -61,7 +70,15 @@ def compute_saved_assembly(
     if definition.engine_kind == "pairwise":
         return _compute_saved_pairwise_assembly(prepared_batch, definition)
     if definition.engine_kind == "multi":
-        return compute_saved_multi_assembly(prepared_batch, definition)
+        return compute_saved_multi_assembly(
+            prepared_batch,
+            definition,
+            previous_result=(
+                previous_result
+                if isinstance(previous_result, MultiAssemblyResult)
+                else None
+            ),
+        )
 
     return ComputedAssembly(
         definition=definition,
@@ -137,8 +154,16 @@ def _compute_saved_pairwise_assembly(
 def compute_saved_multi_assembly(
     prepared_batch: PreparedBatch,
     definition: AssemblyDefinition,
+    *,
+    max_workers: int | None = 1,
+    previous_result: MultiAssemblyResult | None = None,
 ) -> ComputedAssembly:
-    """Resolve one saved multi-read assembly definition against the batch."""
+    """Resolve one saved multi-read assembly definition against the batch.
+
+    ``previous_result`` may hold this definition's earlier result, computed
+    from the same batch and config. When its members are a prefix of the
+    definition's reads, only the appended reads are placed.
+    """
     multi_reasons = _multi_definition_ineligible_reasons(definition)
     if multi_reasons:
         return ComputedAssembly(
@@ -150,11 +175,16 @@ def compute_saved_multi_assembly(
         )
 
     try:
-        result = assemble_trimmed_multi(
+        result = _extended_multi_assembly(
+            prepared_batch,
+            definition,
+            previous_result=previous_result,
+        ) or assemble_trimmed_multi(
             source_filenames=definition.source_filenames,
             raw_records_by_source_filename=prepared_batch.parsed_records,
             trim_results_by_source_filename=prepared_batch.trim_results,
             config=definition.config,
+            max_workers=max_workers,
         )
     except Exception as exc:  # pragma: no cover - defensive boundary
         return ComputedAssembly(
@@ -188,17 +218,77 @@ def compute_saved_multi_assembly(
     )
 
 
+def _extended_multi_assembly(
+    prepared_batch: PreparedBatch,
+    definition: AssemblyDefinition,
+    *,
+    previous_result: MultiAssemblyResult | None,
+) -> MultiAssemblyResult | None:
+    if previous_result is None:
+        return None
+    previous_source_filenames = tuple(
+        member.source_filename for member in previous_result.members
+    )
+    if (
+        len(previous_source_filenames) >= len(definition.source_filenames)
+        or definition.source_filenames[: len(previous_source_filenames)]
+        != previous_source_filenames
+    ):
+        return None
+
+    result = previous_result
+    for source_filename in definition.source_filenames[
+        len(previous_source_filenames) :
+    ]:
+        result = add_member_to_multi_assembly(
+            result,
+            source_filename=source_filename,
+            raw_records_by_source_filename=prepared_batch.parsed_records,
+            trim_results_by_source_filename=prepared_batch.trim_results,
+            config=definition.config,
+        )
+    return result
+
+
 def compute_saved_assemblies(
     prepared_batch: PreparedBatch,
     definitions: Iterable[AssemblyDefinition],
+    *,
+    previous_assemblies: Mapping[str, ComputedAssembly] | None = None,
 ) -> dict[str, ComputedAssembly]:
-    """Resolve all saved assembly definitions against the current prepared batch."""
+    """Resolve all saved assembly definitions against the current prepared batch.
+
+    ``previous_assemblies`` may hold earlier results for the same prepared
+    batch, keyed by assembly id; a multi-read assembly whose config is
+    unchanged and whose reads were only appended to is extended in place.
+    """
+    resolved_previous_assemblies = previous_assemblies or {}
     return {
-        definition.assembly_id: compute_saved_assembly(prepared_batch, definition)
+        definition.assembly_id: compute_saved_assembly(
+            prepared_batch,
+            definition,
+            previous_result=_reusable_previous_result(
+                definition,
+                resolved_previous_assemblies.get(definition.assembly_id),
+            ),
+        )
         for definition in definitions
     }
 
 
+def _reusable_previous_result(
+    definition: AssemblyDefinition,
+    previous_assembly: ComputedAssembly | None,
+) -> AssemblyComputationResult | None:
+    if (
+        previous_assembly is None
+        or previous_assembly.definition.engine_kind != definition.engine_kind
+        or previous_assembly.definition.config != definition.config
+    ):
+        return None
+    return previous_assembly.result
+
+
 def _definition_ineligible_reasons(
     prepared_batch: PreparedBatch,
     definition: AssemblyDefinition,
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import partial
+from html import escape
+
+from abi_sauce.chromatogram import build_chromatogram_view
+from abi_sauce.chromatogram_svg import render_chromatogram_svg
+from abi_sauce.models import SequenceRecord
+from abi_sauce.orientation import orient_left_right_values
+from abi_sauce.parallel import ordered_process_map
+from abi_sauce.services.batch_trim import PreparedBatch
+from abi_sauce.trimming import TrimResult
+
+_DEFAULT_ENTRIES_PER_PAGE = 6
+_DEFAULT_THUMBNAIL_WIDTH_PX = 960
+_DEFAULT_THUMBNAIL_HEIGHT_PX = 140
+_REPORT_STYLE = (
+    "body{font-family:sans-serif;margin:0;color:#111111}"
+    ".page{padding:12mm;page-break-after:always;break-after:page}"
+    ".page:last-child{page-break-after:auto;break-after:auto}"
+    ".read{margin-bottom:6mm;break-inside:avoid}"
+    ".read h2{font-size:12pt;margin:0 0 1mm 0}"
+    ".read p{font-size:9pt;margin:0 0 1mm 0;color:#444444}"
+    ".read svg{width:100%;height:auto;border:1px solid #DDDDDD}"
+    "@page{size:A4;margin:0}"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ChromatogramReportEntry:
+    """One read's chromatogram thumbnail and trim summary for a batch report."""
+
+    source_filename: str
+    display_name: str
+    original_length: int
+    trimmed_length: int
+    display_bases_removed_left: int
+    display_bases_removed_right: int
+    passed_min_length: bool
+    svg: str | None = None
+    render_failure_reason: str | None = None
+
+    @property
+    def trimmed_region_label(self) -> str:
+        """Return the retained display-space base interval as report text."""
+        if self.trimmed_length <= 0:
+            return "no bases retained"
+        first_base = self.display_bases_removed_left + 1
+        last_base = self.display_bases_removed_left + self.trimmed_length
+        return (
+            f"bases {first_base}-{last_base} of {self.original_length} retained "
+            f"({self.trimmed_length} bp)"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ChromatogramReport:
+    """Rendered batch chromatogram report plus its download metadata."""
+
+    entries: tuple[ChromatogramReportEntry, ...]
+    data: str
+    filename: str
+    mime: str = "text/html"
+
+
+def build_chromatogram_report_entry(
+    source_filename: str,
+    raw_record: SequenceRecord,
+    trim_result: TrimResult,
+    *,
+    width_px: int = _DEFAULT_THUMBNAIL_WIDTH_PX,
+    height_px: int = _DEFAULT_THUMBNAIL_HEIGHT_PX,
+) -> ChromatogramReportEntry:
+    """Render one read's thumbnail SVG and trim summary for a batch report."""
+    view = build_chromatogram_view(raw_record, trim_result, use_cache=False)
+    display_bases_removed_left, display_bases_removed_right = (
+        orient_left_right_values(
+            trim_result.bases_removed_left,
+            trim_result.bases_removed_right,
+            raw_record.orientation,
+        )
+    )
+    return ChromatogramReportEntry(
+        source_filename=source_filename,
+        display_name=raw_record.name,
+        original_length=trim_result.original_length,
+        trimmed_length=trim_result.trimmed_length,
+        display_bases_removed_left=display_bases_removed_left,
+        display_bases_removed_right=display_bases_removed_right,
+        passed_min_length=trim_result.passed_min_length,
+        svg=(
+            render_chromatogram_svg(view, width_px=width_px, height_px=height_px)
+            if view.is_renderable
+            else None
+        ),
+        render_failure_reason=view.render_failure_reason,
+    )
+
+
+def build_batch_chromatogram_report(
+    prepared_batch: PreparedBatch,
+    *,
+    filename_stem: str = "",
+    title: str = "Chromatogram report",
+    entries_per_page: int = _DEFAULT_ENTRIES_PER_PAGE,
+    width_px: int = _DEFAULT_THUMBNAIL_WIDTH_PX,
+    height_px: int = _DEFAULT_THUMBNAIL_HEIGHT_PX,
+    max_workers: int | None = None,
+) -> ChromatogramReport:
+    """Render every parsed read of a batch into one printable HTML report.
+
+    Reads are rendered across a process pool (``max_workers=None`` uses every
+    core); the report paginates ``entries_per_page`` thumbnails per page.
+    """
+    entries = tuple(
+        ordered_process_map(
+            partial(
+                _build_chromatogram_report_entry_task,
+                width_px=width_px,
+                height_px=height_px,
+            ),
+            tuple(
+                (
+                    source_filename,
+                    raw_record,
+                    prepared_batch.trim_results[source_filename],
+                )
+                for source_filename, raw_record in prepared_batch.parsed_records.items()
+                if source_filename in prepared_batch.trim_results
+            ),
+            max_workers=max_workers,
+        )
+    )
+    return ChromatogramReport(
+        entries=entries,
+        data=render_chromatogram_report_html(
+            entries,
+            title=title,
+            entries_per_page=entries_per_page,
+        ),
+        filename=f"{filename_stem.strip() or 'abi-sauce-report'}.html",
+    )
+
+
+def render_chromatogram_report_html(
+    entries: tuple[ChromatogramReportEntry, ...],
+    *,
+    title: str = "Chromatogram report",
+    entries_per_page: int = _DEFAULT_ENTRIES_PER_PAGE,
+) -> str:
+    """Serialize report entries as a self-contained, print-paginated HTML page."""
+    if entries_per_page <= 0:
+        raise ValueError("entries_per_page must be > 0")
+
+    pages = [
+        entries[page_start : page_start + entries_per_page]
+        for page_start in range(0, len(entries), entries_per_page)
+    ] or [()]
+    sections = []
+    for page_index, page_entries in enumerate(pages):
+        heading = (
+            f"<h1>{escape(title)} ({len(entries)} reads)</h1>"
+            if page_index == 0
+            else ""
+        )
+        sections.append(
+            '<section class="page">'
+            + heading
+            + "".join(_report_entry_html(entry) for entry in page_entries)
+            + "</section>"
+        )
+    return (
+        "<!DOCTYPE html>"
+        f'<html><head><meta charset="utf-8"><title>{escape(title)}</title>'
+        f"<style>{_REPORT_STYLE}</style></head>"
+        f"<body>{''.join(sections)}</body></html>"
+    )
+
+
+def _build_chromatogram_report_entry_task(
+    item: tuple[str, SequenceRecord, TrimResult],
+    *,
+    width_px: int,
+    height_px: int,
+) -> ChromatogramReportEntry:
+    source_filename, raw_record, trim_result = item
+    return build_chromatogram_report_entry(
+        source_filename,
+        raw_record,
+        trim_result,
+        width_px=width_px,
+        height_px=height_px,
+    )
+
+
+def _report_entry_html(entry: ChromatogramReportEntry) -> str:
+    details = [escape(entry.source_filename), escape(entry.trimmed_region_label)]
+    if not entry.passed_min_length:
+        details.append("fails minimum length")
+    figure = (
+        entry.svg
+        if entry.svg is not None
+        else f"<p>No chromatogram: {escape(entry.render_failure_reason or '')}</p>"
+    )
+    return (
+        '<div class="read">'
+        f"<h2>{escape(entry.display_name)}</h2>"
+        f"<p>{' · '.join(details)}</p>"
+        f"{figure}</div>"
+    )
+
+
+__all__ = [
+    "ChromatogramReport",
+    "ChromatogramReportEntry",
+    "build_batch_chromatogram_report",
+    "build_chromatogram_report_entry",
+    "render_chromatogram_report_html",
+]
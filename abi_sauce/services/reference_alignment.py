@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from abi_sauce.assembly_trace import resolve_trace_column_window
 from abi_sauce.assembly_types import AssemblyConfig
 from abi_sauce.chromatogram import ChromatogramView, build_chromatogram_view
 from abi_sauce.reference_alignment import align_trimmed_read_to_reference
@@ -87,6 +88,9 @@ def compute_reference_alignment(
             source_filename=source_filename,
             raw_record=raw_record,
             trim_result=trim_result,
+            column_window=resolve_trace_column_window(
+                alignment_length=len(alignment_result.columns)
+            ),
         ),
     )
 
@@ -100,6 +104,8 @@ def compute_reference_multi_alignment(
     strand_policy: StrandPolicy = "auto",
     config: AssemblyConfig | None = None,
     include_reference_matches: bool = False,
+    max_workers: int | None = 1,
+    coverage_padding: int | None = None,
 ) -> ComputedReferenceMultiAlignment:
     """Compute one shared-reference multi-read alignment from the current batch."""
     resolved_source_filenames = tuple(source_filenames)
@@ -126,6 +132,8 @@ def compute_reference_multi_alignment(
         reference_name=reference_name,
         strand_policy=strand_policy,
         config=config,
+        max_workers=max_workers,
+        coverage_padding=coverage_padding,
     )
     return ComputedReferenceMultiAlignment(
         source_filenames=resolved_source_filenames,
@@ -147,13 +155,106 @@ def compute_reference_multi_alignment(
                 source_filename: prepared_batch.trim_results[source_filename]
                 for source_filename in resolved_source_filenames
             },
+            column_window=resolve_trace_column_window(
+                alignment_length=len(result.columns)
+            ),
         ),
     )
 
 
+def window_reference_alignment_trace_view(
+    computed_alignment: ComputedReferenceAlignment,
+    prepared_batch: PreparedBatch,
+    *,
+    first_visible_column_index: int,
+    visible_columns: int,
+) -> ReferenceAlignmentTraceView | None:
+    """Return a trace view whose built cells cover one visible column span."""
+    trace_view = computed_alignment.trace_view
+    if trace_view is None:
+        return None
+    column_window = resolve_trace_column_window(
+        alignment_length=trace_view.alignment_length,
+        first_visible_column_index=first_visible_column_index,
+        visible_columns=visible_columns,
+    )
+    if _column_window_covers(
+        trace_view.column_window,
+        alignment_length=trace_view.alignment_length,
+        first_visible_column_index=first_visible_column_index,
+        visible_columns=visible_columns,
+    ):
+        return trace_view
+    source_filename = computed_alignment.source_filename
+    return build_reference_alignment_trace_view(
+        result=computed_alignment.alignment_result,
+        source_filename=source_filename,
+        raw_record=prepared_batch.parsed_records[source_filename],
+        trim_result=prepared_batch.trim_results[source_filename],
+        column_window=column_window,
+    )
+
+
+def window_reference_multi_alignment_trace_view(
+    computed_alignment: ComputedReferenceMultiAlignment,
+    prepared_batch: PreparedBatch,
+    *,
+    first_visible_column_index: int,
+    visible_columns: int,
+) -> ReferenceMultiAlignmentTraceView | None:
+    """Return a shared-reference trace view covering one visible column span."""
+    trace_view = computed_alignment.trace_view
+    if trace_view is None:
+        return None
+    column_window = resolve_trace_column_window(
+        alignment_length=trace_view.alignment_length,
+        first_visible_column_index=first_visible_column_index,
+        visible_columns=visible_columns,
+    )
+    if _column_window_covers(
+        trace_view.column_window,
+        alignment_length=trace_view.alignment_length,
+        first_visible_column_index=first_visible_column_index,
+        visible_columns=visible_columns,
+    ):
+        return trace_view
+    return build_reference_multi_alignment_trace_view(
+        result=computed_alignment.result,
+        raw_records_by_source_filename={
+            source_filename: prepared_batch.parsed_records[source_filename]
+            for source_filename in computed_alignment.source_filenames
+        },
+        trim_results_by_source_filename={
+            source_filename: prepared_batch.trim_results[source_filename]
+            for source_filename in computed_alignment.source_filenames
+        },
+        column_window=column_window,
+    )
+
+
+def _column_window_covers(
+    column_window: tuple[int, int] | None,
+    *,
+    alignment_length: int,
+    first_visible_column_index: int,
+    visible_columns: int,
+) -> bool:
+    if column_window is None:
+        return True
+    visible_start = min(
+        max(first_visible_column_index - 1, 0),
+        max(alignment_length - visible_columns, 0),
+    )
+    visible_end = min(visible_start + visible_columns, alignment_length)
+    window_start, window_end = column_window
+    return window_start <= visible_start and visible_end <= window_end
+
+
 __all__ = [
     "ComputedReferenceAlignment",
     "ComputedReferenceMultiAlignment",
     "compute_reference_alignment",
     "compute_reference_multi_alignment",
+    "window_reference_alignment_trace_view",
+    "window_reference_multi_alignment_trace_view",
 ]
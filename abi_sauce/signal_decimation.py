@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+_MIN_BUCKET_SIZE = 4
+
+
+class SignalPyramid:
+    """Min/max decimation levels for a set of equally sampled trace channels.
+
+    Level ``k`` keeps, for every bucket of ``4 * 2**k`` samples, the sample
+    positions of each channel's bucket minimum and maximum, so every level
+    still draws each peak and trough at its true height.
+    """
+
+    __slots__ = ("_sample_count", "_values", "_levels", "_mirrored")
+
+    def __init__(self, signals: Sequence[Sequence[int | float]]) -> None:
+        self._sample_count = min((len(signal) for signal in signals), default=0)
+        self._values = np.stack(
+            [np.asarray(signal[: self._sample_count]) for signal in signals]
+            or [np.zeros(0, dtype=np.int64)]
+        )
+        self._values.flags.writeable = False
+        self._levels: tuple[tuple[int, np.ndarray, np.ndarray], ...] = ()
+        self._mirrored = False
+        if self._sample_count <= _MIN_BUCKET_SIZE:
+            return
+
+        values = self._values
+        channel_count = values.shape[0]
+        bucket_count = -(-self._sample_count // _MIN_BUCKET_SIZE)
+        padding = bucket_count * _MIN_BUCKET_SIZE - self._sample_count
+        buckets = np.concatenate(
+            [values, np.repeat(values[:, -1:], padding, axis=1)],
+            axis=1,
+        ).reshape(channel_count, bucket_count, _MIN_BUCKET_SIZE)
+        bucket_starts = np.arange(bucket_count) * _MIN_BUCKET_SIZE
+        last_position = self._sample_count - 1
+        min_positions = np.minimum(
+            bucket_starts + buckets.argmin(axis=2),
+            last_position,
+        )
+        max_positions = np.minimum(
+            bucket_starts + buckets.argmax(axis=2),
+            last_position,
+        )
+        channel_offsets = np.arange(channel_count)[:, None]
+
+        levels = [(_MIN_BUCKET_SIZE, min_positions, max_positions)]
+        bucket_size = _MIN_BUCKET_SIZE
+        while min_positions.shape[1] > 1:
+            if min_positions.shape[1] % 2:
+                min_positions = np.concatenate(
+                    [min_positions, min_positions[:, -1:]], axis=1
+                )
+                max_positions = np.concatenate(
+                    [max_positions, max_positions[:, -1:]], axis=1
+                )
+            left_min, right_min = min_positions[:, 0::2], min_positions[:, 1::2]
+            left_max, right_max = max_positions[:, 0::2], max_positions[:, 1::2]
+            min_positions = np.where(
+                values[channel_offsets, left_min] <= values[channel_offsets, right_min],
+                left_min,
+                right_min,
+            )
+            max_positions = np.where(
+                values[channel_offsets, left_max] >= values[channel_offsets, right_max],
+                left_max,
+                right_max,
+            )
+            bucket_size *= 2
+            levels.append((bucket_size, min_positions, max_positions))
+        self._levels = tuple(levels)
+
+    @property
+    def sample_count(self) -> int:
+        """Return the number of samples shared by every channel."""
+        return self._sample_count
+
+    def reversed(self) -> SignalPyramid:
+        """Return the pyramid of the same channels read back to front.
+
+        The reversed pyramid shares this one's arrays and mirrors positions.
+        """
+        mirrored = SignalPyramid.__new__(SignalPyramid)
+        mirrored._sample_count = self._sample_count
+        mirrored._values = self._values
+        mirrored._levels = self._levels
+        mirrored._mirrored = not self._mirrored
+        return mirrored
+
+    def channel_values(self, channel_index: int) -> np.ndarray:
+        """Return one channel's samples as a read-only array."""
+        if self._mirrored:
+            return self._values[channel_index, ::-1]
+        return self._values[channel_index]
+
+    def sample_positions(
+        self,
+        channel_index: int,
+        *,
+        left: int,
+        right: int,
+        max_points: int,
+    ) -> np.ndarray:
+        """Return sorted sample positions drawing one channel over a range.
+
+        The inclusive ``[left, right]`` range is served at full resolution when
+        it fits in ``max_points``; otherwise from the finest level whose bucket
+        minima and maxima do, plus the extremes of the partial edge buckets.
+        """
+        if not self._mirrored:
+            return self._stored_sample_positions(
+                channel_index,
+                left=left,
+                right=right,
+                max_points=max_points,
+            )
+        last_position = self._sample_count - 1
+        positions = self._stored_sample_positions(
+            channel_index,
+            left=last_position - right,
+            right=last_position - left,
+            max_points=max_points,
+        )
+        return last_position - positions[::-1]
+
+    def _stored_sample_positions(
+        self,
+        channel_index: int,
+        *,
+        left: int,
+        right: int,
+        max_points: int,
+    ) -> np.ndarray:
+        left = max(left, 0)
+        right = min(right, self._sample_count - 1)
+        if right < left:
+            return np.zeros(0, dtype=np.int64)
+        if right - left + 1 <= max_points or not self._levels:
+            return np.arange(left, right + 1, dtype=np.int64)
+
+        for bucket_size, min_positions, max_positions in self._levels:
+            first_bucket = -(-left // bucket_size)
+            last_bucket = (right + 1) // bucket_size - 1
+            if 2 * (last_bucket - first_bucket + 3) <= max_points:
+                break
+        channel_values = self._values[channel_index]
+        full_left = first_bucket * bucket_size
+        full_right = (last_bucket + 1) * bucket_size - 1
+        edge_positions = [left, right]
+        for edge_left, edge_right in ((left, full_left - 1), (full_right + 1, right)):
+            if edge_left > edge_right:
+                continue
+            edge_values = channel_values[edge_left : edge_right + 1]
+            edge_positions.extend(
+                (
+                    edge_left + int(edge_values.argmin()),
+                    edge_left + int(edge_values.argmax()),
+                )
+            )
+        return np.unique(
+            np.concatenate(
+                [
+                    np.asarray(edge_positions, dtype=np.int64),
+                    min_positions[channel_index, first_bucket : last_bucket + 1],
+                    max_positions[channel_index, first_bucket : last_bucket + 1],
+                ]
+            )
+        )
+
+
+__all__ = ["SignalPyramid"]
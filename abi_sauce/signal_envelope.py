@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+_BLOCK_SIZE = 64
+
+
+class SignalEnvelope:
+    """Per-sample maximum over a set of trace channels with fast range queries.
+
+    The envelope is split into fixed-size blocks whose maxima are stored in a
+    sparse table, so any inclusive sample range is answered from at most two
+    partial blocks plus two overlapping table lookups.
+    """
+
+    __slots__ = ("_envelope", "_block_levels", "_mirrored")
+
+    def __init__(self, signals: Sequence[Sequence[int | float]]) -> None:
+        self._mirrored = False
+        arrays = [np.asarray(signal) for signal in signals if len(signal)]
+        if not arrays:
+            self._envelope = np.zeros(0, dtype=np.int64)
+            self._block_levels: tuple[np.ndarray, ...] = ()
+            return
+
+        floor_value = min(array.min() for array in arrays)
+        envelope = np.full(
+            max(array.size for array in arrays),
+            floor_value,
+            dtype=np.result_type(*arrays),
+        )
+        for array in arrays:
+            np.maximum(envelope[: array.size], array, out=envelope[: array.size])
+        self._envelope = envelope
+
+        block_count = -(-envelope.size // _BLOCK_SIZE)
+        padded = np.full(block_count * _BLOCK_SIZE, floor_value, dtype=envelope.dtype)
+        padded[: envelope.size] = envelope
+        levels = [padded.reshape(block_count, _BLOCK_SIZE).max(axis=1)]
+        span = 1
+        while span * 2 <= block_count:
+            previous = levels[-1]
+            levels.append(np.maximum(previous[:-span], previous[span:]))
+            span *= 2
+        self._block_levels = tuple(levels)
+
+    def __len__(self) -> int:
+        return int(self._envelope.size)
+
+    def reversed(self) -> SignalEnvelope:
+        """Return the envelope of the same channels read back to front.
+
+        The reversed envelope shares this one's arrays and mirrors positions.
+        """
+        mirrored = SignalEnvelope.__new__(SignalEnvelope)
+        mirrored._envelope = self._envelope
+        mirrored._block_levels = self._block_levels
+        mirrored._mirrored = not self._mirrored
+        return mirrored
+
+    @property
+    def maximum(self) -> int | float | None:
+        """Return the largest sample across every channel, if any."""
+        if not self._block_levels:
+            return None
+        return self._block_levels[-1].max().item()
+
+    def value_at(self, position: int) -> int | float | None:
+        """Return the largest channel value at one raw sample position."""
+        if self._mirrored:
+            position = self._envelope.size - 1 - position
+        if not 0 <= position < self._envelope.size:
+            return None
+        return self._envelope[position].item()
+
+    def range_max(self, left: int, right: int) -> int | float | None:
+        """Return the largest channel value within an inclusive sample range."""
+        if self._mirrored:
+            last_position = self._envelope.size - 1
+            left, right = last_position - right, last_position - left
+        left = max(left, 0)
+        right = min(right, self._envelope.size - 1)
+        if right < left:
+            return None
+
+        left_block = left // _BLOCK_SIZE
+        right_block = right // _BLOCK_SIZE
+        if right_block - left_block < 2:
+            return self._envelope[left : right + 1].max().item()
+
+        first_full_block = left_block + 1
+        last_full_block = right_block - 1
+        level = (last_full_block - first_full_block + 1).bit_length() - 1
+        block_maxima = self._block_levels[level]
+        return max(
+            self._envelope[left : first_full_block * _BLOCK_SIZE].max().item(),
+            self._envelope[right_block * _BLOCK_SIZE : right + 1].max().item(),
+            block_maxima[first_full_block].item(),
+            block_maxima[last_full_block - (1 << level) + 1].item(),
+        )
+
+
+__all__ = ["SignalEnvelope"]
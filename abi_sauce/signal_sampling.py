@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from collections.abc import Sequence
 
+import numpy as np
+
 
 def clamp_unit(value: float) -> float:
     """Clamp one numeric value into the closed unit interval."""
@@ -67,3 +69,73 @@ def resample_signal_window(
         sampled_signal = tuple(clamp_unit(value) for value in sampled_signal)
 
     return x_values, sampled_signal
+
+
+def resample_signal_windows(
+    signals: Sequence[Sequence[int | float]] | np.ndarray,
+    *,
+    raw_left: Sequence[float] | np.ndarray,
+    raw_right: Sequence[float] | np.ndarray,
+    cell_left: Sequence[float] | np.ndarray,
+    cell_right: Sequence[float] | np.ndarray,
+    sample_count: int,
+    signal_scale: float = 1.0,
+    clamp_to_unit: bool = False,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Project many raw trace windows of several channels in one vectorized pass.
+
+    Window bounds are parallel arrays with one entry per window. Returns
+    ``window x sample`` x-values and ``channel x window x sample`` signal values
+    matching ``resample_signal_window`` for every channel/window pair.
+    """
+    if sample_count < 2:
+        raise ValueError("sample_count must be >= 2")
+    raw_lefts = np.asarray(raw_left, dtype=np.float64)
+    raw_rights = np.asarray(raw_right, dtype=np.float64)
+    cell_lefts = np.asarray(cell_left, dtype=np.float64)
+    cell_rights = np.asarray(cell_right, dtype=np.float64)
+    if np.any(cell_rights <= cell_lefts):
+        raise ValueError("cell_right must be > cell_left")
+    if np.any(raw_rights <= raw_lefts):
+        raise ValueError("raw_right must be > raw_left")
+
+    x_values = _linspace_rows(cell_lefts, cell_rights, sample_count)
+    raw_positions = _linspace_rows(raw_lefts, raw_rights, sample_count)
+    resolved_signal_scale = float(signal_scale) if signal_scale > 0 else 1.0
+
+    signal_lengths = np.asarray([len(signal) for signal in signals], dtype=np.int64)
+    signal_matrix = np.zeros(
+        (len(signals), max(int(signal_lengths.max(initial=0)), 1)),
+        dtype=np.float64,
+    )
+    for channel_position, signal in enumerate(signals):
+        signal_matrix[channel_position, : len(signal)] = signal
+
+    last_indices = np.maximum(signal_lengths - 1, 0)[:, None, None]
+    clamped_positions = np.clip(raw_positions[None, :, :], 0.0, last_indices)
+    left_indices = clamped_positions.astype(np.int64)
+    right_indices = np.minimum(left_indices + 1, last_indices)
+    fractions = clamped_positions - left_indices
+    flat_shape = (len(signals), left_indices[0].size if len(signals) else 0)
+    left_values = np.take_along_axis(
+        signal_matrix,
+        left_indices.reshape(flat_shape),
+        axis=1,
+    ).reshape(left_indices.shape)
+    right_values = np.take_along_axis(
+        signal_matrix,
+        right_indices.reshape(flat_shape),
+        axis=1,
+    ).reshape(right_indices.shape)
+    sampled_signal = left_values + ((right_values - left_values) * fractions)
+    sampled_signal[signal_lengths == 0] = 0.0
+    sampled_signal = sampled_signal / resolved_signal_scale
+    if clamp_to_unit:
+        sampled_signal = np.clip(sampled_signal, 0.0, 1.0)
+
+    return x_values, sampled_signal
+
+
+def _linspace_rows(starts: np.ndarray, ends: np.ndarray, count: int) -> np.ndarray:
+    steps = (ends - starts) / float(count - 1)
+    return starts[:, None] + (steps[:, None] * np.arange(count, dtype=np.float64))
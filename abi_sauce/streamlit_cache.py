@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable, Mapping, Sequence
 import hashlib
-from typing import TypeAlias
+from typing import Any, TypeAlias
 
+import plotly.graph_objects as go
 import streamlit as st
 
 from abi_sauce.assembly_types import AssemblyStrand, MultiAssemblyResult
@@ -15,6 +16,12 @@ from abi_sauce.assembly_trace import (
     build_multi_assembly_trace_view,
     build_pairwise_assembly_trace_view,
 )
+from abi_sauce.chromatogram import (
+    ChromatogramColumnView,
+    build_chromatogram_column_view,
+)
+from abi_sauce.figure_spec import FigureSpec, figure_spec, overlay_figure_spec_shapes
+from abi_sauce.lru_cache import LruCache
 from abi_sauce.models import SequenceRecord, TraceData
 from abi_sauce.services.assembly_compute import (
     ComputedAssembly,
@@ -34,6 +41,10 @@ from abi_sauce.trim_state import (
     ResolvedBatchTrimInputs,
     resolve_batch_trim_inputs,
 )
+from abi_sauce.trace_signatures import (
+    BatchTraceSignatures,
+    build_batch_trace_signatures,
+)
 from abi_sauce.trimming import TrimConfig, TrimResult, trim_sequence_record
 
 ParsedBatchCacheKey: TypeAlias = tuple[
@@ -57,14 +68,27 @@ ComputedAssemblyCacheKey: TypeAlias = tuple[
     str | None,
     str | None,
 ]
-AssemblyTraceRowSourceCacheKey: TypeAlias = tuple[str, str, AssemblyStrand]
 TrimmedRecordCacheKey: TypeAlias = tuple[str, TrimConfig]
+ChromatogramColumnViewCacheKey: TypeAlias = tuple[str, str | None, float, int]
+TraceSignaturesCacheKey: TypeAlias = tuple[
+    BatchSignature,
+    tuple[tuple[str, str, int, int, int], ...],
+]
+FigureBuilder: TypeAlias = Callable[..., go.Figure]
 
 _PREPARED_BATCH_CACHE_VERSION = 3
 _COMPUTED_ASSEMBLIES_CACHE_VERSION = 2
-_ASSEMBLY_TRACE_ROW_SOURCE_CACHE_VERSION = 1
 _TRIM_SEQUENCE_RECORD_CACHE_VERSION = 1
-_ASSEMBLY_TRACE_VIEW_CACHE_VERSION = 2
+_ASSEMBLY_TRACE_VIEW_CACHE_VERSION = 4
+_FIGURE_SPEC_CACHE_VERSION = 1
+_CHROMATOGRAM_COLUMN_VIEW_CACHE_VERSION = 1
+_TRACE_SIGNATURES_CACHE_VERSION = 1
+_LATEST_COMPUTED_ASSEMBLIES_MAX_ENTRIES = 8
+
+_latest_computed_assemblies: LruCache[
+    PreparedBatchCacheKey,
+    dict[str, ComputedAssembly],
+] = LruCache(_LATEST_COMPUTED_ASSEMBLIES_MAX_ENTRIES)
 
 
 def build_parsed_batch_cache_key(
@@ -149,20 +173,6 @@ def build_computed_assembly_cache_key(
     )
 
 
-def build_assembly_trace_row_source_cache_key(
-    raw_record: SequenceRecord,
-    trim_result: TrimResult,
-    *,
-    strand: AssemblyStrand,
-) -> AssemblyTraceRowSourceCacheKey:
-    """Return a stable cache key for one aligned-trace row source."""
-    return (
-        _sequence_record_cache_digest(raw_record),
-        _trim_result_cache_digest(trim_result),
-        strand,
-    )
-
-
 def build_trimmed_record_cache_key(
     parsed_record: SequenceRecord,
     trim_config: TrimConfig,
@@ -202,39 +212,22 @@ def trim_sequence_record_for_cache(
     )
 
 
-@st.cache_data(show_spinner=False, max_entries=256)
-def _build_assembly_trace_row_source_cached(
-    *,
-    cache_version: int,
-    row_source_key: AssemblyTraceRowSourceCacheKey,
-    _raw_record: SequenceRecord,
-    _trim_result: TrimResult,
-) -> AssemblyTraceRowSource:
-    """Return a cached aligned-trace row source for one member."""
-    _record_digest, _trim_digest, strand = row_source_key
-    return build_assembly_trace_row_source(
-        raw_record=_raw_record,
-        trim_result=_trim_result,
-        strand=strand,
-    )
-
-
 def build_assembly_trace_row_source_for_member(
     raw_record: SequenceRecord,
     trim_result: TrimResult,
     *,
     strand: AssemblyStrand,
 ) -> AssemblyTraceRowSource:
-    """Return a cached aligned-trace row source for one assembly member."""
-    return _build_assembly_trace_row_source_cached(
-        cache_version=_ASSEMBLY_TRACE_ROW_SOURCE_CACHE_VERSION,
-        row_source_key=build_assembly_trace_row_source_cache_key(
-            raw_record,
-            trim_result,
-            strand=strand,
-        ),
-        _raw_record=raw_record,
-        _trim_result=trim_result,
+    """Return the shared aligned-trace row source for one assembly member.
+
+    Row sources live in the process-wide cache behind
+    ``build_assembly_trace_row_source`` rather than ``st.cache_data``, so the
+    reference-alignment trace views reuse the same prepared geometry.
+    """
+    return build_assembly_trace_row_source(
+        raw_record=raw_record,
+        trim_result=trim_result,
+        strand=strand,
     )
 
 
@@ -299,24 +292,37 @@ def _compute_saved_assemblies_cached(
     definitions_key: AssemblyDefinitionsCacheKey,
     _prepared_batch: PreparedBatch,
     _definitions: tuple[AssemblyDefinition, ...],
+    _previous_assemblies: dict[str, ComputedAssembly] | None = None,
 ) -> dict[str, ComputedAssembly]:
     """Return saved assemblies recomputed against one prepared batch."""
-    return compute_saved_assemblies(_prepared_batch, _definitions)
+    return compute_saved_assemblies(
+        _prepared_batch,
+        _definitions,
+        previous_assemblies=_previous_assemblies,
+    )
 
 
 def compute_saved_assemblies_for_definitions(
     prepared_batch: PreparedBatch,
     definitions: Iterable[AssemblyDefinition],
 ) -> dict[str, ComputedAssembly]:
-    """Return cached saved-assembly results for the current prepared batch."""
+    """Return cached saved-assembly results for the current prepared batch.
+
+    The latest results per prepared batch are kept so that appending reads to
+    a saved multi-read assembly only places the new reads.
+    """
     definitions_tuple = tuple(definitions)
-    return _compute_saved_assemblies_cached(
+    prepared_batch_key = build_prepared_batch_cache_key(prepared_batch)
+    computed_assemblies = _compute_saved_assemblies_cached(
         cache_version=_COMPUTED_ASSEMBLIES_CACHE_VERSION,
-        prepared_batch_key=build_prepared_batch_cache_key(prepared_batch),
+        prepared_batch_key=prepared_batch_key,
         definitions_key=build_assembly_definitions_cache_key(definitions_tuple),
         _prepared_batch=prepared_batch,
         _definitions=definitions_tuple,
+        _previous_assemblies=_latest_computed_assemblies.get(prepared_batch_key),
     )
+    _latest_computed_assemblies.store(prepared_batch_key, computed_assemblies)
+    return computed_assemblies
 
 
 @st.cache_data(show_spinner=False, max_entries=64)
@@ -328,6 +334,7 @@ def _build_selected_assembly_trace_view_cached(
     cell_width: float,
     samples_per_cell: int | None,
     trace_row_height: float,
+    column_window: tuple[int, int] | None,
     _prepared_batch: PreparedBatch,
     _computed_assembly: ComputedAssembly,
 ) -> AssemblyTraceView | None:
@@ -354,6 +361,7 @@ def _build_selected_assembly_trace_view_cached(
             samples_per_cell=samples_per_cell,
             trace_row_height=trace_row_height,
             row_sources_by_member_index=row_sources_by_member_index,
+            column_window=column_window,
         )
 
     source_filenames = _computed_assembly.definition.source_filenames
@@ -383,6 +391,7 @@ def _build_selected_assembly_trace_view_cached(
         trace_row_height=trace_row_height,
         left_row_source=left_row_source,
         right_row_source=right_row_source,
+        column_window=column_window,
     )
 
 
@@ -393,8 +402,12 @@ def build_selected_assembly_trace_view(
     cell_width: float = 1.0,
     samples_per_cell: int | None = None,
     trace_row_height: float = 3.0,
+    column_window: tuple[int, int] | None = None,
 ) -> AssemblyTraceView | None:
-    """Return a cached aligned trace view for the selected assembly."""
+    """Return a cached aligned trace view for the selected assembly.
+
+    Pass ``column_window`` to build row cells only for one column range.
+    """
     return _build_selected_assembly_trace_view_cached(
         cache_version=_ASSEMBLY_TRACE_VIEW_CACHE_VERSION,
         prepared_batch_key=build_prepared_batch_cache_key(prepared_batch),
@@ -402,11 +415,175 @@ def build_selected_assembly_trace_view(
         cell_width=cell_width,
         samples_per_cell=samples_per_cell,
         trace_row_height=trace_row_height,
+        column_window=column_window,
         _prepared_batch=prepared_batch,
         _computed_assembly=computed_assembly,
     )
 
 
+def build_chromatogram_column_view_cache_key(
+    record: SequenceRecord,
+    trim_result: TrimResult | None,
+    *,
+    cell_width: float,
+    samples_per_base: int,
+) -> ChromatogramColumnViewCacheKey:
+    """Return a stable cache key for one base-column chromatogram view."""
+    return (
+        _sequence_record_cache_digest(record),
+        None if trim_result is None else _trim_result_cache_digest(trim_result),
+        float(cell_width),
+        samples_per_base,
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_chromatogram_column_view_cached(
+    *,
+    cache_version: int,
+    column_view_key: ChromatogramColumnViewCacheKey,
+    _record: SequenceRecord,
+    _trim_result: TrimResult | None,
+) -> ChromatogramColumnView:
+    """Return one cached base-column chromatogram view."""
+    _record_digest, _trim_digest, cell_width, samples_per_base = column_view_key
+    return build_chromatogram_column_view(
+        _record,
+        _trim_result,
+        cell_width=cell_width,
+        samples_per_base=samples_per_base,
+    )
+
+
+def build_chromatogram_column_view_for_record(
+    record: SequenceRecord,
+    trim_result: TrimResult | None = None,
+    *,
+    cell_width: float = 1.0,
+    samples_per_base: int = 16,
+) -> ChromatogramColumnView:
+    """Return a cached base-column chromatogram view for one record/trim pair."""
+    return _build_chromatogram_column_view_cached(
+        cache_version=_CHROMATOGRAM_COLUMN_VIEW_CACHE_VERSION,
+        column_view_key=build_chromatogram_column_view_cache_key(
+            record,
+            trim_result,
+            cell_width=cell_width,
+            samples_per_base=samples_per_base,
+        ),
+        _record=record,
+        _trim_result=trim_result,
+    )
+
+
+def build_trace_signatures_cache_key(
+    prepared_batch: PreparedBatch,
+) -> TraceSignaturesCacheKey:
+    """Return a cheap cache key for one prepared batch's trace signatures.
+
+    The upload signature already digests every file's content, so only the
+    per-read orientation and trim counts are added on top of it.
+    """
+    return (
+        prepared_batch.signature,
+        tuple(
+            (
+                source_filename,
+                prepared_batch.parsed_records[source_filename].orientation,
+                trim_result.bases_removed_left,
+                trim_result.bases_removed_right,
+                trim_result.trimmed_length,
+            )
+            for source_filename, trim_result in prepared_batch.trim_results.items()
+        ),
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _build_batch_trace_signatures_cached(
+    *,
+    cache_version: int,
+    trace_signatures_key: TraceSignaturesCacheKey,
+    _prepared_batch: PreparedBatch,
+) -> BatchTraceSignatures:
+    """Return cached trace signatures for every read of one prepared batch."""
+    return build_batch_trace_signatures(
+        _prepared_batch.parsed_records,
+        _prepared_batch.trim_results,
+    )
+
+
+def build_trace_signatures_for_batch(
+    prepared_batch: PreparedBatch,
+) -> BatchTraceSignatures:
+    """Return cached trace signatures for every read of one prepared batch."""
+    return _build_batch_trace_signatures_cached(
+        cache_version=_TRACE_SIGNATURES_CACHE_VERSION,
+        trace_signatures_key=build_trace_signatures_cache_key(prepared_batch),
+        _prepared_batch=prepared_batch,
+    )
+
+
+def build_view_figure_cache_key(view: object) -> str:
+    """Return a stable fingerprint for one frozen figure view model.
+
+    Views are keyed on the upstream ``fingerprint`` stamped by their builder;
+    a view without one is rejected rather than hashed in full.
+    """
+    fingerprint = getattr(view, "fingerprint", None)
+    if not isinstance(fingerprint, str):
+        raise ValueError(f"{type(view).__qualname__} has no fingerprint")
+    return f"{type(view).__qualname__}:{fingerprint}"
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _build_figure_spec_cached(
+    *,
+    cache_version: int,
+    figure_builder_name: str,
+    view_key: str,
+    theme_type: str,
+    builder_options: tuple[tuple[str, Any], ...],
+    _figure_builder: FigureBuilder,
+    _view: object,
+) -> FigureSpec:
+    """Return one cached Plotly figure dict for a view/theme pair."""
+    return figure_spec(
+        _figure_builder(_view, theme_type=theme_type, **dict(builder_options))
+    )
+
+
+def build_figure_spec_for_view(
+    figure_builder: FigureBuilder,
+    view: object,
+    *,
+    theme_type: str = "light",
+    overlay_shapes: Sequence[Mapping[str, Any]] = (),
+    **builder_options: Any,
+) -> FigureSpec:
+    """Return a cached Plotly figure dict built by ``figure_builder``.
+
+    The dict is keyed by the builder, the view fingerprint, the theme and any
+    extra builder options, so unchanged views skip figure construction.
+    ``overlay_shapes`` (e.g. a selection highlight) are layered onto the
+    cached spec afterwards and never enter the cache key.
+    """
+    return overlay_figure_spec_shapes(
+        _build_figure_spec_cached(
+            cache_version=_FIGURE_SPEC_CACHE_VERSION,
+            figure_builder_name=(
+                f"{figure_builder.__module__}.{figure_builder.__qualname__}"
+            ),
+            view_key=build_view_figure_cache_key(view),
+            theme_type=theme_type,
+            builder_options=tuple(sorted(builder_options.items())),
+            _figure_builder=figure_builder,
+            _view=view,
+        ),
+        overlay_shapes,
+    )
+
+
 def _sequence_record_cache_digest(record: SequenceRecord) -> str:
     snapshot = (
         record.record_id,
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from typing import Literal
 
+import numpy as np
+
 from abi_sauce.models import SequenceOrientation, SequenceRecord, TraceData
 from abi_sauce.trimming import TrimResult
 
@@ -136,3 +138,55 @@ def trace_position_for_oriented_query_index(
         trace_length=trace_length,
         display_orientation=raw_record.orientation,
     )
+
+
+def trace_positions_for_oriented_query_indices(
+    *,
+    raw_record: SequenceRecord,
+    trim_result: TrimResult,
+    strand: TraceStrand,
+) -> tuple[int | None, ...]:
+    """Return the display-space trace x for every oriented trimmed query index.
+
+    Equivalent to calling ``trace_position_for_oriented_query_index`` for each
+    index in ``range(trimmed_length)``, but resolves the trim geometry and the
+    sanitized trace length once per record.
+    """
+    trace_data = raw_record.trace_data
+    trimmed_length = trim_result.trimmed_length
+    if trace_data is None or trimmed_length <= 0:
+        return (None,) * max(trimmed_length, 0)
+
+    oriented_query_indices = np.arange(trimmed_length, dtype=np.int64)
+    display_query_indices = (
+        oriented_query_indices
+        if strand == "forward"
+        else trimmed_length - 1 - oriented_query_indices
+    )
+    raw_trimmed_indices = (
+        display_query_indices
+        if raw_record.orientation == "forward"
+        else trimmed_length - 1 - display_query_indices
+    )
+    raw_base_indices = trim_result.bases_removed_left + raw_trimmed_indices
+
+    base_positions = np.asarray(trace_data.base_positions, dtype=np.int64)
+    valid = (raw_base_indices >= 0) & (raw_base_indices < len(base_positions))
+    raw_trace_positions = np.zeros(trimmed_length, dtype=np.int64)
+    raw_trace_positions[valid] = base_positions[raw_base_indices[valid]]
+
+    trace_length = sanitized_trace_length(trace_data)
+    display_positions = raw_trace_positions
+    if trace_length > 0:
+        valid &= (raw_trace_positions >= 0) & (raw_trace_positions < trace_length)
+        if raw_record.orientation != "forward":
+            display_positions = trace_length - 1 - raw_trace_positions
+
+    return tuple(
+        int(position) if is_valid else None
+        for position, is_valid in zip(
+            display_positions.tolist(),
+            valid.tolist(),
+            strict=True,
+        )
+    )
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+
+from abi_sauce.models import SequenceRecord
+from abi_sauce.trimming import TrimResult
+
+_TRACE_CHANNEL_KEYS: Final[tuple[str, ...]] = ("DATA9", "DATA10", "DATA11", "DATA12")
+_DEFAULT_ENVELOPE_BINS: Final[int] = 64
+_DEFAULT_SNR_WINDOWS: Final[int] = 8
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class BatchTraceSignatures:
+    """Compact display-oriented trace signatures for every read of a batch.
+
+    Row ``i`` of each array describes ``source_filenames[i]``: ``envelope`` is
+    the per-bin maximum channel signal scaled to ``[0, 1]``, ``window_snr``
+    the primary/secondary channel ratio per window and ``retained_range`` the
+    trimmed region as trace fractions. Reads without traces hold ``NaN``.
+    """
+
+    source_filenames: tuple[str, ...]
+    display_names: tuple[str, ...]
+    max_signal: np.ndarray
+    envelope: np.ndarray
+    window_snr: np.ndarray
+    retained_range: np.ndarray
+
+    @property
+    def read_count(self) -> int:
+        """Return how many reads the signatures cover."""
+        return len(self.source_filenames)
+
+    @property
+    def has_trace(self) -> np.ndarray:
+        """Return a boolean mask of reads that carry trace signal."""
+        return ~np.isnan(self.max_signal)
+
+    @property
+    def median_snr(self) -> np.ndarray:
+        """Return each read's median window signal-to-noise ratio."""
+        median_snr = np.full(self.read_count, np.nan, dtype=np.float32)
+        has_trace = self.has_trace
+        if has_trace.any():
+            median_snr[has_trace] = np.nanmedian(self.window_snr[has_trace], axis=1)
+        return median_snr
+
+
+def build_batch_trace_signatures(
+    records_by_filename: Mapping[str, SequenceRecord],
+    trim_results_by_filename: Mapping[str, TrimResult],
+    *,
+    envelope_bins: int = _DEFAULT_ENVELOPE_BINS,
+    snr_windows: int = _DEFAULT_SNR_WINDOWS,
+) -> BatchTraceSignatures:
+    """Compute trace signatures for a batch straight from the raw trace arrays."""
+    if envelope_bins <= 0 or snr_windows <= 0:
+        raise ValueError("envelope_bins and snr_windows must be > 0")
+
+    source_filenames = tuple(records_by_filename)
+    read_count = len(source_filenames)
+    max_signal = np.full(read_count, np.nan, dtype=np.float32)
+    envelope = np.full((read_count, envelope_bins), np.nan, dtype=np.float32)
+    window_snr = np.full((read_count, snr_windows), np.nan, dtype=np.float32)
+    retained_range = np.full((read_count, 2), np.nan, dtype=np.float32)
+
+    for read_index, source_filename in enumerate(source_filenames):
+        record = records_by_filename[source_filename]
+        channel_matrix = _channel_matrix(record)
+        if channel_matrix is None:
+            continue
+
+        primary, secondary = _primary_and_secondary_signal(channel_matrix)
+        read_max_signal = float(primary.max())
+        read_envelope = _binned(np.maximum, primary, envelope_bins)
+        read_snr = _binned(np.add, primary, snr_windows) / np.maximum(
+            _binned(np.add, secondary, snr_windows),
+            1.0,
+        )
+        read_range = _retained_fraction_range(
+            record,
+            trim_results_by_filename.get(source_filename),
+            trace_length=primary.size,
+        )
+        if record.orientation == "reverse_complement":
+            read_envelope = read_envelope[::-1]
+            read_snr = read_snr[::-1]
+            read_range = 1.0 - read_range[::-1]
+
+        max_signal[read_index] = read_max_signal
+        envelope[read_index] = read_envelope / max(read_max_signal, 1.0)
+        window_snr[read_index] = read_snr
+        retained_range[read_index] = read_range
+
+    return BatchTraceSignatures(
+        source_filenames=source_filenames,
+        display_names=tuple(
+            records_by_filename[source_filename].name
+            for source_filename in source_filenames
+        ),
+        max_signal=max_signal,
+        envelope=envelope,
+        window_snr=window_snr,
+        retained_range=retained_range,
+    )
+
+
+def _channel_matrix(record: SequenceRecord) -> np.ndarray | None:
+    trace_data = record.trace_data
+    if trace_data is None:
+        return None
+    signals = [
+        trace_data.channels[data_key]
+        for data_key in _TRACE_CHANNEL_KEYS
+        if data_key in trace_data.channels
+    ]
+    trace_length = min((len(signal) for signal in signals), default=0)
+    if trace_length <= 0:
+        return None
+    return np.stack(
+        [np.asarray(signal[:trace_length], dtype=np.float32) for signal in signals]
+    )
+
+
+def _primary_and_secondary_signal(
+    channel_matrix: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    if channel_matrix.shape[0] < 2:
+        return channel_matrix[0], np.zeros_like(channel_matrix[0])
+    partitioned = np.partition(channel_matrix, channel_matrix.shape[0] - 2, axis=0)
+    return partitioned[-1], partitioned[-2]
+
+
+def _binned(reducer: np.ufunc, values: np.ndarray, bin_count: int) -> np.ndarray:
+    if values.size < bin_count:
+        sample_positions = (np.arange(bin_count) * values.size) // bin_count
+        return values[sample_positions].astype(np.float32)
+    bin_starts = -((-np.arange(bin_count) * values.size) // bin_count)
+    return reducer.reduceat(values, bin_starts).astype(np.float32)
+
+
+def _retained_fraction_range(
+    record: SequenceRecord,
+    trim_result: TrimResult | None,
+    *,
+    trace_length: int,
+) -> np.ndarray:
+    positions = (
+        np.asarray(record.trace_data.base_positions, dtype=np.float32)
+        if record.trace_data is not None
+        else np.zeros(0, dtype=np.float32)
+    )
+    positions = positions[: len(record.sequence)]
+    if trim_result is None:
+        retained_positions = positions
+    elif trim_result.trimmed_length <= 0:
+        return np.full(2, np.nan, dtype=np.float32)
+    else:
+        retained_positions = positions[
+            trim_result.bases_removed_left : trim_result.bases_removed_left
+            + trim_result.trimmed_length
+        ]
+    if retained_positions.size == 0:
+        return np.full(2, np.nan, dtype=np.float32)
+    return np.clip(
+        np.array(
+            [retained_positions.min(), retained_positions.max()],
+            dtype=np.float32,
+        )
+        / float(max(trace_length - 1, 1)),
+        0.0,
+        1.0,
+    )
+
+
+__all__ = ["BatchTraceSignatures", "build_batch_trace_signatures"]
@@ -241,6 +241,11 @@ if active_parsed_batch is not None and active_parsed_batch.parsed_records:
                 title="Assembly",
                 icon=":material/merge_type:",
             ),
+            st.Page(
+                "pages/05_plate_overview.py",
+                title="Plate Overview",
+                icon=":material/grid_view:",
+            ),
         ]
     )
 
@@ -251,7 +256,7 @@ current_page = st.navigation(
 
 st.sidebar.title(":apple: abi-sauce")
 st.sidebar.caption(
-    "Use the shared active batch across Home, Sample Viewer, Alignments, and Assembly."
+    "Use the shared active batch across Home, Sample Viewer, Alignments, Assembly, and Plate Overview."
 )
 
 load_button_label = "Upload Files" if active_parsed_batch is None else "Upload Files"
@@ -4,7 +4,10 @@ from typing import cast
 
 import streamlit as st
 
-from abi_sauce.batch_download_ui import render_batch_download_controls
+from abi_sauce.batch_download_ui import (
+    render_batch_download_controls,
+    render_batch_report_controls,
+)
 from abi_sauce.trim_state import (
     BatchTrimState,
     DEFAULT_BATCH_TRIM_CONFIG,
@@ -239,3 +242,9 @@ render_batch_download_controls(
     default_filename_stem="abi-sauce-trim",
     button_label="Download trimmed batch",
 )
+
+st.subheader("Chromatogram report")
+render_batch_report_controls(
+    prepared_batch=prepared_batch,
+    key_prefix="abi_sauce.batch_viewer.report",
+)
@@ -5,12 +5,10 @@ from typing import cast
 
 import streamlit as st
 
-from abi_sauce.chromatogram import (
-    build_chromatogram_column_view,
-    build_chromatogram_view,
-)
+from abi_sauce.chromatogram import build_chromatogram_view
 from abi_sauce.chromatogram_figure import build_chromatogram_column_figure
 from abi_sauce.export import to_fasta
+from abi_sauce.figure_spec import update_figure_spec_layout
 from abi_sauce.models import SequenceOrientation
 from abi_sauce.orientation import (
     orient_left_right_values,
@@ -23,7 +21,11 @@ from abi_sauce.trim_state import (
     build_record_annotations,
     resolve_active_trim_config,
 )
-from abi_sauce.streamlit_cache import prepare_batch_for_trim_state
+from abi_sauce.streamlit_cache import (
+    build_chromatogram_column_view_for_record,
+    build_figure_spec_for_view,
+    prepare_batch_for_trim_state,
+)
 from abi_sauce.trimming import TrimConfig
 from abi_sauce.upload_state import get_active_parsed_batch, update_active_parsed_record
 from abi_sauce.viewer_state import (
@@ -231,7 +233,10 @@ display_bases_removed_left, display_bases_removed_right = orient_left_right_valu
     record.orientation,
 )
 raw_chromatogram_view = build_chromatogram_view(record, trim_result)
-column_chromatogram_view = build_chromatogram_column_view(record, trim_result)
+column_chromatogram_view = build_chromatogram_column_view_for_record(
+    record,
+    trim_result,
+)
 
 st.toggle(
     "Reverse-complement",
@@ -252,11 +257,13 @@ if not column_chromatogram_view.is_renderable:
     )
 else:
     theme_type = str(getattr(getattr(st.context, "theme", None), "type", "light"))
-    figure = build_chromatogram_column_figure(
+    figure = build_figure_spec_for_view(
+        build_chromatogram_column_figure,
         column_chromatogram_view,
         theme_type=theme_type,
     )
-    figure.update_layout(
+    figure = update_figure_spec_layout(
+        figure,
         height=500,
         margin={"l": 24, "r": 24, "t": 24, "b": 24},
     )
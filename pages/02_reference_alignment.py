@@ -6,15 +6,23 @@ import streamlit as st
 
 from abi_sauce.chromatogram import ChromatogramView
 from abi_sauce.chromatogram_figure import build_chromatogram_figure
+from abi_sauce.figure_spec import update_figure_spec_layout
 from abi_sauce.reference_alignment_presenters import (
     format_alignment_block,
 )
 from abi_sauce.reference_alignment_trace_figure import (
     build_reference_alignment_trace_figure,
+    build_reference_alignment_trace_selection_shapes,
 )
 from abi_sauce.reference_alignment_types import StrandPolicy
-from abi_sauce.services.reference_alignment import compute_reference_alignment
-from abi_sauce.streamlit_cache import prepare_batch_for_trim_state
+from abi_sauce.services.reference_alignment import (
+    compute_reference_alignment,
+    window_reference_alignment_trace_view,
+)
+from abi_sauce.streamlit_cache import (
+    build_figure_spec_for_view,
+    prepare_batch_for_trim_state,
+)
 from abi_sauce.trim_state import build_record_annotations
 from abi_sauce.upload_state import get_active_parsed_batch
 from abi_sauce.viewer_state import (
@@ -33,6 +41,7 @@ _ALIGNED_TRACE_ROW_HEIGHT_PX = 84
 _ALIGNED_TRACE_BASE_HEIGHT_PX = 72
 _ALIGNED_TRACE_MIN_HEIGHT_PX = 240
 _ALIGNED_TRACE_VISIBLE_COLUMNS = 150
+_ALIGNED_TRACE_FIRST_COLUMN_WIDGET_KEY = "reference_alignment.trace_first_column"
 
 st.set_page_config(page_title="Reference Alignment", layout="wide")
 st.title("Reference Alignment")
@@ -113,6 +122,47 @@ def _centered_alignment_x_range(
     return [left, right]
 
 
+def _first_visible_column_input(
+    *,
+    alignment_length: int,
+    key: str,
+    default_column_index: int = 1,
+    visible_columns: int = _ALIGNED_TRACE_VISIBLE_COLUMNS,
+) -> int | None:
+    if alignment_length <= visible_columns:
+        return None
+    return int(
+        st.number_input(
+            "First visible column",
+            min_value=1,
+            max_value=alignment_length,
+            value=min(max(default_column_index, 1), alignment_length),
+            step=max(visible_columns // 2, 1),
+            key=key,
+            help=(
+                "Long alignments only build trace cells around the visible "
+                "columns; move this to scroll the aligned view."
+            ),
+        )
+    )
+
+
+def _left_aligned_alignment_x_range(
+    *,
+    alignment_length: int,
+    cell_width: float,
+    first_visible_column_index: int,
+    visible_columns: int = _ALIGNED_TRACE_VISIBLE_COLUMNS,
+) -> list[float]:
+    full_right = float(alignment_length) * cell_width
+    visible_width = min(float(visible_columns) * cell_width, full_right)
+    left = min(
+        float(max(first_visible_column_index - 1, 0)) * cell_width,
+        full_right - visible_width,
+    )
+    return [left, left + visible_width]
+
+
 def _event_option_label(event_row: dict[str, object]) -> str:
     event_type = str(event_row["type"])
     ref_pos = event_row["ref_pos"]
@@ -310,20 +360,62 @@ if trace_view is not None:
         "query bases together with the oriented electropherogram projected into "
         "alignment columns."
     )
-    aligned_trace_figure = build_reference_alignment_trace_figure(
+    first_visible_column_index = _first_visible_column_input(
+        alignment_length=trace_view.alignment_length,
+        key=(
+            f"{_ALIGNED_TRACE_FIRST_COLUMN_WIDGET_KEY}."
+            f"{selected_record_name}.{resolved_selected_column_index}"
+        ),
+        default_column_index=(
+            1
+            if resolved_selected_column_index is None
+            else resolved_selected_column_index - (_ALIGNED_TRACE_VISIBLE_COLUMNS // 2)
+        ),
+    )
+    if first_visible_column_index is not None:
+        trace_view = (
+            window_reference_alignment_trace_view(
+                computed_alignment,
+                prepared_batch,
+                first_visible_column_index=first_visible_column_index,
+                visible_columns=_ALIGNED_TRACE_VISIBLE_COLUMNS,
+            )
+            or trace_view
+        )
+    aligned_trace_figure = build_figure_spec_for_view(
+        build_reference_alignment_trace_figure,
         trace_view,
         theme_type=theme_type,
-        selected_column_index=resolved_selected_column_index,
+        overlay_shapes=build_reference_alignment_trace_selection_shapes(
+            trace_view,
+            theme_type=theme_type,
+            selected_column_index=resolved_selected_column_index,
+        ),
     )
-    if resolved_selected_column_index is not None:
-        aligned_trace_figure.update_xaxes(
-            range=_centered_alignment_x_range(
-                alignment_length=trace_view.alignment_length,
-                cell_width=trace_view.cell_width,
-                center_column_index=resolved_selected_column_index,
-            )
+    if first_visible_column_index is not None:
+        aligned_trace_figure = update_figure_spec_layout(
+            aligned_trace_figure,
+            xaxis={
+                "range": _left_aligned_alignment_x_range(
+                    alignment_length=trace_view.alignment_length,
+                    cell_width=trace_view.cell_width,
+                    first_visible_column_index=first_visible_column_index,
+                )
+            },
+        )
+    elif resolved_selected_column_index is not None:
+        aligned_trace_figure = update_figure_spec_layout(
+            aligned_trace_figure,
+            xaxis={
+                "range": _centered_alignment_x_range(
+                    alignment_length=trace_view.alignment_length,
+                    cell_width=trace_view.cell_width,
+                    center_column_index=resolved_selected_column_index,
+                )
+            },
         )
-    aligned_trace_figure.update_layout(
+    aligned_trace_figure = update_figure_spec_layout(
+        aligned_trace_figure,
         height=max(
             _ALIGNED_TRACE_MIN_HEIGHT_PX,
             _ALIGNED_TRACE_BASE_HEIGHT_PX
@@ -342,19 +434,19 @@ if not chromatogram_view.is_renderable:
     st.warning("Selected record does not have enough trace data to render a chart.")
     st.stop()
 
-figure = build_chromatogram_figure(
+trace_x = None if selected_event_row is None else selected_event_row.get("trace_x")
+figure = build_figure_spec_for_view(
+    build_chromatogram_figure,
     chromatogram_view,
     theme_type=theme_type,
 )
-trace_x = None if selected_event_row is None else selected_event_row.get("trace_x")
 if isinstance(trace_x, (int, float)):
-    figure.update_xaxes(
-        range=_centered_x_range(
-            chromatogram_view,
-            center=float(trace_x),
-        )
+    figure = update_figure_spec_layout(
+        figure,
+        xaxis={"range": _centered_x_range(chromatogram_view, center=float(trace_x))},
     )
-figure.update_layout(
+figure = update_figure_spec_layout(
+    figure,
     height=500,
     margin={"l": 24, "r": 24, "t": 24, "b": 24},
 )
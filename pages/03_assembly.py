@@ -26,15 +26,18 @@ from abi_sauce.assembly_state import (
     sync_assembly_session_state,
     update_assembly_definition,
 )
+from abi_sauce.assembly_trace import resolve_trace_column_window
 from abi_sauce.assembly_trace_figure import build_assembly_trace_figure
 from abi_sauce.chromatogram import ChromatogramView, build_chromatogram_view
 from abi_sauce.chromatogram_figure import build_chromatogram_figure
 from abi_sauce.export import to_fasta
 from abi_sauce.exceptions import ExportError
+from abi_sauce.figure_spec import update_figure_spec_layout
 from abi_sauce.models import SequenceRecord
 from abi_sauce.services.assembly_compute import ComputedAssembly
 from abi_sauce.services.assembly_export import prepare_assembly_download
 from abi_sauce.streamlit_cache import (
+    build_figure_spec_for_view,
     build_selected_assembly_trace_view,
     compute_saved_assemblies_for_definitions,
     prepare_batch_for_trim_state,
@@ -78,6 +81,7 @@ _ALIGNED_TRACE_ROW_HEIGHT_PX = 84
 _ALIGNED_TRACE_BASE_HEIGHT_PX = 72
 _ALIGNED_TRACE_MIN_HEIGHT_PX = 240
 _ALIGNED_TRACE_VISIBLE_COLUMNS = 150
+_ALIGNED_TRACE_FIRST_COLUMN_WIDGET_KEY = "assembly.aligned_trace_first_column"
 
 st.set_page_config(page_title="Assembly", layout="wide")
 st.title("Assembly")
@@ -143,6 +147,47 @@ def _centered_alignment_x_range(
     return [left, right]
 
 
+def _first_visible_column_input(
+    *,
+    alignment_length: int,
+    key: str,
+    default_column_index: int = 1,
+    visible_columns: int = _ALIGNED_TRACE_VISIBLE_COLUMNS,
+) -> int | None:
+    if alignment_length <= visible_columns:
+        return None
+    return int(
+        st.number_input(
+            "First visible column",
+            min_value=1,
+            max_value=alignment_length,
+            value=min(max(default_column_index, 1), alignment_length),
+            step=max(visible_columns // 2, 1),
+            key=key,
+            help=(
+                "Long alignments only build trace cells around the visible "
+                "columns; move this to scroll the aligned view."
+            ),
+        )
+    )
+
+
+def _left_aligned_alignment_x_range(
+    *,
+    alignment_length: int,
+    cell_width: float,
+    first_visible_column_index: int,
+    visible_columns: int = _ALIGNED_TRACE_VISIBLE_COLUMNS,
+) -> list[float]:
+    full_right = float(alignment_length) * cell_width
+    visible_width = min(float(visible_columns) * cell_width, full_right)
+    left = min(
+        float(max(first_visible_column_index - 1, 0)) * cell_width,
+        full_right - visible_width,
+    )
+    return [left, left + visible_width]
+
+
 def _conflict_option_label(conflict_row: dict[str, object]) -> str:
     return (
         f"col {conflict_row['column']} | "
@@ -920,27 +965,62 @@ if selected_result is None:
 
 consensus_record = selected_computed_assembly.consensus_record
 theme_type = str(getattr(getattr(st.context, "theme", None), "type", "light"))
+st.subheader("Aligned electropherogram view")
+assembly_alignment_length = (
+    0
+    if selected_computed_assembly.result is None
+    else len(selected_computed_assembly.result.columns)
+)
+first_visible_column_index = _first_visible_column_input(
+    alignment_length=assembly_alignment_length,
+    key=(
+        f"{_ALIGNED_TRACE_FIRST_COLUMN_WIDGET_KEY}."
+        f"{selected_definition.assembly_id}"
+    ),
+)
 assembly_trace_view = build_selected_assembly_trace_view(
     prepared_batch,
     selected_computed_assembly,
+    column_window=(
+        None
+        if first_visible_column_index is None
+        else resolve_trace_column_window(
+            alignment_length=assembly_alignment_length,
+            first_visible_column_index=first_visible_column_index,
+            visible_columns=_ALIGNED_TRACE_VISIBLE_COLUMNS,
+        )
+    ),
 )
 if assembly_trace_view is None:
     st.error("Aligned trace view could not be built for the selected assembly.")
     st.stop()
 
-st.subheader("Aligned electropherogram view")
-aligned_trace_figure = build_assembly_trace_figure(
+aligned_trace_figure = build_figure_spec_for_view(
+    build_assembly_trace_figure,
     assembly_trace_view,
     theme_type=theme_type,
+    batch_rows=True,
 )
-aligned_trace_figure.update_xaxes(
-    range=_centered_alignment_x_range(
-        alignment_length=assembly_trace_view.alignment_length,
-        cell_width=assembly_trace_view.cell_width,
-        center_column_index=None,
-    )
+aligned_trace_figure = update_figure_spec_layout(
+    aligned_trace_figure,
+    xaxis={
+        "range": (
+            _centered_alignment_x_range(
+                alignment_length=assembly_trace_view.alignment_length,
+                cell_width=assembly_trace_view.cell_width,
+                center_column_index=None,
+            )
+            if first_visible_column_index is None
+            else _left_aligned_alignment_x_range(
+                alignment_length=assembly_trace_view.alignment_length,
+                cell_width=assembly_trace_view.cell_width,
+                first_visible_column_index=first_visible_column_index,
+            )
+        )
+    },
 )
-aligned_trace_figure.update_layout(
+aligned_trace_figure = update_figure_spec_layout(
+    aligned_trace_figure,
     height=max(
         _ALIGNED_TRACE_MIN_HEIGHT_PX,
         _ALIGNED_TRACE_BASE_HEIGHT_PX
@@ -1105,9 +1185,6 @@ if debug:
 
     if left_view.is_renderable and right_view.is_renderable:
         st.subheader("Chromatograms")
-        left_figure = build_chromatogram_figure(left_view, theme_type=theme_type)
-        right_figure = build_chromatogram_figure(right_view, theme_type=theme_type)
-
         left_trace_x = (
             None
             if selected_conflict_row is None
@@ -1118,20 +1195,44 @@ if debug:
             if selected_conflict_row is None
             else selected_conflict_row.get("right_trace_x")
         )
+        left_figure = build_figure_spec_for_view(
+            build_chromatogram_figure,
+            left_view,
+            theme_type=theme_type,
+        )
         if isinstance(left_trace_x, (int, float)):
-            left_figure.update_xaxes(
-                range=_centered_x_range(left_view, center=float(left_trace_x))
+            left_figure = update_figure_spec_layout(
+                left_figure,
+                xaxis={
+                    "range": _centered_x_range(
+                        left_view,
+                        center=float(left_trace_x),
+                    )
+                },
             )
+        right_figure = build_figure_spec_for_view(
+            build_chromatogram_figure,
+            right_view,
+            theme_type=theme_type,
+        )
         if isinstance(right_trace_x, (int, float)):
-            right_figure.update_xaxes(
-                range=_centered_x_range(right_view, center=float(right_trace_x))
+            right_figure = update_figure_spec_layout(
+                right_figure,
+                xaxis={
+                    "range": _centered_x_range(
+                        right_view,
+                        center=float(right_trace_x),
+                    )
+                },
             )
 
-        left_figure.update_layout(
+        left_figure = update_figure_spec_layout(
+            left_figure,
             height=420,
             margin={"l": 24, "r": 24, "t": 24, "b": 24},
         )
-        right_figure.update_layout(
+        right_figure = update_figure_spec_layout(
+            right_figure,
             height=420,
             margin={"l": 24, "r": 24, "t": 24, "b": 24},
         )
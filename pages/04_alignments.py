@@ -21,9 +21,11 @@ from abi_sauce.assembly_presenters import (
     assembly_conflicts_to_rows,
     format_assembly_block,
 )
+from abi_sauce.assembly_trace import resolve_trace_column_window
 from abi_sauce.assembly_trace_figure import build_assembly_trace_figure
 from abi_sauce.assembly_types import AssemblyConfig, AssemblyResult
 from abi_sauce.export import to_fasta
+from abi_sauce.figure_spec import update_figure_spec_layout
 from abi_sauce.reference_alignment import normalize_reference
 from abi_sauce.reference_alignment_exports import format_reference_alignment_fasta
 from abi_sauce.reference_alignment_multi_exports import (
@@ -39,6 +41,7 @@ from abi_sauce.reference_alignment_multi_trace_figure import (
 from abi_sauce.reference_alignment_presenters import format_alignment_block
 from abi_sauce.reference_alignment_trace_figure import (
     build_reference_alignment_trace_figure,
+    build_reference_alignment_trace_selection_shapes,
 )
 from abi_sauce.reference_alignment_types import StrandPolicy
 from abi_sauce.reference_library_state import (
@@ -51,7 +54,12 @@ from abi_sauce.services.alignment_compute import (
     ComputedAlignment,
     compute_saved_alignments,
 )
+from abi_sauce.services.reference_alignment import (
+    window_reference_alignment_trace_view,
+    window_reference_multi_alignment_trace_view,
+)
 from abi_sauce.streamlit_cache import (
+    build_figure_spec_for_view,
     build_selected_assembly_trace_view,
     prepare_batch_for_trim_state,
 )
@@ -75,6 +83,8 @@ _NEW_STRAND_POLICY_WIDGET_KEY = "alignments.dialog.new.strand_policy"
 _NEW_MIN_OVERLAP_WIDGET_KEY = "alignments.dialog.new.min_overlap"
 _NEW_MIN_IDENTITY_WIDGET_KEY = "alignments.dialog.new.min_identity"
 _NEW_QUALITY_MARGIN_WIDGET_KEY = "alignments.dialog.new.quality_margin"
+_NEW_COVERAGE_WINDOW_WIDGET_KEY = "alignments.dialog.new.coverage_window"
+_NEW_COVERAGE_PADDING_WIDGET_KEY = "alignments.dialog.new.coverage_padding"
 
 _EDIT_NAME_WIDGET_KEY_PREFIX = "alignments.dialog.edit.name"
 _EDIT_READS_WIDGET_KEY_PREFIX = "alignments.dialog.edit.reads"
@@ -93,6 +103,8 @@ _EDIT_STRAND_POLICY_WIDGET_KEY_PREFIX = "alignments.dialog.edit.strand_policy"
 _EDIT_MIN_OVERLAP_WIDGET_KEY_PREFIX = "alignments.dialog.edit.min_overlap"
 _EDIT_MIN_IDENTITY_WIDGET_KEY_PREFIX = "alignments.dialog.edit.min_identity"
 _EDIT_QUALITY_MARGIN_WIDGET_KEY_PREFIX = "alignments.dialog.edit.quality_margin"
+_EDIT_COVERAGE_WINDOW_WIDGET_KEY_PREFIX = "alignments.dialog.edit.coverage_window"
+_EDIT_COVERAGE_PADDING_WIDGET_KEY_PREFIX = "alignments.dialog.edit.coverage_padding"
 
 ReferenceSourceMode = Literal["existing", "new"]
 NewReferenceInputMode = Literal["upload", "paste"]
@@ -101,6 +113,7 @@ _ALIGNED_TRACE_ROW_HEIGHT_PX = 84
 _ALIGNED_TRACE_BASE_HEIGHT_PX = 72
 _ALIGNED_TRACE_MIN_HEIGHT_PX = 240
 _ALIGNED_TRACE_VISIBLE_COLUMNS = 150
+_ALIGNED_TRACE_FIRST_COLUMN_WIDGET_KEY = "alignments.aligned_trace_first_column"
 
 st.set_page_config(page_title="Alignments", layout="wide")
 st.title("Alignments")
@@ -134,6 +147,38 @@ def _reference_required(engine_kind: AlignmentEngineKind) -> bool:
     return engine_kind in {"reference_single", "reference_multi"}
 
 
+def _coverage_padding_input(
+    engine_kind: AlignmentEngineKind,
+    *,
+    default_padding: int | None,
+    window_key: str,
+    padding_key: str,
+) -> int | None:
+    windowed = st.checkbox(
+        "Limit shared grid to read coverage",
+        value=default_padding is not None,
+        key=window_key,
+        disabled=engine_kind != "reference_multi",
+        help=(
+            "Only build columns for reference intervals covered by included "
+            "reads. Useful for short reads against a long reference."
+        ),
+    )
+    padding = int(
+        st.number_input(
+            "Coverage window padding (bases)",
+            min_value=0,
+            step=10,
+            value=50 if default_padding is None else default_padding,
+            key=padding_key,
+            disabled=engine_kind != "reference_multi" or not windowed,
+        )
+    )
+    if engine_kind != "reference_multi" or not windowed:
+        return None
+    return padding
+
+
 def _centered_alignment_x_range(
     *,
     alignment_length: int,
@@ -165,6 +210,54 @@ def _centered_alignment_x_range(
     return [left, right]
 
 
+def _first_visible_column_input(
+    *,
+    alignment_length: int,
+    key: str,
+    default_column_index: int = 1,
+    visible_columns: int = _ALIGNED_TRACE_VISIBLE_COLUMNS,
+) -> int | None:
+    if alignment_length <= visible_columns:
+        return None
+    return int(
+        st.number_input(
+            "First visible column",
+            min_value=1,
+            max_value=alignment_length,
+            value=min(max(default_column_index, 1), alignment_length),
+            step=max(visible_columns // 2, 1),
+            key=key,
+            help=(
+                "Long alignments only build trace cells around the visible "
+                "columns; move this to scroll the aligned view."
+            ),
+        )
+    )
+
+
+def _aligned_trace_first_column_key(computed_alignment: ComputedAlignment) -> str:
+    return (
+        f"{_ALIGNED_TRACE_FIRST_COLUMN_WIDGET_KEY}."
+        f"{computed_alignment.definition.alignment_id}"
+    )
+
+
+def _left_aligned_alignment_x_range(
+    *,
+    alignment_length: int,
+    cell_width: float,
+    first_visible_column_index: int,
+    visible_columns: int = _ALIGNED_TRACE_VISIBLE_COLUMNS,
+) -> list[float]:
+    full_right = float(alignment_length) * cell_width
+    visible_width = min(float(visible_columns) * cell_width, full_right)
+    left = min(
+        float(max(first_visible_column_index - 1, 0)) * cell_width,
+        full_right - visible_width,
+    )
+    return [left, left + visible_width]
+
+
 def _event_option_label(event_row: dict[str, object]) -> str:
     event_type = str(event_row["type"])
     ref_pos = event_row["ref_pos"]
@@ -574,24 +667,51 @@ def _render_pairwise_result(
     with metric_col_5:
         st.metric("Conflict columns", result.conflict_count)
 
+    first_visible_column_index = _first_visible_column_input(
+        alignment_length=len(result.columns),
+        key=_aligned_trace_first_column_key(computed_alignment),
+    )
     assembly_trace_view = build_selected_assembly_trace_view(
         prepared_batch,
         computed_assembly,
+        column_window=(
+            None
+            if first_visible_column_index is None
+            else resolve_trace_column_window(
+                alignment_length=len(result.columns),
+                first_visible_column_index=first_visible_column_index,
+                visible_columns=_ALIGNED_TRACE_VISIBLE_COLUMNS,
+            )
+        ),
     )
     if assembly_trace_view is not None:
         st.subheader("Aligned electropherogram view")
-        aligned_trace_figure = build_assembly_trace_figure(
+        aligned_trace_figure = build_figure_spec_for_view(
+            build_assembly_trace_figure,
             assembly_trace_view,
             theme_type=theme_type,
+            batch_rows=True,
         )
-        aligned_trace_figure.update_xaxes(
-            range=_centered_alignment_x_range(
-                alignment_length=assembly_trace_view.alignment_length,
-                cell_width=assembly_trace_view.cell_width,
-                center_column_index=None,
-            )
+        aligned_trace_figure = update_figure_spec_layout(
+            aligned_trace_figure,
+            xaxis={
+                "range": (
+                    _centered_alignment_x_range(
+                        alignment_length=assembly_trace_view.alignment_length,
+                        cell_width=assembly_trace_view.cell_width,
+                        center_column_index=None,
+                    )
+                    if first_visible_column_index is None
+                    else _left_aligned_alignment_x_range(
+                        alignment_length=assembly_trace_view.alignment_length,
+                        cell_width=assembly_trace_view.cell_width,
+                        first_visible_column_index=first_visible_column_index,
+                    )
+                )
+            },
         )
-        aligned_trace_figure.update_layout(
+        aligned_trace_figure = update_figure_spec_layout(
+            aligned_trace_figure,
             height=max(
                 _ALIGNED_TRACE_MIN_HEIGHT_PX,
                 _ALIGNED_TRACE_BASE_HEIGHT_PX
@@ -648,6 +768,7 @@ def _render_pairwise_result(
 def _render_reference_single_result(
     *,
     computed_alignment: ComputedAlignment,
+    prepared_batch,
     theme_type: str,
 ) -> None:
     reference_alignment = computed_alignment.reference_alignment
@@ -683,20 +804,60 @@ def _render_reference_single_result(
             else None
         )
         st.subheader("Aligned electropherogram view")
-        aligned_trace_figure = build_reference_alignment_trace_figure(
+        first_visible_column_index = _first_visible_column_input(
+            alignment_length=trace_view.alignment_length,
+            key=_aligned_trace_first_column_key(computed_alignment),
+            default_column_index=(
+                1
+                if resolved_selected_column_index is None
+                else resolved_selected_column_index
+                - (_ALIGNED_TRACE_VISIBLE_COLUMNS // 2)
+            ),
+        )
+        if first_visible_column_index is not None:
+            trace_view = (
+                window_reference_alignment_trace_view(
+                    reference_alignment,
+                    prepared_batch,
+                    first_visible_column_index=first_visible_column_index,
+                    visible_columns=_ALIGNED_TRACE_VISIBLE_COLUMNS,
+                )
+                or trace_view
+            )
+        aligned_trace_figure = build_figure_spec_for_view(
+            build_reference_alignment_trace_figure,
             trace_view,
             theme_type=theme_type,
-            selected_column_index=resolved_selected_column_index,
+            overlay_shapes=build_reference_alignment_trace_selection_shapes(
+                trace_view,
+                theme_type=theme_type,
+                selected_column_index=resolved_selected_column_index,
+            ),
         )
-        if resolved_selected_column_index is not None:
-            aligned_trace_figure.update_xaxes(
-                range=_centered_alignment_x_range(
-                    alignment_length=trace_view.alignment_length,
-                    cell_width=trace_view.cell_width,
-                    center_column_index=resolved_selected_column_index,
-                )
+        if first_visible_column_index is not None:
+            aligned_trace_figure = update_figure_spec_layout(
+                aligned_trace_figure,
+                xaxis={
+                    "range": _left_aligned_alignment_x_range(
+                        alignment_length=trace_view.alignment_length,
+                        cell_width=trace_view.cell_width,
+                        first_visible_column_index=first_visible_column_index,
+                    )
+                },
             )
-        aligned_trace_figure.update_layout(
+        elif resolved_selected_column_index is not None:
+            aligned_trace_figure = update_figure_spec_layout(
+                aligned_trace_figure,
+                xaxis={
+                    "range": _centered_alignment_x_range(
+                        alignment_length=trace_view.alignment_length,
+                        cell_width=trace_view.cell_width,
+                        center_column_index=resolved_selected_column_index,
+                    )
+                },
+            )
+        aligned_trace_figure = update_figure_spec_layout(
+            aligned_trace_figure,
             height=max(
                 _ALIGNED_TRACE_MIN_HEIGHT_PX,
                 _ALIGNED_TRACE_BASE_HEIGHT_PX
@@ -767,6 +928,7 @@ def _render_reference_single_result(
 def _render_reference_multi_result(
     *,
     computed_alignment: ComputedAlignment,
+    prepared_batch,
     theme_type: str,
 ) -> None:
     reference_multi_alignment = computed_alignment.reference_multi_alignment
@@ -793,12 +955,39 @@ def _render_reference_multi_result(
     trace_view = reference_multi_alignment.trace_view
     if trace_view is not None:
         st.subheader("Aligned electropherogram view")
-        aligned_trace_figure = build_reference_multi_alignment_trace_figure(
+        first_visible_column_index = _first_visible_column_input(
+            alignment_length=trace_view.alignment_length,
+            key=_aligned_trace_first_column_key(computed_alignment),
+        )
+        if first_visible_column_index is not None:
+            trace_view = (
+                window_reference_multi_alignment_trace_view(
+                    reference_multi_alignment,
+                    prepared_batch,
+                    first_visible_column_index=first_visible_column_index,
+                    visible_columns=_ALIGNED_TRACE_VISIBLE_COLUMNS,
+                )
+                or trace_view
+            )
+        aligned_trace_figure = build_figure_spec_for_view(
+            build_reference_multi_alignment_trace_figure,
             trace_view,
             theme_type=theme_type,
-            selected_column_index=None,
+            batch_rows=True,
         )
-        aligned_trace_figure.update_layout(
+        if first_visible_column_index is not None:
+            aligned_trace_figure = update_figure_spec_layout(
+                aligned_trace_figure,
+                xaxis={
+                    "range": _left_aligned_alignment_x_range(
+                        alignment_length=trace_view.alignment_length,
+                        cell_width=trace_view.cell_width,
+                        first_visible_column_index=first_visible_column_index,
+                    )
+                },
+            )
+        aligned_trace_figure = update_figure_spec_layout(
+            aligned_trace_figure,
             height=max(
                 _ALIGNED_TRACE_MIN_HEIGHT_PX,
                 _ALIGNED_TRACE_BASE_HEIGHT_PX
@@ -961,6 +1150,12 @@ def _create_alignment_dialog(
             disabled=engine_kind == "reference_single",
         )
     )
+    coverage_padding = _coverage_padding_input(
+        engine_kind,
+        default_padding=None,
+        window_key=_NEW_COVERAGE_WINDOW_WIDGET_KEY,
+        padding_key=_NEW_COVERAGE_PADDING_WIDGET_KEY,
+    )
 
     selection_valid = _alignment_member_count_valid(
         engine_kind,
@@ -1039,6 +1234,7 @@ def _create_alignment_dialog(
             reference_name=reference_name,
             reference_text=reference_text,
             strand_policy=strand_policy,
+            coverage_padding=coverage_padding,
         )
         st.rerun()
 
@@ -1156,6 +1352,16 @@ def _edit_alignment_dialog(
             disabled=engine_kind == "reference_single",
         )
     )
+    coverage_padding = _coverage_padding_input(
+        engine_kind,
+        default_padding=definition.coverage_padding,
+        window_key=(
+            f"{_EDIT_COVERAGE_WINDOW_WIDGET_KEY_PREFIX}.{definition.alignment_id}"
+        ),
+        padding_key=(
+            f"{_EDIT_COVERAGE_PADDING_WIDGET_KEY_PREFIX}.{definition.alignment_id}"
+        ),
+    )
 
     selection_valid = _alignment_member_count_valid(
         engine_kind,
@@ -1241,6 +1447,7 @@ def _edit_alignment_dialog(
             reference_name=reference_name,
             reference_text=reference_text,
             strand_policy=strand_policy,
+            coverage_padding=coverage_padding,
         )
         st.rerun()
 
@@ -1421,11 +1628,13 @@ if selected_definition.engine_kind == "pairwise":
 elif selected_definition.engine_kind == "reference_single":
     _render_reference_single_result(
         computed_alignment=selected_computed_alignment,
+        prepared_batch=prepared_batch,
         theme_type=theme_type,
     )
 elif selected_definition.engine_kind == "reference_multi":
     _render_reference_multi_result(
         computed_alignment=selected_computed_alignment,
+        prepared_batch=prepared_batch,
         theme_type=theme_type,
     )
 else:
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import numpy as np
+import streamlit as st
+
+from abi_sauce.plate_overview_figure import (
+    build_plate_overview_figure,
+    default_plate_columns,
+    plate_well_labels,
+)
+from abi_sauce.streamlit_cache import (
+    build_trace_signatures_for_batch,
+    prepare_batch_for_trim_state,
+)
+from abi_sauce.upload_state import get_active_parsed_batch
+from abi_sauce.viewer_state import get_batch_trim_state, set_selected_record_name
+
+_PLATE_LAYOUT_WIDGET_KEY = "plate_overview.plate_layout"
+_PLATE_FIGURE_KEY = "plate_overview.figure"
+_PLATE_LAYOUT_COLUMNS: dict[str, int | None] = {
+    "Auto": None,
+    "96-well (12 columns)": 12,
+    "384-well (24 columns)": 24,
+}
+
+st.set_page_config(page_title="Plate Overview", layout="wide")
+
+parsed_batch = get_active_parsed_batch(st.session_state)
+if parsed_batch is None or not parsed_batch.parsed_records:
+    st.info("Load ABI trace files to see the plate overview.")
+    st.stop()
+
+prepared_batch = prepare_batch_for_trim_state(
+    parsed_batch,
+    get_batch_trim_state(st.session_state),
+)
+signatures = build_trace_signatures_for_batch(prepared_batch)
+
+st.title("Plate Overview")
+st.caption(
+    "Wells follow upload order. Shading is the median signal-to-noise ratio; "
+    "the line is the decimated signal envelope and the bar marks the retained "
+    "region. Select a well to open it in the Sample Viewer."
+)
+
+plate_layout = st.segmented_control(
+    "Plate layout",
+    options=tuple(_PLATE_LAYOUT_COLUMNS),
+    default="Auto",
+    key=_PLATE_LAYOUT_WIDGET_KEY,
+)
+plate_columns = _PLATE_LAYOUT_COLUMNS[plate_layout or "Auto"]
+theme_type = str(getattr(getattr(st.context, "theme", None), "type", "light"))
+figure = build_plate_overview_figure(
+    signatures,
+    plate_columns=plate_columns,
+    theme_type=theme_type,
+)
+event = st.plotly_chart(
+    figure,
+    width="stretch",
+    key=_PLATE_FIGURE_KEY,
+    on_select="rerun",
+    selection_mode="points",
+    config={"displayModeBar": False},
+)
+
+selected_points = event.selection.points if event is not None else []
+selected_filenames = [
+    point["customdata"][0]
+    for point in selected_points
+    if isinstance(point.get("customdata"), list) and point["customdata"]
+]
+if selected_filenames:
+    set_selected_record_name(st.session_state, selected_filenames[0])
+    st.switch_page("pages/01_chromatogram_preview.py")
+
+median_snr = signatures.median_snr
+traced_count = int(signatures.has_trace.sum())
+metric_col_1, metric_col_2, metric_col_3 = st.columns(3)
+with metric_col_1:
+    st.metric("Reads", signatures.read_count)
+with metric_col_2:
+    st.metric("Reads with trace", traced_count)
+with metric_col_3:
+    st.metric(
+        "Median SNR",
+        f"{float(np.nanmedian(median_snr)):.1f}" if traced_count else "n/a",
+    )
+
+well_labels = plate_well_labels(
+    signatures.read_count,
+    plate_columns=plate_columns or default_plate_columns(signatures.read_count),
+)
+low_snr_order = np.argsort(np.where(np.isnan(median_snr), -np.inf, median_snr))
+with st.expander("Lowest signal-to-noise wells"):
+    st.dataframe(
+        [
+            {
+                "well": well_labels[read_index],
+                "filename": signatures.source_filenames[read_index],
+                "name": signatures.display_names[read_index],
+                "median_snr": (
+                    None
+                    if np.isnan(median_snr[read_index])
+                    else round(float(median_snr[read_index]), 2)
+                ),
+            }
+            for read_index in low_snr_order[:24].tolist()
+        ],
+        hide_index=True,
+        width="stretch",
+    )
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+from Bio.Align import substitution_matrices
+import numpy as np
+
 from abi_sauce.alignment_policy import (
+    aligner_pool_info,
+    aligner_scoring_key,
+    alignment_cache_info,
     alignment_overlap_metrics,
     alignment_strands_for_policy,
     build_semiglobal_aligner,
+    clear_aligner_pool,
+    clear_alignment_cache,
     oriented_qualities,
     select_best_oriented_alignment,
+    shared_semiglobal_aligner,
 )
 
 
@@ -50,3 +59,89 @@ def test_alignment_overlap_metrics_reports_overlap_and_identity() -> None:
 
     assert overlap_length == 6
     assert percent_identity == (5 / 6) * 100.0
+
+
+def test_select_best_oriented_alignment_reuses_cached_coordinates() -> None:
+    clear_alignment_cache()
+    uncached = select_best_oriented_alignment(
+        target_sequence="GATTACAGCATTTTTCTGACGTCAG",
+        display_query_sequence="GACGTCAGAAAAATGCTGTAATC",
+        display_query_qualities=None,
+        aligner=build_semiglobal_aligner(),
+        use_cache=False,
+    )
+    first = select_best_oriented_alignment(
+        target_sequence="GATTACAGCATTTTTCTGACGTCAG",
+        display_query_sequence="GACGTCAGAAAAATGCTGTAATC",
+        display_query_qualities=None,
+        aligner=build_semiglobal_aligner(),
+    )
+    second = select_best_oriented_alignment(
+        target_sequence="GATTACAGCATTTTTCTGACGTCAG",
+        display_query_sequence="GACGTCAGAAAAATGCTGTAATC",
+        display_query_qualities=list(range(23)),
+        aligner=build_semiglobal_aligner(),
+    )
+
+    assert uncached is not None and first is not None and second is not None
+    assert alignment_cache_info().hits == 1
+    assert alignment_cache_info().misses == 1
+    assert second.strand == uncached.strand == "reverse_complement"
+    assert second.score == uncached.score
+    assert second.sequence == uncached.sequence
+    assert second.qualities == list(reversed(range(23)))
+    assert second.alignment.indices.tolist() == uncached.alignment.indices.tolist()
+
+    select_best_oriented_alignment(
+        target_sequence="GATTACAGCATTTTTCTGACGTCAG",
+        display_query_sequence="GACGTCAGAAAAATGCTGTAATC",
+        display_query_qualities=None,
+        aligner=build_semiglobal_aligner(mismatch_score=-2.0),
+    )
+    assert alignment_cache_info().misses == 2
+
+
+def test_aligner_scoring_key_distinguishes_substitution_matrices() -> None:
+    identity_aligner = build_semiglobal_aligner()
+    identity_aligner.substitution_matrix = substitution_matrices.Array(
+        "ACGT",
+        dims=2,
+        data=np.where(np.eye(4, dtype=bool), 1.0, -1.0),
+    )
+    transition_aligner = build_semiglobal_aligner()
+    transition_aligner.substitution_matrix = substitution_matrices.Array(
+        "ACGT",
+        dims=2,
+        data=np.array(
+            [
+                [1.0, -1.0, 0.5, -1.0],
+                [-1.0, 1.0, -1.0, 0.5],
+                [0.5, -1.0, 1.0, -1.0],
+                [-1.0, 0.5, -1.0, 1.0],
+            ]
+        ),
+    )
+
+    assert aligner_scoring_key(identity_aligner) != aligner_scoring_key(
+        transition_aligner
+    )
+    assert aligner_scoring_key(identity_aligner) != aligner_scoring_key(
+        build_semiglobal_aligner()
+    )
+
+
+def test_shared_semiglobal_aligner_builds_once_per_scoring_tuple() -> None:
+    clear_aligner_pool()
+
+    default_aligner = shared_semiglobal_aligner()
+    assert shared_semiglobal_aligner(match_score=1, mismatch_score=-1) is (
+        default_aligner
+    )
+    strict_aligner = shared_semiglobal_aligner(mismatch_score=-2.0)
+
+    assert strict_aligner is not default_aligner
+    assert strict_aligner.mismatch_score == -2.0
+    assert default_aligner.open_internal_insertion_score == -3.0
+    assert aligner_pool_info().requests == 3
+    assert aligner_pool_info().constructions == 2
+    assert aligner_pool_info().size == 2
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
+import random
+
+import numpy as np
+import pytest
+
+from abi_sauce import assembly_multi
 from abi_sauce.assembly_exports import (
     consensus_record_from_multi_result,
     consensus_record_from_result,
     format_assembly_alignment_fasta,
 )
-from abi_sauce.assembly_multi import assemble_trimmed_multi
+from abi_sauce.assembly_multi import (
+    add_member_to_multi_assembly,
+    assemble_trimmed_multi,
+)
 from abi_sauce.assembly_pairwise import assemble_trimmed_pair
 from abi_sauce.assembly_presenters import assembly_conflicts_to_rows
-from abi_sauce.assembly_types import AssemblyConfig
+from abi_sauce.assembly_types import (
+    GRID_MISSING,
+    AssemblyConfig,
+    MultiAssemblyResult,
+)
 from abi_sauce.models import SequenceRecord, TraceData
+from abi_sauce.orientation import reverse_complement_sequence
 from abi_sauce.trimming import TrimConfig, trim_sequence_record
 
 
@@ -296,6 +310,230 @@ def test_assemble_trimmed_multi_builds_seeded_consensus_and_alignment_grid() ->
     assert consensus_record.annotations["assembly_included_member_count"] == 3
 
 
+def test_assemble_trimmed_multi_stores_member_by_column_grid() -> None:
+    raw_records = {
+        "seed.ab1": make_record(name="seed", sequence="AACCGGTTA", qualities=[40] * 9),
+        "shifted.ab1": make_record(
+            name="shifted",
+            sequence="ACCGGATTA",
+            qualities=[35] * 9,
+        ),
+    }
+    trim_results = {
+        source_filename: trim_sequence_record(record, TrimConfig())
+        for source_filename, record in raw_records.items()
+    }
+
+    result = assemble_trimmed_multi(
+        source_filenames=("seed.ab1", "shifted.ab1"),
+        raw_records_by_source_filename=raw_records,
+        trim_results_by_source_filename=trim_results,
+        config=AssemblyConfig(min_overlap_length=4, min_percent_identity=70.0),
+    )
+
+    grid = result.grid
+    assert grid.member_indices == (0, 1)
+    assert grid.base_codes.shape == (2, 10)
+    assert grid.non_gap_counts.tolist() == [1, 2, 2, 2, 2, 2, 1, 2, 2, 2]
+    assert grid.aligned_sequence(grid.row_position(1)) == "-ACCGGATTA"
+
+    gap_column = result.columns[0]
+    assert gap_column.member_cells[1].is_gap is True
+    assert gap_column.member_cells[1].query_pos is None
+    assert gap_column.gap_member_count == 1
+    assert result.columns[-1].member_cells[1].query_pos == 9
+    assert result.columns[-1].member_cells[1].quality == 35
+    assert result.columns[6].support_counts == (("A", 1),)
+    assert list(result.columns) == list(result.columns[:])
+
+
+def test_add_member_to_multi_assembly_matches_full_rebuild() -> None:
+    raw_records = {
+        "seed.ab1": make_record(name="seed", sequence="AACCGGTTA", qualities=[40] * 9),
+        "shifted.ab1": make_record(
+            name="shifted",
+            sequence="ACCGGATTA",
+            qualities=[35] * 9,
+        ),
+        "reverse.ab1": make_record(
+            name="reverse",
+            sequence="TAACCGGTT",
+            qualities=[30] * 9,
+        ),
+        "longer.ab1": make_record(
+            name="longer",
+            sequence="GAACCGGATTA",
+            qualities=[20] * 11,
+        ),
+    }
+    trim_results = {
+        source_filename: trim_sequence_record(record, TrimConfig())
+        for source_filename, record in raw_records.items()
+    }
+    config = AssemblyConfig(min_overlap_length=4, min_percent_identity=70.0)
+
+    def assemble(*source_filenames: str):
+        return assemble_trimmed_multi(
+            source_filenames=source_filenames,
+            raw_records_by_source_filename=raw_records,
+            trim_results_by_source_filename=trim_results,
+            config=config,
+        )
+
+    def add(result, source_filename: str):
+        return add_member_to_multi_assembly(
+            result,
+            source_filename=source_filename,
+            raw_records_by_source_filename=raw_records,
+            trim_results_by_source_filename=trim_results,
+            config=config,
+        )
+
+    extended = add(assemble("seed.ab1", "shifted.ab1"), "reverse.ab1")
+    assert extended == assemble("seed.ab1", "shifted.ab1", "reverse.ab1")
+    assert extended.members[2].chosen_orientation == "reverse_complement"
+    assert extended.gapped_consensus == "AACCGGATTA"
+
+    reseeded = add(extended, "longer.ab1")
+    assert reseeded.seed_member_index == 3
+    assert reseeded == assemble(
+        "seed.ab1",
+        "shifted.ab1",
+        "reverse.ab1",
+        "longer.ab1",
+    )
+
+
+def make_random_overlapping_records(seed: int) -> dict[str, SequenceRecord]:
+    rng = random.Random(seed)
+    template = "".join(rng.choice("ACGT") for _ in range(60))
+    records = {}
+    for read_position in range(rng.randint(3, 6)):
+        bases = list(template[rng.randint(0, 15) : rng.randint(45, 60)])
+        for _ in range(rng.randint(0, 4)):
+            edit = rng.random()
+            edit_position = rng.randrange(len(bases))
+            if edit < 0.4:
+                bases.insert(edit_position, rng.choice("ACGT"))
+            elif edit < 0.7:
+                del bases[edit_position]
+            else:
+                bases[edit_position] = rng.choice("ACGT")
+        sequence = "".join(bases)
+        if rng.random() < 0.3:
+            sequence = reverse_complement_sequence(sequence)
+        records[f"read_{read_position}.ab1"] = make_record(
+            name=f"read_{read_position}",
+            sequence=sequence,
+            qualities=[rng.randint(10, 40) for _ in sequence],
+        )
+    return records
+
+
+def test_add_member_to_multi_assembly_splices_into_existing_insertion_columns(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    raw_records = {
+        "seed.ab1": make_record(name="seed", sequence="AACCGGTTA", qualities=[40] * 9),
+        "shifted.ab1": make_record(
+            name="shifted",
+            sequence="ACCGGATTA",
+            qualities=[35] * 9,
+        ),
+        "inserted.ab1": make_record(
+            name="inserted",
+            sequence="CCGGATTA",
+            qualities=[30] * 8,
+        ),
+    }
+    trim_results = {
+        source_filename: trim_sequence_record(record, TrimConfig())
+        for source_filename, record in raw_records.items()
+    }
+    config = AssemblyConfig(min_overlap_length=4, min_percent_identity=70.0)
+    result = assemble_trimmed_multi(
+        source_filenames=("seed.ab1", "shifted.ab1"),
+        raw_records_by_source_filename=raw_records,
+        trim_results_by_source_filename=trim_results,
+        config=config,
+    )
+    expected = assemble_trimmed_multi(
+        source_filenames=("seed.ab1", "shifted.ab1", "inserted.ab1"),
+        raw_records_by_source_filename=raw_records,
+        trim_results_by_source_filename=trim_results,
+        config=config,
+    )
+
+    def fail_rebuild(**_kwargs: object) -> None:
+        raise AssertionError("the assembly should be extended in place")
+
+    monkeypatch.setattr(assembly_multi, "assemble_trimmed_multi", fail_rebuild)
+    extended = add_member_to_multi_assembly(
+        result,
+        source_filename="inserted.ab1",
+        raw_records_by_source_filename=raw_records,
+        trim_results_by_source_filename=trim_results,
+        config=config,
+    )
+
+    assert extended.grid.column_count == result.grid.column_count
+    assert extended.aligned_member_sequences[1:] == ("-ACCGGATTA", "--CCGGATTA")
+    assert extended == expected
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_add_member_to_multi_assembly_keeps_rebuild_layout_on_random_reads(
+    seed: int,
+) -> None:
+    raw_records = make_random_overlapping_records(seed)
+    trim_results = {
+        source_filename: trim_sequence_record(record, TrimConfig())
+        for source_filename, record in raw_records.items()
+    }
+    source_filenames = tuple(raw_records)
+    config = AssemblyConfig(min_overlap_length=8, min_percent_identity=70.0)
+
+    result = assemble_trimmed_multi(
+        source_filenames=source_filenames[:2],
+        raw_records_by_source_filename=raw_records,
+        trim_results_by_source_filename=trim_results,
+        config=config,
+    )
+    for member_count in range(3, len(source_filenames) + 1):
+        result = add_member_to_multi_assembly(
+            result,
+            source_filename=source_filenames[member_count - 1],
+            raw_records_by_source_filename=raw_records,
+            trim_results_by_source_filename=trim_results,
+            config=config,
+        )
+        rebuilt = assemble_trimmed_multi(
+            source_filenames=source_filenames[:member_count],
+            raw_records_by_source_filename=raw_records,
+            trim_results_by_source_filename=trim_results,
+            config=config,
+        )
+
+        # Insertion columns may be ordered differently when the new read is
+        # merged last, but every read and every seed-anchored column match.
+        assert result.members == rebuilt.members
+        assert [
+            sequence.replace("-", "") for sequence in result.aligned_member_sequences
+        ] == [
+            sequence.replace("-", "") for sequence in rebuilt.aligned_member_sequences
+        ]
+        assert np.array_equal(
+            _seed_anchored_base_codes(result),
+            _seed_anchored_base_codes(rebuilt),
+        )
+
+
+def _seed_anchored_base_codes(result: MultiAssemblyResult) -> np.ndarray:
+    grid = result.grid
+    seed_row = grid.query_indices[grid.row_position(result.seed_member_index)]
+    return grid.base_codes[:, seed_row != GRID_MISSING]
+
+
 def test_assemble_trimmed_multi_excludes_low_identity_members() -> None:
     seed_raw_record = make_record(
         name="seed",
@@ -4,9 +4,12 @@ import io
 import json
 import zipfile
 
+import pytest
+
 from abi_sauce.assembly_types import AssemblyConfig, MultiAssemblyResult
 from abi_sauce.assembly_state import AssemblyDefinition
 from abi_sauce.models import SequenceRecord, SequenceUpload, TraceData
+from abi_sauce.services import assembly_compute
 from abi_sauce.services.assembly_compute import (
     compute_saved_assemblies,
     compute_saved_assembly,
@@ -209,6 +212,61 @@ def test_select_assembly_export_can_include_rejected_consensus_records() -> None
     )
 
 
+def test_compute_saved_assemblies_extends_previous_multi_assembly_in_place(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    prepared_batch = make_prepared_batch()
+    config = AssemblyConfig(min_overlap_length=4, min_percent_identity=90.0)
+    previous_definition = AssemblyDefinition(
+        assembly_id="assembly-multi",
+        name="Amplicon Multi",
+        source_filenames=("left.ab1", "right.ab1"),
+        config=config,
+        engine_kind="multi",
+    )
+    extended_definition = AssemblyDefinition(
+        assembly_id="assembly-multi",
+        name="Amplicon Multi",
+        source_filenames=("left.ab1", "right.ab1", "short.ab1"),
+        config=config,
+        engine_kind="multi",
+    )
+    previous_assemblies = compute_saved_assemblies(
+        prepared_batch,
+        (previous_definition,),
+    )
+    expected_assemblies = compute_saved_assemblies(
+        prepared_batch,
+        (extended_definition,),
+    )
+
+    def fail_rebuild(**_kwargs: object) -> None:
+        raise AssertionError("the saved assembly should be extended in place")
+
+    monkeypatch.setattr(assembly_compute, "assemble_trimmed_multi", fail_rebuild)
+    extended_assemblies = compute_saved_assemblies(
+        prepared_batch,
+        (extended_definition,),
+        previous_assemblies=previous_assemblies,
+    )
+    reconfigured_assemblies = compute_saved_assemblies(
+        prepared_batch,
+        (
+            AssemblyDefinition(
+                assembly_id="assembly-multi",
+                name="Amplicon Multi",
+                source_filenames=("left.ab1", "right.ab1", "short.ab1"),
+                config=AssemblyConfig(min_overlap_length=5),
+                engine_kind="multi",
+            ),
+        ),
+        previous_assemblies=previous_assemblies,
+    )
+
+    assert extended_assemblies == expected_assemblies
+    assert reconfigured_assemblies["assembly-multi"].status == "error"
+
+
 def test_prepare_assembly_download_builds_concatenated_fasta() -> None:
     prepared_batch = make_prepared_batch()
     computed_assemblies = compute_saved_assemblies(
@@ -4,9 +4,11 @@ from abi_sauce.assembly_multi import assemble_trimmed_multi
 from abi_sauce.assembly_pairwise import assemble_trimmed_pair
 from abi_sauce.assembly_types import AssemblyConfig
 from abi_sauce.assembly_trace import (
+    PackedTraceSignal,
     build_multi_assembly_trace_view,
     build_pairwise_assembly_trace_view,
     resolve_assembly_trace_samples_per_cell,
+    resolve_trace_column_window,
 )
 from abi_sauce.models import SequenceRecord, TraceData
 from abi_sauce.trimming import TrimConfig, trim_sequence_record
@@ -99,16 +101,51 @@ def test_build_pairwise_assembly_trace_view_builds_row_bands_and_alignment_cells
     assert len(left_row.cells) == len(result.columns)
     assert len(right_row.cells) == len(result.columns)
 
-    right_gap_cells = [cell for cell in right_row.cells if cell.is_gap]
-    assert right_gap_cells
-    assert all(cell.channels == () for cell in right_gap_cells)
+    right_gap_positions = [
+        position for position, cell in enumerate(right_row.cells) if cell.is_gap
+    ]
+    assert right_gap_positions
+    assert all(
+        right_row.cell_channels(position) == () for position in right_gap_positions
+    )
+
+    populated_left_positions = [
+        position
+        for position, cell in enumerate(left_row.cells)
+        if cell.has_trace_signal
+    ]
+    assert populated_left_positions
+    first_channels = left_row.cell_channels(populated_left_positions[0])
+    assert len(first_channels) == 4
+    assert all(len(channel.x_values) == 16 for channel in first_channels)
+    assert all(len(channel.normalized_signal) == 16 for channel in first_channels)
+    assert left_row.packed_signal.signal.shape == (
+        4,
+        len(populated_left_positions),
+        16,
+    )
+    assert not left_row.packed_signal.signal.flags.writeable
+    assert left_row.packed_signal == PackedTraceSignal(
+        channel_bases=left_row.packed_signal.channel_bases,
+        channel_colors=left_row.packed_signal.channel_colors,
+        samples_per_cell=left_row.packed_signal.samples_per_cell,
+        traced_cells=left_row.packed_signal.traced_cells.copy(),
+        signal=left_row.packed_signal.signal.copy(),
+    )
 
-    populated_left_cells = [cell for cell in left_row.cells if cell.has_trace_signal]
-    assert populated_left_cells
-    first_cell = populated_left_cells[0]
-    assert len(first_cell.channels) == 4
-    assert all(len(channel.x_values) == 16 for channel in first_cell.channels)
-    assert all(len(channel.normalized_signal) == 16 for channel in first_cell.channels)
+    for row in trace_view.rows:
+        x_values, signal = row.traced_channel_arrays()
+        traced_positions = row.packed_signal.traced_positions.tolist()
+        assert traced_positions == [
+            position for position, cell in enumerate(row.cells) if cell.has_trace_signal
+        ]
+        assert x_values.shape == (len(traced_positions), 16)
+        for traced_index, position in enumerate(traced_positions):
+            channels = row.cell_channels(position)
+            assert x_values[traced_index].tolist() == list(channels[0].x_values)
+            assert [
+                list(channel.normalized_signal) for channel in channels
+            ] == signal[:, traced_index, :].tolist()
 
 
 def test_build_pairwise_assembly_trace_view_carries_raw_base_spans_into_cells() -> None:
@@ -256,8 +293,8 @@ def test_build_pairwise_assembly_trace_view_degrades_without_renderable_trace_da
     left_row, right_row = trace_view.rows
     assert left_row.has_trace_signal is False
     assert right_row.has_trace_signal is False
-    assert all(cell.channels == () for cell in left_row.cells)
-    assert all(cell.channels == () for cell in right_row.cells)
+    assert not any(cell.has_trace_signal for cell in left_row.cells)
+    assert not any(cell.has_trace_signal for cell in right_row.cells)
     assert left_row.aligned_sequence == result.aligned_left
     assert right_row.aligned_sequence == result.aligned_right
 
@@ -329,8 +366,8 @@ def test_build_multi_assembly_trace_view_builds_one_row_per_included_member() ->
     assert seed_cell.base == "-"
     assert shifted_cell.base == "A"
     assert reverse_cell.base == "-"
-    assert seed_cell.channels == ()
-    assert reverse_cell.channels == ()
+    assert trace_view.rows[0].cell_channels(insertion_column_index) == ()
+    assert trace_view.rows[2].cell_channels(insertion_column_index) == ()
     assert shifted_cell.has_trace_signal is True
 
 
@@ -372,3 +409,79 @@ def test_resolve_assembly_trace_samples_per_cell_reduces_for_large_views() -> No
         )
         == 8
     )
+
+
+def test_build_pairwise_assembly_trace_view_builds_only_windowed_cells() -> None:
+    left_raw_record = make_record(
+        name="left",
+        sequence="CCCCAAAAC",
+        qualities=[40] * 9,
+        base_positions=[5, 15, 25, 35, 45, 55, 65, 75, 85],
+    )
+    right_raw_record = make_record(
+        name="right",
+        sequence="GTTTT",
+        qualities=[40] * 5,
+        base_positions=[10, 20, 30, 40, 50],
+    )
+    left_trim_result = trim_sequence_record(left_raw_record, TrimConfig())
+    right_trim_result = trim_sequence_record(right_raw_record, TrimConfig())
+    result = assemble_trimmed_pair(
+        left_source_filename="left.ab1",
+        left_raw_record=left_raw_record,
+        left_trim_result=left_trim_result,
+        right_source_filename="right.ab1",
+        right_raw_record=right_raw_record,
+        right_trim_result=right_trim_result,
+        config=AssemblyConfig(min_overlap_length=4, min_percent_identity=90.0),
+    )
+    full_view = build_pairwise_assembly_trace_view(
+        result=result,
+        left_source_filename="left.ab1",
+        left_raw_record=left_raw_record,
+        left_trim_result=left_trim_result,
+        right_source_filename="right.ab1",
+        right_raw_record=right_raw_record,
+        right_trim_result=right_trim_result,
+    )
+    windowed_view = build_pairwise_assembly_trace_view(
+        result=result,
+        left_source_filename="left.ab1",
+        left_raw_record=left_raw_record,
+        left_trim_result=left_trim_result,
+        right_source_filename="right.ab1",
+        right_raw_record=right_raw_record,
+        right_trim_result=right_trim_result,
+        column_window=(2, 6),
+    )
+
+    assert windowed_view.is_windowed
+    assert windowed_view.columns == full_view.columns
+    assert windowed_view.x_range == full_view.x_range
+    assert windowed_view.window_columns == full_view.columns[2:6]
+    for windowed_row, full_row in zip(
+        windowed_view.rows, full_view.rows, strict=True
+    ):
+        assert windowed_row.cells == full_row.cells[2:6]
+        assert windowed_row.y_bottom == full_row.y_bottom
+
+
+def test_resolve_trace_column_window_skips_short_alignments_and_snaps_viewports() -> (
+    None
+):
+    assert resolve_trace_column_window(alignment_length=150) is None
+    assert resolve_trace_column_window(
+        alignment_length=1000,
+        first_visible_column_index=400,
+    ) == (270, 510)
+    assert resolve_trace_column_window(
+        alignment_length=1000,
+        first_visible_column_index=401,
+    ) == resolve_trace_column_window(
+        alignment_length=1000,
+        first_visible_column_index=449,
+    )
+    assert resolve_trace_column_window(
+        alignment_length=1000,
+        first_visible_column_index=990,
+    ) == (810, 1000)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import numpy as np
+import pytest
+
 from abi_sauce.assembly_multi import assemble_trimmed_multi
 from abi_sauce.assembly_pairwise import assemble_trimmed_pair
 from abi_sauce.assembly_types import AssemblyConfig
 from abi_sauce.assembly_trace import (
+    AssemblyTraceRow,
     build_multi_assembly_trace_view,
     build_pairwise_assembly_trace_view,
 )
@@ -209,3 +213,66 @@ def test_build_assembly_trace_figure_supports_multi_trace_views() -> None:
     )
     assert all("support=" in value for value in consensus_hover.customdata)
     assert all("left=" not in value for value in consensus_hover.customdata)
+
+
+def test_build_assembly_trace_figure_batches_rows_into_shared_traces() -> None:
+    trace_view = make_multi_trace_view()
+
+    per_row_figure = build_assembly_trace_figure(trace_view)
+    figure = build_assembly_trace_figure(trace_view, batch_rows=True)
+
+    traces_by_name = {trace.name: trace for trace in figure.data}
+    per_row_hover = [
+        trace for trace in per_row_figure.data if trace.name.endswith(" hover")
+    ][1:]
+    assert list(traces_by_name) == [
+        "Consensus background",
+        "Consensus",
+        "Consensus hover",
+        "Row backgrounds",
+        "Rows:G",
+        "Rows:A",
+        "Rows:T",
+        "Rows:C",
+        "Row bases",
+        "Row hover",
+    ]
+    assert len(figure.layout.shapes) == len(trace_view.rows)
+    assert [list(values) for values in traces_by_name["Row hover"].customdata] == [
+        list(values) for trace in per_row_hover for values in trace.customdata
+    ]
+    np.testing.assert_array_equal(
+        traces_by_name["Rows:G"].y,
+        np.concatenate(
+            [trace.y for trace in per_row_figure.data if trace.name.endswith(":G")]
+        ),
+    )
+    assert figure.layout == per_row_figure.layout
+
+
+@pytest.mark.parametrize("batch_rows", [False, True])
+def test_build_assembly_trace_figure_packs_row_arrays_once_per_row(
+    monkeypatch: pytest.MonkeyPatch,
+    batch_rows: bool,
+) -> None:
+    trace_view = make_multi_trace_view()
+    original_traced_channel_arrays = AssemblyTraceRow.traced_channel_arrays
+    calls: list[str] = []
+
+    def counting_traced_channel_arrays(
+        row: AssemblyTraceRow,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        calls.append(row.display_name)
+        return original_traced_channel_arrays(row)
+
+    monkeypatch.setattr(
+        AssemblyTraceRow,
+        "traced_channel_arrays",
+        counting_traced_channel_arrays,
+    )
+
+    build_assembly_trace_figure(trace_view, batch_rows=batch_rows)
+
+    assert calls == [
+        row.display_name for row in trace_view.rows if row.has_trace_signal
+    ]
@@ -9,6 +9,7 @@ import pytest
 from abi_sauce.exceptions import AbiParseError, ExportError
 from abi_sauce.models import SequenceOrientation, SequenceRecord, SequenceUpload
 from abi_sauce.services.batch_export import prepare_batch_download, select_batch_export
+from abi_sauce.services.batch_report import build_batch_chromatogram_report
 from abi_sauce.services.batch_parse import (
     ParsedBatch,
     build_batch_signature,
@@ -385,3 +386,28 @@ def test_prepare_batch_download_propagates_serializer_errors() -> None:
             concatenate_batch=True,
             filename_stem="bad-batch",
         )
+
+
+def test_build_batch_chromatogram_report_paginates_reads_and_trim_summaries() -> None:
+    prepared_batch = apply_trim_config(
+        make_parsed_batch(),
+        TrimConfig(left_trim=1, right_trim=1, min_length=3),
+    )
+
+    report = build_batch_chromatogram_report(
+        prepared_batch,
+        filename_stem="plate-7",
+        entries_per_page=1,
+        max_workers=1,
+    )
+
+    assert report.filename == "plate-7.html"
+    assert report.mime == "text/html"
+    assert [entry.source_filename for entry in report.entries] == ["a.ab1", "b.ab1"]
+    assert report.entries[0].trimmed_region_label == (
+        "bases 2-5 of 6 retained (4 bp)"
+    )
+    assert report.entries[0].svg is None
+    assert report.entries[0].render_failure_reason == "missing_trace_data"
+    assert report.data.count('<section class="page">') == 2
+    assert "fails minimum length" in report.data
@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
 from abi_sauce.chromatogram import (
     build_chromatogram_column_view,
     build_chromatogram_view,
+    build_oriented_chromatogram_view,
+    chromatogram_signal_pyramid,
+    chromatogram_view_cache_info,
+    clear_chromatogram_view_cache,
 )
 from abi_sauce.models import SequenceOrientation, SequenceRecord, TraceData
 from abi_sauce.trimming import TrimConfig, TrimResult, trim_sequence_record
@@ -375,6 +383,84 @@ def test_build_chromatogram_view_reverse_complements_trim_boundaries_and_retaine
     assert view.has_any_retained_samples is True
 
 
+def test_build_chromatogram_view_reuses_cached_forward_geometry() -> None:
+    clear_chromatogram_view_cache()
+    record = make_record(trace_data=make_trace_data())
+    reverse_record = make_record(
+        trace_data=make_trace_data(),
+        orientation="reverse_complement",
+    )
+
+    forward_view = build_chromatogram_view(record)
+    reverse_view = build_chromatogram_view(reverse_record)
+
+    assert build_chromatogram_view(record) is forward_view
+    assert reverse_view == build_chromatogram_view(reverse_record, use_cache=False)
+    assert (
+        build_oriented_chromatogram_view(record, orientation="reverse_complement")
+        is reverse_view
+    )
+    assert chromatogram_signal_pyramid(reverse_view).channel_values(0).tolist() == (
+        list(reverse_view.channels[0].signal)
+    )
+    info = chromatogram_view_cache_info()
+    assert (info.hits, info.misses, info.size) == (3, 1, 1)
+
+    assert record.trace_data is not None
+    record.trace_data.channels["DATA9"][0] = 99
+    assert build_chromatogram_view(record).channels[0].signal[0] == 99
+    assert chromatogram_view_cache_info().size == 2
+
+
+def test_build_chromatogram_view_stamps_content_fingerprints() -> None:
+    clear_chromatogram_view_cache()
+    record = make_record(trace_data=make_trace_data())
+    trim_result = trim_sequence_record(record, TrimConfig(left_trim=1))
+
+    forward_view = build_chromatogram_view(record)
+    reverse_view = build_oriented_chromatogram_view(
+        record,
+        orientation="reverse_complement",
+    )
+    trimmed_view = build_chromatogram_view(record, trim_result)
+
+    assert forward_view.fingerprint is not None
+    assert (
+        build_chromatogram_view(record, use_cache=False).fingerprint
+        == forward_view.fingerprint
+    )
+    fingerprints = {
+        forward_view.fingerprint,
+        reverse_view.fingerprint,
+        trimmed_view.fingerprint,
+    }
+    assert len(fingerprints) == 3
+    assert build_chromatogram_view(make_record()).fingerprint is not None
+
+
+def test_build_oriented_chromatogram_view_shares_reverse_view_across_threads() -> None:
+    clear_chromatogram_view_cache()
+    record = make_record(trace_data=make_trace_data())
+    build_chromatogram_view(record)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        reverse_views = list(
+            executor.map(
+                lambda _index: build_oriented_chromatogram_view(
+                    record,
+                    orientation="reverse_complement",
+                ),
+                range(32),
+            )
+        )
+
+    assert all(view is reverse_views[0] for view in reverse_views)
+    assert (
+        build_oriented_chromatogram_view(record, orientation="reverse_complement")
+        is reverse_views[0]
+    )
+
+
 def test_build_chromatogram_column_view_projects_trace_onto_unit_width_base_columns() -> (
     None
 ):
@@ -409,8 +495,14 @@ def test_build_chromatogram_column_view_projects_trace_onto_unit_width_base_colu
     )
     assert view.trim_boundaries.left == 1.0
     assert view.trim_boundaries.right == 3.0
-    assert all(len(column.channels) == 4 for column in view.columns)
-    assert all(len(column.channels[0].x_values) == 16 for column in view.columns)
+    assert all(
+        len(view.column_channels(position)) == 4
+        for position in range(len(view.columns))
+    )
+    assert all(
+        len(view.column_channels(position)[0].x_values) == 16
+        for position in range(len(view.columns))
+    )
 
 
 def test_build_chromatogram_column_view_respects_reverse_complement_display_space() -> (
@@ -448,3 +540,60 @@ def test_build_chromatogram_column_view_respects_reverse_complement_display_spac
     )
     assert view.trim_boundaries.left == 1.0
     assert view.trim_boundaries.right == 3.0
+
+
+def test_build_chromatogram_column_view_handles_collapsed_and_unplaced_base_calls() -> (
+    None
+):
+    record = make_record(
+        sequence="ACNT",
+        qualities=[40, 30],
+        trace_data=make_trace_data(base_positions=[2, 4, 4, 60]),
+    )
+
+    view = build_chromatogram_column_view(record, samples_per_base=4)
+
+    assert tuple(column.trace_x for column in view.columns) == (2, 4, 4)
+    assert tuple(column.raw_left for column in view.columns) == (1.0, 3.0, None)
+    assert tuple(column.raw_right for column in view.columns) == (3.0, 4.0, None)
+    assert tuple(column.raw_center for column in view.columns) == (2.0, 4.0, 4.0)
+    assert tuple(column.quality for column in view.columns) == (40, 30, None)
+    assert tuple(column.peak_height for column in view.columns) == (2, 4, 4)
+    assert tuple(column.has_trace_signal for column in view.columns) == (
+        True,
+        True,
+        False,
+    )
+    assert tuple(len(view.column_channels(position)) for position in range(3)) == (
+        4,
+        4,
+        0,
+    )
+    first_channel = view.column_channels(0)[0]
+    assert first_channel.x_values == pytest.approx((0.0, 1 / 3, 2 / 3, 1.0))
+    assert first_channel.signal == pytest.approx((1.0, 5 / 3, 7 / 3, 3.0))
+
+
+def test_chromatogram_column_view_packs_traced_columns_in_channel_order() -> None:
+    record = make_record(
+        sequence="ACNT",
+        qualities=[40, 30],
+        trace_data=make_trace_data(base_positions=[2, 4, 4, 60]),
+    )
+    view = build_chromatogram_column_view(record, samples_per_base=4)
+
+    packed_signal = view.packed_signal
+
+    assert packed_signal.traced_columns.tolist() == [0, 1]
+    assert packed_signal.x_values.shape == (2, 4)
+    assert packed_signal.signal.shape == (4, 2, 4)
+    assert packed_signal.channel_bases == tuple(
+        channel.base for channel in view.column_channels(1)
+    )
+    assert packed_signal.signal[0, 1].tolist() == pytest.approx(
+        view.column_channels(1)[0].signal
+    )
+    assert view.column_channels(1)[0].x_values == pytest.approx(
+        tuple(packed_signal.x_values[1].tolist())
+    )
+    assert view == build_chromatogram_column_view(record, samples_per_base=4)
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
 
 from abi_sauce.chromatogram import (
     ChromatogramBaseCall,
     ChromatogramChannel,
     ChromatogramColumn,
-    ChromatogramColumnChannel,
     ChromatogramColumnView,
     ChromatogramQualitySegment,
     ChromatogramTrimBoundaries,
     ChromatogramView,
+    PackedColumnSignal,
 )
 from abi_sauce.chromatogram_figure import (
     build_chromatogram_column_figure,
@@ -94,20 +95,7 @@ def make_column_view(
             raw_left=0.0,
             raw_right=2.0,
             raw_center=1.0,
-            channels=(
-                ChromatogramColumnChannel(
-                    base="G",
-                    color="black",
-                    x_values=(0.0, 0.5, 1.0),
-                    signal=(0.0, 6.0, 0.0),
-                ),
-                ChromatogramColumnChannel(
-                    base="A",
-                    color="green",
-                    x_values=(0.0, 0.5, 1.0),
-                    signal=(1.0, 4.0, 1.0),
-                ),
-            ),
+            has_trace_signal=True,
         ),
         ChromatogramColumn(
             column_index=2,
@@ -125,20 +113,7 @@ def make_column_view(
             raw_left=2.0,
             raw_right=4.0,
             raw_center=3.0,
-            channels=(
-                ChromatogramColumnChannel(
-                    base="G",
-                    color="black",
-                    x_values=(1.0, 1.5, 2.0),
-                    signal=(0.0, 5.0, 0.0),
-                ),
-                ChromatogramColumnChannel(
-                    base="A",
-                    color="green",
-                    x_values=(1.0, 1.5, 2.0),
-                    signal=(1.0, 3.0, 1.0),
-                ),
-            ),
+            has_trace_signal=True,
         ),
     )
     return ChromatogramColumnView(
@@ -147,6 +122,17 @@ def make_column_view(
         trim_boundaries=ChromatogramTrimBoundaries(left=1.0, right=None),
         cell_width=1.0,
         samples_per_base=3,
+        packed_signal=PackedColumnSignal(
+            channel_bases=("G", "A"),
+            traced_columns=np.array([0, 1]),
+            x_values=np.array([[0.0, 0.5, 1.0], [1.0, 1.5, 2.0]]),
+            signal=np.array(
+                [
+                    [[0.0, 6.0, 0.0], [0.0, 5.0, 0.0]],
+                    [[1.0, 4.0, 1.0], [1.0, 3.0, 1.0]],
+                ]
+            ),
+        ),
     )
 
 
@@ -386,3 +372,57 @@ def test_build_chromatogram_column_figure_mutes_trimmed_columns_and_overlays_ret
         "rgba(223, 240, 250, 0.95)",
         "rgba(190, 190, 190, 0.45)",
     )
+
+
+def test_build_chromatogram_figure_decimates_trace_outside_the_visible_window() -> (
+    None
+):
+    signal = tuple((index * 37) % 1001 for index in range(20000))
+    figure = build_chromatogram_figure(
+        ChromatogramView(
+            is_renderable=True,
+            x_values=tuple(range(20000)),
+            channels=(
+                ChromatogramChannel(
+                    data_key="DATA9",
+                    base="G",
+                    color="black",
+                    signal=signal,
+                ),
+            ),
+            retained_sample_range=(1000.0, 18999.0),
+        ),
+        x_range=(10000.0, 10400.0),
+        plot_width_px=400,
+    )
+
+    trace_x = tuple(int(x) for x in figure.data[0].x)
+    retained_x = tuple(int(x) for x in figure.data[1].x)
+
+    assert tuple(figure.layout.xaxis.range) == (10000.0, 10400.0)
+    assert len(trace_x) < 6000
+    assert trace_x[0] == 0 and trace_x[-1] == 19999
+    assert set(range(9600, 10801)) <= set(trace_x)
+    assert tuple(figure.data[0].y) == tuple(signal[x] for x in trace_x)
+    assert max(figure.data[0].y) == max(signal)
+    assert retained_x == tuple(x for x in trace_x if 1000 <= x <= 18999)
+
+
+def test_build_chromatogram_column_figure_joins_column_segments_with_nan_gaps() -> (
+    None
+):
+    figure = build_chromatogram_column_figure(
+        make_column_view(retained_flags=(True, False))
+    )
+
+    g_trace, g_retained_trace = figure.data[:2]
+    np.testing.assert_array_equal(
+        g_trace.x,
+        [0.0, 0.5, 1.0, np.nan, 1.0, 1.5, 2.0, np.nan],
+    )
+    np.testing.assert_array_equal(
+        g_trace.y,
+        [0.0, 6.0, 0.0, np.nan, 0.0, 5.0, 0.0, np.nan],
+    )
+    np.testing.assert_array_equal(g_retained_trace.x, [0.0, 0.5, 1.0, np.nan])
+    np.testing.assert_array_equal(g_retained_trace.y, [0.0, 6.0, 0.0, np.nan])
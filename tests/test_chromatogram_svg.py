@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import re
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from abi_sauce.assembly_pairwise import assemble_trimmed_pair
+from abi_sauce.assembly_trace import build_pairwise_assembly_trace_view
+from abi_sauce.assembly_types import AssemblyConfig
+from abi_sauce.chromatogram import build_chromatogram_view
+from abi_sauce.chromatogram_svg import (
+    render_assembly_trace_svg,
+    render_chromatogram_svg,
+)
+from abi_sauce.models import SequenceRecord, TraceData
+from abi_sauce.trimming import TrimConfig, trim_sequence_record
+
+_SVG_NAMESPACE = "{http://www.w3.org/2000/svg}"
+
+
+def make_record(
+    *,
+    name: str,
+    sequence: str,
+    base_positions: list[int],
+    trace_length: int = 200,
+) -> SequenceRecord:
+    return SequenceRecord(
+        record_id=f"{name}_id",
+        name=name,
+        description="synthetic svg record",
+        sequence=sequence,
+        source_format="abi",
+        trace_data=TraceData(
+            channels={
+                "DATA9": [value % 17 for value in range(trace_length)],
+                "DATA10": [value % 23 for value in range(trace_length)],
+                "DATA11": [value % 29 for value in range(trace_length)],
+                "DATA12": [value % 31 for value in range(trace_length)],
+            },
+            base_positions=base_positions,
+            channel_order="GATC",
+        ),
+    )
+
+
+def test_render_chromatogram_svg_decimates_channels_and_shades_trim() -> None:
+    record = make_record(
+        name="trace",
+        sequence="ACGTACGT",
+        base_positions=[1000 * index + 500 for index in range(8)],
+        trace_length=8000,
+    )
+    trim_result = trim_sequence_record(record, TrimConfig(left_trim=2, right_trim=1))
+    view = build_chromatogram_view(record, trim_result)
+
+    svg = render_chromatogram_svg(view, width_px=200, height_px=80)
+    root = ET.fromstring(svg)
+
+    assert root.get("viewBox") == "0 0 200 80"
+    polylines = root.findall(f"{_SVG_NAMESPACE}polyline")
+    assert [polyline.get("stroke") for polyline in polylines] == [
+        channel.color for channel in view.channels
+    ]
+    for polyline in polylines:
+        points = [
+            tuple(float(value) for value in point.split(","))
+            for point in polyline.get("points", "").split()
+        ]
+        assert len(points) <= 2 * 200 + 6
+        assert points[0][0] == pytest.approx(4.0)
+        assert points[-1][0] == pytest.approx(196.0)
+        assert all(4.0 <= y <= 76.0 for _x, y in points)
+    trimmed_rects = [
+        rect
+        for rect in root.findall(f"{_SVG_NAMESPACE}rect")
+        if rect.get("fill") == "#BEBEBE"
+    ]
+    assert len(trimmed_rects) == 2
+    assert float(trimmed_rects[0].get("x", "")) == 0.0
+
+
+def test_render_assembly_trace_svg_draws_one_path_per_row_channel() -> None:
+    left_raw_record = make_record(
+        name="left",
+        sequence="AAAACCCCTTTT",
+        base_positions=[5, 15, 25, 35, 45, 55, 65, 75, 85, 95, 105, 115],
+    )
+    right_raw_record = make_record(
+        name="right<2>",
+        sequence="CCCCTGTT",
+        base_positions=[5, 15, 25, 35, 45, 55, 65, 75],
+    )
+    left_trim_result = trim_sequence_record(left_raw_record, TrimConfig(left_trim=4))
+    right_trim_result = trim_sequence_record(right_raw_record, TrimConfig())
+    result = assemble_trimmed_pair(
+        left_source_filename="left.ab1",
+        left_raw_record=left_raw_record,
+        left_trim_result=left_trim_result,
+        right_source_filename="right.ab1",
+        right_raw_record=right_raw_record,
+        right_trim_result=right_trim_result,
+        config=AssemblyConfig(min_overlap_length=8, min_percent_identity=70.0),
+    )
+    view = build_pairwise_assembly_trace_view(
+        result=result,
+        left_source_filename="left.ab1",
+        left_raw_record=left_raw_record,
+        left_trim_result=left_trim_result,
+        right_source_filename="right.ab1",
+        right_raw_record=right_raw_record,
+        right_trim_result=right_trim_result,
+    )
+
+    svg = render_assembly_trace_svg(view, width_px=400, row_height_px=50)
+    root = ET.fromstring(svg)
+
+    assert root.get("height") == str(50 * len(view.rows))
+    paths = root.findall(f"{_SVG_NAMESPACE}path")
+    traced_rows = [row for row in view.rows if row.packed_signal.traced_cell_count]
+    assert len(paths) == sum(
+        len(row.packed_signal.channel_bases) for row in traced_rows
+    )
+    assert len(re.findall("M", paths[0].get("d", ""))) == (
+        traced_rows[0].packed_signal.traced_cell_count
+    )
+    assert [text.text for text in root.findall(f"{_SVG_NAMESPACE}text")] == [
+        row.display_name for row in view.rows
+    ]
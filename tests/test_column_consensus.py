@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import numpy as np
+
+from abi_sauce.assembly_types import GRID_MISSING
+from abi_sauce.column_consensus import CONSENSUS_RESOLUTIONS, call_column_consensus
+
+
+def test_call_column_consensus_ranks_support_then_quality_then_base() -> None:
+    base_codes = np.frombuffer(b"AACTA-AGCCG-C-C-T-", dtype=np.uint8).reshape(3, 6)
+    qualities = np.asarray(
+        [
+            [30, 30, 30, 20, 30, GRID_MISSING],
+            [30, 10, 30, 20, 30, GRID_MISSING],
+            [30, 10, 30, 20, 30, GRID_MISSING],
+        ],
+        dtype=np.int32,
+    )
+    gap_mask = base_codes == ord("-")
+
+    consensus = call_column_consensus(
+        base_codes=base_codes,
+        qualities=qualities,
+        gap_mask=gap_mask,
+        quality_margin=5,
+        allow_deleted=np.asarray([False] * 5 + [True]),
+    )
+
+    assert consensus.consensus_codes.tobytes() == b"AACNN-"
+    assert [
+        CONSENSUS_RESOLUTIONS[code] for code in consensus.resolution_codes.tolist()
+    ] == [
+        "majority_resolved",
+        "quality_resolved",
+        "concordant",
+        "ambiguous",
+        "ambiguous",
+        "deleted",
+    ]
+    assert consensus.support_count_items(4) == (("A", 1), ("G", 1), ("T", 1))
+    assert consensus.quality_sum_items(1) == (("A", 30), ("G", 10))
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import plotly.graph_objects as go
+
+from abi_sauce.figure_spec import figure_spec, update_figure_spec_layout
+
+
+def test_figure_spec_packs_numeric_trace_arrays_and_keeps_gaps() -> None:
+    figure = go.Figure()
+    figure.add_trace(
+        go.Scattergl(
+            x=[0.0, 1.0, 2.0, None, 4.0, 5.0, 6.0, 7.0, 8.0],
+            y=[1, 2, 3, None, 5, 6, 7, 8, 9],
+            text=["A", "C", "G", "", "T", "A", "C", "G", "T"],
+            mode="lines",
+        )
+    )
+    figure.add_trace(go.Scattergl(x=[0, 1], y=[2, 3], mode="markers"))
+
+    spec = figure_spec(figure)
+    gapped_trace, short_trace = spec["data"]
+
+    assert isinstance(gapped_trace["x"], np.ndarray)
+    assert math.isnan(gapped_trace["y"][3])
+    assert gapped_trace["y"][8] == 9
+    assert list(gapped_trace["text"]) == list(figure.data[0].text)
+    assert list(short_trace["x"]) == [0, 1]
+    assert spec["layout"] == figure.to_plotly_json()["layout"]
+
+
+def test_update_figure_spec_layout_merges_nested_layout_keys() -> None:
+    figure = go.Figure()
+    figure.update_xaxes(title_text="Sample index", range=[0, 10])
+    spec = figure_spec(figure)
+
+    updated = update_figure_spec_layout(spec, xaxis={"range": [2, 4]}, height=300)
+
+    assert updated["layout"]["xaxis"]["range"] == [2, 4]
+    assert updated["layout"]["xaxis"]["title"] == spec["layout"]["xaxis"]["title"]
+    assert updated["layout"]["height"] == 300
+    assert spec["layout"]["xaxis"]["range"] == [0, 10]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from abi_sauce.alignment_policy import build_semiglobal_aligner
+from abi_sauce.insertion_merge import InsertionBucketMerger
+
+
+def test_insertion_bucket_merger_reuses_alignments_across_buckets() -> None:
+    merger = InsertionBucketMerger(build_semiglobal_aligner())
+
+    columns = merger.merge(["ACGT", "ACGT", "ACT", "ACGT", "ACT"])
+
+    assert columns == (
+        {0: 0, 1: 0, 2: 0, 3: 0, 4: 0},
+        {0: 1, 1: 1, 2: 1, 3: 1, 4: 1},
+        {0: 2, 1: 2, 2: 2, 3: 2, 4: 2},
+        {0: 3, 1: 3, 3: 3},
+    )
+    assert merger.aligner_call_count == 1
+
+    assert merger.merge(["ACGT", "ACT"]) == (
+        {0: 0, 1: 0},
+        {0: 1, 1: 1},
+        {0: 2, 1: 2},
+        {0: 3},
+    )
+    assert merger.aligner_call_count == 1
+
+
+def test_insertion_bucket_merger_opens_columns_for_unaligned_bases() -> None:
+    merger = InsertionBucketMerger(build_semiglobal_aligner())
+
+    assert merger.merge(["", "GA", "T"]) == ({2: 0}, {1: 0}, {1: 1})
+
+
+def test_insertion_bucket_merger_places_one_sequence_against_existing_columns() -> (
+    None
+):
+    merger = InsertionBucketMerger(build_semiglobal_aligner())
+
+    assert merger.place(["AA", "CCG", "G"], "ACT") == ((0, 0), (1, 1), (2, 2))
+    assert merger.place(["A", "C"], "AC") == ((0, 0), (1, 1))
+    assert merger.place([], "GA") == ((-1, 0), (-1, 1))
+    assert merger.aligner_call_count == 1
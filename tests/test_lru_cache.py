@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+
+from abi_sauce.lru_cache import LruCache, LruCacheInfo
+
+
+def test_lru_cache_evicts_least_recently_used_entry_and_counts_lookups() -> None:
+    cache: LruCache[str, int | None] = LruCache(2)
+    cache.store("a", 1)
+    cache.store("b", None)
+
+    assert cache.lookup("b") == (True, None)
+    assert cache.get("a") == 1
+    cache.store("c", 3)
+
+    assert cache.lookup("b") == (False, None)
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.info() == LruCacheInfo(hits=4, misses=1, size=2, max_entries=2)
+
+    cache.clear()
+    assert cache.info() == LruCacheInfo(hits=0, misses=0, size=0, max_entries=2)
+
+
+def test_lru_cache_rejects_non_positive_capacity() -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        LruCache(0)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+import pytest
+
+from abi_sauce.parallel import ordered_process_map, resolve_max_workers
+
+
+def test_resolve_max_workers_clamps_to_item_count() -> None:
+    assert resolve_max_workers(8, 3) == 3
+    assert resolve_max_workers(1, 10) == 1
+    assert resolve_max_workers(None, 0) == 1
+    assert resolve_max_workers(None, 1) == 1
+
+    with pytest.raises(ValueError):
+        resolve_max_workers(0, 4)
+
+
+def test_ordered_process_map_preserves_input_order() -> None:
+    items = tuple(range(12))
+
+    assert ordered_process_map(abs, items, max_workers=2, min_items=2) == list(items)
+    assert ordered_process_map(abs, items, max_workers=1) == list(items)
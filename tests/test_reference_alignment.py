@@ -181,3 +181,33 @@ def test_alignment_events_use_display_trace_coordinates_for_reverse_complement_s
     assert event_rows[0]["type"] == "mismatch"
     assert event_rows[0]["query_pos"] == 5
     assert event_rows[0]["trace_x"] == 94
+
+
+def test_deletion_run_events_use_nearest_non_gap_query_flanks() -> None:
+    raw_record = make_record(
+        name="trace_deletion_run",
+        sequence="GATTACAGCACTGACGTCAG",
+        qualities=list(range(10, 30)),
+    )
+    trim_result = trim_sequence_record(raw_record, TrimConfig())
+
+    alignment_result = align_trimmed_read_to_reference(
+        raw_record=raw_record,
+        trim_result=trim_result,
+        reference_text="GATTACAGCATTTTTCTGACGTCAG",
+        strand_policy="forward",
+        context_window=2,
+    )
+    deletion_events = [
+        event for event in alignment_result.events if event.event_type == "deletion"
+    ]
+
+    assert alignment_result.aligned_query == "GATTACAGCA-----CTGACGTCAG"
+    assert [event.ref_pos for event in deletion_events] == [11, 12, 13, 14, 15]
+    assert {(event.flank_q_left, event.flank_q_right) for event in deletion_events} == {
+        (19, 20)
+    }
+    assert {event.context_query for event in deletion_events} == {"CACTG"}
+    assert deletion_events[0].context_ref == "CATTT"
+    assert alignment_result.events[0].flank_q_left is None
+    assert alignment_result.events[-1].flank_q_right is None
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 from abi_sauce.assembly_types import AssemblyConfig
 from abi_sauce.models import SequenceRecord, TraceData
 from abi_sauce.reference_alignment_multi import align_trimmed_reads_to_reference
+from abi_sauce.reference_alignment_multi_exports import (
+    format_reference_multi_alignment_fasta,
+)
 from abi_sauce.trimming import TrimConfig, trim_sequence_record
 
 
@@ -132,3 +137,73 @@ def test_align_trimmed_reads_to_reference_resolves_insertion_buckets() -> None:
     assert insertion_column.resolution == "single_read"
     assert insertion_column.non_gap_member_count == 1
     assert insertion_column.gap_member_count == 2
+
+
+def test_align_trimmed_reads_to_reference_process_pool_matches_serial_result() -> None:
+    base_raw_records, _ = make_inputs()
+    raw_records_by_source_filename = {
+        f"{source_filename}.{copy_index}": record
+        for copy_index in range(3)
+        for source_filename, record in base_raw_records.items()
+    }
+    trim_results_by_source_filename = {
+        source_filename: trim_sequence_record(record, TrimConfig())
+        for source_filename, record in raw_records_by_source_filename.items()
+    }
+    serial_result = align_trimmed_reads_to_reference(
+        source_filenames=tuple(raw_records_by_source_filename),
+        raw_records_by_source_filename=raw_records_by_source_filename,
+        trim_results_by_source_filename=trim_results_by_source_filename,
+        reference_text=">ref\nAACCGGTT\n",
+        strand_policy="forward",
+        config=AssemblyConfig(min_overlap_length=6, min_percent_identity=80.0),
+    )
+    parallel_result = align_trimmed_reads_to_reference(
+        source_filenames=tuple(raw_records_by_source_filename),
+        raw_records_by_source_filename=raw_records_by_source_filename,
+        trim_results_by_source_filename=trim_results_by_source_filename,
+        reference_text=">ref\nAACCGGTT\n",
+        strand_policy="forward",
+        config=AssemblyConfig(min_overlap_length=6, min_percent_identity=80.0),
+        max_workers=2,
+    )
+
+    assert parallel_result == serial_result
+    assert [member.source_filename for member in parallel_result.members] == list(
+        raw_records_by_source_filename
+    )
+
+
+def test_align_trimmed_reads_to_reference_windows_grid_to_read_coverage() -> None:
+    raw_records_by_source_filename, trim_results_by_source_filename = make_inputs()
+    reference_sequence = ("GT" * 30) + "AACCGGTT" + ("CA" * 30)
+    alignment_kwargs = dict(
+        source_filenames=("read_1.ab1", "read_2.ab1", "read_3.ab1"),
+        raw_records_by_source_filename=raw_records_by_source_filename,
+        trim_results_by_source_filename=trim_results_by_source_filename,
+        reference_text=f">ref\n{reference_sequence}\n",
+        strand_policy="forward",
+        config=AssemblyConfig(min_overlap_length=6, min_percent_identity=80.0),
+    )
+
+    full_result = align_trimmed_reads_to_reference(**alignment_kwargs)
+    windowed_result = align_trimmed_reads_to_reference(
+        **alignment_kwargs,
+        coverage_padding=2,
+    )
+
+    assert full_result.is_windowed is False
+    assert replace(full_result, reference_windows=None).is_windowed is False
+    assert windowed_result.is_windowed is True
+    assert windowed_result.reference_windows == ((58, 70),)
+    assert windowed_result.gapped_reference == "GTAACCGGTTCA"
+    assert windowed_result.consensus_sequence == full_result.consensus_sequence
+    assert windowed_result.columns[0].ref_pos == 59
+    assert [column.ref_index for column in windowed_result.columns] == [
+        column.ref_index
+        for column in full_result.columns
+        if column.ref_index is not None and 58 <= column.ref_index < 70
+    ]
+    assert format_reference_multi_alignment_fasta(windowed_result).startswith(
+        ">ref windows=59-70\nGTAACCGGTTCA\n"
+    )
@@ -191,3 +191,31 @@ def test_build_reference_multi_alignment_trace_figure_uses_dark_theme_colors() -
     assert figure.layout.plot_bgcolor == "#0E1117"
     assert figure.layout.font.color == "#FAFAFA"
     assert figure.data[6].name == "read_1 background"
+
+
+def test_build_reference_multi_alignment_trace_figure_batches_rows() -> None:
+    trace_view = make_trace_view()
+
+    per_row_figure = build_reference_multi_alignment_trace_figure(trace_view)
+    figure = build_reference_multi_alignment_trace_figure(
+        trace_view,
+        batch_rows=True,
+    )
+
+    trace_names = [trace.name for trace in figure.data]
+    row_label_traces = [
+        trace for trace in per_row_figure.data if trace.name.endswith(" bases")
+    ]
+    assert trace_names[6:] == [
+        "Row backgrounds",
+        "Rows:G",
+        "Rows:A",
+        "Rows:T",
+        "Rows:C",
+        "Row bases",
+        "Row hover",
+    ]
+    assert list(figure.data[11].text) == [
+        text for trace in row_label_traces for text in trace.text
+    ]
+    assert figure.layout == per_row_figure.layout
@@ -8,6 +8,7 @@ from abi_sauce.services.batch_trim import apply_trim_configs
 from abi_sauce.services.reference_alignment import (
     compute_reference_alignment,
     compute_reference_multi_alignment,
+    window_reference_alignment_trace_view,
 )
 from abi_sauce.assembly_types import AssemblyConfig
 from abi_sauce.trimming import TrimConfig
@@ -97,6 +98,56 @@ def test_compute_reference_alignment_returns_page_facing_alignment_state() -> No
     assert computed_alignment.trace_view.alignment_length == 4
 
 
+def test_window_reference_alignment_trace_view_rebuilds_only_outside_window() -> (
+    None
+):
+    sequence = "ACGTTGCAAC" * 24
+    uploads = (SequenceUpload(filename="long.ab1", content=b"long"),)
+    prepared_batch = apply_trim_configs(
+        ParsedBatch(
+            uploads=uploads,
+            parsed_records={
+                "long.ab1": make_record(
+                    name="long",
+                    sequence=sequence,
+                    qualities=[40] * len(sequence),
+                ),
+            },
+            parse_errors={},
+            signature=build_batch_signature(uploads),
+        ),
+        trim_configs_by_name={},
+    )
+    computed_alignment = compute_reference_alignment(
+        prepared_batch,
+        source_filename="long.ab1",
+        reference_text=sequence,
+        strand_policy="forward",
+    )
+    assert computed_alignment.trace_view is not None
+    assert computed_alignment.trace_view.column_window == (0, 150)
+    assert len(computed_alignment.trace_view.rows[0].cells) == 150
+
+    assert (
+        window_reference_alignment_trace_view(
+            computed_alignment,
+            prepared_batch,
+            first_visible_column_index=20,
+            visible_columns=60,
+        )
+        is computed_alignment.trace_view
+    )
+    scrolled_view = window_reference_alignment_trace_view(
+        computed_alignment,
+        prepared_batch,
+        first_visible_column_index=200,
+        visible_columns=60,
+    )
+    assert scrolled_view is not None
+    assert scrolled_view.column_window == (90, 240)
+    assert scrolled_view.rows[0].cells[0].column_index == 91
+
+
 def test_compute_reference_alignment_can_include_match_rows() -> None:
     prepared_batch = make_prepared_batch()
 
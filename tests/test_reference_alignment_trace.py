@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+from abi_sauce.assembly_trace import (
+    assembly_trace_row_source_cache_info,
+    build_assembly_trace_row_source,
+    clear_assembly_trace_row_source_cache,
+)
 from abi_sauce.models import SequenceRecord, TraceData
 from abi_sauce.reference_alignment import align_trimmed_read_to_reference
 from abi_sauce.reference_alignment_trace import build_reference_alignment_trace_view
@@ -143,4 +148,42 @@ def test_build_reference_alignment_trace_view_degrades_without_trace_data() -> N
 
     row = trace_view.rows[0]
     assert row.has_trace_signal is False
-    assert all(cell.channels == () for cell in row.cells)
+    assert not any(cell.has_trace_signal for cell in row.cells)
+
+
+def test_build_reference_alignment_trace_view_reuses_shared_row_source() -> None:
+    clear_assembly_trace_row_source_cache()
+    raw_record = make_record(
+        name="trace",
+        sequence="AACCGGTT",
+        base_positions=[5, 15, 25, 35, 45, 55, 65, 75],
+    )
+    trim_result = trim_sequence_record(raw_record, TrimConfig())
+    assembly_row_source = build_assembly_trace_row_source(
+        raw_record=raw_record,
+        trim_result=trim_result,
+        strand="forward",
+    )
+    result = align_trimmed_read_to_reference(
+        raw_record=raw_record,
+        trim_result=trim_result,
+        reference_text=">ref\nCCGG\n",
+        strand_policy="forward",
+    )
+
+    trace_view = build_reference_alignment_trace_view(
+        result=result,
+        source_filename="trace.ab1",
+        raw_record=raw_record,
+        trim_result=trim_result,
+    )
+
+    info = assembly_trace_row_source_cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+    assert trace_view.rows[0].signal_scale == assembly_row_source.signal_scale
+    assert assembly_row_source == build_assembly_trace_row_source(
+        raw_record=raw_record,
+        trim_result=trim_result,
+        strand="forward",
+        use_cache=False,
+    )
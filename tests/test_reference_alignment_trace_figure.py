@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from abi_sauce.figure_spec import figure_spec, overlay_figure_spec_shapes
 from abi_sauce.models import SequenceRecord, TraceData
 from abi_sauce.reference_alignment import align_trimmed_read_to_reference
 from abi_sauce.reference_alignment_trace import build_reference_alignment_trace_view
 from abi_sauce.reference_alignment_trace_figure import (
     build_reference_alignment_trace_figure,
+    build_reference_alignment_trace_selection_shapes,
 )
 from abi_sauce.trimming import TrimConfig, trim_sequence_record
 
@@ -107,6 +109,40 @@ def test_build_reference_alignment_trace_figure_adds_selected_column_highlight()
     assert selected_shape.x1 == 4.0
 
 
+def test_selection_shapes_overlay_matches_figure_built_with_selection() -> None:
+    trace_view = make_trace_view()
+    base_spec = figure_spec(
+        build_reference_alignment_trace_figure(trace_view, theme_type="dark")
+    )
+
+    overlaid_spec = overlay_figure_spec_shapes(
+        base_spec,
+        build_reference_alignment_trace_selection_shapes(
+            trace_view,
+            theme_type="dark",
+            selected_column_index=4,
+        ),
+    )
+
+    assert overlaid_spec["data"] is base_spec["data"]
+    assert (
+        overlaid_spec["layout"]
+        == figure_spec(
+            build_reference_alignment_trace_figure(
+                trace_view,
+                theme_type="dark",
+                selected_column_index=4,
+            )
+        )["layout"]
+    )
+    assert (
+        build_reference_alignment_trace_selection_shapes(
+            trace_view,
+            selected_column_index=trace_view.alignment_length + 1,
+        )
+        == ()
+    )
+
 def test_build_reference_alignment_trace_figure_starts_at_first_trace_column_for_long_reference() -> (
     None
 ):
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import random
+
+from abi_sauce.signal_decimation import SignalPyramid
+
+
+def test_signal_pyramid_keeps_range_extremes_within_point_budget() -> None:
+    generator = random.Random(11)
+    signals = tuple(
+        tuple(generator.randrange(0, 5000) for _ in range(3000)) for _ in range(2)
+    )
+    pyramid = SignalPyramid(signals)
+
+    assert pyramid.sample_count == 3000
+    for _ in range(200):
+        left = generator.randrange(-10, 3000)
+        right = generator.randrange(left, 3010)
+        max_points = generator.randrange(8, 400)
+        channel_index = generator.randrange(2)
+        positions = pyramid.sample_positions(
+            channel_index,
+            left=left,
+            right=right,
+            max_points=max_points,
+        ).tolist()
+        window = signals[channel_index][max(left, 0) : min(right, 2999) + 1]
+        sampled = [signals[channel_index][position] for position in positions]
+
+        assert positions == sorted(set(positions))
+        assert positions[0] == max(left, 0)
+        assert positions[-1] == min(right, 2999)
+        assert len(positions) <= max_points + 6
+        assert max(sampled) == max(window)
+        assert min(sampled) == min(window)
+
+
+def test_signal_pyramid_serves_small_ranges_at_full_resolution() -> None:
+    pyramid = SignalPyramid(((3, 1, 4, 1, 5, 9, 2, 6, 5, 3),))
+    empty_pyramid = SignalPyramid(())
+
+    positions = pyramid.sample_positions(0, left=2, right=7, max_points=10)
+    assert positions.tolist() == [2, 3, 4, 5, 6, 7]
+    assert pyramid.sample_positions(0, left=8, right=3, max_points=10).size == 0
+    assert empty_pyramid.sample_positions(0, left=0, right=5, max_points=4).size == 0
+
+
+def test_signal_pyramid_reversed_mirrors_stored_levels() -> None:
+    generator = random.Random(13)
+    signal = tuple(generator.randrange(0, 5000) for _ in range(1000))
+    reversed_pyramid = SignalPyramid((signal,)).reversed()
+    reversed_signal = signal[::-1]
+
+    assert reversed_pyramid.channel_values(0).tolist() == list(reversed_signal)
+    assert reversed_pyramid.reversed().channel_values(0).tolist() == list(signal)
+    for left, right in ((0, 999), (-5, 340), (17, 1003)):
+        positions = reversed_pyramid.sample_positions(
+            0,
+            left=left,
+            right=right,
+            max_points=64,
+        ).tolist()
+        window = reversed_signal[max(left, 0) : min(right, 999) + 1]
+        sampled = [reversed_signal[position] for position in positions]
+
+        assert positions == sorted(set(positions))
+        assert positions[0] == max(left, 0)
+        assert positions[-1] == min(right, 999)
+        assert max(sampled) == max(window)
+        assert min(sampled) == min(window)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import random
+
+from abi_sauce.signal_envelope import SignalEnvelope
+
+
+def test_signal_envelope_range_max_matches_brute_force_over_channels() -> None:
+    generator = random.Random(7)
+    signals = tuple(
+        tuple(generator.randrange(0, 5000) for _ in range(length))
+        for length in (700, 700, 690, 700)
+    )
+    envelope = SignalEnvelope(signals)
+
+    assert len(envelope) == 700
+    assert envelope.maximum == max(max(signal) for signal in signals)
+    for _ in range(300):
+        left = generator.randrange(-20, 720)
+        right = generator.randrange(left - 5, 740)
+        expected = [
+            signal[index]
+            for signal in signals
+            for index in range(max(left, 0), min(right, 699) + 1)
+            if index < len(signal)
+        ]
+        assert envelope.range_max(left, right) == (max(expected) if expected else None)
+    assert envelope.value_at(695) == max(
+        signal[695] for signal in signals if len(signal) > 695
+    )
+    assert envelope.value_at(700) is None
+    assert envelope.reversed().range_max(0, 9) == envelope.range_max(690, 699)
+
+
+def test_signal_envelope_handles_missing_signal() -> None:
+    envelope = SignalEnvelope(((), ()))
+
+    assert len(envelope) == 0
+    assert envelope.maximum is None
+    assert envelope.range_max(0, 10) is None
+    assert envelope.value_at(0) is None
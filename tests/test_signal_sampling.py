@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from abi_sauce.signal_sampling import resample_signal_window, resample_signal_windows
+
+
+def test_resample_signal_windows_matches_per_window_resampling() -> None:
+    signals = ((0, 10, 40, 20, 5), (3, 3), (), (100,))
+    windows = ((0.0, 1.5, 0.0, 1.0), (-2.0, 2.0, 1.0, 2.0), (2.5, 9.0, 2.0, 3.0))
+
+    x_values, sampled_signal = resample_signal_windows(
+        signals,
+        raw_left=[window[0] for window in windows],
+        raw_right=[window[1] for window in windows],
+        cell_left=[window[2] for window in windows],
+        cell_right=[window[3] for window in windows],
+        sample_count=4,
+        signal_scale=30.0,
+        clamp_to_unit=True,
+    )
+
+    assert sampled_signal.shape == (4, 3, 4)
+    for window_position, (raw_left, raw_right, cell_left, cell_right) in enumerate(
+        windows
+    ):
+        for channel_position, signal in enumerate(signals):
+            expected_x, expected_signal = resample_signal_window(
+                signal,
+                raw_left=raw_left,
+                raw_right=raw_right,
+                cell_left=cell_left,
+                cell_right=cell_right,
+                sample_count=4,
+                signal_scale=30.0,
+                clamp_to_unit=True,
+            )
+            assert tuple(x_values[window_position].tolist()) == expected_x
+            assert (
+                tuple(sampled_signal[channel_position, window_position].tolist())
+                == expected_signal
+            )
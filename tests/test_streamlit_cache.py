@@ -16,16 +16,25 @@ from abi_sauce.assembly_trace import (
     build_multi_assembly_trace_view,
     build_pairwise_assembly_trace_view,
 )
+from abi_sauce.chromatogram import build_chromatogram_view
+from abi_sauce.chromatogram_figure import build_chromatogram_figure
+from abi_sauce.figure_spec import figure_spec
 from abi_sauce.models import SequenceRecord, SequenceUpload, TraceData
+from abi_sauce.services import assembly_compute
 from abi_sauce.services.assembly_compute import compute_saved_assemblies
 from abi_sauce.services.batch_parse import ParsedBatch, build_batch_signature
 from abi_sauce.services.batch_trim import apply_trim_configs
 import abi_sauce.streamlit_cache as streamlit_cache
 from abi_sauce.streamlit_cache import (
     build_assembly_trace_row_source_for_member,
+    build_chromatogram_column_view_for_record,
+    build_figure_spec_for_view,
     build_parsed_batch_cache_key,
     build_selected_assembly_trace_view,
+    build_trace_signatures_cache_key,
+    build_trace_signatures_for_batch,
     build_trim_inputs_cache_key,
+    build_view_figure_cache_key,
     compute_saved_assemblies_for_definitions,
     prepare_batch_for_trim_inputs,
 )
@@ -250,6 +259,41 @@ def test_compute_saved_assemblies_for_definitions_varies_with_prepared_batch_sta
     )
 
 
+def test_compute_saved_assemblies_for_definitions_extends_appended_multi_reads(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    st.cache_data.clear()
+    streamlit_cache._latest_computed_assemblies.clear()
+    prepared_batch = apply_trim_configs(make_parsed_batch())
+    config = AssemblyConfig(min_overlap_length=4, min_percent_identity=90.0)
+    extended_definition = AssemblyDefinition(
+        assembly_id="assembly-multi",
+        name="Amplicon Multi",
+        source_filenames=("left.ab1", "right.ab1", "short.ab1"),
+        config=config,
+        engine_kind="multi",
+    )
+    compute_saved_assemblies_for_definitions(
+        prepared_batch,
+        (replace(extended_definition, source_filenames=("left.ab1", "right.ab1")),),
+    )
+    expected_computed_assemblies = compute_saved_assemblies(
+        prepared_batch,
+        (extended_definition,),
+    )
+
+    def fail_rebuild(**_kwargs: object) -> None:
+        raise AssertionError("the saved assembly should be extended in place")
+
+    monkeypatch.setattr(assembly_compute, "assemble_trimmed_multi", fail_rebuild)
+    extended_computed_assemblies = compute_saved_assemblies_for_definitions(
+        prepared_batch,
+        (extended_definition,),
+    )
+
+    assert extended_computed_assemblies == expected_computed_assemblies
+
+
 def test_build_selected_assembly_trace_view_matches_pairwise_builder() -> None:
     st.cache_data.clear()
     parsed_batch = make_parsed_batch()
@@ -373,3 +417,172 @@ def test_prepare_batch_for_trim_inputs_reuses_cached_trim_results_for_unchanged_
     )
 
     assert trim_calls == [("short", TrimConfig(right_trim=2))]
+
+
+def test_build_figure_spec_for_view_reuses_specs_per_view_and_theme() -> None:
+    st.cache_data.clear()
+    parsed_batch = make_parsed_batch()
+    view = build_chromatogram_view(parsed_batch.parsed_records["left.ab1"])
+    builder_calls: list[str] = []
+
+    def counting_chromatogram_figure(view, *, theme_type: str):
+        builder_calls.append(theme_type)
+        return build_chromatogram_figure(view, theme_type=theme_type)
+
+    light_spec = build_figure_spec_for_view(
+        counting_chromatogram_figure,
+        view,
+        theme_type="light",
+    )
+    build_figure_spec_for_view(counting_chromatogram_figure, view, theme_type="light")
+    build_figure_spec_for_view(counting_chromatogram_figure, view, theme_type="dark")
+
+    assert builder_calls == ["light", "dark"]
+    assert light_spec["layout"] == figure_spec(
+        build_chromatogram_figure(view, theme_type="light")
+    )["layout"]
+    assert [trace["name"] for trace in light_spec["data"]] == [
+        trace.name for trace in build_chromatogram_figure(view).data
+    ]
+
+
+def test_build_view_figure_cache_key_uses_trace_view_fingerprints() -> None:
+    st.cache_data.clear()
+    parsed_batch = make_parsed_batch()
+    prepared_batch = apply_trim_configs(parsed_batch)
+    definition = AssemblyDefinition(
+        assembly_id="assembly-multi",
+        name="Amplicon Multi",
+        source_filenames=("left.ab1", "right.ab1", "short.ab1"),
+        config=AssemblyConfig(min_overlap_length=4, min_percent_identity=90.0),
+        engine_kind="multi",
+    )
+    computed_assembly = compute_saved_assemblies_for_definitions(
+        prepared_batch,
+        (definition,),
+    )["assembly-multi"]
+    trace_view = build_selected_assembly_trace_view(prepared_batch, computed_assembly)
+    assert trace_view is not None
+    rebuilt_view = build_selected_assembly_trace_view(
+        prepared_batch,
+        computed_assembly,
+    )
+    windowed_view = build_selected_assembly_trace_view(
+        prepared_batch,
+        computed_assembly,
+        column_window=(0, 2),
+    )
+    assert windowed_view is not None
+
+    assert trace_view.fingerprint is not None
+    assert build_view_figure_cache_key(trace_view) == build_view_figure_cache_key(
+        rebuilt_view
+    )
+    assert build_view_figure_cache_key(trace_view) != build_view_figure_cache_key(
+        windowed_view
+    )
+    with pytest.raises(ValueError, match="has no fingerprint"):
+        build_view_figure_cache_key(replace(trace_view, fingerprint=None))
+
+
+def test_build_figure_spec_for_view_layers_overlay_shapes_on_cached_spec() -> None:
+    st.cache_data.clear()
+    parsed_batch = make_parsed_batch()
+    view = build_chromatogram_view(parsed_batch.parsed_records["left.ab1"])
+    builder_calls: list[str] = []
+
+    def counting_chromatogram_figure(view, *, theme_type: str):
+        builder_calls.append(theme_type)
+        return build_chromatogram_figure(view, theme_type=theme_type)
+
+    base_spec = build_figure_spec_for_view(counting_chromatogram_figure, view)
+    overlaid_specs = [
+        build_figure_spec_for_view(
+            counting_chromatogram_figure,
+            view,
+            overlay_shapes=({"type": "rect", "x0": x0, "x1": x0 + 1.0},),
+        )
+        for x0 in (3.0, 7.0)
+    ]
+
+    assert builder_calls == ["light"]
+    assert [spec["layout"]["shapes"][0]["x0"] for spec in overlaid_specs] == [
+        3.0,
+        7.0,
+    ]
+    assert overlaid_specs[0]["layout"]["shapes"][1:] == list(
+        base_spec["layout"].get("shapes", ())
+    )
+
+
+def test_build_chromatogram_column_view_for_record_caches_per_record_and_trim(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    st.cache_data.clear()
+    parsed_batch = make_parsed_batch()
+    prepared_batch = apply_trim_configs(parsed_batch)
+    record = parsed_batch.parsed_records["left.ab1"]
+    trim_result = prepared_batch.trim_results["left.ab1"]
+
+    original_build = streamlit_cache.build_chromatogram_column_view
+    build_calls: list[int] = []
+
+    def counting_build_chromatogram_column_view(record, trim_result, **kwargs):
+        build_calls.append(kwargs["samples_per_base"])
+        return original_build(record, trim_result, **kwargs)
+
+    monkeypatch.setattr(
+        streamlit_cache,
+        "build_chromatogram_column_view",
+        counting_build_chromatogram_column_view,
+    )
+
+    cached_view = build_chromatogram_column_view_for_record(record, trim_result)
+    build_chromatogram_column_view_for_record(record, trim_result)
+    build_chromatogram_column_view_for_record(
+        record,
+        trim_result,
+        samples_per_base=8,
+    )
+
+    assert build_calls == [16, 8]
+    assert cached_view == original_build(record, trim_result)
+    assert cached_view.fingerprint == original_build(record, trim_result).fingerprint
+    assert cached_view.fingerprint != (
+        original_build(record, trim_result, samples_per_base=8).fingerprint
+    )
+
+
+def test_build_trace_signatures_for_batch_rebuilds_only_when_trims_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    st.cache_data.clear()
+    parsed_batch = make_parsed_batch()
+    prepared_batch = apply_trim_configs(parsed_batch)
+    retrimmed_batch = apply_trim_configs(
+        parsed_batch,
+        default_trim_config=TrimConfig(left_trim=2),
+    )
+
+    original_build = streamlit_cache.build_batch_trace_signatures
+    build_calls: list[int] = []
+
+    def counting_build_batch_trace_signatures(records, trim_results, **kwargs):
+        build_calls.append(len(records))
+        return original_build(records, trim_results, **kwargs)
+
+    monkeypatch.setattr(
+        streamlit_cache,
+        "build_batch_trace_signatures",
+        counting_build_batch_trace_signatures,
+    )
+
+    signatures = build_trace_signatures_for_batch(prepared_batch)
+    build_trace_signatures_for_batch(prepared_batch)
+    build_trace_signatures_for_batch(retrimmed_batch)
+
+    assert build_calls == [3, 3]
+    assert signatures.source_filenames == tuple(parsed_batch.parsed_records)
+    assert build_trace_signatures_cache_key(
+        prepared_batch
+    ) != build_trace_signatures_cache_key(retrimmed_batch)
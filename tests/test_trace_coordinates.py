@@ -9,6 +9,7 @@ from abi_sauce.trace_coordinates import (
     raw_trimmed_index_for_display_query_index,
     sanitized_trace_length,
     trace_position_for_oriented_query_index,
+    trace_positions_for_oriented_query_indices,
 )
 from abi_sauce.trimming import TrimConfig, trim_sequence_record
 
@@ -207,3 +208,35 @@ def test_trace_position_for_oriented_query_index_maps_through_display_coordinate
         )
         is None
     )
+
+
+def test_trace_positions_for_oriented_query_indices_matches_per_index_mapping() -> (
+    None
+):
+    raw_record = make_record(
+        name="table_trace",
+        sequence="GATTACAGT",
+        base_positions=[5, 15, 25, 35, 150, 55, 65, 75, 85],
+    )
+    raw_record.orientation = "reverse_complement"
+    trim_result = trim_sequence_record(
+        raw_record,
+        TrimConfig(left_trim=1, right_trim=2),
+    )
+
+    for strand in ("forward", "reverse_complement"):
+        table = trace_positions_for_oriented_query_indices(
+            raw_record=raw_record,
+            trim_result=trim_result,
+            strand=strand,
+        )
+        assert table == tuple(
+            trace_position_for_oriented_query_index(
+                raw_record=raw_record,
+                trim_result=trim_result,
+                oriented_query_index=query_index,
+                strand=strand,
+            )
+            for query_index in range(trim_result.trimmed_length)
+        )
+        assert None in table
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import numpy as np
+
+from abi_sauce.models import SequenceRecord, TraceData
+from abi_sauce.plate_overview_figure import (
+    build_plate_overview_figure,
+    plate_well_labels,
+)
+from abi_sauce.trace_signatures import build_batch_trace_signatures
+from abi_sauce.trimming import TrimConfig, trim_sequence_record
+
+
+def make_record(*, name: str, trace_length: int = 400) -> SequenceRecord:
+    positions = np.arange(trace_length)
+    primary = (100 + positions).tolist()
+    return SequenceRecord(
+        record_id=f"{name}_id",
+        name=name,
+        description="synthetic signature record",
+        sequence="ACGT" * 10,
+        source_format="abi",
+        trace_data=TraceData(
+            channels={
+                "DATA9": primary,
+                "DATA10": [10] * trace_length,
+                "DATA11": [5] * trace_length,
+                "DATA12": [0] * trace_length,
+            },
+            base_positions=list(range(5, trace_length, 10)),
+            channel_order="GATC",
+        ),
+    )
+
+
+def test_build_batch_trace_signatures_bins_envelope_snr_and_retained_range() -> None:
+    forward = make_record(name="forward")
+    reverse = replace(make_record(name="reverse"), orientation="reverse_complement")
+    untraced = replace(make_record(name="untraced"), trace_data=None)
+    records = {"f.ab1": forward, "r.ab1": reverse, "u.ab1": untraced}
+    trim_results = {
+        filename: trim_sequence_record(record, TrimConfig(left_trim=10))
+        for filename, record in records.items()
+    }
+
+    signatures = build_batch_trace_signatures(
+        records,
+        trim_results,
+        envelope_bins=8,
+        snr_windows=4,
+    )
+
+    assert signatures.source_filenames == ("f.ab1", "r.ab1", "u.ab1")
+    assert signatures.envelope.shape == (3, 8)
+    assert signatures.window_snr.shape == (3, 4)
+    assert signatures.has_trace.tolist() == [True, True, False]
+    assert signatures.max_signal[0] == 499.0
+    assert signatures.envelope[0, -1] == 1.0
+    assert np.all(np.diff(signatures.envelope[0]) > 0)
+    assert np.all(signatures.window_snr[0] > 10.0)
+    np.testing.assert_allclose(signatures.envelope[1], signatures.envelope[0][::-1])
+    np.testing.assert_allclose(
+        signatures.retained_range[0],
+        [105 / 399, 395 / 399],
+        rtol=1e-6,
+    )
+    np.testing.assert_allclose(
+        signatures.retained_range[1],
+        1.0 - signatures.retained_range[0][::-1],
+        rtol=1e-6,
+    )
+    assert np.isnan(signatures.envelope[2]).all()
+    assert np.isnan(signatures.median_snr[2])
+
+
+def test_build_plate_overview_figure_shares_traces_across_wells() -> None:
+    records = {
+        f"read_{index}.ab1": make_record(name=f"read_{index}") for index in range(14)
+    }
+    signatures = build_batch_trace_signatures(
+        records,
+        {},
+        envelope_bins=16,
+        snr_windows=4,
+    )
+
+    figure = build_plate_overview_figure(signatures)
+
+    heatmap, envelope, retained, hover = figure.data
+    assert np.asarray(heatmap.z).shape == (2, 12)
+    assert len(envelope.x) == 14 * 17
+    assert len(retained.x) == 14 * 3
+    assert hover.customdata[13][0] == "read_13.ab1"
+    assert hover.customdata[13][2] == "B2"
+    assert list(figure.layout.yaxis.ticktext) == ["A", "B"]
+    assert plate_well_labels(28, plate_columns=1)[-2:] == ("AA1", "AB1")